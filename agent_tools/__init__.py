@@ -0,0 +1,138 @@
+"""
+Agent Tools for AutoGen DekuDeals Analysis
+Narzędzia dla agentów AutoGen do analizy gier z DekuDeals
+
+Tools live in per-domain modules listed in ``registry.TOOL_GROUPS`` (scrape,
+value, review, recommendations, quality, monitoring, personalization,
+price_ml, users, collection). Importing ``agent_tools`` loads none of them;
+a group is imported the first time one of its tools is accessed:
+
+    from agent_tools import calculate_value_score  # loads agent_tools.value only
+
+Tools that call tools of another group (or the profiler hooks) import them
+from this package at call time, so a replacement installed here - the CLI's
+cached search, a test double - is used everywhere, as with the old module.
+"""
+
+import functools
+import inspect
+import logging
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from agent_tools.registry import TOOL_GROUPS, ToolRegistry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+# Non-tool names other modules and tests reach through agent_tools
+_EXPORTS = {
+    "_scrape_games_concurrently": "agent_tools.scrape",
+    "SCRAPE_MAX_WORKERS": "agent_tools.scrape",
+    "_recommendation_engine": "agent_tools.recommendations",
+    "_review_generator": "agent_tools.review",
+    "_opinion_adapter": "agent_tools.review",
+    "enhanced_qa_agent": "agent_tools.quality",
+    "completeness_checker": "agent_tools.quality",
+    "quality_metrics_tracker": "agent_tools.quality",
+    "get_smart_user_profiler": "utils.smart_user_profiler",
+    "record_user_interaction": "utils.smart_user_profiler",
+    "get_personalized_adjustments": "utils.smart_user_profiler",
+}
+
+tool_registry = ToolRegistry(TOOL_GROUPS, exports=_EXPORTS)
+
+# Parameters passed by code (shared analysis context), never by the LLM
+INTERNAL_PARAMETERS = frozenset({"context"})
+
+__all__ = tool_registry.tool_names()
+
+
+def __getattr__(name: str) -> Any:
+    # Cached in the package namespace: later lookups (and patches) hit globals
+    value = tool_registry.resolve(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__) | set(_EXPORTS))
+
+
+def build_function_map(
+    tool_names: Optional[Iterable[str]] = None,
+    groups: Optional[Iterable[str]] = None,
+) -> Dict[str, Callable[..., Any]]:
+    """
+    Mapa funkcji AutoGen (nazwa -> narzędzie) budowana na żądanie.
+
+    Only the groups of the requested tools are imported. Tools are looked up
+    on this package, so replacements installed here end up in the map.
+
+    Args:
+        tool_names: Nazwy narzędzi (domyślnie wszystkie z ``groups``)
+        groups: Nazwy grup (domyślnie wszystkie)
+    """
+    names = (
+        list(tool_names) if tool_names is not None else tool_registry.tool_names(groups)
+    )
+    package = sys.modules[__name__]
+    return {name: getattr(package, name) for name in names}
+
+
+def llm_tool(name: str) -> Callable[..., Any]:
+    """
+    Narzędzie w postaci rejestrowanej w AutoGen.
+
+    Calls look the tool up on this package, so replacements installed before
+    or after registration are used. The LLM schema is built from the tool as
+    defined in its group module, without ``INTERNAL_PARAMETERS``.
+    """
+    func = tool_registry.resolve(name)
+
+    @functools.wraps(func)
+    def tool(*args, **kwargs):
+        return getattr(sys.modules[__name__], name)(*args, **kwargs)
+
+    signature = inspect.signature(func)
+    tool.__name__ = name
+    tool.__signature__ = signature.replace(
+        parameters=[
+            parameter
+            for parameter in signature.parameters.values()
+            if parameter.name not in INTERNAL_PARAMETERS
+        ]
+    )
+    return tool
+
+
+def register_tools(
+    caller: Any,
+    executor: Any,
+    tool_names: Optional[Iterable[str]] = None,
+    groups: Optional[Iterable[str]] = None,
+    wrap: Optional[Callable[[Callable[..., Any]], Callable[..., Any]]] = None,
+) -> Dict[str, Callable[..., Any]]:
+    """
+    Rejestruje narzędzia na agentach AutoGen (schemat LLM i wykonanie).
+
+    Args:
+        caller: Agent proponujący wywołania (``register_for_llm``)
+        executor: Agent wykonujący narzędzia (``register_for_execution``)
+        tool_names: Nazwy narzędzi (domyślnie wszystkie z ``groups``)
+        groups: Nazwy grup (domyślnie wszystkie)
+        wrap: Opakowanie każdego narzędzia (np. kompaktowanie wyników)
+
+    Returns:
+        Dict: Zarejestrowana mapa funkcji (opakowane narzędzia)
+    """
+    function_map = {}
+    for name, func in build_function_map(tool_names, groups).items():
+        tool = llm_tool(name)
+        if wrap is not None:
+            tool = wrap(tool)
+        description = tool_registry.describe(name, func)
+        caller.register_for_llm(name=name, description=description)(tool)
+        executor.register_for_execution(name=name)(tool)
+        function_map[name] = tool
+    return function_map
@@ -0,0 +1,2184 @@
+"""
+Game Collection Tools for AutoGen DekuDeals
+Narzędzia kolekcji gier (Faza 7.1.6+): import (Steam, CSV, DekuDeals),
+edycja, eksport i analiza z uwzględnieniem kolekcji.
+"""
+
+import logging
+from typing import Dict, Any, Optional, List
+from datetime import datetime
+
+from agent_tools.registry import register_for_execution, register_for_llm
+
+logger = logging.getLogger(__name__)
+
+
+@register_for_llm(
+    description="Import games from Steam library to current user's collection - Input: steam_id (str), api_key (str) - Output: Dict with import results"
+)
+@register_for_execution()
+def import_steam_library(steam_id: str, api_key: str) -> Dict:
+    """
+    Import games from Steam library to current user's collection.
+
+    Automatically imports owned Steam games with playtime data.
+    Integrates with Multi-User system for personalized imports.
+
+    Args:
+        steam_id (str): Steam user ID (17-digit number)
+        api_key (str): Steam Web API key
+
+    Returns:
+        Dict with import results, statistics, and imported games info
+    """
+    try:
+        from utils.game_collection_manager import get_game_collection_manager
+        from utils.user_management import get_current_user_info
+
+        # Get current user info
+        user_info = get_current_user_info()
+        current_user = user_info.get("current_user", {})
+        username = current_user.get("username", "Unknown User")
+
+        # Get collection manager
+        collection_manager = get_game_collection_manager()
+
+        # Validate inputs
+        if not steam_id or not steam_id.isdigit() or len(steam_id) != 17:
+            return {
+                "success": False,
+                "error": "Invalid Steam ID. Must be a 17-digit number",
+                "example": "76561198000000000",
+                "provided": steam_id,
+            }
+
+        if not api_key or len(api_key) < 20:
+            return {
+                "success": False,
+                "error": "Invalid Steam API key. Get one from https://steamcommunity.com/dev/apikey",
+                "provided_length": len(api_key) if api_key else 0,
+            }
+
+        # Get collection stats before import
+        stats_before = collection_manager.get_collection_stats()
+
+        # Import from Steam
+        success, message, imported_count = collection_manager.import_from_steam(
+            steam_id, api_key
+        )
+
+        if not success:
+            return {
+                "success": False,
+                "error": message,
+                "steam_id": steam_id,
+                "user": username,
+            }
+
+        # Get updated stats
+        stats_after = collection_manager.get_collection_stats()
+
+        # Get newly imported games (Steam platform)
+        imported_games = []
+        for game in collection_manager.get_collection():
+            if game.import_source.value == "steam":
+                imported_games.append(
+                    {
+                        "title": game.title,
+                        "hours_played": game.hours_played,
+                        "steam_id": game.steam_id,
+                        "date_added": game.date_added.strftime("%Y-%m-%d"),
+                    }
+                )
+
+        # Limit to recent imports for display
+        recent_imports = imported_games[-min(10, len(imported_games)) :]
+
+        return {
+            "success": True,
+            "message": f"✅ {message} for {username}",
+            "import_results": {
+                "games_imported": imported_count,
+                "steam_id": steam_id,
+                "import_date": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                "recent_games": recent_imports,
+            },
+            "collection_changes": {
+                "before": {
+                    "total_games": stats_before.total_games,
+                    "owned_games": stats_before.owned_games,
+                },
+                "after": {
+                    "total_games": stats_after.total_games,
+                    "owned_games": stats_after.owned_games,
+                },
+                "games_added": stats_after.total_games - stats_before.total_games,
+            },
+            "user_context": {
+                "username": username,
+                "user_id": current_user.get("user_id", "unknown"),
+            },
+            "next_steps": [
+                "Review imported games in your collection",
+                "Add personal ratings for your favorite games",
+                "Update game statuses (completed, playing, etc.)",
+                "Add personal notes and tags",
+            ],
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Steam import error: {str(e)}",
+            "action": "import_steam_library",
+            "steam_id": steam_id,
+        }
+
+
+def import_collection_from_csv(csv_file_path: str) -> Dict:
+    """
+    Import games from CSV file to current user's collection.
+
+    Supports bulk import of game libraries from CSV files.
+    Expected CSV format: title, status, platform, user_rating, hours_played, notes, tags
+
+    Args:
+        csv_file_path (str): Path to CSV file with game collection data
+
+    Returns:
+        Dict with import results and statistics
+    """
+    try:
+        from utils.game_collection_manager import get_game_collection_manager
+        from utils.user_management import get_current_user_info
+
+        # Get current user info
+        user_info = get_current_user_info()
+        current_user = user_info.get("current_user", {})
+        username = current_user.get("username", "Unknown User")
+
+        # Get collection manager
+        collection_manager = get_game_collection_manager()
+
+        # Validate file path
+        if not csv_file_path or not csv_file_path.endswith(".csv"):
+            return {
+                "success": False,
+                "error": "Invalid CSV file path. Must end with .csv",
+                "provided": csv_file_path,
+            }
+
+        # Get collection stats before import
+        stats_before = collection_manager.get_collection_stats()
+
+        # Import from CSV
+        success, message, imported_count = collection_manager.import_from_csv(
+            csv_file_path
+        )
+
+        if not success:
+            return {
+                "success": False,
+                "error": message,
+                "csv_file": csv_file_path,
+                "user": username,
+            }
+
+        # Get updated stats
+        stats_after = collection_manager.get_collection_stats()
+
+        return {
+            "success": True,
+            "message": f"✅ {message} for {username}",
+            "import_results": {
+                "games_imported": imported_count,
+                "csv_file": csv_file_path,
+                "import_date": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            },
+            "collection_changes": {
+                "before": {
+                    "total_games": stats_before.total_games,
+                    "owned_games": stats_before.owned_games,
+                },
+                "after": {
+                    "total_games": stats_after.total_games,
+                    "owned_games": stats_after.owned_games,
+                },
+                "games_added": stats_after.total_games - stats_before.total_games,
+            },
+            "user_context": {
+                "username": username,
+                "user_id": current_user.get("user_id", "unknown"),
+            },
+            "csv_format_example": {
+                "headers": [
+                    "title",
+                    "status",
+                    "platform",
+                    "user_rating",
+                    "hours_played",
+                    "notes",
+                    "tags",
+                ],
+                "example_row": [
+                    "Hollow Knight",
+                    "owned",
+                    "Nintendo Switch",
+                    "9.5",
+                    "47",
+                    "Amazing metroidvania",
+                    "indie,metroidvania",
+                ],
+            },
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"CSV import error: {str(e)}",
+            "action": "import_collection_from_csv",
+            "csv_file": csv_file_path,
+        }
+
+
+def export_collection_to_csv(csv_file_path: str, status_filter: str = None) -> Dict:
+    """
+    Export current user's game collection to CSV file.
+
+    Creates backup of personal game library in CSV format.
+
+    Args:
+        csv_file_path (str): Path where CSV file will be saved
+        status_filter (str, optional): Export only games with specific status
+
+    Returns:
+        Dict with export results and file info
+    """
+    try:
+        from utils.game_collection_manager import (
+            get_game_collection_manager,
+            GameStatus,
+        )
+        from utils.user_management import get_current_user_info
+
+        # Get current user info
+        user_info = get_current_user_info()
+        current_user = user_info.get("current_user", {})
+        username = current_user.get("username", "Unknown User")
+
+        # Get collection manager
+        collection_manager = get_game_collection_manager()
+
+        # Validate file path
+        if not csv_file_path or not csv_file_path.endswith(".csv"):
+            return {
+                "success": False,
+                "error": "Invalid CSV file path. Must end with .csv",
+                "provided": csv_file_path,
+            }
+
+        # Parse status filter
+        status_enum = None
+        if status_filter:
+            try:
+                status_enum = GameStatus(status_filter.lower())
+            except ValueError:
+                return {
+                    "success": False,
+                    "error": f"Invalid status filter '{status_filter}'",
+                    "valid_statuses": [
+                        "owned",
+                        "wishlist",
+                        "not_interested",
+                        "completed",
+                        "playing",
+                        "dropped",
+                    ],
+                }
+
+        # Export to CSV
+        success, message = collection_manager.export_to_csv(csv_file_path, status_enum)
+
+        if not success:
+            return {
+                "success": False,
+                "error": message,
+                "csv_file": csv_file_path,
+                "user": username,
+            }
+
+        # Get collection stats
+        stats = collection_manager.get_collection_stats()
+        games_exported = len(collection_manager.get_collection(status_enum))
+
+        return {
+            "success": True,
+            "message": f"✅ {message} for {username}",
+            "export_results": {
+                "games_exported": games_exported,
+                "csv_file": csv_file_path,
+                "export_date": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                "status_filter": status_filter,
+            },
+            "collection_stats": {
+                "total_games": stats.total_games,
+                "owned_games": stats.owned_games,
+                "wishlist_games": stats.wishlist_games,
+                "average_rating": stats.average_rating,
+            },
+            "user_context": {
+                "username": username,
+                "user_id": current_user.get("user_id", "unknown"),
+            },
+            "file_info": {
+                "format": "CSV",
+                "encoding": "UTF-8",
+                "columns": [
+                    "title",
+                    "status",
+                    "platform",
+                    "user_rating",
+                    "hours_played",
+                    "purchase_price",
+                    "current_price",
+                    "notes",
+                    "tags",
+                    "date_added",
+                    "import_source",
+                ],
+            },
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"CSV export error: {str(e)}",
+            "action": "export_collection_to_csv",
+            "csv_file": csv_file_path,
+        }
+
+
+def get_collection_recommendations_filter() -> Dict:
+    """
+    Get list of owned games to exclude from recommendations.
+
+    Provides collection-aware recommendation filtering to avoid suggesting owned games.
+
+    Returns:
+        Dict with owned games list and filtering info
+    """
+    try:
+        from utils.game_collection_manager import (
+            get_game_collection_manager,
+            GameStatus,
+        )
+        from utils.user_management import get_current_user_info
+
+        # Get current user info
+        user_info = get_current_user_info()
+        current_user = user_info.get("current_user", {})
+        username = current_user.get("username", "Unknown User")
+
+        # Get collection manager
+        collection_manager = get_game_collection_manager()
+
+        # Get owned games
+        owned_games = collection_manager.get_collection(GameStatus.OWNED)
+
+        # Get games that should be excluded from recommendations
+        exclude_from_recommendations = []
+        for game in owned_games:
+            exclude_from_recommendations.append(
+                {
+                    "title": game.title,
+                    "status": game.status.value,
+                    "user_rating": game.user_rating,
+                    "normalized_title": collection_manager._normalize_title(game.title),
+                }
+            )
+
+        # Get collection stats
+        stats = collection_manager.get_collection_stats()
+
+        return {
+            "success": True,
+            "message": f"Generated recommendation filter for {username}",
+            "filter_data": {
+                "exclude_from_recommendations": exclude_from_recommendations,
+                "total_owned_games": len(owned_games),
+                "filtering_active": len(owned_games) > 0,
+            },
+            "collection_context": {
+                "total_games": stats.total_games,
+                "owned_games": stats.owned_games,
+                "wishlist_games": stats.wishlist_games,
+                "completion_rate": (
+                    round((stats.completed_games / stats.total_games * 100), 1)
+                    if stats.total_games > 0
+                    else 0
+                ),
+            },
+            "user_context": {
+                "username": username,
+                "user_id": current_user.get("user_id", "unknown"),
+            },
+            "usage_info": {
+                "purpose": "Filter out owned games from recommendations",
+                "integration": "Use with recommendation engine to avoid suggesting owned games",
+                "benefit": "Personalized recommendations excluding user's existing library",
+            },
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Filter generation error: {str(e)}",
+            "action": "get_collection_recommendations_filter",
+        }
+
+
+@register_for_llm(
+    description="Add a game to current user's personal collection - Input: title (str), status (str, optional), user_rating (float, optional), notes (str, optional) - Output: Dict with success status"
+)
+@register_for_execution()
+def add_game_to_collection(
+    title: str, status: str = "owned", user_rating: float = None, notes: str = ""
+) -> Dict:
+    """
+    Add a game to current user's personal collection.
+
+    Allows users to build their personal game library with ownership status tracking.
+    Integrates with Multi-User system for personalized collections.
+
+    Args:
+        title (str): Game title to add to collection
+        status (str): Game status - "owned", "wishlist", "not_interested", "completed", "playing", "dropped"
+        user_rating (float, optional): Personal rating 1-10 scale
+        notes (str, optional): Personal notes about the game
+
+    Returns:
+        Dict with success status, message, and collection info
+    """
+    try:
+        from utils.game_collection_manager import (
+            get_game_collection_manager,
+            GameStatus,
+        )
+        from utils.user_management import get_current_user_info
+
+        # Get current user info
+        user_info = get_current_user_info()
+        current_user = user_info.get("current_user", {})
+        username = current_user.get("username", "Unknown User")
+
+        # Get collection manager
+        collection_manager = get_game_collection_manager()
+
+        # Validate status
+        try:
+            game_status = GameStatus(status.lower())
+        except ValueError:
+            return {
+                "success": False,
+                "error": f"Invalid status '{status}'. Valid options: owned, wishlist, not_interested, completed, playing, dropped",
+                "valid_statuses": [
+                    "owned",
+                    "wishlist",
+                    "not_interested",
+                    "completed",
+                    "playing",
+                    "dropped",
+                ],
+            }
+
+        # Validate rating if provided
+        if user_rating is not None:
+            if not isinstance(user_rating, (int, float)) or not (
+                1 <= user_rating <= 10
+            ):
+                return {
+                    "success": False,
+                    "error": "User rating must be a number between 1 and 10",
+                    "provided_rating": user_rating,
+                }
+
+        # Check if game already exists
+        existing_game = collection_manager.get_game(title)
+        if existing_game:
+            return {
+                "success": False,
+                "error": f"Game '{title}' already exists in {username}'s collection",
+                "existing_status": existing_game.status.value,
+                "existing_rating": existing_game.user_rating,
+                "suggestion": f"Use update_game_in_collection() to modify existing entry",
+            }
+
+        # Add game to collection
+        success = collection_manager.add_game(
+            title=title, status=game_status, user_rating=user_rating, notes=notes
+        )
+
+        if not success:
+            return {
+                "success": False,
+                "error": f"Failed to add '{title}' to collection",
+                "user": username,
+            }
+
+        # Get updated stats
+        stats = collection_manager.get_collection_stats()
+
+        return {
+            "success": True,
+            "message": f"✅ Added '{title}' to {username}'s collection",
+            "game_details": {
+                "title": title,
+                "status": status,
+                "user_rating": user_rating,
+                "notes": notes,
+                "date_added": "now",
+            },
+            "collection_stats": {
+                "total_games": stats.total_games,
+                "owned_games": stats.owned_games,
+                "wishlist_games": stats.wishlist_games,
+                "completed_games": stats.completed_games,
+                "average_rating": stats.average_rating,
+            },
+            "user_context": {
+                "username": username,
+                "user_id": current_user.get("user_id", "unknown"),
+            },
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Collection management error: {str(e)}",
+            "action": "add_game_to_collection",
+            "game": title,
+        }
+
+
+@register_for_llm(
+    description="Update an existing game in current user's collection - Input: title (str), **updates - Output: Dict with success status and updated game info"
+)
+@register_for_execution()
+def update_game_in_collection(title: str, **updates) -> Dict:
+    """
+    Update an existing game in current user's collection.
+
+    Allows modification of game status, rating, notes, and other properties.
+
+    Args:
+        title (str): Game title to update
+        **updates: Fields to update (status, user_rating, notes, hours_played, etc.)
+
+    Returns:
+        Dict with success status, message, and updated game info
+    """
+    try:
+        from utils.game_collection_manager import (
+            get_game_collection_manager,
+            GameStatus,
+        )
+        from utils.user_management import get_current_user_info
+
+        # Get current user info
+        user_info = get_current_user_info()
+        current_user = user_info.get("current_user", {})
+        username = current_user.get("username", "Unknown User")
+
+        # Get collection manager
+        collection_manager = get_game_collection_manager()
+
+        # Check if game exists
+        existing_game = collection_manager.get_game(title)
+        if not existing_game:
+            return {
+                "success": False,
+                "error": f"Game '{title}' not found in {username}'s collection",
+                "suggestion": "Use add_game_to_collection() to add new games",
+                "user": username,
+            }
+
+        # Validate updates
+        if "status" in updates:
+            try:
+                GameStatus(updates["status"].lower())
+            except ValueError:
+                return {
+                    "success": False,
+                    "error": f"Invalid status '{updates['status']}'. Valid options: owned, wishlist, not_interested, completed, playing, dropped",
+                }
+
+        if "user_rating" in updates and updates["user_rating"] is not None:
+            rating = updates["user_rating"]
+            if not isinstance(rating, (int, float)) or not (1 <= rating <= 10):
+                return {
+                    "success": False,
+                    "error": "User rating must be a number between 1 and 10",
+                    "provided_rating": rating,
+                }
+
+        # Store original values for comparison
+        original_status = existing_game.status.value
+        original_rating = existing_game.user_rating
+
+        # Update game
+        success = collection_manager.update_game(title, **updates)
+
+        if not success:
+            return {
+                "success": False,
+                "error": f"Failed to update '{title}' in collection",
+                "user": username,
+            }
+
+        # Get updated game
+        updated_game = collection_manager.get_game(title)
+
+        # Get updated stats
+        stats = collection_manager.get_collection_stats()
+
+        return {
+            "success": True,
+            "message": f"✅ Updated '{title}' in {username}'s collection",
+            "changes": {
+                "title": title,
+                "updates_applied": updates,
+                "before": {"status": original_status, "user_rating": original_rating},
+                "after": {
+                    "status": updated_game.status.value,
+                    "user_rating": updated_game.user_rating,
+                    "notes": updated_game.notes,
+                    "last_updated": updated_game.last_updated.isoformat(),
+                },
+            },
+            "collection_stats": {
+                "total_games": stats.total_games,
+                "owned_games": stats.owned_games,
+                "average_rating": stats.average_rating,
+            },
+            "user_context": {
+                "username": username,
+                "user_id": current_user.get("user_id", "unknown"),
+            },
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Collection update error: {str(e)}",
+            "action": "update_game_in_collection",
+            "game": title,
+        }
+
+
+@register_for_llm(
+    description="Get current user's game collection with optional filtering - Input: status_filter (str, optional), limit (int, optional) - Output: Dict with collection and statistics"
+)
+@register_for_execution()
+def get_user_game_collection(status_filter: str = None, limit: int = 1000) -> Dict:
+    """
+    Get current user's game collection with optional filtering.
+
+    Retrieves personal game library with comprehensive details and statistics.
+
+    Args:
+        status_filter (str, optional): Filter by status - "owned", "wishlist", "completed", etc.
+        limit (int): Maximum number of games to return (default: 50)
+
+    Returns:
+        Dict with collection games, statistics, and user info
+    """
+    try:
+        from utils.game_collection_manager import (
+            get_game_collection_manager,
+            GameStatus,
+        )
+        from utils.user_management import get_current_user_info
+
+        # Get current user info
+        user_info = get_current_user_info()
+        current_user = user_info.get("current_user", {})
+        username = current_user.get("username", "Unknown User")
+
+        # Get collection manager
+        collection_manager = get_game_collection_manager()
+
+        # Parse status filter
+        status_enum = None
+        if status_filter:
+            try:
+                status_enum = GameStatus(status_filter.lower())
+            except ValueError:
+                return {
+                    "success": False,
+                    "error": f"Invalid status filter '{status_filter}'",
+                    "valid_statuses": [
+                        "owned",
+                        "wishlist",
+                        "not_interested",
+                        "completed",
+                        "playing",
+                        "dropped",
+                    ],
+                }
+
+        # Get collection
+        games = collection_manager.get_collection(status_enum)
+
+        # Apply limit
+        if len(games) > limit:
+            games = games[:limit]
+            truncated = True
+        else:
+            truncated = False
+
+        # Format games data
+        games_data = []
+        for game in games:
+            games_data.append(
+                {
+                    "title": game.title,
+                    "status": game.status.value,
+                    "platform": game.platform,
+                    "user_rating": game.user_rating,
+                    "hours_played": game.hours_played,
+                    "purchase_price": game.purchase_price,
+                    "current_price": game.current_price,
+                    "notes": game.notes,
+                    "tags": game.tags,
+                    "import_source": game.import_source.value,
+                    "date_added": game.date_added.strftime("%Y-%m-%d"),
+                    "last_updated": game.last_updated.strftime("%Y-%m-%d"),
+                }
+            )
+
+        # Get collection statistics
+        stats = collection_manager.get_collection_stats()
+
+        return {
+            "success": True,
+            "message": f"Retrieved {len(games_data)} games from {username}'s collection",
+            "collection": {
+                "games": games_data,
+                "total_returned": len(games_data),
+                "truncated": truncated,
+                "filter_applied": status_filter,
+            },
+            "statistics": {
+                "total_games": stats.total_games,
+                "owned_games": stats.owned_games,
+                "wishlist_games": stats.wishlist_games,
+                "completed_games": stats.completed_games,
+                "total_value": round(stats.total_value, 2),
+                "average_rating": stats.average_rating,
+                "total_hours": stats.total_hours,
+                "platforms": stats.platforms,
+                "import_sources": stats.import_sources,
+                "last_updated": stats.last_updated.strftime("%Y-%m-%d %H:%M"),
+            },
+            "user_context": {
+                "username": username,
+                "user_id": current_user.get("user_id", "unknown"),
+                "role": current_user.get("role", "unknown"),
+            },
+            "insights": {
+                "most_played_platform": (
+                    max(stats.platforms.items(), key=lambda x: x[1])[0]
+                    if stats.platforms
+                    else "None"
+                ),
+                "completion_rate": (
+                    round((stats.completed_games / stats.total_games * 100), 1)
+                    if stats.total_games > 0
+                    else 0
+                ),
+                "average_hours_per_game": (
+                    round(stats.total_hours / stats.owned_games, 1)
+                    if stats.owned_games > 0
+                    else 0
+                ),
+            },
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Collection retrieval error: {str(e)}",
+            "action": "get_user_game_collection",
+        }
+
+
+@register_for_llm(
+    description="Check if current user owns a specific game - Input: title (str) - Output: Dict with ownership status"
+)
+@register_for_execution()
+def check_if_game_owned(title: str) -> Dict:
+    """
+    Check if current user owns a specific game in their collection.
+
+    Quick lookup to determine game ownership status for recommendation filtering.
+
+    Args:
+        title (str): Game title to check
+
+    Returns:
+        Dict with ownership status and game details if found
+    """
+    try:
+        from utils.game_collection_manager import get_game_collection_manager
+        from utils.user_management import get_current_user_info
+
+        # Get current user info
+        user_info = get_current_user_info()
+        current_user = user_info.get("current_user", {})
+        username = current_user.get("username", "Unknown User")
+
+        # Get collection manager
+        collection_manager = get_game_collection_manager()
+
+        # Check if game exists in collection
+        game = collection_manager.get_game(title)
+
+        if game:
+            return {
+                "success": True,
+                "owned": True,
+                "game_found": True,
+                "game_details": {
+                    "title": game.title,
+                    "status": game.status.value,
+                    "platform": game.platform,
+                    "user_rating": game.user_rating,
+                    "hours_played": game.hours_played,
+                    "date_added": game.date_added.strftime("%Y-%m-%d"),
+                    "notes": game.notes,
+                },
+                "user_context": {
+                    "username": username,
+                    "user_id": current_user.get("user_id", "unknown"),
+                },
+            }
+        else:
+            return {
+                "success": True,
+                "owned": False,
+                "game_found": False,
+                "message": f"'{title}' not found in {username}'s collection",
+                "suggestion": "This game could be added to your collection or recommended for purchase",
+                "user_context": {
+                    "username": username,
+                    "user_id": current_user.get("user_id", "unknown"),
+                },
+            }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Ownership check error: {str(e)}",
+            "action": "check_if_game_owned",
+            "game": title,
+        }
+
+
+@register_for_llm(
+    description="Remove a game from current user's collection - Input: title (str) - Output: Dict with success status"
+)
+@register_for_execution()
+def remove_game_from_collection(title: str) -> Dict:
+    """
+    Remove a game from current user's collection.
+
+    Permanently deletes game entry from personal library.
+
+    Args:
+        title (str): Game title to remove from collection
+
+    Returns:
+        Dict with success status and collection stats
+    """
+    try:
+        from utils.game_collection_manager import get_game_collection_manager
+        from utils.user_management import get_current_user_info
+
+        # Get current user info
+        user_info = get_current_user_info()
+        current_user = user_info.get("current_user", {})
+        username = current_user.get("username", "Unknown User")
+
+        # Get collection manager
+        collection_manager = get_game_collection_manager()
+
+        # Check if game exists
+        existing_game = collection_manager.get_game(title)
+        if not existing_game:
+            return {
+                "success": False,
+                "error": f"Game '{title}' not found in {username}'s collection",
+                "user": username,
+            }
+
+        # Store game details before removal
+        game_details = {
+            "title": existing_game.title,
+            "status": existing_game.status.value,
+            "user_rating": existing_game.user_rating,
+            "date_added": existing_game.date_added.isoformat(),
+        }
+
+        # Remove game
+        success = collection_manager.remove_game(title)
+
+        if not success:
+            return {
+                "success": False,
+                "error": f"Failed to remove '{title}' from collection",
+                "user": username,
+            }
+
+        # Get updated stats
+        stats = collection_manager.get_collection_stats()
+
+        return {
+            "success": True,
+            "message": f"✅ Removed '{title}' from {username}'s collection",
+            "removed_game": game_details,
+            "collection_stats": {
+                "total_games": stats.total_games,
+                "owned_games": stats.owned_games,
+                "wishlist_games": stats.wishlist_games,
+                "average_rating": stats.average_rating,
+            },
+            "user_context": {
+                "username": username,
+                "user_id": current_user.get("user_id", "unknown"),
+            },
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Collection removal error: {str(e)}",
+            "action": "remove_game_from_collection",
+            "game": title,
+        }
+
+
+@register_for_llm(
+    description="Import games from DekuDeals collection URL to current user's collection - Input: collection_url (str), import_status (str, optional) - Output: Dict with import results and statistics"
+)
+@register_for_execution()
+def import_dekudeals_collection(
+    collection_url: str, import_status: str = "owned"
+) -> Dict:
+    """Import games from DekuDeals collection URL to current user's collection."""
+    try:
+        logger.info(f"🌐 Starting DekuDeals collection import: {collection_url}")
+
+        # Validate collection URL
+        if not collection_url or "dekudeals.com/collection/" not in collection_url:
+            error_msg = "Invalid DekuDeals collection URL format. Expected: https://www.dekudeals.com/collection/{id}"
+            logger.error(f"❌ {error_msg}")
+            return {
+                "success": False,
+                "error": error_msg,
+                "collection_url": collection_url,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        # Import the scraping function
+        try:
+            from deku_tools import scrape_dekudeals_collection
+        except ImportError:
+            error_msg = "DekuDeals scraping functionality not available"
+            logger.error(f"❌ {error_msg}")
+            return {
+                "success": False,
+                "error": error_msg,
+                "collection_url": collection_url,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        # Parse the collection
+        scraping_result = scrape_dekudeals_collection(collection_url)
+
+        if not scraping_result.get("success", False):
+            error_msg = f"Failed to parse DekuDeals collection: {scraping_result.get('error', 'Unknown error')}"
+            logger.error(f"❌ {error_msg}")
+            return {
+                "success": False,
+                "error": error_msg,
+                "collection_url": collection_url,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        games_list = scraping_result.get("games", [])
+        games_found = scraping_result.get("game_count", 0)
+
+        if not games_list:
+            error_msg = "No games found in the DekuDeals collection"
+            logger.error(f"❌ {error_msg}")
+            return {
+                "success": False,
+                "error": error_msg,
+                "collection_url": collection_url,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        # Import games to collection
+        imported_count = 0
+        skipped_count = 0
+        failed_count = 0
+
+        for i, game_title in enumerate(games_list, 1):
+            try:
+                add_result = add_game_to_collection(
+                    title=game_title,
+                    status=import_status,
+                    notes=f"Imported from DekuDeals collection: {collection_url}",
+                )
+
+                if add_result.get("success", False):
+                    imported_count += 1
+                    logger.info(f"✅ {i:2d}/{games_found}: {game_title} imported")
+                else:
+                    error = add_result.get("error", "Unknown error")
+                    if "already exists" in error.lower():
+                        skipped_count += 1
+                        logger.info(
+                            f"⏭️ {i:2d}/{games_found}: {game_title} (already in collection)"
+                        )
+                    else:
+                        failed_count += 1
+                        logger.warning(
+                            f"❌ {i:2d}/{games_found}: {game_title} - {error}"
+                        )
+
+            except Exception as e:
+                failed_count += 1
+                logger.error(
+                    f"❌ {i:2d}/{games_found}: {game_title} - Exception: {str(e)}"
+                )
+
+        # Create result
+        result = {
+            "success": True,
+            "collection_url": collection_url,
+            "import_summary": {
+                "games_found": games_found,
+                "games_imported": imported_count,
+                "games_skipped": skipped_count,
+                "games_failed": failed_count,
+                "import_status": import_status,
+                "success_rate": (
+                    round((imported_count / games_found) * 100, 1)
+                    if games_found > 0
+                    else 0
+                ),
+            },
+            "timestamp": datetime.now().isoformat(),
+        }
+
+        logger.info(
+            f"✅ DekuDeals import completed: {imported_count}/{games_found} games imported"
+        )
+        return result
+
+    except Exception as e:
+        error_msg = f"Error importing DekuDeals collection: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {
+            "success": False,
+            "error": error_msg,
+            "collection_url": collection_url,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+@register_for_llm(
+    description="Analyze game with collection awareness - checks ownership before analysis - Input: game_name (str), force_analysis (bool, optional) - Output: Dict with analysis or ownership info"
+)
+@register_for_execution()
+def analyze_game_with_collection_awareness(
+    game_name: str, force_analysis: bool = False
+) -> Dict[str, Any]:
+    """
+    Analizuje grę z uwzględnieniem kolekcji użytkownika - sprawdza czy gra jest już posiadana.
+
+    DESCRIPTION: Smart game analysis that checks user collection first and provides appropriate insights
+    ARGS:
+        game_name (str): Name of game to analyze
+        force_analysis (bool): Force analysis even if game is owned (default: False)
+    RETURNS:
+        Dict: Collection-aware analysis results or ownership information
+    RAISES:
+        ValueError: When game name is empty
+    """
+    from agent_tools import search_and_scrape_game
+
+    try:
+        logger.info(f"🔍 Starting collection-aware analysis for: {game_name}")
+
+        # Input validation
+        if not game_name or not game_name.strip():
+            raise ValueError("Game name cannot be empty")
+
+        game_name = game_name.strip()
+
+        # Check if user owns the game
+        ownership_result = check_if_game_owned(game_name)
+
+        if ownership_result.get("success", False) and ownership_result.get(
+            "owned", False
+        ):
+            # User already owns this game
+            game_details = ownership_result.get("game_details", {})
+            user_context = ownership_result.get("user_context", {})
+            username = user_context.get("username", "Unknown User")
+
+            logger.info(f"👑 Game '{game_name}' is already owned by {username}")
+
+            if not force_analysis:
+                # Provide ownership-specific analysis instead of purchase analysis
+                owned_analysis = {
+                    "success": True,
+                    "analysis_type": "already_owned",
+                    "game_title": game_details.get("title", game_name),
+                    "ownership_status": {
+                        "owned": True,
+                        "status": game_details.get("status", "owned"),
+                        "platform": game_details.get("platform", "Nintendo Switch"),
+                        "user_rating": game_details.get("user_rating"),
+                        "hours_played": game_details.get("hours_played"),
+                        "date_added": game_details.get("date_added"),
+                        "notes": game_details.get("notes", ""),
+                    },
+                    "ownership_insights": {
+                        "main_message": f"✅ You already own '{game_details.get('title', game_name)}' in your collection!",
+                        "recommendation": "No need to purchase - you can play this game anytime",
+                        "suggested_actions": [
+                            "Rate this game in your collection if you haven't already",
+                            "Add notes about your experience with the game",
+                            "Update your playtime if you've been playing",
+                            "Mark as completed if you've finished it",
+                        ],
+                    },
+                    "collection_context": {
+                        "owner": username,
+                        "collection_status": game_details.get("status", "owned"),
+                        "personal_rating": game_details.get("user_rating"),
+                        "play_time": game_details.get("hours_played"),
+                    },
+                    "alternative_suggestions": {
+                        "message": "Since you already own this game, here are some alternatives:",
+                        "suggestions": [
+                            "Look for similar games in the same genre",
+                            "Check for DLC or expansion content for this game",
+                            "Find games from the same developer or franchise",
+                            "Get personalized recommendations based on your collection",
+                        ],
+                    },
+                    "next_steps": [
+                        "Use 'Update game in collection' to modify rating or status",
+                        "Export your collection to backup your game library",
+                        "Get personalized recommendations for new games to try",
+                        "Add more games to your wishlist for future purchases",
+                    ],
+                    "user_context": user_context,
+                    "timestamp": datetime.now().isoformat(),
+                }
+
+                logger.info(f"✅ Provided ownership-specific insights for {username}")
+                return owned_analysis
+            else:
+                logger.info(
+                    f"🔄 Force analysis requested - continuing with standard analysis"
+                )
+                # Add ownership context to standard analysis
+                standard_result = search_and_scrape_game(game_name)
+                if standard_result.get("success", False):
+                    standard_result["ownership_context"] = {
+                        "already_owned": True,
+                        "ownership_details": game_details,
+                        "analysis_note": "⚠️ Note: You already own this game. This analysis is for informational purposes.",
+                    }
+                return standard_result
+
+        else:
+            # User doesn't own the game - proceed with standard purchase analysis
+            logger.info(
+                f"🎮 Game '{game_name}' not in collection - proceeding with purchase analysis"
+            )
+
+            # Perform standard analysis
+            analysis_result = search_and_scrape_game(game_name)
+
+            if analysis_result.get("success", False):
+                # Add collection context to analysis
+                analysis_result["collection_context"] = {
+                    "already_owned": False,
+                    "analysis_type": "purchase_decision",
+                    "collection_note": "This game is not in your collection - analysis focused on purchase decision",
+                }
+
+                # Add suggestion to add to collection after analysis
+                if "next_steps" not in analysis_result:
+                    analysis_result["next_steps"] = []
+
+                analysis_result["next_steps"].extend(
+                    [
+                        "Add this game to your wishlist if interested",
+                        "Add to collection once purchased",
+                        "Check for similar games you might also like",
+                    ]
+                )
+
+            return analysis_result
+
+    except Exception as e:
+        error_msg = f"Error in collection-aware analysis: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {
+            "success": False,
+            "error": error_msg,
+            "game_name": game_name,
+            "analysis_type": "error",
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+@register_for_llm(
+    description="Generate personalized game recommendations based on user's collection - Input: recommendation_type (str, optional), max_recommendations (int, optional), user_id (str, optional) - Output: Dict with collection-based recommendations"
+)
+@register_for_execution()
+def generate_collection_based_recommendations(
+    recommendation_type: str = "similar",
+    max_recommendations: int = 10,
+    user_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Generate personalized game recommendations based on user's collection.
+
+    Analyzes user's owned games to provide intelligent recommendations using
+    collection preferences, genre patterns, developer preferences, and ML insights.
+
+    Args:
+        recommendation_type (str): Type of recommendations - "similar", "discovery", "developer", or "complementary"
+        max_recommendations (int): Maximum number of recommendations to return (default: 10)
+        user_id (str, optional): User ID, defaults to current user
+
+    Returns:
+        Dict: Collection-based recommendations with analysis and insights
+    """
+    try:
+        logger.info(
+            f"🎯 Generating {recommendation_type} recommendations (max: {max_recommendations})"
+        )
+
+        # Import collection recommendation engine
+        try:
+            from utils.collection_recommendation_engine import (
+                get_collection_recommendation_engine,
+                RecommendationType,
+            )
+        except ImportError as e:
+            logger.error(f"Collection recommendation engine not available: {e}")
+            return {
+                "success": False,
+                "error": "Collection recommendation engine not available",
+                "recommendation_type": recommendation_type,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        # Get current user info
+        from utils.user_management import get_current_user_info
+
+        user_info = get_current_user_info()
+        current_user = user_info.get("current_user", {})
+        username = current_user.get("username", "Unknown User")
+
+        if not user_id:
+            user_id = current_user.get("user_id", "default_user")
+
+        # Validate recommendation type
+        valid_types = ["similar", "discovery", "developer", "complementary"]
+        if recommendation_type not in valid_types:
+            return {
+                "success": False,
+                "error": f"Invalid recommendation type '{recommendation_type}'. Valid types: {valid_types}",
+                "valid_types": valid_types,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        # Convert to enum
+        rec_type = RecommendationType(recommendation_type.lower())
+
+        # Get recommendation engine
+        engine = get_collection_recommendation_engine()
+
+        # Check if user has sufficient collection for recommendations
+        collection_insights = engine.get_collection_insights(user_id)
+        readiness = collection_insights.get("recommendations_readiness", {})
+
+        if not readiness.get(recommendation_type, False):
+            collection_size = collection_insights.get("collection_summary", {}).get(
+                "total_games", 0
+            )
+            min_requirements = {
+                "similar": "at least 3 games with genres and ratings",
+                "discovery": "at least 5 games",
+                "developer": "games from at least 1 developer with good ratings",
+                "complementary": "at least 6 games with diverse genres",
+            }
+
+            return {
+                "success": False,
+                "error": f"Insufficient collection for {recommendation_type} recommendations",
+                "requirements": {
+                    "needed": min_requirements.get(recommendation_type, "more games"),
+                    "current_collection_size": collection_size,
+                    "recommendation_type": recommendation_type,
+                },
+                "suggestions": [
+                    "Add more games to your collection first",
+                    "Import your Steam library or DekuDeals collection",
+                    "Try a different recommendation type",
+                    "Rate the games in your current collection",
+                ],
+                "collection_insights": collection_insights,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        # Generate recommendations
+        recommendations = engine.generate_recommendations(
+            recommendation_type=rec_type,
+            max_recommendations=max_recommendations,
+            user_id=user_id,
+        )
+
+        if not recommendations:
+            return {
+                "success": False,
+                "error": f"No {recommendation_type} recommendations could be generated",
+                "possible_reasons": [
+                    "Limited candidate games available",
+                    "Collection preferences too specific",
+                    "No suitable matches found in current game database",
+                ],
+                "suggestions": [
+                    "Try a different recommendation type",
+                    "Increase max_recommendations parameter",
+                    "Add more variety to your game collection",
+                ],
+                "collection_insights": collection_insights,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        # Format recommendations for output
+        formatted_recommendations = []
+        for rec in recommendations:
+            formatted_rec = {
+                "game_title": rec.game_title,
+                "recommendation_score": round(rec.final_score, 2),
+                "confidence": rec.confidence.value,
+                "primary_reason": rec.primary_reason,
+                "detailed_reasons": rec.detailed_reasons,
+                "similar_owned_games": rec.similar_owned_games,
+                "genre_matches": rec.genre_matches,
+                "developer_matches": rec.developer_matches,
+                "scoring_breakdown": {
+                    "base_score": round(rec.base_score, 2),
+                    "preference_bonus": round(rec.preference_bonus, 2),
+                    "diversity_bonus": round(rec.diversity_bonus, 2),
+                    "ml_adjustment": round(rec.ml_adjustment, 2),
+                    "final_score": round(rec.final_score, 2),
+                },
+                "warnings": rec.warnings,
+                "notes": rec.notes,
+            }
+            formatted_recommendations.append(formatted_rec)
+
+        # Generate recommendation summary
+        collection_summary = collection_insights.get("collection_summary", {})
+        genre_prefs = collection_insights.get("genre_preferences", {})
+
+        recommendation_summary = {
+            "total_recommendations": len(formatted_recommendations),
+            "recommendation_type": recommendation_type,
+            "based_on_collection": {
+                "total_games": collection_summary.get("total_games", 0),
+                "average_rating": collection_summary.get("average_rating", 0),
+                "confidence_level": collection_summary.get(
+                    "confidence_level", "unknown"
+                ),
+            },
+            "key_preferences": {
+                "favorite_genres": genre_prefs.get("favorites", [])[:3],
+                "recent_trends": collection_insights.get("recent_trends", {}).get(
+                    "recent_preferences", []
+                )[:3],
+            },
+        }
+
+        # Generate personalized message
+        if recommendation_type == "similar":
+            message = f"Found {len(formatted_recommendations)} games similar to your favorites"
+        elif recommendation_type == "discovery":
+            message = f"Discovered {len(formatted_recommendations)} games in new genres for you to explore"
+        elif recommendation_type == "developer":
+            message = f"Found {len(formatted_recommendations)} games from your favorite developers"
+        elif recommendation_type == "complementary":
+            message = f"Found {len(formatted_recommendations)} games to complement your collection"
+        else:
+            message = f"Generated {len(formatted_recommendations)} personalized recommendations"
+
+        result = {
+            "success": True,
+            "message": message,
+            "recommendations": formatted_recommendations,
+            "recommendation_summary": recommendation_summary,
+            "collection_insights": collection_insights,
+            "user_context": {
+                "username": username,
+                "user_id": user_id,
+                "recommendation_type": recommendation_type,
+                "max_requested": max_recommendations,
+            },
+            "next_steps": [
+                "Analyze any interesting games with search_and_scrape_game()",
+                "Add promising games to your wishlist",
+                "Get detailed reviews for top recommendations",
+                "Try different recommendation types for variety",
+            ],
+            "metadata": {
+                "algorithm_version": "1.0.0",
+                "generation_time": datetime.now().isoformat(),
+                "ml_enhanced": True,
+            },
+        }
+
+        logger.info(
+            f"✅ Generated {len(formatted_recommendations)} {recommendation_type} recommendations for {username}"
+        )
+        return result
+
+    except Exception as e:
+        error_msg = f"Error generating collection-based recommendations: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {
+            "success": False,
+            "error": error_msg,
+            "recommendation_type": recommendation_type,
+            "max_recommendations": max_recommendations,
+            "user_id": user_id,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+@register_for_llm(
+    description="View your game collection summary with completion status and recommendation readiness"
+)
+@register_for_execution()
+def view_collection_summary() -> Dict[str, Any]:
+    """
+    View comprehensive summary of your game collection.
+
+    Returns:
+        Dict containing collection statistics, completion status, and recommendation readiness
+    """
+    try:
+        from utils.collection_updater import get_collection_updater
+
+        updater = get_collection_updater()
+        summary = updater.view_collection_summary()
+
+        logger.info(
+            f"📊 Collection Summary: {summary['total_games']} games, {summary['completion_percentage']}% complete"
+        )
+
+        return {
+            "success": True,
+            "collection_summary": summary,
+            "message": f"Collection has {summary['total_games']} games with {summary['rated_games']} ratings and {summary['tagged_games']} genre tags",
+            "recommendation_ready": summary["recommendation_ready"],
+            "completion_percentage": summary["completion_percentage"],
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Error viewing collection summary: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+@register_for_llm(
+    description="List games in your collection with their current ratings and tags"
+)
+@register_for_execution()
+def list_collection_games(
+    status_filter: Optional[str] = None, limit: int = 1000
+) -> Dict[str, Any]:
+    """
+    List games in your collection with their metadata.
+
+    Args:
+        status_filter: Filter by status ('owned', 'wishlist', 'completed', etc.)
+        limit: Maximum number of games to return (default: 20)
+
+    Returns:
+        Dict containing list of games with their current metadata
+    """
+    try:
+        from utils.collection_updater import get_collection_updater
+
+        updater = get_collection_updater()
+        games = updater.list_games(status_filter=status_filter, limit=limit)
+
+        logger.info(f"📋 Listed {len(games)} games from collection")
+
+        return {
+            "success": True,
+            "games": games,
+            "total_shown": len(games),
+            "status_filter": status_filter,
+            "message": f"Found {len(games)} games"
+            + (f" with status '{status_filter}'" if status_filter else ""),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Error listing games: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+@register_for_llm(
+    description="Get detailed information about a specific game in your collection"
+)
+@register_for_execution()
+def get_game_details(title: str) -> Dict[str, Any]:
+    """
+    Get detailed information about a specific game in your collection.
+
+    Args:
+        title: Title of the game to get details for
+
+    Returns:
+        Dict containing detailed game information and suggested improvements
+    """
+    try:
+        from utils.collection_updater import get_collection_updater
+
+        updater = get_collection_updater()
+        details = updater.get_game_details(title)
+
+        if not details:
+            return {
+                "success": False,
+                "error": f"Game '{title}' not found in collection",
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        logger.info(
+            f"🎮 Retrieved details for '{title}' (Status: {details['completion_status']})"
+        )
+
+        return {
+            "success": True,
+            "game_details": details,
+            "message": f"Retrieved details for '{title}'",
+            "completion_status": details["completion_status"],
+            "suggested_genres": details["suggested_genres"],
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting game details: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+@register_for_llm(
+    description="Update a game in your collection with rating, tags, or other metadata"
+)
+@register_for_execution()
+def update_collection_game(
+    title: str,
+    user_rating: Optional[float] = None,
+    tags: Optional[str] = None,
+    status: Optional[str] = None,
+    hours_played: Optional[int] = None,
+    notes: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Update a game in your collection with new metadata.
+
+    Args:
+        title: Title of the game to update
+        user_rating: Your rating for the game (1.0-10.0)
+        tags: Comma-separated genre tags (e.g., "Action,RPG,Indie")
+        status: Game status ('owned', 'wishlist', 'completed', etc.)
+        hours_played: Number of hours played
+        notes: Additional notes about the game
+
+    Returns:
+        Dict indicating success/failure and details
+    """
+    try:
+        from utils.collection_updater import get_collection_updater
+
+        updater = get_collection_updater()
+
+        # Build updates dictionary
+        updates = {}
+        if user_rating is not None:
+            updates["user_rating"] = user_rating
+        if tags is not None:
+            updates["tags"] = tags
+        if status is not None:
+            updates["status"] = status
+        if hours_played is not None:
+            updates["hours_played"] = hours_played
+        if notes is not None:
+            updates["notes"] = notes
+
+        if not updates:
+            return {
+                "success": False,
+                "error": "No updates provided",
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        success, message = updater.update_game(title, updates)
+
+        if success:
+            logger.info(f"✅ Updated '{title}' with {len(updates)} fields")
+
+            # Get updated details
+            updated_details = updater.get_game_details(title)
+
+            return {
+                "success": True,
+                "message": message,
+                "updates_applied": updates,
+                "updated_game": updated_details,
+                "completion_status": (
+                    updated_details["completion_status"]
+                    if updated_details
+                    else "unknown"
+                ),
+                "timestamp": datetime.now().isoformat(),
+            }
+        else:
+            return {
+                "success": False,
+                "error": message,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+    except Exception as e:
+        logger.error(f"Error updating game: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+@register_for_llm(description="Get automatic suggestions for improving your collection")
+@register_for_execution()
+def get_collection_improvement_suggestions() -> Dict[str, Any]:
+    """
+    Get automatic suggestions for improving your collection to enable recommendations.
+
+    Returns:
+        Dict containing suggestions for missing ratings, tags, and priority games
+    """
+    try:
+        from utils.collection_updater import get_collection_updater
+
+        updater = get_collection_updater()
+        suggestions = updater.auto_suggest_improvements()
+
+        logger.info(
+            f"💡 Generated improvement suggestions: {len(suggestions['missing_ratings'])} need ratings, "
+            f"{len(suggestions['missing_tags'])} need tags"
+        )
+
+        return {
+            "success": True,
+            "suggestions": suggestions,
+            "summary": {
+                "games_needing_ratings": len(suggestions["missing_ratings"]),
+                "games_needing_tags": len(suggestions["missing_tags"]),
+                "priority_games": len(suggestions["priority_games"]),
+                "completion_tips": len(suggestions["completion_tips"]),
+            },
+            "message": f"Found {len(suggestions['missing_ratings'])} games needing ratings and {len(suggestions['missing_tags'])} needing tags",
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting suggestions: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+@register_for_llm(description="Batch update ratings for multiple games at once")
+@register_for_execution()
+def batch_update_game_ratings(ratings_data: str) -> Dict[str, Any]:
+    """
+    Batch update ratings for multiple games.
+
+    Args:
+        ratings_data: JSON string of game titles and ratings, e.g., '{"Bastion": 8.5, "Minecraft": 9.0}'
+
+    Returns:
+        Dict containing batch update results
+    """
+    try:
+        from utils.collection_updater import get_collection_updater
+        import json
+
+        # Parse ratings data
+        try:
+            ratings_dict = json.loads(ratings_data)
+        except json.JSONDecodeError:
+            return {
+                "success": False,
+                "error": "Invalid JSON format for ratings_data",
+                "example": '{"Bastion": 8.5, "Minecraft": 9.0}',
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        updater = get_collection_updater()
+        success_count, error_count, errors = updater.batch_update_ratings(ratings_dict)
+
+        logger.info(
+            f"🔄 Batch rating update: {success_count} success, {error_count} errors"
+        )
+
+        return {
+            "success": success_count > 0,
+            "results": {
+                "successful_updates": success_count,
+                "failed_updates": error_count,
+                "total_attempted": len(ratings_dict),
+                "errors": errors,
+            },
+            "message": f"Updated ratings for {success_count} games"
+            + (f", {error_count} errors" if error_count > 0 else ""),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Error in batch rating update: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+@register_for_llm(
+    description="Validate if your collection is ready for recommendations"
+)
+@register_for_execution()
+def validate_collection_readiness() -> Dict[str, Any]:
+    """
+    Validate if your collection has enough data for recommendations.
+
+    Returns:
+        Dict containing validation results and readiness status for each recommendation type
+    """
+    try:
+        from utils.collection_updater import get_collection_updater
+
+        updater = get_collection_updater()
+        validation = updater.validate_collection_for_recommendations()
+
+        logger.info(
+            f"🔍 Collection validation: {'Ready' if validation.get('ready') else 'Not Ready'} for recommendations"
+        )
+
+        return {
+            "success": True,
+            "validation_results": validation,
+            "overall_ready": validation.get("ready", False),
+            "collection_size": validation.get("collection_size", 0),
+            "confidence_level": validation.get("confidence_level", "unknown"),
+            "message": (
+                "Collection is ready for recommendations!"
+                if validation.get("ready")
+                else "Collection needs more ratings and tags for recommendations"
+            ),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Error validating collection: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+@register_for_llm(description="Quick update a game with both rating and tags")
+@register_for_execution()
+def quick_game_update(title: str, rating: float, tags: str) -> Dict[str, Any]:
+    """
+    Quick way to update a game with both rating and genre tags.
+
+    Args:
+        title: Game title to update
+        rating: Your rating (1.0-10.0)
+        tags: Comma-separated genre tags (e.g., "Action,RPG,Indie")
+
+    Returns:
+        Dict indicating success and updated game details
+    """
+    try:
+        from utils.collection_updater import quick_update_game
+
+        # Convert tags string to list
+        tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
+
+        success, message = quick_update_game(title, rating=rating, tags=tag_list)
+
+        if success:
+            logger.info(f"⚡ Quick updated '{title}': {rating}/10, tags: {tag_list}")
+
+            # Get updated details
+            from utils.collection_updater import get_collection_updater
+
+            updater = get_collection_updater()
+            updated_details = updater.get_game_details(title)
+
+            return {
+                "success": True,
+                "message": message,
+                "rating_added": rating,
+                "tags_added": tag_list,
+                "updated_game": updated_details,
+                "completion_status": (
+                    updated_details["completion_status"]
+                    if updated_details
+                    else "unknown"
+                ),
+                "timestamp": datetime.now().isoformat(),
+            }
+        else:
+            return {
+                "success": False,
+                "error": message,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+    except Exception as e:
+        logger.error(f"Error in quick game update: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+@register_for_llm(
+    description="Bulk update all owned games with metadata (genres, ratings, etc.) to enable recommendations"
+)
+@register_for_execution()
+def bulk_update_owned_games_metadata(
+    auto_suggest_genres: bool = True,
+    update_missing_only: bool = True,
+    include_hours_estimates: bool = False,
+) -> Dict[str, Any]:
+    """
+    Bulk update all owned games with metadata to enable better recommendations.
+
+    Args:
+        auto_suggest_genres: Automatically suggest genres based on game titles
+        update_missing_only: Only update games that are missing metadata (safer)
+        include_hours_estimates: Add estimated hours played based on genres
+
+    Returns:
+        Dict with bulk update results and statistics
+    """
+    try:
+        from utils.collection_updater import get_collection_updater
+
+        updater = get_collection_updater()
+
+        # Get current collection
+        user_id, collection = updater.get_current_user_collection()
+
+        if not collection:
+            return {
+                "success": False,
+                "error": "No games found in collection",
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        # Filter to owned games only
+        owned_games = [
+            game
+            for game in collection
+            if game.status.value in ["owned", "completed", "playing"]
+        ]
+
+        if not owned_games:
+            return {
+                "success": False,
+                "error": "No owned games found in collection",
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        results = {
+            "success": True,
+            "total_games_processed": len(owned_games),
+            "games_updated": 0,
+            "games_skipped": 0,
+            "update_details": [],
+            "errors": [],
+            "metadata_improvements": {
+                "genres_added": 0,
+                "ratings_suggested": 0,
+                "hours_estimated": 0,
+            },
+            "recommendation_readiness": {
+                "before": {"rated": 0, "tagged": 0, "complete": 0},
+                "after": {"rated": 0, "tagged": 0, "complete": 0},
+            },
+            "timestamp": datetime.now().isoformat(),
+        }
+
+        # Calculate before stats
+        for game in owned_games:
+            if game.user_rating:
+                results["recommendation_readiness"]["before"]["rated"] += 1
+            if game.tags:
+                results["recommendation_readiness"]["before"]["tagged"] += 1
+            if game.user_rating and game.tags:
+                results["recommendation_readiness"]["before"]["complete"] += 1
+
+        logger.info(
+            f"🎮 Starting bulk metadata update for {len(owned_games)} owned games"
+        )
+
+        # Process each owned game
+        for game in owned_games:
+            try:
+                game_title = game.title
+                needs_update = False
+                updates = {}
+                update_reasons = []
+
+                # Check if we should update this game
+                if update_missing_only:
+                    if not game.user_rating:
+                        needs_update = True
+                    if not game.tags:
+                        needs_update = True
+                else:
+                    needs_update = True
+
+                if not needs_update:
+                    results["games_skipped"] += 1
+                    continue
+
+                # 1. Auto-suggest genres if enabled and missing
+                if auto_suggest_genres and not game.tags:
+                    suggested_genres = updater._suggest_genres_for_game(game_title)
+                    if suggested_genres:
+                        updates["tags"] = suggested_genres
+                        update_reasons.append(
+                            f"Added genres: {', '.join(suggested_genres[:3])}"
+                        )
+                        results["metadata_improvements"]["genres_added"] += 1
+
+                # 2. Suggest rating ranges if missing (don't auto-assign, just suggest)
+                if not game.user_rating:
+                    # Suggest rating ranges based on game patterns
+                    rating_suggestion = _suggest_rating_for_game(game_title)
+                    if rating_suggestion:
+                        update_reasons.append(f"Rating suggestion: {rating_suggestion}")
+                        results["metadata_improvements"]["ratings_suggested"] += 1
+
+                # 3. Estimate hours if enabled and missing
+                if include_hours_estimates and not game.hours_played and game.tags:
+                    estimated_hours = _estimate_hours_for_genres(game.tags)
+                    if estimated_hours:
+                        updates["hours_played"] = estimated_hours
+                        update_reasons.append(f"Estimated hours: {estimated_hours}")
+                        results["metadata_improvements"]["hours_estimated"] += 1
+
+                # Apply updates if any
+                if updates:
+                    success, message = updater.update_game(game_title, updates)
+
+                    if success:
+                        results["games_updated"] += 1
+                        results["update_details"].append(
+                            {
+                                "game": game_title,
+                                "updates": updates,
+                                "reasons": update_reasons,
+                                "status": "success",
+                            }
+                        )
+                        logger.info(
+                            f"✅ Updated '{game_title}': {', '.join(update_reasons)}"
+                        )
+                    else:
+                        results["errors"].append(
+                            {
+                                "game": game_title,
+                                "error": message,
+                                "attempted_updates": updates,
+                            }
+                        )
+                        logger.warning(f"❌ Failed to update '{game_title}': {message}")
+                else:
+                    results["games_skipped"] += 1
+                    results["update_details"].append(
+                        {
+                            "game": game_title,
+                            "reasons": ["No updates needed"],
+                            "status": "skipped",
+                        }
+                    )
+
+            except Exception as e:
+                results["errors"].append(
+                    {
+                        "game": game.title,
+                        "error": str(e),
+                        "attempted_updates": "unknown",
+                    }
+                )
+                logger.error(f"❌ Error updating '{game.title}': {e}")
+
+        # Calculate after stats
+        _, updated_collection = updater.get_current_user_collection()
+        updated_owned_games = [
+            game
+            for game in updated_collection
+            if game.status.value in ["owned", "completed", "playing"]
+        ]
+
+        for game in updated_owned_games:
+            if game.user_rating:
+                results["recommendation_readiness"]["after"]["rated"] += 1
+            if game.tags:
+                results["recommendation_readiness"]["after"]["tagged"] += 1
+            if game.user_rating and game.tags:
+                results["recommendation_readiness"]["after"]["complete"] += 1
+
+        # Calculate improvement
+        before_complete = results["recommendation_readiness"]["before"]["complete"]
+        after_complete = results["recommendation_readiness"]["after"]["complete"]
+        improvement = after_complete - before_complete
+
+        results["message"] = (
+            f"Bulk update completed: {results['games_updated']} games updated, {improvement} games now recommendation-ready"
+        )
+
+        logger.info(
+            f"🎉 Bulk metadata update completed: {results['games_updated']} games updated"
+        )
+
+        return results
+
+    except Exception as e:
+        logger.error(f"Error in bulk metadata update: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+def _suggest_rating_for_game(game_title: str) -> str:
+    """Suggest rating ranges based on game patterns."""
+    title_lower = game_title.lower()
+
+    # High-rated indie darlings
+    if any(
+        game in title_lower
+        for game in ["hollow knight", "celeste", "hades", "dead cells", "ori and"]
+    ):
+        return "8.5-9.5/10 (Critically acclaimed indie)"
+
+    # Nintendo first-party
+    if any(game in title_lower for game in ["mario", "zelda", "metroid", "pokemon"]):
+        return "8.0-9.0/10 (Nintendo first-party quality)"
+
+    # Popular indies
+    if any(
+        game in title_lower
+        for game in ["steamworld", "shovel knight", "cuphead", "binding of isaac"]
+    ):
+        return "7.5-8.5/10 (Well-reviewed indie)"
+
+    # Final Fantasy series
+    if "final fantasy" in title_lower:
+        return "7.0-8.0/10 (JRPG series)"
+
+    # Overcooked party games
+    if any(
+        game in title_lower for game in ["overcooked", "moving out", "human fall flat"]
+    ):
+        return "7.5-8.5/10 (Great party game)"
+
+    return "7.0-8.0/10 (General suggestion - please adjust based on your experience)"
+
+
+def _estimate_hours_for_genres(tags: List[str]) -> Optional[int]:
+    """Estimate hours played based on game genres."""
+    if not tags:
+        return None
+
+    # Genre hour estimates (conservative)
+    genre_hours = {
+        "RPG": 40,
+        "Strategy": 25,
+        "Simulation": 30,
+        "Metroidvania": 20,
+        "Platformer": 12,
+        "Puzzle": 8,
+        "Action": 15,
+        "Adventure": 18,
+        "Indie": 10,
+        "Party": 5,
+        "Racing": 8,
+        "Fighting": 10,
+    }
+
+    # Calculate average based on tags
+    total_hours = 0
+    valid_genres = 0
+
+    for tag in tags:
+        if tag in genre_hours:
+            total_hours += genre_hours[tag]
+            valid_genres += 1
+
+    if valid_genres > 0:
+        return int(total_hours / valid_genres)
+
+    return 15  # Default estimate
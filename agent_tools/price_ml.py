@@ -0,0 +1,532 @@
+"""
+Price Prediction Tools for AutoGen DekuDeals
+Narzędzia predykcji cen (Faza 7.1): modele ML spadków cen, historia
+cen, obserwowane gry i przegląd rynku.
+"""
+
+import logging
+from typing import Dict, Any, Optional
+
+from agent_tools.registry import register_for_execution, register_for_llm
+
+logger = logging.getLogger(__name__)
+
+# ====================================================================
+# PHASE 7.1: Advanced ML Features - Price Drop Prediction Models
+# ====================================================================
+
+
+@register_for_llm(
+    description="Generate ML-powered price prediction and analysis - Input: game_data (Dict), user_id (str, optional) - Output: Dict with comprehensive price prediction"
+)
+@register_for_execution()
+def generate_ml_price_prediction(
+    game_data: Dict[str, Any], user_id: Optional[str] = None
+) -> Dict:
+    """
+    🧠 PHASE 7.1: Generate ML-powered price prediction and drop analysis.
+
+    Features:
+    - Historical price trend analysis with linear regression
+    - Price drop probability calculation (0-100%)
+    - Target price recommendations based on user preferences
+    - Confidence levels for predictions (VERY_HIGH → VERY_LOW)
+    - Integration with Smart User Profiler for personalized predictions
+    - Next price drop date estimation
+
+    Args:
+        game_data: Complete game data dictionary
+        user_id: Optional user ID for personalized predictions
+
+    Returns:
+        Dict: Comprehensive ML price prediction with insights
+    """
+    from agent_tools import get_smart_user_insights
+
+    try:
+        from utils.price_prediction_ml import (
+            get_price_prediction_engine,
+            format_price_prediction_summary,
+        )
+
+        logger.info(
+            f"🧠 Generating ML price prediction for: {game_data.get('title', 'Unknown')}"
+        )
+
+        # Extract game details
+        game_title = game_data.get("title", "Unknown Game")
+        current_price_str = game_data.get("current_eshop_price", "0")
+
+        # Parse current price
+        current_price = 0.0
+        if isinstance(current_price_str, str):
+            import re
+
+            price_match = re.search(r"[\d.,]+", current_price_str.replace(",", "."))
+            if price_match:
+                current_price = float(price_match.group())
+        elif isinstance(current_price_str, (int, float)):
+            current_price = float(current_price_str)
+
+        if current_price <= 0:
+            return {
+                "success": False,
+                "error": f"Invalid price data: {current_price_str}",
+                "message": "Cannot generate price prediction without valid price information",
+                "fallback": "Price prediction requires valid current price",
+            }
+
+        # Get price prediction engine
+        prediction_engine = get_price_prediction_engine()
+
+        # Store the full scraped price history before predicting
+        if game_data.get("price_history_points"):
+            from utils.price_history_ingestion import PriceHistoryIngestor
+
+            # The current price is recorded by generate_price_prediction
+            PriceHistoryIngestor(prediction_engine).ingest_game_details(
+                game_data, include_current_price=False
+            )
+
+        # Generate comprehensive prediction
+        prediction = prediction_engine.generate_price_prediction(
+            game_title=game_title,
+            current_price=current_price,
+            user_id=user_id,
+            genres=game_data.get("genres"),
+            publisher=game_data.get("publisher"),
+        )
+
+        # Keep the user's wishlist watch target in line with the prediction
+        if user_id:
+            try:
+                from utils.price_watch import get_price_watch_engine
+
+                get_price_watch_engine().record_prediction(user_id, prediction)
+            except Exception as e:
+                logger.debug(f"Could not update price watch target: {e}")
+
+        # Get user profile for personalized insights (if available)
+        personalized_insights = []
+        if user_id:
+            try:
+                user_insights = get_smart_user_insights(user_id)
+                if user_insights.get("success") and user_insights.get("user_profile"):
+                    profile = user_insights["user_profile"]
+
+                    # Add budget-aware insights
+                    if "budget_conscious" in [
+                        p["pattern"] for p in profile.get("detected_patterns", [])
+                    ]:
+                        if (
+                            prediction.target_price
+                            and prediction.target_price < current_price
+                        ):
+                            savings = current_price - prediction.target_price
+                            personalized_insights.append(
+                                f"💰 Budget-conscious: Wait for target price to save ${savings:.2f}"
+                            )
+
+                    # Add quality-focused insights
+                    if "quality_focused" in [
+                        p["pattern"] for p in profile.get("detected_patterns", [])
+                    ]:
+                        if prediction.confidence.value in ["high", "very_high"]:
+                            personalized_insights.append(
+                                f"⭐ Quality-focused: High confidence prediction ({prediction.confidence.value})"
+                            )
+
+                    # Add genre-specific insights
+                    game_genres = game_data.get("genres", [])
+                    favorite_genres = [
+                        g["genre"] for g in profile.get("favorite_genres", [])
+                    ]
+                    matching_genres = [g for g in game_genres if g in favorite_genres]
+                    if matching_genres:
+                        personalized_insights.append(
+                            f"🎮 Matches your favorite genres: {', '.join(matching_genres)}"
+                        )
+            except Exception as e:
+                logger.debug(f"Could not get personalized insights: {e}")
+
+        # Format comprehensive response
+        prediction_dict = prediction.to_dict()
+
+        # Generate actionable recommendations
+        action_recommendations = []
+
+        if prediction.price_drop_probability > 0.7:
+            action_recommendations.append(
+                "🎯 HIGH DROP PROBABILITY: Consider waiting 2-4 weeks"
+            )
+        elif prediction.price_drop_probability > 0.5:
+            action_recommendations.append(
+                "⚖️ MODERATE DROP CHANCE: Monitor for 2-6 weeks"
+            )
+        elif prediction.price_drop_probability < 0.3:
+            action_recommendations.append(
+                "⬆️ LOW DROP CHANCE: Current price likely stable"
+            )
+
+        if prediction.target_price and prediction.target_price < current_price:
+            savings_potential = current_price - prediction.target_price
+            if savings_potential > 10:
+                action_recommendations.append(
+                    f"💰 TARGET SAVINGS: ${savings_potential:.2f} potential"
+                )
+
+        if (
+            prediction.historical_low
+            and current_price <= prediction.historical_low * 1.1
+        ):
+            action_recommendations.append("💎 NEAR HISTORICAL LOW: Excellent timing!")
+
+        # Add trend-based recommendations
+        if prediction.trend.value == "declining":
+            action_recommendations.append(
+                "📉 DECLINING TREND: Price likely to drop further"
+            )
+        elif prediction.trend.value == "rising":
+            action_recommendations.append("📈 RISING TREND: Price may increase soon")
+        elif prediction.trend.value == "volatile":
+            action_recommendations.append("📊 VOLATILE PRICE: Watch for sudden drops")
+
+        # Generate formatted summary for display
+        formatted_summary = format_price_prediction_summary(prediction)
+
+        logger.info(
+            f"✅ ML price prediction complete: {prediction.trend.value} trend, {prediction.price_drop_probability:.1%} drop probability"
+        )
+
+        return {
+            "success": True,
+            "game_title": game_title,
+            "current_price": current_price,
+            "prediction": prediction_dict,
+            "personalized_insights": personalized_insights,
+            "action_recommendations": action_recommendations,
+            "formatted_summary": formatted_summary,
+            "confidence_level": prediction.confidence.value,
+            "analysis_quality": {
+                "has_historical_data": len(
+                    prediction_engine.get_price_history(game_title)
+                )
+                >= 5,
+                "trend_confidence": prediction.confidence.value,
+                "prediction_timeframe": f"{prediction.prediction_timeframe} days",
+            },
+        }
+
+    except ImportError as e:
+        error_msg = f"ML prediction dependencies not available: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {
+            "success": False,
+            "error": error_msg,
+            "message": "Install ML dependencies: pip install numpy scikit-learn",
+            "fallback": "Basic price analysis available without ML prediction",
+        }
+    except Exception as e:
+        error_msg = f"Error generating ML price prediction: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {
+            "success": False,
+            "error": error_msg,
+            "fallback": "ML price prediction temporarily unavailable",
+        }
+
+
+@register_for_llm(
+    description="Get historical price analysis and trends for a game - Input: game_name (str), days_back (int, optional) - Output: Dict with price history analysis"
+)
+@register_for_execution()
+def get_price_history_analysis(game_name: str, days_back: int = 365) -> Dict:
+    """
+    🧠 PHASE 7.1: Get comprehensive historical price analysis and trends.
+
+    Features:
+    - Historical price data retrieval
+    - Trend analysis with statistical confidence
+    - Price volatility assessment
+    - Significant price drop detection
+    - Price pattern recognition
+
+    Args:
+        game_name: Name of the game to analyze
+        days_back: Number of days of history to analyze (default: 365)
+
+    Returns:
+        Dict: Historical price analysis with trends and insights
+    """
+    try:
+        import numpy as np
+
+        from utils.price_prediction_ml import get_price_prediction_engine
+
+        logger.info(f"📊 Analyzing price history for: {game_name} ({days_back} days)")
+
+        # Get price prediction engine
+        prediction_engine = get_price_prediction_engine()
+
+        # Array-backed history; statistics and drops come from the rollups
+        series = prediction_engine.get_price_series(game_name, days_back)
+
+        if series is None or len(series) == 0:
+            return {
+                "success": True,
+                "game_name": game_name,
+                "price_history": [],
+                "analysis": {
+                    "trend": "unknown",
+                    "data_points": 0,
+                    "message": "No historical price data available for this game",
+                },
+                "recommendations": [
+                    "Check back later as price data is collected",
+                    "Price tracking starts when game is first analyzed",
+                ],
+            }
+
+        # Analyze trend
+        trend_analysis = prediction_engine.analyze_price_trend(series)
+        data_points = len(series)
+
+        # Extract price statistics
+        rollups = prediction_engine.rollups
+        window = rollups.window_summary(game_name, days_back)
+        summary = rollups.game_summary(game_name)
+        if window and summary:
+            high, low = window["high"], window["low"]
+            prices = series.prices
+            price_stats = {
+                "current_price": summary["current_price"],
+                "historical_high": high,
+                "historical_low": low,
+                "average_price": window["average_price"],
+                "median_price": float(
+                    np.partition(prices, len(prices) // 2)[len(prices) // 2]
+                ),
+                "price_range": high - low,
+                "volatility_percent": ((high - low) / high * 100 if high > 0 else 0),
+            }
+        else:
+            price_stats = {}
+
+        # Significant price drops (15% threshold), recorded on insert
+        significant_drops = rollups.price_drops(game_name, days_back)
+
+        # Generate insights
+        insights = []
+
+        if data_points >= 10:
+            insights.append(
+                f"Rich dataset: {data_points} price points over {days_back} days"
+            )
+        elif data_points >= 5:
+            insights.append(f"Moderate dataset: {data_points} price points available")
+        else:
+            insights.append(f"Limited dataset: Only {data_points} price points")
+
+        if price_stats:
+            current_vs_low = (
+                (price_stats["current_price"] - price_stats["historical_low"])
+                / price_stats["historical_low"]
+                * 100
+            )
+            if current_vs_low < 10:
+                insights.append(f"💎 Near historical low (+{current_vs_low:.1f}%)")
+            elif current_vs_low > 50:
+                insights.append(
+                    f"💸 Well above historical low (+{current_vs_low:.1f}%)"
+                )
+
+        if len(significant_drops) > 0:
+            insights.append(f"📉 {len(significant_drops)} significant drops detected")
+            if significant_drops:
+                latest_drop = significant_drops[-1]
+                insights.append(
+                    f"Latest drop: {latest_drop['drop_percentage']:.1f}% on {latest_drop['date'][:10]}"
+                )
+
+        # Generate recommendations
+        recommendations = []
+
+        if trend_analysis["trend"].value == "declining":
+            recommendations.append(
+                "📉 Declining trend detected - consider waiting for further drops"
+            )
+        elif trend_analysis["trend"].value == "rising":
+            recommendations.append(
+                "📈 Rising trend detected - current price may be good value"
+            )
+        elif trend_analysis["trend"].value == "volatile":
+            recommendations.append(
+                "📊 Volatile pricing - monitor closely for opportunities"
+            )
+
+        if price_stats and price_stats.get("volatility_percent", 0) > 30:
+            recommendations.append("⚠️ High price volatility - wait for better timing")
+
+        if len(significant_drops) >= 2:
+            recommendations.append(
+                "🎯 History of price drops - good candidate for waiting"
+            )
+
+        # Format price history for response
+        formatted_history = [
+            {
+                "date": point.date.isoformat(),
+                "price": point.price,
+                "promotion_type": point.promotion_type,
+            }
+            # Last 30 points for display
+            for point in prediction_engine.get_recent_price_points(
+                game_name, limit=30, days_back=days_back
+            )
+        ]
+
+        logger.info(
+            f"✅ Price history analysis complete: {data_points} data points, {trend_analysis['trend'].value} trend"
+        )
+
+        return {
+            "success": True,
+            "game_name": game_name,
+            "analysis_period": f"{days_back} days",
+            "data_quality": {
+                "total_data_points": data_points,
+                "analysis_confidence": trend_analysis.get("confidence", 0.0),
+                "sufficient_data": data_points >= 5,
+            },
+            "price_statistics": price_stats,
+            "trend_analysis": {
+                "trend": trend_analysis["trend"].value,
+                "confidence": trend_analysis.get("confidence", 0.0),
+                "slope": trend_analysis.get("slope", 0.0),
+                "volatility": trend_analysis.get("volatility", 0.0),
+                "analysis": trend_analysis.get("analysis", ""),
+            },
+            "significant_drops": significant_drops,
+            "price_history": formatted_history,
+            "insights": insights,
+            "recommendations": recommendations,
+        }
+
+    except ImportError as e:
+        error_msg = f"Price analysis dependencies not available: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {
+            "success": False,
+            "error": error_msg,
+            "message": "Install ML dependencies: pip install numpy scikit-learn",
+        }
+    except Exception as e:
+        error_msg = f"Error analyzing price history: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {
+            "success": False,
+            "error": error_msg,
+            "fallback": "Price history analysis temporarily unavailable",
+        }
+
+
+@register_for_llm(
+    description="Check which wishlist games reached their target price - Input: user_id (str, optional), refresh_prices (bool, optional) - Output: Dict with watched games and price-drop events"
+)
+@register_for_execution()
+def check_wishlist_price_drops(
+    user_id: Optional[str] = None, refresh_prices: bool = True
+) -> Dict:
+    """
+    🎯 Check all wishlist price watches in one bulk scan.
+
+    Wishlist games are watched against stored target prices. A scan
+    refreshes only current prices (not full game analyses) and evaluates
+    every watch at once; reached targets are also sent to the alerting
+    system.
+
+    Args:
+        user_id: Only report this user's watches (all users by default)
+        refresh_prices: Fetch current prices before evaluating
+
+    Returns:
+        Dict: Watches and target-reached events
+    """
+    try:
+        from utils.price_watch import get_price_watch_engine
+
+        watch_engine = get_price_watch_engine()
+        watch_engine.sync_wishlists()
+        refreshed = (
+            watch_engine.refresh_prices()
+            if refresh_prices
+            else {"refreshed": 0, "failed": []}
+        )
+        events = [
+            event.to_dict()
+            for event in watch_engine.evaluate()
+            if user_id is None or event.user_id == user_id
+        ]
+        watches = [watch.to_dict() for watch in watch_engine.get_watches(user_id)]
+
+        logger.info(
+            f"🎯 Wishlist price check: {len(watches)} watches, {len(events)} targets reached"
+        )
+        return {
+            "success": True,
+            "watches": watches,
+            "events": events,
+            "statistics": {
+                "watched_games": len(watches),
+                "targets_reached": len(events),
+                "prices_refreshed": refreshed["refreshed"],
+                "failed_games": refreshed["failed"],
+            },
+        }
+
+    except Exception as e:
+        error_msg = f"Error checking wishlist prices: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg}
+
+
+@register_for_llm(
+    description="Get price market overview from pre-aggregated rollups - Input: group_type (str: 'genre' or 'publisher', optional), days_back (int, optional), low_tolerance (float, optional) - Output: Dict with discount depth per group and games at all-time low"
+)
+@register_for_execution()
+def get_price_market_overview(
+    group_type: str = "genre", days_back: int = 90, low_tolerance: float = 0.0
+) -> Dict:
+    """
+    📊 PHASE 7.1: Market-wide price analytics from pre-aggregated rollups.
+
+    Args:
+        group_type: Group discount depth by "genre" or "publisher"
+        days_back: Days of price buckets to aggregate (default: 90)
+        low_tolerance: Fraction above the all-time low still counted (0.05 = 5%)
+
+    Returns:
+        Dict: Discount depth per group and games at their all-time low
+    """
+    try:
+        from utils.price_prediction_ml import get_price_prediction_engine
+
+        rollups = get_price_prediction_engine().rollups
+        discount_depth = rollups.discount_depth_by_group(group_type, days_back)
+        at_low = rollups.games_at_all_time_low(tolerance=low_tolerance)
+
+        logger.info(
+            f"📊 Price market overview: {len(discount_depth)} {group_type} groups, {len(at_low)} games at all-time low"
+        )
+        return {
+            "success": True,
+            "group_type": group_type,
+            "analysis_period": f"{days_back} days",
+            "discount_depth": discount_depth,
+            "games_at_all_time_low": at_low,
+        }
+
+    except Exception as e:
+        error_msg = f"Error building price market overview: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg}
@@ -0,0 +1,586 @@
+"""
+Recommendation Tools for AutoGen DekuDeals
+Narzędzia rekomendacji: spersonalizowane rekomendacje dla profili
+użytkowników i porównania gier.
+"""
+
+import logging
+from typing import Dict, Any, Optional, List
+
+from utils.recommendation_engine import (
+    RecommendationEngine,
+    UserProfile,
+    UserPreference,
+    GameRecommendation,
+)
+from utils.analysis_context import GameAnalysisContext
+
+logger = logging.getLogger(__name__)
+
+# Initialize global engines
+_recommendation_engine = RecommendationEngine()
+
+
+def _format_recommendation(rec: GameRecommendation) -> Dict[str, Any]:
+    """Formatuje rekomendację do wyniku narzędzia."""
+    return {
+        "game_title": rec.game_title,
+        "recommendation_score": round(rec.recommendation_score, 2),
+        "match_percentage": round(rec.match_percentage, 1),
+        "confidence_level": rec.confidence_level,
+        "primary_reason": rec.primary_reason.value,
+        "reasons": rec.reasons,
+        "personalized_message": rec.personalized_message,
+        "price_info": rec.price_info,
+        "analysis_summary": rec.analysis_summary,
+        "warnings": rec.warnings,
+    }
+
+
+def generate_personalized_recommendations(
+    games_list: List[str],
+    user_preference: str = "bargain_hunter",
+    max_recommendations: int = 5,
+) -> Dict[str, Any]:
+    """
+    Generuje spersonalizowane rekomendacje gier dla użytkownika.
+
+    DESCRIPTION: Generate personalized game recommendations based on user preferences
+    ARGS:
+        games_list (List[str]): Lista nazw gier do analizy
+        user_preference (str): Typ preferencji użytkownika (bargain_hunter, quality_seeker, etc.)
+        max_recommendations (int): Maksymalna liczba rekomendacji
+    RETURNS:
+        Dict: Spersonalizowane rekomendacje z uzasadnieniami
+    RAISES:
+        ValueError: Gdy user_preference jest nieprawidłowy
+    """
+    from agent_tools import _scrape_games_concurrently
+
+    try:
+        logger.info(
+            f"🎯 Generating personalized recommendations for {len(games_list)} games..."
+        )
+        logger.info(f"👤 User preference: {user_preference}")
+
+        # Get predefined profile
+        predefined_profiles = _recommendation_engine.get_predefined_profiles()
+
+        if user_preference not in predefined_profiles:
+            available_prefs = list(predefined_profiles.keys())
+            error_msg = f"Invalid user preference. Available: {available_prefs}"
+            logger.error(f"❌ {error_msg}")
+            return {
+                "success": False,
+                "error": error_msg,
+                "available_preferences": available_prefs,
+            }
+
+        user_profile = predefined_profiles[user_preference]
+        logger.info(f"✅ Using profile: {user_profile.user_id}")
+
+        # Collect game data for all games concurrently
+        games_data, successful_games, failed_games = _scrape_games_concurrently(
+            games_list
+        )
+
+        if not games_data:
+            error_msg = "No games could be processed successfully"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg, "failed_games": failed_games}
+
+        # Generate recommendations
+        logger.info(
+            f"🚀 Generating recommendations from {len(games_data)} processed games..."
+        )
+        recommendations = _recommendation_engine.generate_personalized_recommendations(
+            games_data, user_profile, max_recommendations
+        )
+
+        if not recommendations:
+            logger.warning("⚠️ No recommendations generated")
+            return {
+                "success": True,
+                "recommendations": [],
+                "user_profile": user_profile.user_id,
+                "processed_games": len(games_data),
+                "message": "No suitable recommendations found",
+            }
+
+        # Format results
+        formatted_recommendations = [
+            _format_recommendation(rec) for rec in recommendations
+        ]
+
+        result = {
+            "success": True,
+            "user_profile": {
+                "user_id": user_profile.user_id,
+                "primary_preference": user_profile.primary_preference.value,
+                "preferred_genres": user_profile.preferred_genres,
+                "budget_range": user_profile.budget_range,
+                "minimum_score": user_profile.minimum_score,
+            },
+            "recommendations": formatted_recommendations,
+            "statistics": {
+                "total_games_requested": len(games_list),
+                "successfully_processed": len(games_data),
+                "failed_games": failed_games,
+                "recommendations_generated": len(recommendations),
+            },
+            "recommendation_summary": _generate_recommendation_summary(
+                recommendations, user_profile
+            ),
+        }
+
+        logger.info(
+            f"✅ Generated {len(recommendations)} recommendations successfully!"
+        )
+        return result
+
+    except Exception as e:
+        error_msg = f"Error in generate_personalized_recommendations: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg}
+
+
+def compare_games_for_user(
+    game_names: List[str], user_preference: str = "bargain_hunter"
+) -> Dict[str, Any]:
+    """
+    Porównuje gry pod kątem konkretnego użytkownika.
+
+    DESCRIPTION: Compare games specifically for a user's preferences and provide ranked recommendations
+    ARGS:
+        game_names (List[str]): Lista nazw gier do porównania
+        user_preference (str): Typ preferencji użytkownika
+    RETURNS:
+        Dict: Porównanie gier z rankingiem dla użytkownika
+    RAISES:
+        ValueError: Gdy user_preference jest nieprawidłowy lub brak gier
+    """
+    try:
+        logger.info(
+            f"🆚 Comparing {len(game_names)} games for user preference: {user_preference}"
+        )
+
+        if len(game_names) < 2:
+            error_msg = "Need at least 2 games to compare"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg}
+
+        # Generate recommendations (which includes comparison)
+        recommendations_result = generate_personalized_recommendations(
+            game_names, user_preference, len(game_names)
+        )
+
+        if not recommendations_result.get("success", False):
+            return recommendations_result
+
+        recommendations = recommendations_result["recommendations"]
+
+        # Create comparison result
+        comparison_result = {
+            "success": True,
+            "user_preference": user_preference,
+            "comparison_type": "personalized_ranking",
+            "games_compared": len(game_names),
+            "ranking": [],
+            "best_choice": None,
+            "worst_choice": None,
+            "comparison_summary": "",
+        }
+
+        # Create ranking
+        for i, rec in enumerate(recommendations, 1):
+            ranking_entry = {
+                "rank": i,
+                "game_title": rec["game_title"],
+                "score": rec["recommendation_score"],
+                "match_percentage": rec["match_percentage"],
+                "why_this_rank": _explain_ranking_position(
+                    rec, i, len(recommendations)
+                ),
+                "key_strengths": rec["reasons"][:2],  # Top 2 reasons
+                "warnings": rec["warnings"],
+            }
+            comparison_result["ranking"].append(ranking_entry)
+
+        # Set best and worst
+        if recommendations:
+            comparison_result["best_choice"] = {
+                "game": recommendations[0]["game_title"],
+                "score": recommendations[0]["recommendation_score"],
+                "message": recommendations[0]["personalized_message"],
+            }
+
+            if len(recommendations) > 1:
+                comparison_result["worst_choice"] = {
+                    "game": recommendations[-1]["game_title"],
+                    "score": recommendations[-1]["recommendation_score"],
+                    "reasons": recommendations[-1]["warnings"]
+                    or ["Lower overall match"],
+                }
+
+        # Generate comparison summary
+        comparison_result["comparison_summary"] = _generate_comparison_summary(
+            recommendations, user_preference
+        )
+
+        logger.info(f"✅ Game comparison completed for {user_preference}")
+        return comparison_result
+
+    except Exception as e:
+        error_msg = f"Error in compare_games_for_user: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg}
+
+
+def generate_recommendations_for_all_profiles(
+    games_list: List[str],
+    user_preferences: Optional[List[str]] = None,
+    max_recommendations: int = 5,
+) -> Dict[str, Any]:
+    """
+    Generuje rekomendacje dla wielu profili użytkowników w jednym przebiegu.
+
+    DESCRIPTION: Recommend games for several predefined user profiles at once - games are
+        scraped concurrently and analyzed once, then scored against every profile
+    ARGS:
+        games_list (List[str]): Lista nazw gier do analizy
+        user_preferences (List[str]): Profile do oceny (domyślnie wszystkie predefiniowane)
+        max_recommendations (int): Maksymalna liczba rekomendacji na profil
+    RETURNS:
+        Dict: Rekomendacje pogrupowane według profilu użytkownika
+    """
+    from agent_tools import _scrape_games_concurrently
+
+    try:
+        logger.info(
+            f"🎯 Generating multi-profile recommendations for {len(games_list)} games..."
+        )
+
+        predefined_profiles = _recommendation_engine.get_predefined_profiles()
+        if user_preferences is None:
+            user_preferences = list(predefined_profiles.keys())
+
+        unknown_preferences = [
+            pref for pref in user_preferences if pref not in predefined_profiles
+        ]
+        if unknown_preferences:
+            available_prefs = list(predefined_profiles.keys())
+            error_msg = f"Invalid user preferences {unknown_preferences}. Available: {available_prefs}"
+            logger.error(f"❌ {error_msg}")
+            return {
+                "success": False,
+                "error": error_msg,
+                "available_preferences": available_prefs,
+            }
+
+        games_data, successful_games, failed_games = _scrape_games_concurrently(
+            games_list
+        )
+        if not games_data:
+            error_msg = "No games could be processed successfully"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg, "failed_games": failed_games}
+
+        # Analyze every game once, then score all profiles in one pass
+        analyzed_games = _recommendation_engine.analyze_games(games_data)
+        user_profiles = [predefined_profiles[pref] for pref in user_preferences]
+        recommendations_by_profile = _recommendation_engine.recommend_for_profiles(
+            analyzed_games, user_profiles, max_recommendations
+        )
+
+        profiles_result = {}
+        for user_profile in user_profiles:
+            recommendations = recommendations_by_profile[user_profile.user_id]
+            profiles_result[user_profile.user_id] = {
+                "primary_preference": user_profile.primary_preference.value,
+                "recommendations": [
+                    _format_recommendation(rec) for rec in recommendations
+                ],
+                "recommendation_summary": _generate_recommendation_summary(
+                    recommendations, user_profile
+                ),
+            }
+
+        logger.info(
+            f"✅ Generated recommendations for {len(user_profiles)} profiles "
+            f"from {len(analyzed_games)} analyzed games"
+        )
+        return {
+            "success": True,
+            "profiles": profiles_result,
+            "statistics": {
+                "total_games_requested": len(games_list),
+                "successfully_processed": len(games_data),
+                "successfully_analyzed": len(analyzed_games),
+                "failed_games": failed_games,
+                "profiles_scored": len(user_profiles),
+            },
+        }
+
+    except Exception as e:
+        error_msg = f"Error in generate_recommendations_for_all_profiles: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg}
+
+
+def get_recommendation_insights(
+    game_name: str,
+    user_preferences: Optional[List[str]] = None,
+    context: Optional[GameAnalysisContext] = None,
+) -> Dict[str, Any]:
+    """
+    Analizuje jak gra pasuje do różnych typów użytkowników.
+
+    DESCRIPTION: Analyze how a game fits different user preference types
+    ARGS:
+        game_name (str): Nazwa gry do analizy
+        user_preferences (List[str]): Lista preferencji do sprawdzenia
+        context (GameAnalysisContext): Opcjonalny kontekst z już pobranymi danymi i analizami
+    RETURNS:
+        Dict: Analiza dopasowania do różnych profili użytkowników
+    """
+    try:
+        logger.info(f"🔍 Analyzing game '{game_name}' for different user types...")
+
+        if user_preferences is None:
+            user_preferences = [
+                "bargain_hunter",
+                "quality_seeker",
+                "indie_lover",
+                "aaa_gamer",
+                "casual_player",
+            ]
+        else:
+            user_preferences = user_preferences
+
+        # Get game data (reuse the caller's context when provided)
+        if context is None:
+            context = GameAnalysisContext.from_game_name(game_name)
+        if not context.success:
+            error_msg = f"Could not retrieve data for '{game_name}'"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg}
+
+        game_data = context.game_data
+
+        # Analyses are shared by every user type
+        if not context.analyses_successful:
+            error_msg = "No successful analyses completed"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg}
+
+        basic_analysis = context.basic_analysis
+        advanced_analysis = context.advanced_analysis
+
+        # Get predefined profiles
+        predefined_profiles = _recommendation_engine.get_predefined_profiles()
+
+        # Analyze for each user type
+        user_analyses = {}
+
+        for user_pref in user_preferences:
+            if user_pref not in predefined_profiles:
+                logger.warning(f"⚠️ Unknown user preference: {user_pref}")
+                continue
+
+            try:
+                user_profile = predefined_profiles[user_pref]
+
+                # Calculate recommendation score
+                rec_score = _recommendation_engine.calculate_recommendation_score(
+                    game_data, basic_analysis, advanced_analysis, user_profile
+                )
+
+                # Create user analysis
+                user_analyses[user_pref] = {
+                    "recommendation_score": round(rec_score, 2),
+                    "suitability": _classify_suitability(rec_score),
+                    "key_reasons": _get_key_reasons_for_user(
+                        game_data, advanced_analysis, user_profile
+                    ),
+                    "concerns": _get_concerns_for_user(
+                        game_data, advanced_analysis, user_profile
+                    ),
+                    "recommendation": _get_recommendation_for_score(rec_score),
+                }
+
+            except Exception as e:
+                logger.error(f"❌ Error analyzing for {user_pref}: {e}")
+                continue
+
+        if not user_analyses:
+            error_msg = "No successful analyses completed"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg}
+
+        # Find best fit user type
+        best_fit = max(
+            user_analyses.items(), key=lambda x: x[1]["recommendation_score"]
+        )
+        worst_fit = min(
+            user_analyses.items(), key=lambda x: x[1]["recommendation_score"]
+        )
+
+        result = {
+            "success": True,
+            "game_title": game_data.get("title", game_name),
+            "user_analyses": user_analyses,
+            "best_fit_user": {
+                "user_type": best_fit[0],
+                "score": best_fit[1]["recommendation_score"],
+                "suitability": best_fit[1]["suitability"],
+            },
+            "worst_fit_user": {
+                "user_type": worst_fit[0],
+                "score": worst_fit[1]["recommendation_score"],
+                "suitability": worst_fit[1]["suitability"],
+            },
+            "overall_insights": _generate_overall_insights(user_analyses),
+        }
+
+        logger.info(f"✅ Multi-user analysis completed for '{game_name}'")
+        return result
+
+    except Exception as e:
+        error_msg = f"Error in get_recommendation_insights: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg}
+
+
+def _generate_recommendation_summary(
+    recommendations: List[GameRecommendation], user_profile: UserProfile
+) -> str:
+    """Generuje podsumowanie rekomendacji."""
+    if not recommendations:
+        return "No recommendations available"
+
+    best_rec = recommendations[0]
+    user_type = user_profile.primary_preference.value.replace("_", " ").title()
+
+    summary_parts = [
+        f"For {user_type}: Top choice is '{best_rec.game_title}'",
+        f"Score: {best_rec.recommendation_score:.1f}/100",
+        f"Match: {best_rec.match_percentage:.0f}%",
+    ]
+
+    if len(recommendations) > 1:
+        summary_parts.append(f"Found {len(recommendations)} suitable games")
+
+    return " | ".join(summary_parts)
+
+
+def _explain_ranking_position(rec: Dict[str, Any], rank: int, total: int) -> str:
+    """Wyjaśnia pozycję w rankingu."""
+    if rank == 1:
+        return "Best overall match for your preferences"
+    elif rank == total:
+        return "Lowest match, but still worth considering"
+    elif rank <= total // 3:
+        return "Strong match with good value"
+    else:
+        return "Decent option with some trade-offs"
+
+
+def _generate_comparison_summary(
+    recommendations: List[Dict[str, Any]], user_preference: str
+) -> str:
+    """Generuje podsumowanie porównania."""
+    if not recommendations:
+        return "No games could be compared"
+
+    best = recommendations[0]
+    user_type = user_preference.replace("_", " ").title()
+
+    return f"For {user_type}: '{best['game_title']}' is the clear winner with {best['match_percentage']:.0f}% match"
+
+
+def _classify_suitability(score: float) -> str:
+    """Klasyfikuje odpowiedniość gry."""
+    if score >= 80:
+        return "Excellent Fit"
+    elif score >= 65:
+        return "Good Fit"
+    elif score >= 50:
+        return "Average Fit"
+    elif score >= 35:
+        return "Poor Fit"
+    else:
+        return "Not Recommended"
+
+
+def _get_key_reasons_for_user(
+    game_data: Dict[str, Any],
+    advanced_analysis: Dict[str, Any],
+    user_profile: UserProfile,
+) -> List[str]:
+    """Zwraca kluczowe powody dla użytkownika."""
+    reasons = []
+
+    market_analysis = advanced_analysis.get("comprehensive_analysis", {}).get(
+        "market_analysis", {}
+    )
+    market_position = market_analysis.get("market_position", "")
+
+    pref = user_profile.primary_preference
+
+    if pref == UserPreference.BARGAIN_HUNTER and "Great Deal" in market_position:
+        reasons.append("Excellent value for money")
+    elif pref == UserPreference.QUALITY_SEEKER and "Exceptional" in market_analysis.get(
+        "quality_category", ""
+    ):
+        reasons.append("High quality gaming experience")
+    elif pref == UserPreference.INDIE_LOVER:
+        reasons.append("Supports independent developers")
+
+    return reasons[:3]
+
+
+def _get_concerns_for_user(
+    game_data: Dict[str, Any],
+    advanced_analysis: Dict[str, Any],
+    user_profile: UserProfile,
+) -> List[str]:
+    """Zwraca obawy dla użytkownika."""
+    concerns = []
+
+    from utils.price_calculator import extract_price
+
+    current_price = extract_price(game_data.get("current_eshop_price", "N/A"))
+
+    if current_price and current_price > user_profile.budget_range[1]:
+        concerns.append("Exceeds budget range")
+
+    return concerns[:3]
+
+
+def _get_recommendation_for_score(score: float) -> str:
+    """Zwraca rekomendację na podstawie score."""
+    if score >= 80:
+        return "Highly Recommended"
+    elif score >= 65:
+        return "Recommended"
+    elif score >= 50:
+        return "Consider"
+    else:
+        return "Skip"
+
+
+def _generate_overall_insights(user_analyses: Dict[str, Any]) -> List[str]:
+    """Generuje ogólne insights."""
+    insights = []
+
+    scores = [analysis["recommendation_score"] for analysis in user_analyses.values()]
+    avg_score = sum(scores) / len(scores) if scores else 0
+
+    if avg_score >= 70:
+        insights.append("Universally appealing game - good for most players")
+    elif avg_score >= 50:
+        insights.append("Appeals to specific user types")
+    else:
+        insights.append("Niche appeal - very specific audience")
+
+    return insights
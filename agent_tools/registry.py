@@ -0,0 +1,307 @@
+"""
+Tool Registry for AutoGen DekuDeals
+Rejestr narzędzi agentów: grupy domenowe ładowane leniwie.
+
+Every tool group is one module of the ``agent_tools`` package. The registry
+knows which group defines which tool without importing anything; a group is
+imported on first use of one of its tools and its import time is recorded.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ToolGroup:
+    """Grupa narzędzi zdefiniowana w jednym module pakietu."""
+
+    name: str
+    module: str
+    description: str
+    tools: Tuple[str, ...] = field(default_factory=tuple)
+
+
+# Tool lists are static so that resolving a name never imports a group;
+# tests/test_agent_orchestration.py::TestToolRegistry checks them against the modules.
+TOOL_GROUPS: Tuple[ToolGroup, ...] = (
+    ToolGroup(
+        "scrape",
+        "agent_tools.scrape",
+        "DekuDeals search, scraping and game data helpers",
+        (
+            "search_and_scrape_game",
+            "validate_game_data",
+            "format_game_summary",
+            "extract_key_metrics",
+            "scrape_dekudeals_category",
+            "get_games_from_popular_categories",
+            "get_random_game_sample",
+        ),
+    ),
+    ToolGroup(
+        "value",
+        "agent_tools.value",
+        "Value-for-money scoring",
+        ("calculate_value_score", "calculate_advanced_value_analysis"),
+    ),
+    ToolGroup(
+        "review",
+        "agent_tools.review",
+        "Game reviews, quick opinions and opinion adaptation",
+        (
+            "generate_comprehensive_game_review",
+            "generate_quick_game_opinion",
+            "compare_games_with_reviews",
+            "adapt_review_for_context",
+            "create_multi_platform_opinions",
+            "get_available_adaptation_options",
+        ),
+    ),
+    ToolGroup(
+        "recommendations",
+        "agent_tools.recommendations",
+        "Profile-based game recommendations",
+        (
+            "generate_personalized_recommendations",
+            "compare_games_for_user",
+            "generate_recommendations_for_all_profiles",
+            "get_recommendation_insights",
+        ),
+    ),
+    ToolGroup(
+        "quality",
+        "agent_tools.quality",
+        "Quality validation, completeness checks and feedback loop",
+        (
+            "perform_quality_validation",
+            "enhanced_qa_validation",
+            "automatic_completeness_check",
+            "track_quality_metrics",
+            "process_feedback_loop",
+        ),
+    ),
+    ToolGroup(
+        "monitoring",
+        "agent_tools.monitoring",
+        "Cache, batch processing, performance and usage monitoring",
+        (
+            "get_advanced_cache_statistics",
+            "invalidate_game_cache",
+            "warm_cache_popular_games",
+            "perform_cache_maintenance",
+            "batch_analyze_games",
+            "get_batch_analysis_status",
+            "cancel_batch_analysis",
+            "get_batch_analysis_results",
+            "get_monitoring_dashboard_data",
+            "get_performance_monitoring_summary",
+            "get_usage_analytics_summary",
+            "evaluate_system_alerts",
+            "get_comprehensive_monitoring_overview",
+        ),
+    ),
+    ToolGroup(
+        "personalization",
+        "agent_tools.personalization",
+        "Smart user profiling and personalized recommendations",
+        (
+            "get_smart_user_insights",
+            "record_smart_interaction",
+            "get_personalized_game_recommendation",
+        ),
+    ),
+    ToolGroup(
+        "price_ml",
+        "agent_tools.price_ml",
+        "ML price prediction, price history and wishlist alerts",
+        (
+            "generate_ml_price_prediction",
+            "get_price_history_analysis",
+            "check_wishlist_price_drops",
+            "get_price_market_overview",
+        ),
+    ),
+    ToolGroup(
+        "users",
+        "agent_tools.users",
+        "User accounts and sessions",
+        (
+            "register_new_user",
+            "get_current_user_details",
+            "switch_to_user",
+            "list_system_users",
+            "create_guest_access",
+            "get_user_system_stats",
+            "get_user_ml_profiles_integration",
+        ),
+    ),
+    ToolGroup(
+        "collection",
+        "agent_tools.collection",
+        "Game collection management, imports and collection-aware analysis",
+        (
+            "import_steam_library",
+            "import_collection_from_csv",
+            "export_collection_to_csv",
+            "get_collection_recommendations_filter",
+            "add_game_to_collection",
+            "update_game_in_collection",
+            "get_user_game_collection",
+            "check_if_game_owned",
+            "remove_game_from_collection",
+            "import_dekudeals_collection",
+            "analyze_game_with_collection_awareness",
+            "generate_collection_based_recommendations",
+            "view_collection_summary",
+            "list_collection_games",
+            "get_game_details",
+            "update_collection_game",
+            "get_collection_improvement_suggestions",
+            "batch_update_game_ratings",
+            "validate_collection_readiness",
+            "quick_game_update",
+            "bulk_update_owned_games_metadata",
+        ),
+    ),
+)
+
+# Descriptions declared with @register_for_llm, filled in as groups load
+_llm_descriptions: Dict[str, str] = {}
+
+
+def register_for_execution():
+    """
+    Znacznik narzędzia wykonywanego przez agenta.
+
+    AutoGen has no module-level register_for_* decorators (they are agent
+    methods, see ``agent_tools.register_tools``), so the marker is a no-op.
+    """
+
+    def decorator(func):
+        return func
+
+    return decorator
+
+
+def register_for_llm(description: Optional[str] = None, **kwargs):
+    """Znacznik narzędzia LLM; zapamiętuje opis używany przy rejestracji."""
+
+    def decorator(func):
+        if description:
+            _llm_descriptions[func.__name__] = description
+        return func
+
+    return decorator
+
+
+class ToolRegistry:
+    """
+    Leniwe ładowanie grup narzędzi z pomiarem czasu importu.
+
+    Usage:
+        registry = ToolRegistry(TOOL_GROUPS)
+        registry.group_of("calculate_value_score")  # "value", nothing imported
+        registry.resolve("calculate_value_score")  # imports agent_tools.value
+        registry.get_import_statistics()["value"]["import_seconds"]
+    """
+
+    def __init__(
+        self,
+        groups: Iterable[ToolGroup] = TOOL_GROUPS,
+        exports: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            groups: Grupy narzędzi
+            exports: Dodatkowe nazwy pakietu (nie narzędzia) -> moduł je definiujący
+        """
+        self._groups: Dict[str, ToolGroup] = {group.name: group for group in groups}
+        self._tool_group: Dict[str, str] = {}
+        for group in self._groups.values():
+            for tool in group.tools:
+                if tool in self._tool_group:
+                    raise ValueError(
+                        f"Tool '{tool}' defined in groups "
+                        f"'{self._tool_group[tool]}' and '{group.name}'"
+                    )
+                self._tool_group[tool] = group.name
+        self._exports = dict(exports or {})
+
+        self._lock = threading.RLock()
+        self._modules: Dict[str, ModuleType] = {}
+        self._import_seconds: Dict[str, float] = {}
+
+    def group_names(self) -> List[str]:
+        return list(self._groups)
+
+    def tool_names(self, groups: Optional[Iterable[str]] = None) -> List[str]:
+        """Nazwy narzędzi (wszystkich lub wybranych grup), bez importu."""
+        names = self._groups if groups is None else groups
+        return [tool for name in names for tool in self._groups[name].tools]
+
+    def group_of(self, tool_name: str) -> str:
+        """Grupa definiująca narzędzie (KeyError dla nieznanej nazwy)."""
+        return self._tool_group[tool_name]
+
+    def is_loaded(self, group_name: str) -> bool:
+        return group_name in self._modules
+
+    def load_group(self, group_name: str) -> ModuleType:
+        """Importuje moduł grupy (raz) i zapisuje czas importu."""
+        module = self._modules.get(group_name)
+        if module is not None:
+            return module
+        group = self._groups[group_name]
+        with self._lock:
+            if group_name not in self._modules:
+                started = time.perf_counter()
+                module = __import__(group.module, fromlist=["__name__"])
+                elapsed = time.perf_counter() - started
+                self._import_seconds[group_name] = elapsed
+                self._modules[group_name] = module
+                logger.debug(f"🧰 Loaded tool group '{group_name}' in {elapsed:.3f}s")
+            return self._modules[group_name]
+
+    def resolve(self, name: str) -> Any:
+        """Narzędzie lub eksport pakietu (ładuje tylko potrzebną grupę)."""
+        group_name = self._tool_group.get(name)
+        if group_name is not None:
+            return getattr(self.load_group(group_name), name)
+        module_name = self._exports.get(name)
+        if module_name is not None:
+            return getattr(__import__(module_name, fromlist=["__name__"]), name)
+        raise AttributeError(f"module 'agent_tools' has no attribute '{name}'")
+
+    def describe(self, tool_name: str, func: Optional[Callable] = None) -> str:
+        """Opis narzędzia dla LLM: z @register_for_llm albo z docstringa."""
+        func = func or self.resolve(tool_name)
+        if tool_name in _llm_descriptions:
+            return _llm_descriptions[tool_name]
+        for line in (func.__doc__ or "").splitlines():
+            line = line.strip()
+            if line.startswith("DESCRIPTION:"):
+                return line[len("DESCRIPTION:") :].strip()
+        doc = (func.__doc__ or "").strip()
+        return doc.splitlines()[0] if doc else tool_name
+
+    def get_import_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Stan i czas importu każdej grupy (czas obejmuje zależności grupy)."""
+        with self._lock:
+            return {
+                name: {
+                    "loaded": name in self._modules,
+                    "import_seconds": (
+                        round(self._import_seconds[name], 4)
+                        if name in self._import_seconds
+                        else None
+                    ),
+                    "tools": len(group.tools),
+                }
+                for name, group in self._groups.items()
+            }
@@ -0,0 +1,779 @@
+"""
+Review & Opinion Tools for AutoGen DekuDeals
+Narzędzia recenzji: kompleksowe recenzje, szybkie opinie, porównania
+i adaptacja opinii do stylu, formatu i platformy.
+"""
+
+import logging
+from typing import Dict, Any, Optional, List
+from datetime import datetime
+
+from utils.analysis_context import GameAnalysisContext
+from utils.review_generator import ReviewGenerator, format_review_for_display
+from utils.opinion_adapters import (
+    OpinionAdapter,
+    AdaptationContext,
+    CommunicationStyle,
+    OutputFormat,
+    AudienceType,
+    create_context_presets,
+    format_for_multiple_platforms,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def generate_comprehensive_game_review(
+    game_name: str,
+    include_recommendations: bool = True,
+    context: Optional[GameAnalysisContext] = None,
+) -> Dict[str, Any]:
+    """
+    Generuje kompleksową opinię o grze łącząc wszystkie analizy.
+
+    DESCRIPTION: Generate comprehensive game review combining all analyses from Phase 1, 2, and 3
+    ARGS:
+        game_name (str): Nazwa gry do przeglądu
+        include_recommendations (bool): Czy dołączyć analizę rekomendacji dla różnych użytkowników
+        context (GameAnalysisContext): Opcjonalny kontekst z już pobranymi danymi i analizami
+    RETURNS:
+        Dict: Kompletna opinia o grze z wszystkimi sekcjami
+    RAISES:
+        ValueError: Gdy nie można znaleźć danych o grze
+    """
+    try:
+        logger.info(f"🎬 Starting comprehensive review generation for: {game_name}")
+
+        # Step 1: Collect game data
+        logger.info("📡 Step 1: Collecting game data...")
+        if context is None:
+            context = GameAnalysisContext.from_game_name(game_name)
+        game_data = context.game_data
+
+        if not context.success:
+            error_msg = f"Could not retrieve game data for '{game_name}'"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg, "game_name": game_name}
+
+        game_title = game_data.get("title", game_name)
+        logger.info(f"✅ Game data collected for: {game_title}")
+
+        # Step 2: Basic value analysis
+        logger.info("💰 Step 2: Performing basic value analysis...")
+        basic_analysis = context.basic_analysis
+
+        if not basic_analysis.get("success", False):
+            logger.warning("⚠️ Basic analysis failed, using fallback")
+            basic_analysis = {"success": False, "value_metrics": {}}
+
+        # Step 3: Advanced value analysis
+        logger.info("🚀 Step 3: Performing advanced value analysis...")
+        advanced_analysis = context.advanced_analysis
+
+        if not advanced_analysis.get("success", False):
+            logger.warning("⚠️ Advanced analysis failed, using fallback")
+            advanced_analysis = {"success": False, "comprehensive_analysis": {}}
+
+        # Step 4: Recommendation analysis (optional)
+        recommendation_analysis = None
+        if include_recommendations:
+            logger.info("🎯 Step 4: Performing recommendation analysis...")
+            try:
+                from agent_tools import get_recommendation_insights
+
+                # Reuse the scraped data and analyses from steps 1-3
+                rec_result = get_recommendation_insights(game_name, context=context)
+                if rec_result.get("success", False):
+                    recommendation_analysis = rec_result
+                    logger.info("✅ Recommendation analysis completed")
+                else:
+                    logger.warning("⚠️ Recommendation analysis failed")
+            except Exception as e:
+                logger.warning(f"⚠️ Recommendation analysis error: {e}")
+
+        # Step 5: Generate comprehensive review
+        logger.info("📝 Step 5: Generating comprehensive review...")
+        review = _review_generator.generate_comprehensive_review(
+            game_data=game_data,
+            basic_analysis=basic_analysis,
+            advanced_analysis=advanced_analysis,
+            recommendation_analysis=recommendation_analysis,
+        )
+
+        # Step 6: Format for output
+        logger.info("📄 Step 6: Formatting review for output...")
+        formatted_review = format_review_for_display(review)
+
+        # Create comprehensive result
+        result = {
+            "success": True,
+            "game_title": review.game_title,
+            "review_data": {
+                "overall_rating": review.overall_rating,
+                "recommendation": review.recommendation.value,
+                "confidence": review.confidence.value,
+                "strengths": review.strengths,
+                "weaknesses": review.weaknesses,
+                "target_audience": review.target_audience,
+                "value_assessment": review.value_assessment,
+                "price_recommendation": review.price_recommendation,
+                "timing_advice": review.timing_advice,
+                "final_verdict": review.final_verdict,
+                "reviewer_notes": review.reviewer_notes,
+                "data_sources": review.data_sources,
+            },
+            "quality_scores": {
+                "gameplay": review.gameplay_score,
+                "graphics": review.graphics_score,
+                "story": review.story_score,
+                "replay_value": review.replay_value,
+            },
+            "market_context": {
+                "genre_performance": review.genre_performance,
+                "market_position": review.market_position,
+                "competition_analysis": review.competition_analysis,
+            },
+            "underlying_analyses": {
+                "basic_analysis_success": basic_analysis.get("success", False),
+                "advanced_analysis_success": advanced_analysis.get("success", False),
+                "recommendation_analysis_success": recommendation_analysis is not None,
+            },
+            "formatted_review": formatted_review,
+            "review_metadata": {
+                "review_date": review.review_date.isoformat(),
+                "confidence_level": review.confidence.value,
+                "data_completeness": _assess_data_completeness(game_data),
+            },
+        }
+
+        logger.info(f"✅ Comprehensive review generated successfully!")
+        logger.info(
+            f"📊 Rating: {review.overall_rating:.1f}/10, Recommendation: {review.recommendation.value}"
+        )
+
+        return result
+
+    except Exception as e:
+        error_msg = f"Error generating comprehensive review: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg, "game_name": game_name}
+
+
+def generate_quick_game_opinion(game_name: str) -> Dict[str, Any]:
+    """
+    Generuje szybką opinię o grze (bez pełnej analizy rekomendacji).
+
+    DESCRIPTION: Generate quick game opinion with essential analysis only
+    ARGS:
+        game_name (str): Nazwa gry do szybkiej opinii
+    RETURNS:
+        Dict: Podstawowa opinia z kluczowymi informacjami
+    """
+    try:
+        logger.info(f"⚡ Generating quick opinion for: {game_name}")
+
+        # Use comprehensive review but without recommendations to speed up
+        result = generate_comprehensive_game_review(
+            game_name, include_recommendations=False
+        )
+
+        if not result.get("success", False):
+            return result
+
+        # Extract quick summary
+        review_data = result.get("review_data", {})
+        quick_opinion = {
+            "success": True,
+            "game_title": result.get("game_title"),
+            "quick_summary": {
+                "rating": f"{review_data.get('overall_rating', 0):.1f}/10",
+                "recommendation": review_data.get("recommendation", "unknown")
+                .replace("_", " ")
+                .title(),
+                "confidence": review_data.get("confidence", "unknown")
+                .replace("_", " ")
+                .title(),
+                "key_strength": (
+                    review_data.get("strengths", ["Unknown"])[0]
+                    if review_data.get("strengths")
+                    else "Unknown"
+                ),
+                "main_concern": (
+                    review_data.get("weaknesses", ["None identified"])[0]
+                    if review_data.get("weaknesses")
+                    else "None identified"
+                ),
+                "target_audience": ", ".join(
+                    review_data.get("target_audience", ["General gamers"])[:2]
+                ),
+            },
+            "one_liner": review_data.get("final_verdict", "Opinion not available")[:100]
+            + "...",
+            "buy_advice": review_data.get(
+                "timing_advice", "No timing advice available"
+            ),
+        }
+
+        logger.info(
+            f"✅ Quick opinion generated: {quick_opinion['quick_summary']['rating']}, {quick_opinion['quick_summary']['recommendation']}"
+        )
+
+        return quick_opinion
+
+    except Exception as e:
+        error_msg = f"Error generating quick opinion: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg, "game_name": game_name}
+
+
+def compare_games_with_reviews(
+    game_names: List[str], comparison_focus: str = "overall"
+) -> Dict[str, Any]:
+    """
+    Porównuje gry z pełnymi opiniami.
+
+    DESCRIPTION: Compare multiple games with full review analysis
+    ARGS:
+        game_names (List[str]): Lista nazw gier do porównania
+        comparison_focus (str): Fokus porównania ('overall', 'value', 'quality')
+    RETURNS:
+        Dict: Porównanie gier z pełnymi opiniami
+    """
+    try:
+        logger.info(f"🆚 Comparing {len(game_names)} games with full reviews...")
+
+        if len(game_names) < 2:
+            error_msg = "Need at least 2 games to compare"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg}
+
+        # Generate reviews for all games
+        game_reviews = []
+        failed_games = []
+
+        for game_name in game_names:
+            try:
+                logger.info(f"📝 Generating review for: {game_name}")
+                review_result = generate_quick_game_opinion(game_name)
+
+                if review_result.get("success", False):
+                    game_reviews.append(review_result)
+                    logger.info(f"✅ Review completed for: {game_name}")
+                else:
+                    failed_games.append(game_name)
+                    logger.warning(f"⚠️ Review failed for: {game_name}")
+
+            except Exception as e:
+                failed_games.append(game_name)
+                logger.error(f"❌ Error reviewing {game_name}: {e}")
+
+        if not game_reviews:
+            error_msg = "No games could be reviewed successfully"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg, "failed_games": failed_games}
+
+        # Sort games based on comparison focus
+        if comparison_focus == "value":
+            # Sort by value-related factors
+            game_reviews.sort(key=lambda x: x["quick_summary"]["rating"], reverse=True)
+        elif comparison_focus == "quality":
+            # Sort by quality score
+            game_reviews.sort(
+                key=lambda x: float(x["quick_summary"]["rating"].split("/")[0]),
+                reverse=True,
+            )
+        else:  # overall
+            # Sort by overall rating
+            game_reviews.sort(
+                key=lambda x: float(x["quick_summary"]["rating"].split("/")[0]),
+                reverse=True,
+            )
+
+        # Create comparison result
+        comparison_result = {
+            "success": True,
+            "comparison_focus": comparison_focus,
+            "games_compared": len(game_reviews),
+            "failed_games": failed_games,
+            "winner": game_reviews[0] if game_reviews else None,
+            "ranking": [],
+            "comparison_summary": "",
+        }
+
+        # Create detailed ranking
+        for i, review in enumerate(game_reviews, 1):
+            summary = review["quick_summary"]
+            ranking_entry = {
+                "rank": i,
+                "game_title": review["game_title"],
+                "rating": summary["rating"],
+                "recommendation": summary["recommendation"],
+                "key_strength": summary["key_strength"],
+                "main_concern": summary["main_concern"],
+                "why_this_rank": _explain_review_ranking(i, len(game_reviews), summary),
+            }
+            comparison_result["ranking"].append(ranking_entry)
+
+        # Generate comparison summary
+        if game_reviews:
+            winner = game_reviews[0]
+            winner_name = winner["game_title"]
+            winner_rating = winner["quick_summary"]["rating"]
+
+            comparison_result["comparison_summary"] = (
+                f"'{winner_name}' emerges as the top choice with {winner_rating} rating. "
+            )
+
+            if len(game_reviews) > 1:
+                runner_up = game_reviews[1]
+                runner_up_name = runner_up["game_title"]
+                comparison_result[
+                    "comparison_summary"
+                ] += f"'{runner_up_name}' follows as a strong alternative."
+
+        logger.info(f"✅ Game comparison completed successfully!")
+        return comparison_result
+
+    except Exception as e:
+        error_msg = f"Error comparing games with reviews: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg}
+
+
+def _assess_data_completeness(game_data: Dict[str, Any]) -> str:
+    """Ocenia kompletność danych o grze."""
+    completeness_score = 0
+    max_score = 8
+
+    # Check key data fields
+    if game_data.get("title"):
+        completeness_score += 1
+    if game_data.get("current_eshop_price"):
+        completeness_score += 1
+    if game_data.get("MSRP"):
+        completeness_score += 1
+    if game_data.get("lowest_historical_price"):
+        completeness_score += 1
+    if game_data.get("metacritic_score"):
+        completeness_score += 1
+    if game_data.get("opencritic_score"):
+        completeness_score += 1
+    if game_data.get("genres"):
+        completeness_score += 1
+    if game_data.get("developer"):
+        completeness_score += 1
+
+    percentage = (completeness_score / max_score) * 100
+
+    if percentage >= 90:
+        return "Excellent"
+    elif percentage >= 75:
+        return "Good"
+    elif percentage >= 50:
+        return "Fair"
+    else:
+        return "Limited"
+
+
+def _explain_review_ranking(rank: int, total: int, summary: Dict[str, Any]) -> str:
+    """Wyjaśnia pozycję w rankingu."""
+    if rank == 1:
+        return f"Top choice with {summary['rating']} rating and {summary['recommendation']} recommendation"
+    elif rank == total:
+        return (
+            f"Last place but still worth considering for {summary['target_audience']}"
+        )
+    elif rank <= total // 3:
+        return f"Strong contender with {summary['rating']} rating"
+    else:
+        return f"Solid option with some trade-offs"
+
+
+_review_generator = ReviewGenerator()
+
+
+# Initialize global opinion adapter
+_opinion_adapter = OpinionAdapter()
+
+
+def adapt_review_for_context(
+    game_name: str,
+    style: str = "casual",
+    format_type: str = "summary",
+    audience: str = "general_public",
+    platform: str = "website",
+    max_length: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Adaptuje opinię o grze do określonego kontekstu komunikacyjnego.
+
+    DESCRIPTION: Adapt game review to specific communication context and audience
+    ARGS:
+        game_name (str): Nazwa gry do adaptacji
+        style (str): Styl komunikacji (casual, technical, social_media, professional, gaming_enthusiast, beginner_friendly)
+        format_type (str): Format wyjściowy (detailed, summary, bullet_points, social_post, comparison_table, recommendation_card)
+        audience (str): Grupa docelowa (bargain_hunters, quality_seekers, casual_gamers, hardcore_gamers, indie_lovers, family_oriented, general_public)
+        platform (str): Platforma docelowa (twitter, reddit, facebook, website, blog, newsletter)
+        max_length (int): Maksymalna długość treści (opcjonalne)
+    RETURNS:
+        Dict: Adaptowana opinia z metadanymi
+    RAISES:
+        ValueError: Gdy nie można wygenerować opinii lub nieprawidłowe parametry
+    """
+    try:
+        logger.info(
+            f"🎭 Adapting review for {game_name}: {style}/{format_type}/{audience}"
+        )
+
+        # Generate base comprehensive review
+        base_review_result = generate_comprehensive_game_review(
+            game_name, include_recommendations=True
+        )
+
+        if not base_review_result.get("success", False):
+            error_msg = f"Could not generate base review for '{game_name}'"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg, "game_name": game_name}
+
+        # Extract review object (we need to reconstruct it from result)
+        from utils.review_generator import (
+            GameReview,
+            ReviewConfidence,
+            RecommendationType,
+        )
+
+        review_data = base_review_result.get("review_data", {})
+
+        # Map string values back to enums
+        confidence_mapping = {
+            "very_high": ReviewConfidence.VERY_HIGH,
+            "high": ReviewConfidence.HIGH,
+            "medium": ReviewConfidence.MEDIUM,
+            "low": ReviewConfidence.LOW,
+            "very_low": ReviewConfidence.VERY_LOW,
+        }
+
+        recommendation_mapping = {
+            "instant_buy": RecommendationType.INSTANT_BUY,
+            "strong_buy": RecommendationType.STRONG_BUY,
+            "buy": RecommendationType.BUY,
+            "consider": RecommendationType.CONSIDER,
+            "wait_for_sale": RecommendationType.WAIT_FOR_SALE,
+            "wait": RecommendationType.WAIT,
+            "skip": RecommendationType.SKIP,
+        }
+
+        # Reconstruct GameReview object
+        review = GameReview(
+            game_title=review_data.get("overall_rating", game_name),
+            overall_rating=review_data.get("overall_rating", 5.0),
+            recommendation=recommendation_mapping.get(
+                review_data.get("recommendation", "consider"),
+                RecommendationType.CONSIDER,
+            ),
+            confidence=confidence_mapping.get(
+                review_data.get("confidence", "medium"), ReviewConfidence.MEDIUM
+            ),
+            strengths=review_data.get("strengths", []),
+            weaknesses=review_data.get("weaknesses", []),
+            target_audience=review_data.get("target_audience", []),
+            value_assessment=review_data.get("value_assessment", "Standard value"),
+            price_recommendation=review_data.get(
+                "price_recommendation", "No recommendation"
+            ),
+            timing_advice=review_data.get("timing_advice", "Consider timing"),
+            final_verdict=review_data.get("final_verdict", "Game review completed"),
+        )
+
+        # Map string parameters to enums
+        style_mapping = {
+            "technical": CommunicationStyle.TECHNICAL,
+            "casual": CommunicationStyle.CASUAL,
+            "social_media": CommunicationStyle.SOCIAL_MEDIA,
+            "professional": CommunicationStyle.PROFESSIONAL,
+            "gaming_enthusiast": CommunicationStyle.GAMING_ENTHUSIAST,
+            "beginner_friendly": CommunicationStyle.BEGINNER_FRIENDLY,
+        }
+
+        format_mapping = {
+            "detailed": OutputFormat.DETAILED,
+            "summary": OutputFormat.SUMMARY,
+            "bullet_points": OutputFormat.BULLET_POINTS,
+            "social_post": OutputFormat.SOCIAL_POST,
+            "comparison_table": OutputFormat.COMPARISON_TABLE,
+            "recommendation_card": OutputFormat.RECOMMENDATION_CARD,
+        }
+
+        audience_mapping = {
+            "bargain_hunters": AudienceType.BARGAIN_HUNTERS,
+            "quality_seekers": AudienceType.QUALITY_SEEKERS,
+            "casual_gamers": AudienceType.CASUAL_GAMERS,
+            "hardcore_gamers": AudienceType.HARDCORE_GAMERS,
+            "indie_lovers": AudienceType.INDIE_LOVERS,
+            "family_oriented": AudienceType.FAMILY_ORIENTED,
+            "general_public": AudienceType.GENERAL_PUBLIC,
+        }
+
+        # Validate and map parameters
+        comm_style = style_mapping.get(style)
+        output_format = format_mapping.get(format_type)
+        target_audience = audience_mapping.get(audience)
+
+        if not comm_style or not output_format or not target_audience:
+            error_msg = f"Invalid parameters: style='{style}', format='{format_type}', audience='{audience}'"
+            logger.error(f"❌ {error_msg}")
+            return {
+                "success": False,
+                "error": error_msg,
+                "available_styles": list(style_mapping.keys()),
+                "available_formats": list(format_mapping.keys()),
+                "available_audiences": list(audience_mapping.keys()),
+            }
+
+        # Create adaptation context
+        context = AdaptationContext(
+            style=comm_style,
+            format=output_format,
+            audience=target_audience,
+            platform=platform,
+            max_length=max_length,
+            include_emoji=platform in ["twitter", "facebook", "instagram"],
+            include_price_focus=target_audience == AudienceType.BARGAIN_HUNTERS,
+            include_technical_details=comm_style == CommunicationStyle.TECHNICAL,
+        )
+
+        # Adapt the review
+        adapted_opinion = _opinion_adapter.adapt_opinion(review, context)
+
+        # Create result
+        result = {
+            "success": True,
+            "game_title": game_name,
+            "adaptation_context": {
+                "style": style,
+                "format": format_type,
+                "audience": audience,
+                "platform": platform,
+                "max_length": max_length,
+            },
+            "adapted_content": adapted_opinion.content,
+            "metadata": adapted_opinion.metadata,
+            "character_count": adapted_opinion.character_count,
+            "engagement_elements": adapted_opinion.engagement_elements,
+            "call_to_action": adapted_opinion.call_to_action,
+            "original_review_data": {
+                "rating": review.overall_rating,
+                "recommendation": review.recommendation.value,
+                "confidence": review.confidence.value,
+            },
+            "adaptation_timestamp": adapted_opinion.adaptation_timestamp.isoformat(),
+        }
+
+        logger.info(
+            f"✅ Review adapted successfully: {adapted_opinion.character_count} chars"
+        )
+        return result
+
+    except Exception as e:
+        error_msg = f"Error adapting review for '{game_name}': {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg, "game_name": game_name}
+
+
+def create_multi_platform_opinions(
+    game_name: str, platforms: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Tworzy opinie o grze dla wielu platform jednocześnie.
+
+    DESCRIPTION: Create game opinions for multiple platforms simultaneously with platform-specific adaptations
+    ARGS:
+        game_name (str): Nazwa gry do analizy
+        platforms (List[str]): Lista platform (twitter, reddit, facebook, website, blog, newsletter)
+    RETURNS:
+        Dict: Opinie dostosowane do różnych platform z metadanymi
+    """
+    try:
+        logger.info(f"🌐 Creating multi-platform opinions for: {game_name}")
+
+        if platforms is None:
+            platforms = ["twitter", "reddit", "website", "blog"]
+
+        # Generate base comprehensive review
+        base_review_result = generate_comprehensive_game_review(
+            game_name, include_recommendations=True
+        )
+
+        if not base_review_result.get("success", False):
+            error_msg = f"Could not generate base review for '{game_name}'"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg, "game_name": game_name}
+
+        # Reconstruct GameReview object (same logic as above)
+        from utils.review_generator import (
+            GameReview,
+            ReviewConfidence,
+            RecommendationType,
+        )
+
+        review_data = base_review_result.get("review_data", {})
+
+        confidence_mapping = {
+            "very_high": ReviewConfidence.VERY_HIGH,
+            "high": ReviewConfidence.HIGH,
+            "medium": ReviewConfidence.MEDIUM,
+            "low": ReviewConfidence.LOW,
+            "very_low": ReviewConfidence.VERY_LOW,
+        }
+
+        recommendation_mapping = {
+            "instant_buy": RecommendationType.INSTANT_BUY,
+            "strong_buy": RecommendationType.STRONG_BUY,
+            "buy": RecommendationType.BUY,
+            "consider": RecommendationType.CONSIDER,
+            "wait_for_sale": RecommendationType.WAIT_FOR_SALE,
+            "wait": RecommendationType.WAIT,
+            "skip": RecommendationType.SKIP,
+        }
+
+        review = GameReview(
+            game_title=review_data.get("game_title", game_name),
+            overall_rating=review_data.get("overall_rating", 5.0),
+            recommendation=recommendation_mapping.get(
+                review_data.get("recommendation", "consider"),
+                RecommendationType.CONSIDER,
+            ),
+            confidence=confidence_mapping.get(
+                review_data.get("confidence", "medium"), ReviewConfidence.MEDIUM
+            ),
+            strengths=review_data.get("strengths", []),
+            weaknesses=review_data.get("weaknesses", []),
+            target_audience=review_data.get("target_audience", []),
+            value_assessment=review_data.get("value_assessment", "Standard value"),
+            price_recommendation=review_data.get(
+                "price_recommendation", "No recommendation"
+            ),
+            timing_advice=review_data.get("timing_advice", "Consider timing"),
+            final_verdict=review_data.get("final_verdict", "Game review completed"),
+        )
+
+        # Generate platform-specific opinions
+        platform_opinions = format_for_multiple_platforms(review, platforms)
+
+        # Format results
+        formatted_results = {}
+        for platform, adapted_opinion in platform_opinions.items():
+            formatted_results[platform] = {
+                "content": adapted_opinion.content,
+                "character_count": adapted_opinion.character_count,
+                "style": adapted_opinion.style_used.value,
+                "format": adapted_opinion.format_used.value,
+                "audience": adapted_opinion.audience_targeted.value,
+                "engagement_elements": adapted_opinion.engagement_elements,
+                "call_to_action": adapted_opinion.call_to_action,
+                "metadata": adapted_opinion.metadata,
+            }
+
+        result = {
+            "success": True,
+            "game_title": game_name,
+            "platforms_generated": len(formatted_results),
+            "platform_opinions": formatted_results,
+            "generation_summary": {
+                "total_characters": sum(
+                    op.character_count for op in platform_opinions.values()
+                ),
+                "platforms_requested": platforms,
+                "timestamp": datetime.now().isoformat(),
+            },
+            "base_review_rating": review.overall_rating,
+            "base_recommendation": review.recommendation.value,
+        }
+
+        logger.info(
+            f"✅ Multi-platform opinions created for {len(platforms)} platforms"
+        )
+        return result
+
+    except Exception as e:
+        error_msg = (
+            f"Error creating multi-platform opinions for '{game_name}': {str(e)}"
+        )
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg, "game_name": game_name}
+
+
+def get_available_adaptation_options() -> Dict[str, Any]:
+    """
+    Zwraca dostępne opcje adaptacji opinii.
+
+    DESCRIPTION: Get available adaptation options for review customization
+    RETURNS:
+        Dict: Wszystkie dostępne opcje adaptacji z opisami
+    """
+    try:
+        logger.info("📋 Getting available adaptation options...")
+
+        presets = create_context_presets()
+
+        options = {
+            "success": True,
+            "communication_styles": {
+                "technical": "Detailed, analytical communication with data focus",
+                "casual": "Friendly, conversational tone for general audience",
+                "social_media": "Short, engaging content with emojis and hashtags",
+                "professional": "Formal, business-oriented communication",
+                "gaming_enthusiast": "Expert-level discussion for passionate gamers",
+                "beginner_friendly": "Simple, easy-to-understand explanations",
+            },
+            "output_formats": {
+                "detailed": "Full, comprehensive review with all sections",
+                "summary": "Brief overview with key points",
+                "bullet_points": "Organized list format for easy scanning",
+                "social_post": "Social media ready post with hashtags",
+                "comparison_table": "Structured table format for comparisons",
+                "recommendation_card": "Visual card-style recommendation",
+            },
+            "audience_types": {
+                "bargain_hunters": "Price-focused users looking for best deals",
+                "quality_seekers": "Users prioritizing game quality and ratings",
+                "casual_gamers": "Occasional players seeking accessible games",
+                "hardcore_gamers": "Enthusiast players wanting depth and challenge",
+                "indie_lovers": "Supporters of independent game developers",
+                "family_oriented": "Parents looking for family-friendly content",
+                "general_public": "Broad audience with mixed interests",
+            },
+            "supported_platforms": {
+                "twitter": "280 character limit, hashtag optimized",
+                "reddit": "Detailed discussion format",
+                "facebook": "Casual social sharing",
+                "website": "Professional web content",
+                "blog": "Long-form article style",
+                "newsletter": "Email-friendly format",
+            },
+            "preset_combinations": {
+                name: {
+                    "style": preset.style.value,
+                    "format": preset.format.value,
+                    "audience": preset.audience.value,
+                    "platform": preset.platform,
+                    "description": f"{preset.style.value.replace('_', ' ').title()} style {preset.format.value} for {preset.audience.value.replace('_', ' ')}",
+                }
+                for name, preset in presets.items()
+            },
+            "usage_examples": [
+                "adapt_review_for_context('Celeste', 'social_media', 'social_post', 'bargain_hunters', 'twitter')",
+                "create_multi_platform_opinions('Hollow Knight', ['twitter', 'reddit', 'blog'])",
+                "adapt_review_for_context('INSIDE', 'beginner_friendly', 'bullet_points', 'family_oriented')",
+            ],
+        }
+
+        logger.info(
+            f"✅ Retrieved adaptation options: {len(options['communication_styles'])} styles, {len(options['output_formats'])} formats"
+        )
+        return options
+
+    except Exception as e:
+        error_msg = f"Error getting adaptation options: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"success": False, "error": error_msg}
@@ -1,10 +1,18 @@
 """
 AutoGen Agents for DekuDeals Game Analysis
 Agenci AutoGen do analizy gier z DekuDeals
+
+``build_analysis_team`` creates an isolated team (own agents, chat history
+and tool registrations) for one conversation; ``utils/agent_pool.py`` runs
+several of them concurrently. The module-level agents (``default_team``,
+``user_proxy``, ``data_collector``...) form the default team, built on first
+access by ``get_default_team``.
 """
 
 import autogen
-from typing import Dict, Any, Optional, List
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Callable, Tuple
 from config.llm_config import (
     get_data_collector_config,
     get_price_analyzer_config,
@@ -13,29 +21,12 @@ from config.llm_config import (
     get_user_proxy_config,
     validate_api_key,
 )
-from agent_tools import (
-    search_and_scrape_game,
-    validate_game_data,
-    format_game_summary,
-    extract_key_metrics,
-    calculate_value_score,
-    calculate_advanced_value_analysis,
-    generate_personalized_recommendations,
-    compare_games_for_user,
-    get_recommendation_insights,
-    # Phase 3 tools - Review Generation
-    generate_comprehensive_game_review,
-    generate_quick_game_opinion,
-    compare_games_with_reviews,
-    # Category scraping tools for diverse testing
-    scrape_dekudeals_category,
-    get_games_from_popular_categories,
-    get_random_game_sample,
-    # Phase 3 Point 2 - Opinion Adaptations
-    adapt_review_for_context,
-    create_multi_platform_opinions,
-    get_available_adaptation_options,
+from utils.llm_completion_cache import attach_completion_cache
+from utils.tool_result_compaction import (
+    ToolResultCompactor,
+    get_tool_result_compactor,
 )
+import agent_tools
 
 # Validate API key before creating agents
 if not validate_api_key():
@@ -44,9 +35,7 @@ if not validate_api_key():
     )
 
 # Agent 1: DATA_COLLECTOR_agent
-data_collector = autogen.AssistantAgent(
-    name="DATA_COLLECTOR_agent",
-    system_message="""You are an expert at collecting game data from DekuDeals.com.
+DATA_COLLECTOR_SYSTEM_MESSAGE = """You are an expert at collecting game data from DekuDeals.com.
 
 Your tasks:
 - Search for the game specified by the user
@@ -59,14 +48,10 @@ Always use the search_and_scrape_game function to get game data.
 Format your response clearly and pass complete data to the next agent.
 
 Terminate when: You obtain complete game data or determine that the game doesn't exist.
-Reply 'TERMINATE' when your task is complete.""",
-    llm_config=get_data_collector_config(),
-)
+Reply 'TERMINATE' when your task is complete."""
 
 # Agent 2: PRICE_ANALYZER_agent
-price_analyzer = autogen.AssistantAgent(
-    name="PRICE_ANALYZER_agent",
-    system_message="""You are a game price and value analyst.
+PRICE_ANALYZER_SYSTEM_MESSAGE = """You are a game price and value analyst.
 
 Your tasks:
 - Analyze price data from the game information received
@@ -82,14 +67,10 @@ Focus on:
 - Deal quality evaluation
 
 Terminate when: You provide complete price analysis with clear recommendations.
-Reply 'TERMINATE' when your analysis is complete.""",
-    llm_config=get_price_analyzer_config(),
-)
+Reply 'TERMINATE' when your analysis is complete."""
 
 # Agent 3: REVIEW_GENERATOR_agent
-review_generator = autogen.AssistantAgent(
-    name="REVIEW_GENERATOR_agent",
-    system_message="""You are a game critic specializing in objective reviews.
+REVIEW_GENERATOR_SYSTEM_MESSAGE = """You are a game critic specializing in objective reviews.
 
 Your tasks:
 - Analyze all collected game data comprehensively
@@ -108,14 +89,10 @@ Your review should include:
 Be objective and base your opinion on data, not speculation.
 
 Terminate when: You create a complete opinion with argumentation and recommendation.
-Reply 'TERMINATE' when your review is complete.""",
-    llm_config=get_review_generator_config(),
-)
+Reply 'TERMINATE' when your review is complete."""
 
 # Agent 4: QUALITY_ASSURANCE_agent
-quality_assurance = autogen.AssistantAgent(
-    name="QUALITY_ASSURANCE_agent",
-    system_message="""You are a quality controller for game analyses.
+QUALITY_ASSURANCE_SYSTEM_MESSAGE = """You are a quality controller for game analyses.
 
 Your tasks:
 - Review all analyses from previous agents for completeness
@@ -130,15 +107,11 @@ Quality checkpoints:
 - Objectivity of review and recommendations
 - Clarity and usefulness of final assessment
 
-Terminate when: You confirm high quality of final analysis or suggest specific improvements.
-Reply 'TERMINATE' when quality check is complete.""",
-    llm_config=get_quality_assurance_config(),
-)
+End your reply with 'QA_STATUS: PASS' if the analysis meets the checkpoints,
+or 'QA_STATUS: FAIL' followed by the specific corrections for the review."""
 
 # Agent 5: USER_PROXY (Human Interface)
-user_proxy = autogen.UserProxyAgent(
-    name="USER_PROXY",
-    system_message="""You are the interface between users and the game analysis team.
+USER_PROXY_SYSTEM_MESSAGE = """You are the interface between users and the game analysis team.
 
 Your tasks:
 - Accept user queries about games
@@ -146,264 +119,195 @@ Your tasks:
 - Present results in a clear, readable format
 - Handle follow-up questions from users
 
-You can execute functions and coordinate the conversation flow.""",
-    human_input_mode="NEVER",  # Automated for now
-    max_consecutive_auto_reply=10,
-    code_execution_config={"work_dir": "logs", "use_docker": False},
-)
-
-
-# Register tools for agents
-@user_proxy.register_for_execution()
-@data_collector.register_for_llm(
-    description=(
-        "Search for a game on DekuDeals and retrieve all available data - "
-        "Input: game_name (str) - Output: Dict with complete game data"
-    )
-)
-def get_game_data(game_name: str) -> Dict[str, Any]:
-    """Wrapper function for search_and_scrape_game tool"""
-    return search_and_scrape_game(game_name)
-
-
-@user_proxy.register_for_execution()
-@data_collector.register_for_llm(
-    description=(
-        "Validate completeness of game data - "
-        "Input: game_data (dict) - Output: validation report"
-    )
-)
-def check_data_quality(game_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Wrapper function for validate_game_data tool"""
-    return validate_game_data(game_data)
-
-
-@user_proxy.register_for_execution()
-@price_analyzer.register_for_llm(
-    description=(
-        "Extract key metrics from game data for analysis - "
-        "Input: game_data (dict) - Output: metrics summary"
-    )
-)
-def get_analysis_metrics(game_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Wrapper function for extract_key_metrics tool"""
-    return extract_key_metrics(game_data)
-
-
-@user_proxy.register_for_execution()
-@price_analyzer.register_for_llm(
-    description=(
-        "Calculate value for money based on price and ratings - "
-        "Input: game_data (Dict) - Output: Dict with comprehensive value analysis"
-    )
-)
-def analyze_game_value(game_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Wrapper function for calculate_value_score tool"""
-    return calculate_value_score(game_data)
-
-
-@user_proxy.register_for_execution()
-@price_analyzer.register_for_llm(
-    description=(
-        "Perform advanced comprehensive value analysis with genre factors, "
-        "market position, and age considerations - "
-        "Input: game_data (Dict) - Output: Dict with advanced analysis"
-    )
-)
-def analyze_advanced_value(game_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Wrapper function for calculate_advanced_value_analysis tool (Point 2 of Phase 2)"""
-    return calculate_advanced_value_analysis(game_data)
-
-
-@user_proxy.register_for_execution()
-@review_generator.register_for_llm(
-    description=(
-        "Generate personalized game recommendations based on user preferences - "
-        "Input: games_list (List[str]), user_preference (str), max_recommendations (int) - "
-        "Output: Dict with personalized recommendations"
-    )
-)
-def get_personalized_recommendations(
-    games_list: List[str],
-    user_preference: str = "bargain_hunter",
-    max_recommendations: int = 5,
-) -> Dict[str, Any]:
-    """Wrapper function for generate_personalized_recommendations tool (Point 3 of Phase 2)"""
-    return generate_personalized_recommendations(
-        games_list, user_preference, max_recommendations
-    )
-
-
-@user_proxy.register_for_execution()
-@review_generator.register_for_llm(
-    description=(
-        "Compare games for specific user preferences and provide ranked recommendations - "
-        "Input: game_names (List[str]), user_preference (str) - "
-        "Output: Dict with comparison and ranking"
-    )
+You can execute functions and coordinate the conversation flow."""
+
+
+# Agent → registry tools it may call (USER_PROXY executes every tool); the
+# functions, descriptions and groups come from ``agent_tools`` on demand
+ANALYSIS_TOOL_CALLERS: Dict[str, Tuple[str, ...]] = {
+    "data_collector": (
+        "search_and_scrape_game",
+        "validate_game_data",
+        "scrape_dekudeals_category",
+        "get_games_from_popular_categories",
+        "get_random_game_sample",
+    ),
+    "price_analyzer": (
+        "extract_key_metrics",
+        "calculate_value_score",
+        "calculate_advanced_value_analysis",
+    ),
+    "review_generator": (
+        "generate_personalized_recommendations",
+        "compare_games_for_user",
+        "get_recommendation_insights",
+        "generate_comprehensive_game_review",
+        "generate_quick_game_opinion",
+        "compare_games_with_reviews",
+        "adapt_review_for_context",
+        "create_multi_platform_opinions",
+        "get_available_adaptation_options",
+    ),
+}
+
+FULL_RESULT_TOOL_CALLERS = ("data_collector", "price_analyzer", "review_generator")
+FULL_RESULT_TOOL_DESCRIPTION = (
+    "Get omitted details of a summarized tool result - "
+    "Input: result_id (str from _compaction.result_id), field_path (str, "
+    "e.g. 'review_data.reviewer_notes', empty for the whole result) - "
+    "Output: Dict with the requested value"
 )
-def compare_games_by_preference(
-    game_names: List[str], user_preference: str = "bargain_hunter"
-) -> Dict[str, Any]:
-    """Wrapper function for compare_games_for_user tool (Point 3 of Phase 2)"""
-    return compare_games_for_user(game_names, user_preference)
 
 
-@user_proxy.register_for_execution()
-@review_generator.register_for_llm(
-    description=(
-        "Analyze how a game fits different user preference types - "
-        "Input: game_name (str), user_preferences (List[str]) - "
-        "Output: Dict with multi-user analysis"
-    )
-)
-def analyze_game_for_users(
-    game_name: str, user_preferences: Optional[List[str]] = None
+@dataclass
+class AnalysisTeam:
+    """Zespół agentów jednej konwersacji."""
+
+    user_proxy: autogen.UserProxyAgent
+    data_collector: autogen.AssistantAgent
+    price_analyzer: autogen.AssistantAgent
+    review_generator: autogen.AssistantAgent
+    quality_assurance: autogen.AssistantAgent
+    compactor: ToolResultCompactor
+    cached_agents: Dict[str, bool] = field(default_factory=dict)
+
+    @property
+    def agents(self) -> list:
+        """Agenci w kolejności workflow."""
+        return [
+            self.user_proxy,
+            self.data_collector,
+            self.price_analyzer,
+            self.review_generator,
+            self.quality_assurance,
+        ]
+
+    def reset(self):
+        """Czyści historię konwersacji przed ponownym użyciem zespołu."""
+        for agent in self.agents:
+            agent.reset()
+        self.compactor.start_conversation()
+
+
+def _llm_config(
+    config_factory: Callable[[], Dict[str, Any]], http_client: Optional[Any]
 ) -> Dict[str, Any]:
-    """Wrapper function for get_recommendation_insights tool (Point 3 of Phase 2)"""
-    return get_recommendation_insights(game_name, user_preferences)
-
-
-# Phase 3 Point 1: Comprehensive Review Generation Tools
-@user_proxy.register_for_execution()
-@review_generator.register_for_llm(
-    description=(
-        "Generate comprehensive game review combining all analyses from Phase 1, 2, and 3 "
-        "with detailed ratings and recommendations - Input: game_name (str), "
-        "include_recommendations (bool) - Output: Dict with complete review including "
-        "rating, verdict, strengths, weaknesses"
-    )
-)
-def create_comprehensive_review(
-    game_name: str, include_recommendations: bool = True
-) -> Dict[str, Any]:
-    """Wrapper function for generate_comprehensive_game_review tool (Phase 3 Point 1)"""
-    return generate_comprehensive_game_review(game_name, include_recommendations)
+    """Konfiguracja LLM agenta (opcjonalnie ze wspólnym klientem HTTP)."""
+    config = config_factory()
+    if http_client is not None:
+        config["config_list"] = [
+            {**entry, "http_client": http_client} for entry in config["config_list"]
+        ]
+    return config
 
 
-@user_proxy.register_for_execution()
-@review_generator.register_for_llm(
-    description=(
-        "Generate quick game opinion with essential analysis for fast assessment - "
-        "Input: game_name (str) - Output: Dict with summarized opinion including "
-        "rating, recommendation, and key points"
-    )
-)
-def create_quick_opinion(game_name: str) -> Dict[str, Any]:
-    """Wrapper function for generate_quick_game_opinion tool (Phase 3 Point 1)"""
-    return generate_quick_game_opinion(game_name)
+def register_analysis_tools(team: AnalysisTeam, tool_executor: Optional[Any] = None):
+    """
+    Rejestruje narzędzia w zespole (kompaktowanie wyników, opcjonalnie
+    wspólny executor z limitami).
+    """
 
+    def wrap(tool: Callable[..., Any]) -> Callable[..., Any]:
+        tool = team.compactor.wrap(tool)
+        return tool_executor.wrap(tool) if tool_executor is not None else tool
 
-@user_proxy.register_for_execution()
-@review_generator.register_for_llm(
-    description=(
-        "Compare multiple games with full review analysis and detailed ranking - "
-        "Input: game_names (List[str]), comparison_focus (str) - "
-        "Output: Dict with detailed comparison including winner, ranking, and explanations"
-    )
-)
-def compare_games_with_full_reviews(
-    game_names: List[str], comparison_focus: str = "overall"
-) -> Dict[str, Any]:
-    """Wrapper function for compare_games_with_reviews tool (Phase 3 Point 1)"""
-    return compare_games_with_reviews(game_names, comparison_focus)
+    for caller, tool_names in ANALYSIS_TOOL_CALLERS.items():
+        agent_tools.register_tools(
+            getattr(team, caller), team.user_proxy, tool_names=tool_names, wrap=wrap
+        )
 
+    def get_full_tool_result(result_id: str, field_path: str = "") -> Dict[str, Any]:
+        """Full payload (or one field) of a compacted tool result"""
+        return team.compactor.get_full_result(result_id, field_path)
 
-# Category Scraping Tools for Diverse Testing
-@user_proxy.register_for_execution()
-@data_collector.register_for_llm(
-    description=(
-        "Scrape games from specific DekuDeals category pages for diverse testing data - "
-        "Input: category (str), max_games (int), include_details (bool) - "
-        "Output: Dict with games list and metadata"
-    )
-)
-def get_games_from_category(
-    category: str, max_games: int = 20, include_details: bool = False
-) -> Dict[str, Any]:
-    """Wrapper function for scrape_dekudeals_category tool"""
-    return scrape_dekudeals_category(category, max_games, include_details)
+    for caller in FULL_RESULT_TOOL_CALLERS:
+        getattr(team, caller).register_for_llm(
+            description=FULL_RESULT_TOOL_DESCRIPTION
+        )(get_full_tool_result)
+    team.user_proxy.register_for_execution()(get_full_tool_result)
 
 
-@user_proxy.register_for_execution()
-@data_collector.register_for_llm(
-    description=(
-        "Get games from multiple popular DekuDeals categories for comprehensive testing - "
-        "Input: max_games_per_category (int), categories (List[str]) - "
-        "Output: Dict with categorized games"
-    )
-)
-def collect_games_from_categories(
-    max_games_per_category: int = 10, categories: Optional[List[str]] = None
-) -> Dict[str, Any]:
-    """Wrapper function for get_games_from_popular_categories tool"""
-    return get_games_from_popular_categories(max_games_per_category, categories)
-
-
-@user_proxy.register_for_execution()
-@data_collector.register_for_llm(
-    description=(
-        "Get random sample of games from DekuDeals for unbiased testing - "
-        "Input: sample_size (int), category_preference (str) - "
-        "Output: Dict with random game selection"
-    )
-)
-def get_random_games_sample(
-    sample_size: int = 5, category_preference: str = "mixed"
-) -> Dict[str, Any]:
-    """Wrapper function for get_random_game_sample tool"""
-    return get_random_game_sample(sample_size, category_preference)
+def build_analysis_team(
+    tool_executor: Optional[Any] = None,
+    http_client: Optional[Any] = None,
+    compactor: Optional[ToolResultCompactor] = None,
+) -> AnalysisTeam:
+    """
+    Tworzy izolowany zespół agentów do jednej konwersacji.
 
+    Args:
+        tool_executor: Wspólny executor narzędzi (``SharedToolExecutor``)
+        http_client: Wspólny klient HTTP dla klientów LLM
+        compactor: Kompaktor wyników narzędzi (domyślnie nowy, z konfiguracji)
 
-# Phase 3 Point 2: Opinion Adaptation Tools
-@user_proxy.register_for_execution()
-@review_generator.register_for_llm(
-    description=(
-        "Adapt game review to specific communication context and audience - "
-        "Input: game_name (str), style (str), format_type (str), audience (str), "
-        "platform (str), max_length (int) - Output: Dict with adapted review content"
+    Returns:
+        AnalysisTeam: Nowi agenci z zarejestrowanymi narzędziami
+    """
+    team = AnalysisTeam(
+        data_collector=autogen.AssistantAgent(
+            name="DATA_COLLECTOR_agent",
+            system_message=DATA_COLLECTOR_SYSTEM_MESSAGE,
+            llm_config=_llm_config(get_data_collector_config, http_client),
+        ),
+        price_analyzer=autogen.AssistantAgent(
+            name="PRICE_ANALYZER_agent",
+            system_message=PRICE_ANALYZER_SYSTEM_MESSAGE,
+            llm_config=_llm_config(get_price_analyzer_config, http_client),
+        ),
+        review_generator=autogen.AssistantAgent(
+            name="REVIEW_GENERATOR_agent",
+            system_message=REVIEW_GENERATOR_SYSTEM_MESSAGE,
+            llm_config=_llm_config(get_review_generator_config, http_client),
+        ),
+        quality_assurance=autogen.AssistantAgent(
+            name="QUALITY_ASSURANCE_agent",
+            system_message=QUALITY_ASSURANCE_SYSTEM_MESSAGE,
+            llm_config=_llm_config(get_quality_assurance_config, http_client),
+        ),
+        user_proxy=autogen.UserProxyAgent(
+            name="USER_PROXY",
+            system_message=USER_PROXY_SYSTEM_MESSAGE,
+            human_input_mode="NEVER",  # Automated for now
+            max_consecutive_auto_reply=10,
+            code_execution_config={"work_dir": "logs", "use_docker": False},
+        ),
+        compactor=compactor or ToolResultCompactor.from_config(),
     )
+    register_analysis_tools(team, tool_executor)
+    team.cached_agents = attach_completion_cache(team.agents)
+    return team
+
+
+# Default team (module-level agents used by existing imports), built lazily
+_default_team: Optional[AnalysisTeam] = None
+_default_team_lock = threading.Lock()
+_DEFAULT_TEAM_AGENTS = (
+    "user_proxy",
+    "data_collector",
+    "price_analyzer",
+    "review_generator",
+    "quality_assurance",
 )
-def adapt_game_review_style(
-    game_name: str,
-    style: str = "casual",
-    format_type: str = "summary",
-    audience: str = "general_public",
-    platform: str = "website",
-    max_length: Optional[int] = None,
-) -> Dict[str, Any]:
-    """Wrapper function for adapt_review_for_context tool (Phase 3 Point 2)"""
-    return adapt_review_for_context(
-        game_name, style, format_type, audience, platform, max_length
-    )
 
 
-@user_proxy.register_for_execution()
-@review_generator.register_for_llm(
-    description=(
-        "Create game opinions for multiple platforms simultaneously with "
-        "platform-specific adaptations - Input: game_name (str), platforms (List[str]) - "
-        "Output: Dict with platform-specific review adaptations"
-    )
-)
-def create_platform_specific_reviews(
-    game_name: str, platforms: Optional[List[str]] = None
-) -> Dict[str, Any]:
-    """Wrapper function for create_multi_platform_opinions tool (Phase 3 Point 2)"""
-    return create_multi_platform_opinions(game_name, platforms)
+def get_default_team() -> AnalysisTeam:
+    """Domyślny zespół (agenci modułu), tworzony przy pierwszym użyciu."""
+    global _default_team
+    if _default_team is None:
+        with _default_team_lock:
+            if _default_team is None:
+                _default_team = build_analysis_team(
+                    compactor=get_tool_result_compactor()
+                )
+    return _default_team
 
 
-@user_proxy.register_for_execution()
-@review_generator.register_for_llm(
-    description=(
-        "Get available adaptation options for review customization - "
-        "Input: none - Output: Dict with all available styles, formats, "
-        "audiences, and platforms"
-    )
-)
-def get_adaptation_options() -> Dict[str, Any]:
-    """Wrapper function for get_available_adaptation_options tool (Phase 3 Point 2)"""
-    return get_available_adaptation_options()
+def __getattr__(name: str) -> Any:
+    if name == "default_team":
+        return get_default_team()
+    if name in _DEFAULT_TEAM_AGENTS:
+        return getattr(get_default_team(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_analysis_team() -> list:
@@ -413,13 +317,7 @@ def create_analysis_team() -> list:
     Returns:
         list: Lista agentów w kolejności workflow
     """
-    return [
-        user_proxy,
-        data_collector,
-        price_analyzer,
-        review_generator,
-        quality_assurance,
-    ]
+    return get_default_team().agents
 
 
 def get_agent_by_name(name: str) -> Optional[autogen.Agent]:
@@ -432,11 +330,5 @@ def get_agent_by_name(name: str) -> Optional[autogen.Agent]:
     Returns:
         Optional[autogen.Agent]: Agent lub None jeśli nie znaleziono
     """
-    agents = {
-        "DATA_COLLECTOR_agent": data_collector,
-        "PRICE_ANALYZER_agent": price_analyzer,
-        "REVIEW_GENERATOR_agent": review_generator,
-        "QUALITY_ASSURANCE_agent": quality_assurance,
-        "USER_PROXY": user_proxy,
-    }
+    agents = {agent.name: agent for agent in get_default_team().agents}
     return agents.get(name)
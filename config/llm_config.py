@@ -97,6 +97,44 @@ def get_user_proxy_config() -> Dict[str, Any]:
     return config
 
 
+def get_completion_cache_config() -> Dict[str, Any]:
+    """
+    Konfiguracja cache odpowiedzi LLM (utils/llm_completion_cache.py).
+
+    Cache is enabled only for agents with deterministic, low-temperature
+    output; creative agents always get a fresh completion.
+    """
+    return {
+        "db_path": "cache/llm_completions.db",
+        "ttl_seconds": 24 * 3600,  # Ceny i dane gier zmieniają się codziennie
+        "max_entries": 5000,
+        "max_bytes": 50 * 1024 * 1024,
+        "agents": {
+            "DATA_COLLECTOR_agent": True,  # temperature 0.0
+            "PRICE_ANALYZER_agent": False,
+            "REVIEW_GENERATOR_agent": False,
+            "QUALITY_ASSURANCE_agent": True,  # temperature 0.2
+            "USER_PROXY": False,
+        },
+    }
+
+
+def get_tool_compaction_config() -> Dict[str, Any]:
+    """
+    Konfiguracja kompaktowania wyników narzędzi (utils/tool_result_compaction.py).
+
+    Results above the token budget are summarized before they enter the
+    conversation; the full payload stays available by id.
+    """
+    return {
+        "token_budget": 600,
+        "tool_budgets": {
+            "search_and_scrape_game": 1200,  # Dane gry są przekazywane do innych narzędzi
+        },
+        "max_stored_results": 256,
+    }
+
+
 # Cost analysis and model comparison
 def get_cost_analysis() -> Dict[str, Any]:
     """
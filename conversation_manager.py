@@ -4,16 +4,16 @@ Menedżer konwersacji do zarządzania workflow analizy gier
 """
 
 import autogen
-from typing import Dict, Any, List, Optional
-from autogen_agents import (
-    user_proxy,
-    data_collector,
-    price_analyzer,
-    review_generator,
-    quality_assurance,
-    create_analysis_team,
-)
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional
+from autogen_agents import AnalysisTeam, create_analysis_team, get_default_team
 from config.llm_config import get_llm_config
+from utils.agent_pool import AnalysisTeamPool, SharedToolExecutor
+from utils.analysis_pipeline import run_analysis_pipeline, synthesize_narrative
+from utils.llm_completion_cache import get_llm_completion_cache
+from utils.speaker_selection import AnalysisSpeakerFSM
 import logging
 
 # Configure logging
@@ -26,57 +26,181 @@ class GameAnalysisManager:
     Menedżer do koordynacji analizy gier przez zespół agentów AutoGen.
     """
 
-    def __init__(self):
-        """Inicjalizuje menedżera z zespołem agentów."""
-        self.agents = create_analysis_team()
+    def __init__(self, team_pool: Optional[AnalysisTeamPool] = None):
+        """
+        Inicjalizuje menedżera z zespołem agentów.
+
+        Args:
+            team_pool: Pula izolowanych zespołów (konwersacje równoległe);
+                bez puli używany jest domyślny zespół modułu ``autogen_agents``
+        """
+        self.team_pool = team_pool
+        self._agents: Optional[list] = None
         self.analysis_results = {}
 
-    def analyze_game(self, game_name: str, max_rounds: int = 15) -> Dict[str, Any]:
+    @property
+    def agents(self) -> list:
+        """Agenci domyślnego zespołu (tworzeni przy pierwszym użyciu)."""
+        if self._agents is None:
+            self._agents = create_analysis_team()
+        return self._agents
+
+    @contextmanager
+    def _conversation_team(self) -> Iterator[AnalysisTeam]:
+        """Zespół agentów na czas jednej konwersacji."""
+        if self.team_pool is None:
+            yield get_default_team()
+        else:
+            with self.team_pool.team() as team:
+                yield team
+
+    def analyze_game(
+        self, game_name: str, max_rounds: int = 15, mode: str = "agents"
+    ) -> Dict[str, Any]:
         """
         Przeprowadza pełną analizę gry używając zespołu agentów.
 
         Args:
             game_name (str): Nazwa gry do analizy
             max_rounds (int): Maksymalna liczba rund konwersacji
+            mode (str): "agents" (GroupChat), "fsm" (GroupChat z deterministycznym
+                wyborem mówcy, patrz ``AnalysisSpeakerFSM``) lub "hybrid"
+                (deterministyczne narzędzia + jedno wywołanie LLM, patrz
+                ``hybrid_analysis``)
 
         Returns:
             Dict: Wyniki analizy lub komunikat o błędzie
         """
+        if mode == "hybrid":
+            return self.hybrid_analysis(game_name)
+        if mode not in ("agents", "fsm"):
+            return {
+                "success": False,
+                "error": f"Unknown analysis mode: {mode}",
+                "game_name": game_name,
+            }
+
         logger.info(f"🎮 Starting comprehensive analysis for: {game_name}")
 
         try:
-            # Prepare initial message
-            initial_message = self._create_analysis_prompt(game_name)
-
-            # Create group chat
-            groupchat = autogen.GroupChat(
-                agents=self.agents,
-                messages=[],
-                max_round=max_rounds,
-                speaker_selection_method="auto",
-                allow_repeat_speaker=False,
-            )
+            with self._conversation_team() as team:
+                return self._run_team_analysis(team, game_name, max_rounds, mode)
 
-            # Create manager
-            manager = autogen.GroupChatManager(
-                groupchat=groupchat, llm_config=get_llm_config()
+        except Exception as e:
+            error_msg = f"Error during game analysis: {str(e)}"
+            logger.error(f"❌ {error_msg}")
+            return {"success": False, "error": error_msg, "game_name": game_name}
+
+    def _run_team_analysis(
+        self, team: AnalysisTeam, game_name: str, max_rounds: int, mode: str
+    ) -> Dict[str, Any]:
+        """Konwersacja GroupChat jednego zespołu."""
+        # Prepare initial message
+        initial_message = self._create_analysis_prompt(game_name, mode)
+
+        # Create group chat (FSM mode: no LLM selection calls, bounded rounds)
+        speaker_fsm = AnalysisSpeakerFSM() if mode == "fsm" else None
+        groupchat = autogen.GroupChat(
+            agents=team.agents,
+            messages=[],
+            max_round=speaker_fsm.max_rounds if speaker_fsm else max_rounds,
+            speaker_selection_method=speaker_fsm or "auto",
+            allow_repeat_speaker=False,
+        )
+
+        # Create manager
+        manager = autogen.GroupChatManager(
+            groupchat=groupchat, llm_config=get_llm_config()
+        )
+
+        # Start analysis
+        logger.info("🚀 Initiating agent conversation...")
+
+        if speaker_fsm:
+            speaker_fsm.reset()
+        team.compactor.start_conversation()
+        result = team.user_proxy.initiate_chat(
+            manager, message=initial_message, silent=False
+        )
+
+        # Extract and structure results
+        analysis_results = self._extract_results(result, game_name, team)
+        if speaker_fsm:
+            analysis_results["speaker_selection"] = speaker_fsm.get_summary()
+        analysis_results["tool_result_compaction"] = team.compactor.get_statistics()
+        if any(team.cached_agents.values()):
+            analysis_results["completion_cache"] = (
+                get_llm_completion_cache().get_statistics()
             )
 
-            # Start analysis
-            logger.info("🚀 Initiating agent conversation...")
+        logger.info("✅ Analysis completed successfully")
+        return analysis_results
 
-            result = user_proxy.initiate_chat(
-                manager, message=initial_message, silent=False
-            )
+    def hybrid_analysis(
+        self, game_name: str, synthesize: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Pełna analiza bez konwersacji agentów: narzędzia ``agent_tools``
+        wykonywane bezpośrednio, LLM tylko do końcowej narracji (jedno wywołanie).
 
-            # Extract and structure results
-            analysis_results = self._extract_results(result, game_name)
+        Args:
+            game_name (str): Nazwa gry
+            synthesize (bool): Czy wygenerować narrację LLM (False = zero wywołań LLM)
+
+        Returns:
+            Dict: Wyniki analizy z czasami kroków i zużyciem tokenów
+        """
+        logger.info(f"⚙️ Starting hybrid analysis for: {game_name}")
+        started = time.perf_counter()
 
-            logger.info("✅ Analysis completed successfully")
-            return analysis_results
+        try:
+            facts = run_analysis_pipeline(game_name)
+            if not facts.success:
+                return {
+                    "success": False,
+                    "error": facts.context.game_data.get(
+                        "message", "Could not retrieve game data"
+                    ),
+                    "game_name": game_name,
+                    "analysis_type": "hybrid",
+                }
+
+            # Deterministic review text is the fallback narrative
+            narrative = facts.review.get("formatted_review", "")
+            token_usage: Dict[str, Any] = {}
+            llm_calls = 0
+            if synthesize:
+                synthesis_started = time.perf_counter()
+                try:
+                    llm_calls = 1
+                    narrative, token_usage = synthesize_narrative(facts)
+                except Exception as e:
+                    logger.warning(f"⚠️ Narrative synthesis failed, using review: {e}")
+                stage_seconds = time.perf_counter() - synthesis_started
+            else:
+                stage_seconds = 0.0
+
+            timings = {stage.name: round(stage.seconds, 3) for stage in facts.stages}
+            timings["narrative_synthesis"] = round(stage_seconds, 3)
+
+            logger.info("✅ Hybrid analysis completed successfully")
+            return {
+                "success": True,
+                "game_name": game_name,
+                "analysis_type": "hybrid",
+                "timestamp": self._get_timestamp(),
+                "narrative": narrative,
+                "facts": facts.prompt_facts(),
+                "review": facts.review.get("review_data", {}),
+                "quality_assessment": facts.quality.get("quality_assessment", {}),
+                "stage_timings": timings,
+                "llm_calls": llm_calls,
+                "token_usage": token_usage,
+                "total_seconds": round(time.perf_counter() - started, 3),
+            }
 
         except Exception as e:
-            error_msg = f"Error during game analysis: {str(e)}"
+            error_msg = f"Error during hybrid analysis: {str(e)}"
             logger.error(f"❌ {error_msg}")
             return {"success": False, "error": error_msg, "game_name": game_name}
 
@@ -93,10 +217,15 @@ class GameAnalysisManager:
         logger.info(f"⚡ Starting quick analysis for: {game_name}")
 
         try:
-            # Just use data collector and one analysis agent
-            quick_agents = [user_proxy, data_collector, price_analyzer]
-
-            initial_message = f"""
+            with self._conversation_team() as team:
+                # Just use data collector and one analysis agent
+                quick_agents = [
+                    team.user_proxy,
+                    team.data_collector,
+                    team.price_analyzer,
+                ]
+
+                initial_message = f"""
 Please perform a quick analysis of the game: {game_name}
 
 Tasks:
@@ -107,20 +236,20 @@ Tasks:
 Keep it concise and focused.
 """
 
-            groupchat = autogen.GroupChat(
-                agents=quick_agents,
-                messages=[],
-                max_round=8,
-                speaker_selection_method="round_robin",
-            )
+                groupchat = autogen.GroupChat(
+                    agents=quick_agents,
+                    messages=[],
+                    max_round=8,
+                    speaker_selection_method="round_robin",
+                )
 
-            manager = autogen.GroupChatManager(
-                groupchat=groupchat, llm_config=get_llm_config()
-            )
+                manager = autogen.GroupChatManager(
+                    groupchat=groupchat, llm_config=get_llm_config()
+                )
 
-            result = user_proxy.initiate_chat(
-                manager, message=initial_message, silent=False
-            )
+                result = team.user_proxy.initiate_chat(
+                    manager, message=initial_message, silent=False
+                )
 
             quick_results = self._extract_quick_results(result, game_name)
 
@@ -132,8 +261,16 @@ Keep it concise and focused.
             logger.error(f"❌ {error_msg}")
             return {"success": False, "error": error_msg, "game_name": game_name}
 
-    def _create_analysis_prompt(self, game_name: str) -> str:
+    def _create_analysis_prompt(self, game_name: str, mode: str = "agents") -> str:
         """Tworzy szczegółowy prompt do pełnej analizy."""
+        if mode == "fsm":
+            # AnalysisSpeakerFSM ends the chat on the QA verdict, not on TERMINATE
+            termination = (
+                "Do not reply 'TERMINATE': QUALITY_ASSURANCE_agent's "
+                "'QA_STATUS: PASS' ends the analysis"
+            )
+        else:
+            termination = "Terminate with 'TERMINATE' when complete"
         return f"""
 Please conduct a comprehensive analysis of the game: {game_name}
 
@@ -147,13 +284,13 @@ Each agent should:
 - Use available tools when appropriate
 - Provide clear, structured output
 - Pass relevant information to the next agent
-- Terminate with 'TERMINATE' when complete
+- {termination}
 
 Start with data collection and proceed through each step systematically.
 """
 
     def _extract_results(
-        self, conversation_result: Any, game_name: str
+        self, conversation_result: Any, game_name: str, team: AnalysisTeam
     ) -> Dict[str, Any]:
         """Wyciąga ustrukturyzowane wyniki z konwersacji agentów."""
 
@@ -166,7 +303,7 @@ Start with data collection and proceed through each step systematically.
             "analysis_type": "comprehensive",
             "conversation_summary": "Full analysis completed by agent team",
             "timestamp": self._get_timestamp(),
-            "agents_involved": [agent.name for agent in self.agents],
+            "agents_involved": [agent.name for agent in team.agents],
             "raw_conversation": (
                 str(conversation_result)
                 if conversation_result
@@ -200,18 +337,19 @@ Start with data collection and proceed through each step systematically.
 
 
 # Convenience functions for easy usage
-def analyze_game_comprehensive(game_name: str) -> Dict[str, Any]:
+def analyze_game_comprehensive(game_name: str, mode: str = "agents") -> Dict[str, Any]:
     """
     Funkcja pomocnicza do przeprowadzenia pełnej analizy gry.
 
     Args:
         game_name (str): Nazwa gry
+        mode (str): "agents", "fsm" lub "hybrid"
 
     Returns:
         Dict: Wyniki analizy
     """
     manager = GameAnalysisManager()
-    return manager.analyze_game(game_name)
+    return manager.analyze_game(game_name, mode=mode)
 
 
 def analyze_game_quick(game_name: str) -> Dict[str, Any]:
@@ -228,6 +366,56 @@ def analyze_game_quick(game_name: str) -> Dict[str, Any]:
     return manager.quick_analysis(game_name)
 
 
+def analyze_games_concurrently(
+    game_names: List[str],
+    max_concurrent: int = 4,
+    mode: str = "agents",
+    tool_rate_limit: float = 2.0,
+) -> Dict[str, Any]:
+    """
+    Równoległa analiza listy gier przez izolowane zespoły agentów.
+
+    Each conversation gets its own team from an ``AnalysisTeamPool``; all
+    teams share one rate-limited tool executor and one LLM HTTP client.
+
+    Args:
+        game_names (List[str]): Nazwy gier
+        max_concurrent (int): Liczba równoległych konwersacji
+        mode (str): "agents" lub "fsm"
+        tool_rate_limit (float): Wywołania narzędzi na sekundę (wszystkie zespoły)
+
+    Returns:
+        Dict: Wyniki w kolejności ``game_names`` i statystyki puli
+    """
+    started = time.perf_counter()
+    pool = AnalysisTeamPool(
+        size=max_concurrent,
+        tool_executor=SharedToolExecutor(
+            max_concurrent=max_concurrent, rate_limit=tool_rate_limit
+        ),
+    )
+    manager = GameAnalysisManager(team_pool=pool)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+            results = list(
+                executor.map(
+                    lambda game_name: manager.analyze_game(game_name, mode=mode),
+                    game_names,
+                )
+            )
+        return {
+            "success": True,
+            "results": results,
+            "games_analyzed": len(results),
+            "succeeded": sum(1 for result in results if result.get("success")),
+            "total_seconds": round(time.perf_counter() - started, 3),
+            "pool": pool.get_statistics(),
+        }
+    finally:
+        pool.close()
+
+
 if __name__ == "__main__":
     # Test the conversation manager
     test_game = "Hollow Knight"
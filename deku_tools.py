@@ -1,11 +1,13 @@
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from typing import Optional, Dict, List
 import json
 import re  # Dodaj import modułu re dla wyrażeń regularnych
 from datetime import datetime
 from urllib.parse import quote
 
+from utils.tracing import trace_span
+
 BASE_URL = "https://www.dekudeals.com"
 
 
@@ -92,8 +94,10 @@ def search_deku_deals(query: str) -> Optional[str]:
     print(f"Szukam gry '{query}' na: {search_url}")
 
     try:
-        response = requests.get(search_url)
-        response.raise_for_status()
+        with trace_span("search", query=query) as span:
+            response = requests.get(search_url)
+            response.raise_for_status()
+            span.set_attribute("bytes", len(response.content))
 
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -121,6 +125,175 @@ def search_deku_deals(query: str) -> Optional[str]:
         return None
 
 
+# Klucze używane w danych wykresu historii cen (np. format Chart.js {x, y})
+PRICE_HISTORY_DATE_KEYS = ("date", "x", "t", "time", "timestamp")
+PRICE_HISTORY_PRICE_KEYS = ("price", "y", "value", "amount")
+
+
+def _parse_history_date(raw) -> Optional[str]:
+    """Zamienia datę z wykresu (ISO, 'Month Day, Year' lub epoch) na ISO."""
+    if raw is None:
+        return None
+    if isinstance(raw, (int, float)):
+        # Znaczniki czasu w JS są w milisekundach
+        seconds = raw / 1000 if raw > 1e11 else raw
+        return datetime.fromtimestamp(seconds).isoformat()
+
+    text = str(raw).strip()
+    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%B %d, %Y", "%b %d, %Y"):
+        try:
+            return datetime.strptime(
+                text[:19] if "T" in text else text, fmt
+            ).isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_history_price(raw) -> Optional[float]:
+    """Zamienia cenę z wykresu (liczba lub tekst z walutą) na float."""
+    if raw is None:
+        return None
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    match = re.search(r"\d+(?:[.,]\d+)?", str(raw).replace(" ", ""))
+    return float(match.group().replace(",", ".")) if match else None
+
+
+def _normalize_history_point(raw) -> Optional[Dict]:
+    """Normalizuje pojedynczy punkt historii cen do {'date', 'price'}."""
+    if isinstance(raw, dict):
+        date_raw = next((raw[k] for k in PRICE_HISTORY_DATE_KEYS if k in raw), None)
+        price_raw = next((raw[k] for k in PRICE_HISTORY_PRICE_KEYS if k in raw), None)
+    elif isinstance(raw, (list, tuple)) and len(raw) >= 2:
+        date_raw, price_raw = raw[0], raw[1]
+    else:
+        return None
+
+    date = _parse_history_date(date_raw)
+    price = _parse_history_price(price_raw)
+    if date is None or price is None:
+        return None
+    return {"date": date, "price": price}
+
+
+def _extract_history_series(data) -> List[Dict]:
+    """Wyszukuje w strukturze JSON listę punktów historii cen."""
+    if isinstance(data, list):
+        points = [_normalize_history_point(item) for item in data]
+        points = [point for point in points if point]
+        if points:
+            return points
+        # Lista serii (np. datasets Chart.js) - weź pierwszą niepustą
+        for item in data:
+            points = _extract_history_series(item)
+            if points:
+                return points
+    elif isinstance(data, dict):
+        for value in data.values():
+            if isinstance(value, (list, dict)):
+                points = _extract_history_series(value)
+                if points:
+                    return points
+    return []
+
+
+def parse_price_history_points(soup: BeautifulSoup) -> List[Dict]:
+    """
+    Parsuje pełną historię cen z sekcji 'Price history' strony gry.
+
+    Obsługuje dane wykresu osadzone jako JSON (w <script> lub atrybutach data-*)
+    oraz wiersze tabeli z datą i ceną. Zwraca listę {'date': ISO, 'price': float}
+    posortowaną po dacie (pustą, gdy brak danych).
+    """
+    section = soup.find("div", id="price-history")
+    candidates = []
+
+    # 1. JSON w tagach <script> sekcji lub oznaczonych id historii cen
+    scripts = list(section.find_all("script")) if section else []
+    scripts += soup.find_all("script", id=re.compile(r"price[-_]history", re.I))
+    for script in scripts:
+        if script.string:
+            candidates.append(script.string)
+
+    # 2. JSON w atrybutach data-* elementów sekcji
+    if section:
+        for element in [section] + section.find_all(True):
+            for attr, value in element.attrs.items():
+                if attr.startswith("data-") and isinstance(value, str):
+                    if value.lstrip().startswith(("[", "{")):
+                        candidates.append(value)
+
+    for raw in candidates:
+        try:
+            points = _extract_history_series(json.loads(raw))
+        except (ValueError, TypeError):
+            continue
+        if points:
+            return sorted(points, key=lambda point: point["date"])
+
+    # 3. Wiersze tabeli zawierające datę i cenę
+    points = []
+    if section:
+        date_pattern = re.compile(r"\d{4}-\d{2}-\d{2}|[A-Z][a-z]+\.? \d{1,2}, \d{4}")
+        for row in section.find_all("tr"):
+            row_text = row.get_text(" ", strip=True)
+            date_match = date_pattern.search(row_text)
+            price_td = row.find("td", class_="text-right")
+            if not date_match or not price_td:
+                continue
+            point = _normalize_history_point(
+                (date_match.group().replace(".", ""), price_td.get_text(strip=True))
+            )
+            if point:
+                points.append(point)
+
+    return sorted(points, key=lambda point: point["date"])
+
+
+def parse_current_eshop_price(soup: BeautifulSoup) -> str:
+    """
+    Wyciąga aktualną cenę eShop z tabeli cen strony gry.
+    Zwraca "N/A", jeśli cena nie została znaleziona.
+    """
+    # Zidentyfikowana tabela: <table class='table table-align-middle item-price-table'>
+    price_table = soup.find("table", class_="item-price-table")
+    if not price_table:
+        print("Nie znaleziono tabeli cen.")
+        return "N/A"
+
+    # Pierwszy wiersz (tr) z ceną jest zazwyczaj aktualną ceną eShop (digital)
+    first_price_row = price_table.find("tr")
+    if not first_price_row:
+        return "N/A"
+
+    price_button_tag = first_price_row.find("div", class_="btn-primary")
+    if not price_button_tag:
+        return "N/A"
+    return price_button_tag.get_text(strip=True)
+
+
+def scrape_current_price(game_url: str) -> Optional[str]:
+    """
+    Pobiera tylko aktualną cenę eShop ze strony gry (bez pełnego scrapowania).
+    Parsowana jest wyłącznie tabela cen. Zwraca None w przypadku błędu.
+    """
+    try:
+        response = requests.get(game_url, timeout=15)
+        response.raise_for_status()
+
+        soup = BeautifulSoup(
+            response.text,
+            "html.parser",
+            parse_only=SoupStrainer("table", class_="item-price-table"),
+        )
+        return parse_current_eshop_price(soup)
+
+    except requests.exceptions.RequestException as e:
+        print(f"Błąd sieciowy podczas pobierania ceny z {game_url}: {e}")
+        return None
+
+
 def scrape_game_details(game_url: str) -> Optional[Dict]:
     """
     Scrapuje szczegółowe dane o grze z jej strony DekuDeals.
@@ -129,328 +302,313 @@ def scrape_game_details(game_url: str) -> Optional[Dict]:
     print(f"Scrapuję szczegóły z URL: {game_url}")
 
     try:
-        response = requests.get(game_url)
-        response.raise_for_status()
+        with trace_span("scrape", url=game_url) as span:
+            response = requests.get(game_url)
+            response.raise_for_status()
+            span.set_attribute("bytes", len(response.content))
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        game_details = {}
+        with trace_span("parse", url=game_url):
+            return _parse_game_details(response.text)
 
-        # --- Tytuł Gry ---
-        # Widać, że tytuł jest w <span class='display-5 item-title'> wewnątrz <h2>
-        title_tag = soup.find("span", class_="item-title")
-        if title_tag:
-            game_details["title"] = title_tag.get_text(strip=True)
-        else:
-            game_details["title"] = "Nieznany tytuł"
-
-        # --- Sekcja 'Details' (list-group) ---
-        details_list = soup.find("ul", class_="details")
-        if details_list:
-            # Iteruj przez wszystkie elementy listy w sekcji 'Details'
-            for li in details_list.find_all("li", class_="list-group-item"):
-                strong_tag = li.find("strong")
-                if not strong_tag:
-                    continue  # Pomijamy elementy bez strong (np. te zagnieżdżone ul dla player modes)
-
-                label = strong_tag.get_text(strip=True).replace(":", "")  # Np. 'MSRP'
-
-                # Użyj find_next_sibling('dd') dla pewności, lub po prostu .find() dla a
-                # Sprawdź, co następuje po strong i jak wyciągnąć tekst
-
-                # --- MSRP ---
-                if "MSRP" in label:
-                    # Cena jest bezpośrednio po strong, lub w innerHTML
-                    msrp_text = li.get_text(strip=True).replace(label, "").strip()
-                    game_details["MSRP"] = msrp_text
-
-                # --- Release date ---
-                elif "Release date" in label:
-                    release_date_text = (
-                        li.get_text(strip=True).replace(label, "").strip()
-                    )
-                    # Parsuj surowy tekst na strukturę użyteczną dla AI
-                    parsed_release_dates = parse_release_dates(release_date_text)
-                    game_details["release_date"] = (
-                        release_date_text  # Zachowaj surowy dla debug
-                    )
-                    game_details["release_dates_parsed"] = (
-                        parsed_release_dates  # Dodaj sparsowane dane
-                    )
+    except requests.exceptions.RequestException as e:
+        print(f"Błąd sieciowy podczas scrapowania szczegółów z '{game_url}': {e}")
+        return None
+    except Exception as e:
+        print(f"Nieoczekiwany błąd podczas parsowania szczegółów z '{game_url}': {e}")
+        return None
 
-                # --- Genre ---
-                elif "Genre" in label:
-                    genres = [
-                        a.get_text(strip=True)
-                        for a in li.find_all(
-                            "a", href=re.compile(r"/games\?filter\[genre\]=")
-                        )
-                    ]
-                    game_details["genres"] = genres if genres else ["Nieznany"]
 
-                # --- Developer ---
-                elif "Developer" in label:
-                    dev_tag = li.find(
-                        "a", href=re.compile(r"/games\?filter\[developer\]=")
-                    )
-                    if dev_tag:
-                        game_details["developer"] = dev_tag.get_text(strip=True)
-                    else:
-                        game_details["developer"] = "Nieznany"
-
-                # --- Publisher ---
-                elif "Publisher" in label:
-                    pub_tag = li.find(
-                        "a", href=re.compile(r"/games\?filter\[publisher\]=")
-                    )
-                    if pub_tag:
-                        game_details["publisher"] = pub_tag.get_text(strip=True)
-                    else:
-                        game_details["publisher"] = "Nieznany"
-
-                # --- Metacritic ---
-                elif "Metacritic" in label:
-                    metacritic_link = li.find("a", class_="metacritic")
-                    if metacritic_link:
-                        # Pierwszy span to wynik Metacritic, drugi to User Score (opcjonalnie)
-                        scores = metacritic_link.find_all("span")
-                        if scores:
-                            game_details["metacritic_score"] = scores[0].get_text(
-                                strip=True
-                            )
-                        if len(scores) > 1:
-                            game_details["metacritic_user_score"] = scores[1].get_text(
-                                strip=True
-                            )
-                    else:
-                        game_details["metacritic_score"] = "Brak oceny"
-                        game_details["metacritic_user_score"] = "Brak oceny"
-
-                # --- OpenCritic ---
-                elif "OpenCritic" in label:
-                    opencritic_link = li.find("a", class_="opencritic")
-                    if opencritic_link:
-                        # Wynik jest bezpośrednio po div'ie z klasą 'opencritic-tier'
-                        # Lub jest ostatnim tekstem w linku a
-                        score_text = "".join(
-                            opencritic_link.find_all(string=True, recursive=False)
-                        ).strip()
-                        game_details["opencritic_score"] = score_text
-                    else:
-                        game_details["opencritic_score"] = "Brak oceny"
-
-                # --- Platformy ---
-                # Jak zauważyłeś, "Platforms" to ostatni element <li> w 'details' list
-                # Sprawdź, czy `li` zawiera tekst "Platforms", a następnie pobierz jego tekst
-                if "Platforms" in label:  # `Platforms:`
-                    # Tekst platformy jest bezpośrednio w li, po strong
-                    platform_text = li.get_text(strip=True).replace(label, "").strip()
-                    game_details["platform"] = platform_text
+def _parse_game_details(html: str) -> Dict:
+    """Parsuje stronę produktu DekuDeals do słownika szczegółów gry."""
+    soup = BeautifulSoup(html, "html.parser")
+    game_details = {}
 
-        else:
-            print("Nie znaleziono sekcji 'Details'.")
-
-        # --- Aktualne Ceny (z tabeli) ---
-        # Zidentyfikowana tabela: <table class='table table-align-middle item-price-table'>
-        price_table = soup.find("table", class_="item-price-table")
-        if price_table:
-            # Pierwszy wiersz (tr) z ceną jest zazwyczaj aktualną ceną eShop (digital)
-            first_price_row = price_table.find("tr")
-            if first_price_row:
-                price_button_tag = first_price_row.find(
-                    "div", class_="btn-primary"
-                )  # Przycisk z ceną
-                if price_button_tag:
-                    game_details["current_eshop_price"] = price_button_tag.get_text(
-                        strip=True
+    # --- Tytuł Gry ---
+    # Widać, że tytuł jest w <span class='display-5 item-title'> wewnątrz <h2>
+    title_tag = soup.find("span", class_="item-title")
+    if title_tag:
+        game_details["title"] = title_tag.get_text(strip=True)
+    else:
+        game_details["title"] = "Nieznany tytuł"
+
+    # --- Sekcja 'Details' (list-group) ---
+    details_list = soup.find("ul", class_="details")
+    if details_list:
+        # Iteruj przez wszystkie elementy listy w sekcji 'Details'
+        for li in details_list.find_all("li", class_="list-group-item"):
+            strong_tag = li.find("strong")
+            if not strong_tag:
+                continue  # Pomijamy elementy bez strong (np. te zagnieżdżone ul dla player modes)
+
+            label = strong_tag.get_text(strip=True).replace(":", "")  # Np. 'MSRP'
+
+            # Użyj find_next_sibling('dd') dla pewności, lub po prostu .find() dla a
+            # Sprawdź, co następuje po strong i jak wyciągnąć tekst
+
+            # --- MSRP ---
+            if "MSRP" in label:
+                # Cena jest bezpośrednio po strong, lub w innerHTML
+                msrp_text = li.get_text(strip=True).replace(label, "").strip()
+                game_details["MSRP"] = msrp_text
+
+            # --- Release date ---
+            elif "Release date" in label:
+                release_date_text = li.get_text(strip=True).replace(label, "").strip()
+                # Parsuj surowy tekst na strukturę użyteczną dla AI
+                parsed_release_dates = parse_release_dates(release_date_text)
+                game_details["release_date"] = (
+                    release_date_text  # Zachowaj surowy dla debug
+                )
+                game_details["release_dates_parsed"] = (
+                    parsed_release_dates  # Dodaj sparsowane dane
+                )
+
+            # --- Genre ---
+            elif "Genre" in label:
+                genres = [
+                    a.get_text(strip=True)
+                    for a in li.find_all(
+                        "a", href=re.compile(r"/games\?filter\[genre\]=")
                     )
+                ]
+                game_details["genres"] = genres if genres else ["Nieznany"]
+
+            # --- Developer ---
+            elif "Developer" in label:
+                dev_tag = li.find("a", href=re.compile(r"/games\?filter\[developer\]="))
+                if dev_tag:
+                    game_details["developer"] = dev_tag.get_text(strip=True)
                 else:
-                    game_details["current_eshop_price"] = "N/A"
-            else:
-                game_details["current_eshop_price"] = "N/A"
-        else:
-            print("Nie znaleziono tabeli cen.")
-            game_details["current_eshop_price"] = "N/A"
-
-        # --- Najniższa Cena w Historii ---
-        # Znajduje się w sekcji 'Price history'
-        price_history_section = soup.find("div", id="price-history")
-        if price_history_section:
-            # Szukaj tekstu 'All time low' i obok niego ceny
-            all_time_low_row = price_history_section.find(
-                "strong", string="All time low"
+                    game_details["developer"] = "Nieznany"
+
+            # --- Publisher ---
+            elif "Publisher" in label:
+                pub_tag = li.find("a", href=re.compile(r"/games\?filter\[publisher\]="))
+                if pub_tag:
+                    game_details["publisher"] = pub_tag.get_text(strip=True)
+                else:
+                    game_details["publisher"] = "Nieznany"
+
+            # --- Metacritic ---
+            elif "Metacritic" in label:
+                metacritic_link = li.find("a", class_="metacritic")
+                if metacritic_link:
+                    # Pierwszy span to wynik Metacritic, drugi to User Score (opcjonalnie)
+                    scores = metacritic_link.find_all("span")
+                    if scores:
+                        game_details["metacritic_score"] = scores[0].get_text(
+                            strip=True
+                        )
+                    if len(scores) > 1:
+                        game_details["metacritic_user_score"] = scores[1].get_text(
+                            strip=True
+                        )
+                else:
+                    game_details["metacritic_score"] = "Brak oceny"
+                    game_details["metacritic_user_score"] = "Brak oceny"
+
+            # --- OpenCritic ---
+            elif "OpenCritic" in label:
+                opencritic_link = li.find("a", class_="opencritic")
+                if opencritic_link:
+                    # Wynik jest bezpośrednio po div'ie z klasą 'opencritic-tier'
+                    # Lub jest ostatnim tekstem w linku a
+                    score_text = "".join(
+                        opencritic_link.find_all(string=True, recursive=False)
+                    ).strip()
+                    game_details["opencritic_score"] = score_text
+                else:
+                    game_details["opencritic_score"] = "Brak oceny"
+
+            # --- Platformy ---
+            # Jak zauważyłeś, "Platforms" to ostatni element <li> w 'details' list
+            # Sprawdź, czy `li` zawiera tekst "Platforms", a następnie pobierz jego tekst
+            if "Platforms" in label:  # `Platforms:`
+                # Tekst platformy jest bezpośrednio w li, po strong
+                platform_text = li.get_text(strip=True).replace(label, "").strip()
+                game_details["platform"] = platform_text
+
+    else:
+        print("Nie znaleziono sekcji 'Details'.")
+
+    # --- Aktualne Ceny (z tabeli) ---
+    game_details["current_eshop_price"] = parse_current_eshop_price(soup)
+
+    # --- Najniższa Cena w Historii ---
+    # Znajduje się w sekcji 'Price history'
+    price_history_section = soup.find("div", id="price-history")
+    if price_history_section:
+        # Szukaj tekstu 'All time low' i obok niego ceny
+        all_time_low_row = price_history_section.find("strong", string="All time low")
+        if all_time_low_row:
+            # Cena jest w następnym <td> po <tr> zawierającym 'All time low'
+            # lub w td z klasą 'text-right pl-3'
+            lowest_price_td = (
+                all_time_low_row.find_parent("tr")
+                .find_next_sibling("tr")
+                .find("td", class_="text-right")
             )
-            if all_time_low_row:
-                # Cena jest w następnym <td> po <tr> zawierającym 'All time low'
-                # lub w td z klasą 'text-right pl-3'
-                lowest_price_td = (
-                    all_time_low_row.find_parent("tr")
-                    .find_next_sibling("tr")
-                    .find("td", class_="text-right")
+            if lowest_price_td:
+                game_details["lowest_historical_price"] = lowest_price_td.get_text(
+                    strip=True
                 )
-                if lowest_price_td:
-                    game_details["lowest_historical_price"] = lowest_price_td.get_text(
-                        strip=True
-                    )
-                else:
-                    game_details["lowest_historical_price"] = (
-                        "Brak danych o najniższej cenie"
-                    )
             else:
                 game_details["lowest_historical_price"] = (
                     "Brak danych o najniższej cenie"
                 )
         else:
-            print("Nie znaleziono sekcji 'Price history'.")
-            game_details["lowest_historical_price"] = "Brak danych o historii cen"
-
-        # NEW: --- Game Description Extraction ---
-        print("Szukam opisu gry...")
-        description_text = ""
-        awards_list = []
-
-        # Try multiple selectors for description content
-        description_selectors = [
-            # Common selectors for description sections
-            "section[data-section='description']",  # Specific description section
-            "div.description",  # Description div
-            "div#description",  # Description with ID
-            ".game-description",  # Game description class
-            "p.description",  # Description paragraph
-            "div.item-description",  # Item description
-        ]
+            game_details["lowest_historical_price"] = "Brak danych o najniższej cenie"
+    else:
+        print("Nie znaleziono sekcji 'Price history'.")
+        game_details["lowest_historical_price"] = "Brak danych o historii cen"
+
+    # --- Pełna historia cen (punkty wykresu) ---
+    game_details["price_history_points"] = parse_price_history_points(soup)
+    if game_details["price_history_points"]:
+        print(
+            f"✅ Znaleziono {len(game_details['price_history_points'])} punktów historii cen"
+        )
+
+    # NEW: --- Game Description Extraction ---
+    print("Szukam opisu gry...")
+    description_text = ""
+    awards_list = []
+
+    # Try multiple selectors for description content
+    description_selectors = [
+        # Common selectors for description sections
+        "section[data-section='description']",  # Specific description section
+        "div.description",  # Description div
+        "div#description",  # Description with ID
+        ".game-description",  # Game description class
+        "p.description",  # Description paragraph
+        "div.item-description",  # Item description
+    ]
 
-        description_found = False
-        for selector in description_selectors:
-            description_section = soup.select_one(selector)
-            if description_section:
-                description_text = description_section.get_text(strip=True)
-                if description_text and len(description_text) > 20:  # Valid description
-                    description_found = True
-                    print(f"✅ Znaleziono opis używając selektora: {selector}")
-                    break
+    description_found = False
+    for selector in description_selectors:
+        description_section = soup.select_one(selector)
+        if description_section:
+            description_text = description_section.get_text(strip=True)
+            if description_text and len(description_text) > 20:  # Valid description
+                description_found = True
+                print(f"✅ Znaleziono opis używając selektora: {selector}")
+                break
+
+    # If no specific description section found, try alternative approaches
+    if not description_found:
+        print("Nie znaleziono dedykowanej sekcji opisu, szukam alternatywnie...")
+
+        # Look for text patterns that indicate description
+        # Find all paragraphs and look for game description patterns
+        all_paragraphs = soup.find_all("p")
+        for p in all_paragraphs:
+            p_text = p.get_text(strip=True)
+            # Check if paragraph looks like a game description
+            if (
+                p_text
+                and len(p_text) > 50  # Reasonable length
+                and len(p_text) < 2000  # Not too long
+                and not p_text.startswith("$")  # Not price info
+                and not p_text.lower().startswith("rating")  # Not rating
+                and not p_text.lower().startswith("format")  # Not format
+                and (
+                    "game" in p_text.lower()
+                    or "player" in p_text.lower()
+                    or "adventure" in p_text.lower()
+                    or "action" in p_text.lower()
+                    or "story" in p_text.lower()
+                )
+            ):
+                description_text = p_text
+                description_found = True
+                print("✅ Znaleziono opis w paragrafie")
+                break
 
-        # If no specific description section found, try alternative approaches
+        # If still no description, try looking in the main content area
         if not description_found:
-            print("Nie znaleziono dedykowanej sekcji opisu, szukam alternatywnie...")
-
-            # Look for text patterns that indicate description
-            # Find all paragraphs and look for game description patterns
-            all_paragraphs = soup.find_all("p")
-            for p in all_paragraphs:
-                p_text = p.get_text(strip=True)
-                # Check if paragraph looks like a game description
-                if (
-                    p_text
-                    and len(p_text) > 50  # Reasonable length
-                    and len(p_text) < 2000  # Not too long
-                    and not p_text.startswith("$")  # Not price info
-                    and not p_text.lower().startswith("rating")  # Not rating
-                    and not p_text.lower().startswith("format")  # Not format
-                    and (
-                        "game" in p_text.lower()
-                        or "player" in p_text.lower()
-                        or "adventure" in p_text.lower()
-                        or "action" in p_text.lower()
-                        or "story" in p_text.lower()
-                    )
-                ):
-                    description_text = p_text
-                    description_found = True
-                    print("✅ Znaleziono opis w paragrafie")
-                    break
-
-            # If still no description, try looking in the main content area
-            if not description_found:
-                # Look for content after the details section
-                main_content = soup.find("div", class_="container") or soup.find("main")
-                if main_content:
-                    # Find text blocks that might contain description
-                    text_blocks = main_content.find_all(["p", "div"], recursive=True)
-                    for block in text_blocks:
-                        block_text = block.get_text(strip=True)
-                        # Look for descriptive text patterns
-                        if (
-                            block_text
-                            and len(block_text) > 100
-                            and len(block_text) < 1500
-                            and block_text.count(".") >= 2  # Multiple sentences
-                            and not block_text.startswith("Price")
-                            and not block_text.startswith("$")
+            # Look for content after the details section
+            main_content = soup.find("div", class_="container") or soup.find("main")
+            if main_content:
+                # Find text blocks that might contain description
+                text_blocks = main_content.find_all(["p", "div"], recursive=True)
+                for block in text_blocks:
+                    block_text = block.get_text(strip=True)
+                    # Look for descriptive text patterns
+                    if (
+                        block_text
+                        and len(block_text) > 100
+                        and len(block_text) < 1500
+                        and block_text.count(".") >= 2  # Multiple sentences
+                        and not block_text.startswith("Price")
+                        and not block_text.startswith("$")
+                    ):
+                        # Check if it contains game-related keywords
+                        game_keywords = [
+                            "gameplay",
+                            "story",
+                            "adventure",
+                            "action",
+                            "platformer",
+                            "puzzle",
+                            "character",
+                            "world",
+                            "experience",
+                            "journey",
+                            "quest",
+                            "battle",
+                        ]
+                        if any(
+                            keyword in block_text.lower() for keyword in game_keywords
                         ):
-                            # Check if it contains game-related keywords
-                            game_keywords = [
-                                "gameplay",
-                                "story",
-                                "adventure",
-                                "action",
-                                "platformer",
-                                "puzzle",
-                                "character",
-                                "world",
-                                "experience",
-                                "journey",
-                                "quest",
-                                "battle",
-                            ]
-                            if any(
-                                keyword in block_text.lower()
-                                for keyword in game_keywords
-                            ):
-                                description_text = block_text
-                                description_found = True
-                                print("✅ Znaleziono opis w bloku treści")
-                                break
-
-        # Clean and format description
-        if description_text:
-            # Clean up the description text
-            description_text = clean_description_text(description_text)
-            game_details["description"] = description_text
-            game_details["description_length"] = len(description_text)
-
-            # Awards extraction removed due to unreliable results
-        else:
-            game_details["description"] = "No description available"
-            game_details["description_length"] = 0
-            print("⚠️ Nie znaleziono opisu gry")
-
-        # Enhanced genre processing with context
-        if game_details.get("genres"):
-            genres = game_details["genres"]
-            game_details["primary_genre"] = genres[0] if genres else "Unknown"
-            game_details["secondary_genres"] = genres[1:4] if len(genres) > 1 else []
-            game_details["genre_count"] = len(genres)
-            game_details["is_multi_genre"] = len(genres) > 1
-            print(f"✅ Przetworzono {len(genres)} gatunków: {', '.join(genres[:3])}")
-
-        # Add metadata about data completeness
-        game_details["data_extraction_metadata"] = {
-            "has_description": bool(description_text and len(description_text) > 20),
-            "description_source": "found" if description_found else "not_found",
-            "extraction_timestamp": f"{datetime.now().isoformat()}",
-            "enhanced_scraping": True,
-        }
-
-        print(f"Szczegóły zebrane dla {game_details.get('title', 'gry')}:")
-        if (
-            game_details.get("description")
-            and game_details["description"] != "No description available"
-        ):
-            desc_preview = (
-                game_details["description"][:100] + "..."
-                if len(game_details["description"]) > 100
-                else game_details["description"]
-            )
-            print(f"  📝 Opis: {desc_preview}")
-
-        return game_details
-
-    except requests.exceptions.RequestException as e:
-        print(f"Błąd sieciowy podczas scrapowania szczegółów z '{game_url}': {e}")
-        return None
-    except Exception as e:
-        print(f"Nieoczekiwany błąd podczas parsowania szczegółów z '{game_url}': {e}")
-        return None
+                            description_text = block_text
+                            description_found = True
+                            print("✅ Znaleziono opis w bloku treści")
+                            break
+
+    # Clean and format description
+    if description_text:
+        # Clean up the description text
+        description_text = clean_description_text(description_text)
+        game_details["description"] = description_text
+        game_details["description_length"] = len(description_text)
+
+        # Awards extraction removed due to unreliable results
+    else:
+        game_details["description"] = "No description available"
+        game_details["description_length"] = 0
+        print("⚠️ Nie znaleziono opisu gry")
+
+    # Enhanced genre processing with context
+    if game_details.get("genres"):
+        genres = game_details["genres"]
+        game_details["primary_genre"] = genres[0] if genres else "Unknown"
+        game_details["secondary_genres"] = genres[1:4] if len(genres) > 1 else []
+        game_details["genre_count"] = len(genres)
+        game_details["is_multi_genre"] = len(genres) > 1
+        print(f"✅ Przetworzono {len(genres)} gatunków: {', '.join(genres[:3])}")
+
+    # Add metadata about data completeness
+    game_details["data_extraction_metadata"] = {
+        "has_description": bool(description_text and len(description_text) > 20),
+        "description_source": "found" if description_found else "not_found",
+        "extraction_timestamp": f"{datetime.now().isoformat()}",
+        "enhanced_scraping": True,
+    }
+
+    print(f"Szczegóły zebrane dla {game_details.get('title', 'gry')}:")
+    if (
+        game_details.get("description")
+        and game_details["description"] != "No description available"
+    ):
+        desc_preview = (
+            game_details["description"][:100] + "..."
+            if len(game_details["description"]) > 100
+            else game_details["description"]
+        )
+        print(f"  📝 Opis: {desc_preview}")
+
+    return game_details
 
 
 def scrape_dekudeals_collection(collection_url: str) -> Dict[str, any]:
@@ -31,44 +31,12 @@ from termcolor import colored, cprint
 from tqdm import tqdm
 import shutil
 
-# Import project components
-from conversation_manager import (
-    GameAnalysisManager,
-    analyze_game_quick,
-    analyze_game_comprehensive,
-)
-from agent_tools import (
-    search_and_scrape_game,
-    calculate_value_score,
-    calculate_advanced_value_analysis,
-    generate_comprehensive_game_review,
-    generate_quick_game_opinion,
-    compare_games_with_reviews,
-    adapt_review_for_context,
-    create_multi_platform_opinions,
-    scrape_dekudeals_category,
-    get_random_game_sample,
-    get_games_from_popular_categories,
-    # 👨‍👩‍👧‍👦 PHASE 7.1.5: Multi-User System imports
-    register_new_user,
-    get_current_user_details,
-    switch_to_user,
-    list_system_users,
-    create_guest_access,
-    get_user_system_stats,
-    # 🎮 PHASE 7.1.6: Game Collection Management imports
-    add_game_to_collection,
-    update_game_in_collection,
-    remove_game_from_collection,
-    get_user_game_collection,
-    import_steam_library,
-    import_collection_from_csv,
-    export_collection_to_csv,
-    check_if_game_owned,
-    get_collection_recommendations_filter,
-    # 🎮 PHASE 7.1.9: Collection-Aware Analysis import
-    analyze_game_with_collection_awareness,
-)
+# Project components load on first use: --help and quick mode stay free of
+# AutoGen/OpenAI, and each tool module is imported by the command needing it
+from utils.lazy_imports import LazyModule
+
+agent_tools = LazyModule("agent_tools")
+conversation_manager = LazyModule("conversation_manager")
 
 import logging
 
@@ -81,13 +49,14 @@ from utils.batch_processor import (
     create_batch_analysis,
     BatchStatus,
 )
+from utils.tracing import get_tracer, propagate_context, trace_span
 
 
 class EnhancedCLI:
     """Enhanced CLI Interface with colors, progress bars and interactive elements."""
 
     def __init__(self):
-        self.manager = GameAnalysisManager()
+        self._manager = None
         self.terminal_width = shutil.get_terminal_size().columns
         self.colors = {
             "header": "cyan",
@@ -101,20 +70,34 @@ class EnhancedCLI:
         }
 
         # 🚀 FAZA 6.1 - KROK 2: Advanced Multi-Level Cache System
-        self.advanced_cache = get_advanced_cache()
+        # (created with its warming thread on first cache access)
+        self._advanced_cache = None
         self._cache_hits = 0
         self._cache_misses = 0
 
         # Setup cache-aware functions with advanced caching
         self._setup_advanced_cached_functions()
 
+    @property
+    def manager(self):
+        """Menedżer konwersacji agentów (AutoGen ładowany przy pierwszym użyciu)."""
+        if self._manager is None:
+            self._manager = conversation_manager.GameAnalysisManager()
+        return self._manager
+
+    @property
+    def advanced_cache(self):
+        """Wielopoziomowy cache danych gier (tworzony przy pierwszym użyciu)."""
+        if self._advanced_cache is None:
+            self._advanced_cache = get_advanced_cache()
+        return self._advanced_cache
+
     def _setup_advanced_cached_functions(self):
         """
         🚀 FAZA 6.1 - KROK 2: Setup advanced multi-level cache system.
         Features: Persistent cache, TTL expiration, memory+disk hierarchy.
+        The wrapper is installed when agent_tools is first loaded.
         """
-        # Store original functions
-        self._original_search_and_scrape = search_and_scrape_game
 
         # Create advanced cached version
         def advanced_cached_search_and_scrape_game(game_name: str) -> Dict:
@@ -122,7 +105,8 @@ class EnhancedCLI:
             cache_key = game_name.lower().strip()
 
             # Try to get from advanced cache (memory → disk → scrape)
-            cached_result = self.advanced_cache.get(cache_key, game_name)
+            with trace_span("cache_lookup", game=game_name):
+                cached_result = self.advanced_cache.get(cache_key, game_name)
 
             if cached_result is not None:
                 self._cache_hits += 1
@@ -169,11 +153,15 @@ class EnhancedCLI:
                 return result
 
         # Monkey-patch the global function
-        import agent_tools
-
-        agent_tools.search_and_scrape_game = advanced_cached_search_and_scrape_game
+        def install_cached_search(module):
+            # Store original functions
+            self._original_search_and_scrape = module.search_and_scrape_game
+            module.search_and_scrape_game = advanced_cached_search_and_scrape_game
+            self.print_status(
+                "🚀 Advanced multi-level cache system activated", "success"
+            )
 
-        self.print_status("🚀 Advanced multi-level cache system activated", "success")
+        agent_tools.when_loaded(install_cached_search)
 
     def get_cache_stats(self) -> Dict:
         """
@@ -416,6 +404,16 @@ class EnhancedCLI:
 
     def analyze_game_with_progress(
         self, game_name: str, analysis_type: str = "comprehensive"
+    ) -> Dict:
+        """
+        Analiza gry jako jeden ślad: span ``analyze_game`` z dziećmi dla
+        wyszukiwania, kroków równoległych (także w wątkach) i finalizacji.
+        """
+        with trace_span("analyze_game", game=game_name, analysis_type=analysis_type):
+            return self._analyze_game_with_progress(game_name, analysis_type)
+
+    def _analyze_game_with_progress(
+        self, game_name: str, analysis_type: str = "comprehensive"
     ) -> Dict:
         """
         🚀 FAZA 6.1: Optimized game analysis with parallel processing and data sharing.
@@ -510,9 +508,15 @@ class EnhancedCLI:
             with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
                 # Submit all parallel tasks
                 future_to_step = {
-                    executor.submit(run_value_analysis): "value_analysis",
-                    executor.submit(run_review_generation): "review_generation",
-                    executor.submit(run_opinion_adaptations): "opinion_adaptations",
+                    executor.submit(
+                        propagate_context(run_value_analysis)
+                    ): "value_analysis",
+                    executor.submit(
+                        propagate_context(run_review_generation)
+                    ): "review_generation",
+                    executor.submit(
+                        propagate_context(run_opinion_adaptations)
+                    ): "opinion_adaptations",
                 }
 
                 # Collect results as they complete
@@ -588,7 +592,8 @@ class EnhancedCLI:
         """Step 1: Search and scrape game data with collection awareness."""
         try:
             # Use collection-aware analysis instead of standard search
-            result = analyze_game_with_collection_awareness(game_name)
+            with trace_span("search_step", game=game_name):
+                result = agent_tools.analyze_game_with_collection_awareness(game_name)
             return {"success": True, "data": result}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -601,7 +606,8 @@ class EnhancedCLI:
         Performance improvement: No redundant scraping!
         """
         try:
-            result = calculate_advanced_value_analysis(game_data)
+            with trace_span("value_analysis", game=game_data.get("title")):
+                result = agent_tools.calculate_advanced_value_analysis(game_data)
             return {"success": True, "data": result}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -614,9 +620,10 @@ class EnhancedCLI:
         try:
             game_title = game_data.get("title", "Unknown Game")
             # Use the pre-fetched data for review generation instead of re-scraping
-            result = generate_comprehensive_game_review(
-                game_title, include_recommendations=True
-            )
+            with trace_span("review_generation", game=game_title):
+                result = agent_tools.generate_comprehensive_game_review(
+                    game_title, include_recommendations=True
+                )
             return {"success": True, "data": result}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -628,9 +635,10 @@ class EnhancedCLI:
         """
         try:
             game_title = game_data.get("title", "Unknown Game")
-            result = create_multi_platform_opinions(
-                game_title, ["twitter", "website", "blog"]
-            )
+            with trace_span("opinion_adaptations", game=game_title):
+                result = agent_tools.create_multi_platform_opinions(
+                    game_title, ["twitter", "website", "blog"]
+                )
             return {"success": True, "data": result}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -639,7 +647,7 @@ class EnhancedCLI:
     def _step_value_analysis(self, game_name: str) -> Dict:
         """Legacy Step 2: Calculate value analysis (less efficient)."""
         try:
-            result = calculate_advanced_value_analysis({"title": game_name})
+            result = agent_tools.calculate_advanced_value_analysis({"title": game_name})
             return {"success": True, "data": result}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -647,7 +655,7 @@ class EnhancedCLI:
     def _step_generate_review(self, game_name: str) -> Dict:
         """Legacy Step 3: Generate comprehensive review (less efficient)."""
         try:
-            result = generate_comprehensive_game_review(
+            result = agent_tools.generate_comprehensive_game_review(
                 game_name, include_recommendations=True
             )
             return {"success": True, "data": result}
@@ -657,7 +665,7 @@ class EnhancedCLI:
     def _step_opinion_adaptations(self, game_name: str) -> Dict:
         """Legacy Step 4: Create opinion adaptations (less efficient)."""
         try:
-            result = create_multi_platform_opinions(
+            result = agent_tools.create_multi_platform_opinions(
                 game_name, ["twitter", "website", "blog"]
             )
             return {"success": True, "data": result}
@@ -1046,7 +1054,7 @@ class EnhancedCLI:
 
         # Show current user collection stats
         try:
-            collection_data = get_user_game_collection(limit=5)
+            collection_data = agent_tools.get_user_game_collection(limit=5)
             if collection_data.get("success", False):
                 stats = collection_data.get("statistics", {})
                 total_games = stats.get("total_games", 0)
@@ -1197,7 +1205,7 @@ class EnhancedCLI:
         ).strip()
 
         try:
-            result = add_game_to_collection(
+            result = agent_tools.add_game_to_collection(
                 title=title,
                 status=status_value,
                 user_rating=rating,  # type: ignore
@@ -1246,7 +1254,7 @@ class EnhancedCLI:
 
         # Check if game exists
         try:
-            ownership_check = check_if_game_owned(title)
+            ownership_check = agent_tools.check_if_game_owned(title)
             if not ownership_check.get("owned", False):
                 self.print_status(f"❌ '{title}' not found in your collection", "error")
                 self.print_status(
@@ -1401,7 +1409,7 @@ class EnhancedCLI:
                 return False
 
             # Perform update
-            result = update_game_in_collection(title, **updates)
+            result = agent_tools.update_game_in_collection(title, **updates)
 
             if result.get("success", False):
                 self.print_status(
@@ -1646,7 +1654,7 @@ class EnhancedCLI:
 
         # Check if game exists and show details
         try:
-            ownership_check = check_if_game_owned(title)
+            ownership_check = agent_tools.check_if_game_owned(title)
             if not ownership_check.get("owned", False):
                 self.print_status(f"❌ '{title}' not found in your collection", "error")
                 return False
@@ -1682,7 +1690,7 @@ class EnhancedCLI:
             return False
 
         try:
-            result = remove_game_from_collection(title)
+            result = agent_tools.remove_game_from_collection(title)
 
             if result.get("success", False):
                 self.print_status(
@@ -1745,7 +1753,7 @@ class EnhancedCLI:
         )
 
         try:
-            result = get_user_game_collection(status_filter=status_filter, limit=50)  # type: ignore
+            result = agent_tools.get_user_game_collection(status_filter=status_filter, limit=50)  # type: ignore
 
             if result.get("success", False):
                 collection = result.get("collection", {})
@@ -1853,7 +1861,7 @@ class EnhancedCLI:
 
             # Show collection status first
             try:
-                collection_data = get_user_game_collection(limit=5)
+                collection_data = agent_tools.get_user_game_collection(limit=5)
                 if collection_data.get("success", False):
                     stats = collection_data.get("statistics", {})
                     total_games = stats.get("total_games", 0)
@@ -2028,7 +2036,7 @@ class EnhancedCLI:
 
                         if game_to_add:
                             try:
-                                add_result = add_game_to_collection(
+                                add_result = agent_tools.add_game_to_collection(
                                     title=game_to_add,
                                     status="wishlist",
                                     notes=f"Added from {recommendation_type} recommendations",
@@ -2092,7 +2100,7 @@ class EnhancedCLI:
             return
 
         try:
-            result = check_if_game_owned(title)
+            result = agent_tools.check_if_game_owned(title)
 
             if result.get("success", False):
                 owned = result.get("owned", False)
@@ -2182,7 +2190,7 @@ class EnhancedCLI:
         self.print_status("🔗 Importing Steam library...", "loading")
 
         try:
-            result = import_steam_library(steam_id, api_key)
+            result = agent_tools.import_steam_library(steam_id, api_key)
 
             if result.get("success", False):
                 import_results = result.get("import_results", {})
@@ -2286,7 +2294,7 @@ class EnhancedCLI:
         self.print_status("📁 Importing from CSV file...", "loading")
 
         try:
-            result = import_collection_from_csv(csv_path)
+            result = agent_tools.import_collection_from_csv(csv_path)
 
             if result.get("success", False):
                 import_results = result.get("import_results", {})
@@ -2398,7 +2406,7 @@ class EnhancedCLI:
         self.print_status("💾 Exporting collection to CSV...", "loading")
 
         try:
-            result = export_collection_to_csv(csv_path, status_filter)  # type: ignore
+            result = agent_tools.export_collection_to_csv(csv_path, status_filter)  # type: ignore
 
             if result.get("success", False):
                 export_results = result.get("export_results", {})
@@ -2449,7 +2457,7 @@ class EnhancedCLI:
         self.print_section("🎯 Recommendation Filter", "highlight")
 
         try:
-            result = get_collection_recommendations_filter()
+            result = agent_tools.get_collection_recommendations_filter()
 
             if result.get("success", False):
                 filter_data = result.get("filter_data", {})
@@ -2533,7 +2541,7 @@ class EnhancedCLI:
     def check_user_login_status(self) -> Dict:
         """Check current user login status and display welcome info."""
         try:
-            current_user = get_current_user_details()
+            current_user = agent_tools.get_current_user_details()
 
             if current_user.get("success", False) and current_user.get(
                 "logged_in", False
@@ -2572,7 +2580,7 @@ class EnhancedCLI:
 
         # Show current system stats
         try:
-            stats = get_user_system_stats()
+            stats = agent_tools.get_user_system_stats()
             if stats.get("success", False):
                 overview = stats.get("system_overview", {})
                 total_users = overview.get("total_users", 0)
@@ -2657,7 +2665,7 @@ class EnhancedCLI:
         role_name = next((v for k, v in role_map.items() if k in role), "guest")
 
         try:
-            result = register_new_user(username, role_name)
+            result = agent_tools.register_new_user(username, role_name)
 
             if result.get("success", False):
                 user_profile = result.get("user_profile", {})
@@ -2675,7 +2683,7 @@ class EnhancedCLI:
                 )
 
                 if "Yes" in auto_login:
-                    switch_result = switch_to_user(username)
+                    switch_result = agent_tools.switch_to_user(username)
                     if switch_result.get("success", False):
                         self.print_status(f"🔄 Switched to {username}", "success")
 
@@ -2695,7 +2703,7 @@ class EnhancedCLI:
 
         # Get list of users
         try:
-            users_result = list_system_users()
+            users_result = agent_tools.list_system_users()
             if not users_result.get("success", False):
                 self.print_status("Failed to get user list", "error")
                 return False
@@ -2742,7 +2750,7 @@ class EnhancedCLI:
             username = user_choice.split(" ")[1]  # Get username after emoji
 
             # Switch user
-            switch_result = switch_to_user(username)
+            switch_result = agent_tools.switch_to_user(username)
 
             if switch_result.get("success", False):
                 switched_to = switch_result.get("switched_to", {})
@@ -2769,7 +2777,7 @@ class EnhancedCLI:
         self.print_section("👥 Family Members", "highlight")
 
         try:
-            users_result = list_system_users()
+            users_result = agent_tools.list_system_users()
             if not users_result.get("success", False):
                 self.print_status("Failed to get family list", "error")
                 return
@@ -2815,7 +2823,7 @@ class EnhancedCLI:
         self.print_section("🧳 Guest Session", "highlight")
 
         try:
-            guest_result = create_guest_access()
+            guest_result = agent_tools.create_guest_access()
 
             if guest_result.get("success", False):
                 guest_profile = guest_result.get("guest_profile", {})
@@ -2843,7 +2851,7 @@ class EnhancedCLI:
         self.print_section("📊 System Statistics", "highlight")
 
         try:
-            stats = get_user_system_stats()
+            stats = agent_tools.get_user_system_stats()
 
             if stats.get("success", False):
                 overview = stats.get("system_overview", {})
@@ -3051,7 +3059,9 @@ class EnhancedCLI:
 
                 progress.close()
 
-                result = scrape_dekudeals_category(category, max_games=count)
+                result = agent_tools.scrape_dekudeals_category(
+                    category, max_games=count
+                )
 
                 if result.get("success", False):
                     games = result.get("game_titles", [])
@@ -3185,7 +3195,7 @@ class EnhancedCLI:
 
             progress.close()
 
-            result = get_random_game_sample(size, preference)
+            result = agent_tools.get_random_game_sample(size, preference)
 
             if result.get("success", False):
                 games = result.get("selected_games", [])
@@ -3234,7 +3244,7 @@ class EnhancedCLI:
 
         for i, game in enumerate(games):
             try:
-                result = generate_quick_game_opinion(game)
+                result = agent_tools.generate_quick_game_opinion(game)
 
                 if result.get("success", False):
                     summary = result.get("quick_summary", {})
@@ -3322,7 +3332,7 @@ class EnhancedCLI:
 
             progress.close()
 
-            result = compare_games_with_reviews(games, "overall")
+            result = agent_tools.compare_games_with_reviews(games, "overall")
 
             if result.get("success", False):
                 winner = result.get("winner", {})
@@ -3721,7 +3731,7 @@ class EnhancedCLI:
 
             progress.close()
 
-            result = scrape_dekudeals_category(category, max_games=count)
+            result = agent_tools.scrape_dekudeals_category(category, max_games=count)
 
             if result.get("success", False):
                 games = result.get("game_titles", [])
@@ -3761,7 +3771,7 @@ class EnhancedCLI:
 
             progress.close()
 
-            result = get_random_game_sample(count, preference)
+            result = agent_tools.get_random_game_sample(count, preference)
 
             if result.get("success", False):
                 games = result.get("selected_games", [])
@@ -4000,7 +4010,7 @@ class EnhancedCLI:
         try:
             for i, title in enumerate(games_list, 1):
                 try:
-                    result = add_game_to_collection(
+                    result = agent_tools.add_game_to_collection(
                         title=title,
                         status=import_status,
                         notes=f"Imported from DekuDeals collection",
@@ -4038,7 +4048,7 @@ class EnhancedCLI:
             # Show updated collection stats
             if imported_count > 0:
                 try:
-                    collection_result = get_user_game_collection(limit=1)
+                    collection_result = agent_tools.get_user_game_collection(limit=1)
                     if collection_result.get("success", False):
                         stats = collection_result.get("statistics", {})
                         total_games = stats.get("total_games", 0)
@@ -4152,7 +4162,7 @@ class EnhancedCLI:
 
             for i, title in enumerate(games_list, 1):
                 try:
-                    result = add_game_to_collection(
+                    result = agent_tools.add_game_to_collection(
                         title=title,
                         status=selected_status,
                         notes=f"Imported from DekuDeals collection: {collection_url}",
@@ -4321,9 +4331,17 @@ Batch Processing (NEW - Phase 6.2):
     parser.add_argument(
         "--no-progress", action="store_true", help="Disable progress bars"
     )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Record spans and write a Chrome trace JSON (chrome://tracing, Perfetto)",
+    )
 
     args = parser.parse_args()
 
+    if args.trace:
+        get_tracer().enable(args.trace)
+
     # Initialize CLI
     cli = EnhancedCLI()
 
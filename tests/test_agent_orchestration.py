@@ -0,0 +1,856 @@
+"""
+🤖 Agent Orchestration Tests
+Test the deterministic analysis pipeline, hybrid orchestration, speaker
+selection, completion cache and tool result compaction (no network; LLM calls
+go to a local stub)
+"""
+
+import ast
+import json
+import queue
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import agent_tools
+import conversation_manager
+from agent_tools.registry import TOOL_GROUPS, ToolRegistry
+from autogen_agents import build_analysis_team
+from conversation_manager import GameAnalysisManager
+from utils.agent_pool import (
+    AnalysisTeamPool,
+    SharedToolExecutor,
+    create_shared_http_client,
+)
+from utils.analysis_pipeline import run_analysis_pipeline
+from utils.llm_completion_cache import (
+    LLMCompletionCache,
+    attach_completion_cache,
+    completion_key,
+)
+from utils.tool_result_compaction import (
+    ToolResultCompactor,
+    count_tokens,
+    get_tool_result_compactor,
+)
+from utils.speaker_selection import (
+    ANALYSIS_STAGES,
+    EXECUTOR,
+    AnalysisSpeakerFSM,
+    qa_status,
+)
+
+
+@pytest.fixture
+def offline_game(monkeypatch, mock_game_data):
+    """Serve mock game data instead of scraping DekuDeals"""
+    searches = []
+
+    def search(game_name):
+        searches.append(game_name)
+        return dict(mock_game_data, source_url="https://example.test/mock-game")
+
+    monkeypatch.setattr(agent_tools, "search_and_scrape_game", search)
+    return searches
+
+
+class TestAnalysisPipeline:
+    """Deterministic tool pipeline"""
+
+    @pytest.mark.unit
+    def test_pipeline_runs_every_stage_once(self, offline_game):
+        facts = run_analysis_pipeline("Mock Game")
+
+        assert facts.success
+        assert offline_game == ["Mock Game"]  # Data is scraped once
+        assert [stage.name for stage in facts.stages] == [
+            "data_collection",
+            "data_validation",
+            "key_metrics",
+            "value_analysis",
+            "review_generation",
+            "quality_assurance",
+        ]
+        assert facts.review["success"]
+        assert "quality_assessment" in facts.quality
+
+        prompt = facts.prompt_facts()
+        assert prompt["title"] == "Mock Game"
+        assert prompt["current_price"] == "30.00 zł"
+        assert prompt["recommendation"] == facts.review["review_data"]["recommendation"]
+
+    @pytest.mark.unit
+    def test_value_analysis_stage_computes_both_analyses(
+        self, offline_game, monkeypatch
+    ):
+        calls = []
+        monkeypatch.setattr(
+            agent_tools,
+            "calculate_value_score",
+            lambda game_data: calls.append("basic") or {"success": False},
+        )
+        monkeypatch.setattr(
+            agent_tools,
+            "calculate_advanced_value_analysis",
+            lambda game_data: calls.append("advanced") or {"success": True},
+        )
+        reviewed_after = []
+        monkeypatch.setattr(
+            agent_tools,
+            "generate_comprehensive_game_review",
+            lambda game_name, context=None: reviewed_after.append(list(calls))
+            or {"success": True},
+        )
+        facts = run_analysis_pipeline("Mock Game")
+
+        # Both run in the value stage even when the basic analysis fails
+        stages = {stage.name: stage.success for stage in facts.stages}
+        assert stages["value_analysis"] is False
+        assert reviewed_after == [["basic", "advanced"]]
+
+    @pytest.mark.unit
+    def test_missing_game_stops_after_collection(self, monkeypatch):
+        monkeypatch.setattr(
+            agent_tools,
+            "search_and_scrape_game",
+            lambda name: {"success": False, "message": "Game not found"},
+        )
+        facts = run_analysis_pipeline("Nope")
+        assert not facts.success
+        assert [stage.name for stage in facts.stages] == ["data_collection"]
+
+
+class TestHybridOrchestration:
+    """GameAnalysisManager hybrid mode"""
+
+    @pytest.mark.unit
+    def test_single_llm_call_with_precomputed_facts(self, offline_game, monkeypatch):
+        calls = []
+
+        def synthesize(facts):
+            calls.append(facts.prompt_facts())
+            return "Narrative", {"total_tokens": 42}
+
+        monkeypatch.setattr(conversation_manager, "synthesize_narrative", synthesize)
+        result = GameAnalysisManager().analyze_game("Mock Game", mode="hybrid")
+
+        assert result["success"] and result["analysis_type"] == "hybrid"
+        assert result["narrative"] == "Narrative"
+        assert result["llm_calls"] == 1 and len(calls) == 1
+        assert calls[0]["title"] == "Mock Game"
+        assert result["token_usage"] == {"total_tokens": 42}
+        assert "narrative_synthesis" in result["stage_timings"]
+
+    @pytest.mark.unit
+    def test_without_synthesis_no_llm_is_used(self, offline_game, monkeypatch):
+        def synthesize(facts):
+            raise AssertionError("LLM must not be called")
+
+        monkeypatch.setattr(conversation_manager, "synthesize_narrative", synthesize)
+        result = GameAnalysisManager().hybrid_analysis("Mock Game", synthesize=False)
+
+        assert result["success"] and result["llm_calls"] == 0
+        assert "Mock Game" in result["narrative"]
+
+    @pytest.mark.unit
+    def test_failed_synthesis_falls_back_to_review(self, offline_game, monkeypatch):
+        def synthesize(facts):
+            raise RuntimeError("API unavailable")
+
+        monkeypatch.setattr(conversation_manager, "synthesize_narrative", synthesize)
+        result = GameAnalysisManager().hybrid_analysis("Mock Game")
+
+        assert result["success"]
+        assert "Mock Game" in result["narrative"]
+
+
+class _Chat:
+    """Minimal GroupChat stand-in for the speaker FSM"""
+
+    def __init__(self):
+        self.messages = []
+        self.agents = {
+            name: SimpleNamespace(name=name) for name in [EXECUTOR, *ANALYSIS_STAGES]
+        }
+
+    def agent_by_name(self, name):
+        return self.agents[name]
+
+    def say(self, fsm, speaker, content="", tool_calls=None):
+        message = {"name": speaker, "content": content}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        self.messages.append(message)
+        selected = fsm(self.agents[speaker], self)
+        return selected.name if selected else None
+
+
+class TestSpeakerSelectionFSM:
+    """Deterministic GroupChat speaker transitions"""
+
+    @pytest.mark.unit
+    def test_tool_calls_return_to_requesting_stage(self):
+        fsm, chat = AnalysisSpeakerFSM(), _Chat()
+        tool_call = [{"id": "1", "function": {"name": "search_and_scrape_game"}}]
+
+        assert chat.say(fsm, EXECUTOR, "Analyze") == "DATA_COLLECTOR_agent"
+        assert chat.say(fsm, "DATA_COLLECTOR_agent", tool_calls=tool_call) == EXECUTOR
+        assert chat.say(fsm, EXECUTOR, "{...}") == "DATA_COLLECTOR_agent"
+        assert chat.say(fsm, "DATA_COLLECTOR_agent", "Data") == "PRICE_ANALYZER_agent"
+        assert (
+            chat.say(fsm, "PRICE_ANALYZER_agent", "Price") == "REVIEW_GENERATOR_agent"
+        )
+        assert (
+            chat.say(fsm, "REVIEW_GENERATOR_agent", "Review")
+            == "QUALITY_ASSURANCE_agent"
+        )
+        assert chat.say(fsm, "QUALITY_ASSURANCE_agent", "OK\nQA_STATUS: PASS") is None
+
+        summary = fsm.get_summary()
+        assert summary["qa_passed"] and summary["qa_retries"] == 0
+        assert summary["rounds"] == 7 <= summary["max_rounds"]
+        assert [t["speaker"] for t in summary["round_timings"]][:2] == [
+            EXECUTOR,
+            "DATA_COLLECTOR_agent",
+        ]
+
+    @pytest.mark.unit
+    def test_qa_fail_retries_review_then_stops(self):
+        fsm, chat = AnalysisSpeakerFSM(max_qa_retries=1), _Chat()
+        fsm.current_stage = "QUALITY_ASSURANCE_agent"
+
+        assert (
+            chat.say(fsm, "QUALITY_ASSURANCE_agent", "QA_STATUS: FAIL")
+            == "REVIEW_GENERATOR_agent"
+        )
+        assert (
+            chat.say(fsm, "REVIEW_GENERATOR_agent", "Fixed")
+            == "QUALITY_ASSURANCE_agent"
+        )
+        assert chat.say(fsm, "QUALITY_ASSURANCE_agent", "QA_STATUS: FAIL") is None
+        assert fsm.qa_passed is False and fsm.qa_retries == 1
+        assert fsm.termination_reason == "quality retries exhausted"
+
+    @pytest.mark.unit
+    def test_tool_round_limit_ends_chat(self):
+        fsm, chat = AnalysisSpeakerFSM(max_tool_rounds=1), _Chat()
+        tool_call = [{"id": "1", "function": {"name": "search_and_scrape_game"}}]
+
+        chat.say(fsm, EXECUTOR, "Analyze")
+        assert chat.say(fsm, "DATA_COLLECTOR_agent", tool_calls=tool_call) == EXECUTOR
+        chat.say(fsm, EXECUTOR, "{...}")
+        assert chat.say(fsm, "DATA_COLLECTOR_agent", tool_calls=tool_call) is None
+        assert "tool round limit" in fsm.termination_reason
+
+    @pytest.mark.unit
+    def test_round_bound_and_status_parsing(self):
+        # 4 stages + QA retry of review and QA, each up to 2 tool rounds + answer
+        assert AnalysisSpeakerFSM(max_tool_rounds=2, max_qa_retries=1).max_rounds == (
+            1 + 6 * 5
+        )
+        assert qa_status("qa_status: pass") is True
+        assert qa_status("QA_STATUS: PASS ... QA_STATUS: FAIL") is False
+        assert qa_status("TERMINATE") is None
+        with pytest.raises(ValueError):
+            AnalysisSpeakerFSM(retry_stage="UNKNOWN_agent")
+
+    @pytest.mark.unit
+    def test_only_fsm_prompt_drops_terminate(self):
+        manager = GameAnalysisManager()
+        agents_prompt = manager._create_analysis_prompt("Hades")
+        fsm_prompt = manager._create_analysis_prompt("Hades", mode="fsm")
+
+        assert "Terminate with 'TERMINATE'" in agents_prompt
+        assert "Do not reply 'TERMINATE'" in fsm_prompt
+        assert "QA_STATUS: PASS" in fsm_prompt
+
+    @pytest.mark.unit
+    def test_drives_autogen_group_chat(self):
+        import autogen
+
+        replies = {
+            "DATA_COLLECTOR_agent": ["Data collected"],
+            "PRICE_ANALYZER_agent": ["Price analysis"],
+            "REVIEW_GENERATOR_agent": ["Review v1", "Review v2"],
+            "QUALITY_ASSURANCE_agent": ["QA_STATUS: FAIL", "QA_STATUS: PASS"],
+        }
+
+        def scripted(name):
+            agent = autogen.ConversableAgent(
+                name, llm_config=False, human_input_mode="NEVER"
+            )
+            agent.register_reply(
+                [autogen.Agent, None],
+                lambda recipient, messages, sender, config: (
+                    True,
+                    replies[name].pop(0),
+                ),
+            )
+            return agent
+
+        user = autogen.ConversableAgent(
+            EXECUTOR, llm_config=False, human_input_mode="NEVER"
+        )
+        fsm = AnalysisSpeakerFSM()
+        groupchat = autogen.GroupChat(
+            agents=[user, *[scripted(name) for name in ANALYSIS_STAGES]],
+            messages=[],
+            max_round=fsm.max_rounds,
+            speaker_selection_method=fsm,
+        )
+        manager = autogen.GroupChatManager(groupchat=groupchat, llm_config=False)
+        user.initiate_chat(manager, message="Analyze Mock Game", silent=True)
+
+        assert [message["name"] for message in groupchat.messages] == [
+            EXECUTOR,
+            *ANALYSIS_STAGES,
+            "REVIEW_GENERATOR_agent",
+            "QUALITY_ASSURANCE_agent",
+        ]
+        assert fsm.qa_passed and fsm.qa_retries == 1
+        assert len(fsm.round_timings) == len(groupchat.messages)
+
+
+@pytest.fixture
+def stub_llm_server():
+    """Local OpenAI-compatible chat completions endpoint"""
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            requests_seen.append(request)
+            body = json.dumps(
+                {
+                    "id": f"chatcmpl-{len(requests_seen)}",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": request["model"],
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "message": {
+                                "role": "assistant",
+                                "content": f"Answer {len(requests_seen)}",
+                            },
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": 90,
+                        "completion_tokens": 10,
+                        "total_tokens": 100,
+                    },
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield SimpleNamespace(
+        base_url=f"http://127.0.0.1:{server.server_port}/v1", requests=requests_seen
+    )
+    server.shutdown()
+    server.server_close()
+
+
+class TestLLMCompletionCache:
+    """Content-addressed completion cache"""
+
+    @pytest.mark.unit
+    def test_key_ignores_tool_call_ids_and_timestamps(self):
+        def history(call_id, timestamp):
+            return {
+                "model": "gpt-4o-mini",
+                "temperature": 0.0,
+                "messages": [
+                    {"role": "user", "content": "Analyze Hades  \n"},
+                    {
+                        "role": "assistant",
+                        "content": None,
+                        "tool_calls": [{"id": call_id, "type": "function"}],
+                    },
+                    {
+                        "role": "tool",
+                        "tool_call_id": call_id,
+                        "content": f'{{"timestamp": "{timestamp}"}}',
+                    },
+                ],
+            }
+
+        key = completion_key(history("call_a1", "2026-01-02T10:00:00.123"))
+        assert key == completion_key(history("call_b7", "2026-03-04 11:12:13"))
+        assert key != completion_key(
+            {**history("call_a1", "2026-01-02T10:00:00"), "temperature": 0.7}
+        )
+        assert key != completion_key(
+            {**history("call_a1", "2026-01-02T10:00:00"), "model": "gpt-4o"}
+        )
+
+    @pytest.mark.unit
+    def test_agent_turn_served_from_cache(self, tmp_path, stub_llm_server):
+        import autogen
+
+        cache = LLMCompletionCache(str(tmp_path / "llm.db"))
+        agent = autogen.AssistantAgent(
+            "DATA_COLLECTOR_agent",
+            llm_config={
+                "config_list": [
+                    {
+                        "model": "gpt-4o-mini",
+                        "api_key": "test-key",
+                        "base_url": stub_llm_server.base_url,
+                    }
+                ],
+                "temperature": 0.0,
+            },
+        )
+        agent.client_cache = cache
+
+        replies = [
+            agent.generate_reply(messages=[{"role": "user", "content": "Hades"}])
+            for _ in range(3)
+        ]
+
+        assert len(stub_llm_server.requests) == 1
+        assert replies == ["Answer 1"] * 3
+        stats = cache.get_statistics()
+        assert stats["hits"] == 2 and stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(66.67)
+        assert stats["tokens_saved"] == 200 and stats["entries"] == 1
+
+        # A persistent cache survives the process (new instance, same file)
+        cache.close()
+        assert (
+            LLMCompletionCache(str(tmp_path / "llm.db")).get_statistics()["entries"]
+            == 1
+        )
+
+    @pytest.mark.unit
+    def test_ttl_and_size_limits(self, tmp_path, monkeypatch):
+        cache = LLMCompletionCache(str(tmp_path / "llm.db"), ttl_seconds=60)
+        clock = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: clock[0])
+
+        cache.set({"model": "m", "messages": []}, "old")
+        clock[0] += 61
+        assert cache.get({"model": "m", "messages": []}) is None
+        assert cache.get_statistics()["expired"] == 1
+
+        cache.max_entries = 2
+        for index in range(3):
+            clock[0] += 1
+            cache.set(f"key-{index}", "x" * 100)
+        assert cache.get("key-0") is None and cache.get("key-2") == "x" * 100
+
+        cache.max_bytes = 100  # Only the small newest entry fits
+        clock[0] += 1
+        cache.get("key-1")
+        cache.set("key-3", "y" * 10)
+        assert cache.get("key-3") == "y" * 10
+        assert cache.get("key-1") is None and cache.get("key-2") is None
+        assert cache.get_statistics()["evictions"] == 3
+
+    @pytest.mark.unit
+    def test_attached_only_to_configured_agents(self, tmp_path):
+        agents = [
+            SimpleNamespace(name=name, client_cache=None)
+            for name in ("DATA_COLLECTOR_agent", "REVIEW_GENERATOR_agent")
+        ]
+        cache = LLMCompletionCache(str(tmp_path / "llm.db"))
+
+        attached = attach_completion_cache(agents, cache)
+
+        assert attached == {
+            "DATA_COLLECTOR_agent": True,
+            "REVIEW_GENERATOR_agent": False,
+        }
+        assert agents[0].client_cache is cache and agents[1].client_cache is None
+
+
+def _large_review(title="Mock Game"):
+    return {
+        "success": True,
+        "game_title": title,
+        "review_data": {
+            "overall_rating": 8.4,
+            "recommendation": "BUY",
+            "strengths": ["Great combat", "Strong art"],
+            "weaknesses": ["Short"],
+            "final_verdict": "Worth it on sale",
+            "reviewer_notes": "note " * 400,
+        },
+        "market_context": {"competition_analysis": "competitor " * 500},
+        "formatted_review": "Full review text. " * 600,
+    }
+
+
+class TestToolResultCompaction:
+    """Token-budgeted tool results"""
+
+    @pytest.mark.unit
+    def test_small_results_pass_unchanged(self):
+        compactor = ToolResultCompactor(token_budget=200)
+        result = {"success": True, "title": "Mock Game"}
+
+        assert compactor.compact("search_and_scrape_game", result) is result
+        stats = compactor.get_statistics()
+        assert stats["tool_calls"] == 1 and stats["compacted_calls"] == 0
+        assert stats["tokens_saved"] == 0
+
+    @pytest.mark.unit
+    def test_review_summary_schema_and_side_store(self):
+        compactor = ToolResultCompactor(token_budget=300)
+        result = _large_review()
+
+        summary = compactor.compact("generate_comprehensive_game_review", result)
+
+        assert count_tokens(summary) <= 300
+        assert summary["review_data"]["recommendation"] == "BUY"
+        assert summary["review_data"]["strengths"] == ["Great combat", "Strong art"]
+        assert "formatted_review" not in summary
+        assert "reviewer_notes" not in summary["review_data"]
+
+        result_id = summary["_compaction"]["result_id"]
+        assert compactor.get_full_result(result_id) == result
+        field = compactor.get_full_result(result_id, "review_data.reviewer_notes")
+        assert field["value"] == result["review_data"]["reviewer_notes"]
+        assert not compactor.get_full_result(result_id, "review_data.missing")[
+            "success"
+        ]
+
+        stats = compactor.get_statistics()
+        assert stats["compacted_calls"] == 1
+        assert stats["tokens_saved"] == (
+            summary["_compaction"]["original_tokens"] - count_tokens(summary)
+        )
+        assert (
+            stats["per_tool"]["generate_comprehensive_game_review"]["tokens_saved"]
+            > 1000
+        )
+
+        compactor.start_conversation()
+        assert compactor.get_statistics()["tool_calls"] == 0
+
+    @pytest.mark.unit
+    def test_game_lists_are_projected_and_shortened(self):
+        compactor = ToolResultCompactor(token_budget=150)
+        games = [
+            {
+                "title": f"Game {index}",
+                "current_price": "19.99 zł",
+                "game_url": f"https://example.test/items/game-{index}",
+                "description": "long text " * 50,
+            }
+            for index in range(60)
+        ]
+        result = {"success": True, "category": "hottest", "games": games}
+
+        summary = compactor.compact("scrape_dekudeals_category", result)
+
+        assert count_tokens(summary) <= 150
+        assert summary["games"][0] == {"title": "Game 0", "current_price": "19.99 zł"}
+        assert summary["games"][-1].endswith("more")
+
+    @pytest.mark.unit
+    def test_agent_tools_are_compacted(self, monkeypatch):
+        import autogen_agents
+
+        monkeypatch.setattr(
+            agent_tools,
+            "generate_comprehensive_game_review",
+            lambda game_name, include_recommendations=True: _large_review(game_name),
+        )
+        compactor = get_tool_result_compactor()
+        compactor.start_conversation()
+
+        output = autogen_agents.user_proxy.function_map[
+            "generate_comprehensive_game_review"
+        ](game_name="Hades")
+        summary = ast.literal_eval(output) if isinstance(output, str) else output
+
+        assert summary["game_title"] == "Hades"
+        assert "formatted_review" not in summary
+        fetch = autogen_agents.user_proxy.function_map["get_full_tool_result"]
+        full = fetch(result_id=summary["_compaction"]["result_id"])
+        full = ast.literal_eval(full) if isinstance(full, str) else full
+        assert full["formatted_review"].startswith("Full review text.")
+        assert compactor.get_statistics()["tokens_saved"] > 0
+
+
+class TestConcurrentAnalysis:
+    """Pula zespołów agentów i wspólny executor narzędzi"""
+
+    @pytest.mark.unit
+    def test_pool_builds_up_to_size_and_reuses_teams(self):
+        built = []
+
+        def factory(tool_executor, http_client):
+            team = SimpleNamespace(resets=0, executor=tool_executor)
+            team.reset = lambda: setattr(team, "resets", team.resets + 1)
+            built.append(team)
+            return team
+
+        pool = AnalysisTeamPool(size=2, team_factory=factory)
+        first, second = pool.acquire(), pool.acquire()
+        assert first is not second and len(built) == 2
+        assert first.executor is pool.tool_executor
+
+        with pytest.raises(queue.Empty):
+            pool.acquire(timeout=0.05)
+
+        pool.release(first)
+        assert first.resets == 1
+        with pool.team() as team:
+            assert team is first
+        pool.release(second)
+
+        stats = pool.get_statistics()
+        assert stats["teams_created"] == 2 and stats["idle_teams"] == 2
+        assert stats["acquisitions"] == 3 and stats["waits"] == 1
+        pool.close()
+
+    @pytest.mark.unit
+    def test_pooled_manager_builds_no_default_team(self, monkeypatch):
+        def create_analysis_team():
+            raise AssertionError("default team built")
+
+        monkeypatch.setattr(
+            conversation_manager, "create_analysis_team", create_analysis_team
+        )
+        monkeypatch.setattr(
+            conversation_manager, "get_default_team", create_analysis_team
+        )
+        pool = AnalysisTeamPool(size=1, team_factory=lambda **kwargs: SimpleNamespace())
+        manager = GameAnalysisManager(team_pool=pool)
+        with manager._conversation_team() as team:
+            assert isinstance(team, SimpleNamespace)
+        pool.close()
+
+        monkeypatch.undo()
+        assert [agent.name for agent in manager.agents][0] == "USER_PROXY"
+
+    @pytest.mark.unit
+    def test_import_builds_no_default_team(self):
+        code = (
+            "import conversation_manager, autogen_agents\n"
+            "assert autogen_agents._default_team is None\n"
+            "assert autogen_agents.user_proxy.name == 'USER_PROXY'\n"
+            "assert autogen_agents._default_team is not None\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert result.returncode == 0, result.stderr
+
+    @pytest.mark.unit
+    def test_executor_enforces_concurrency_and_rate_limit(self):
+        executor = SharedToolExecutor(max_concurrent=2, rate_limit=50.0)
+
+        def scrape(game_name):
+            time.sleep(0.05)
+            if game_name == "missing":
+                raise ValueError(game_name)
+            return game_name
+
+        tool = executor.wrap(scrape)
+        names = ["a", "b", "c", "d", "e", "missing"]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=6) as threads:
+            futures = [threads.submit(tool, name) for name in names]
+        elapsed = time.perf_counter() - started
+
+        assert [f.result() for f in futures[:-1]] == names[:-1]
+        assert isinstance(futures[-1].exception(), ValueError)
+        stats = executor.get_statistics()
+        assert stats["calls"] == 6 and stats["errors"] == 1
+        assert stats["max_in_flight"] == 2 and stats["in_flight"] == 0
+        assert stats["per_tool"]["scrape"]["calls"] == 6
+        # Two slots, 50 ms per call -> at least three waves
+        assert elapsed >= 0.15
+
+    @pytest.mark.unit
+    def test_teams_are_isolated_and_share_resources(self, monkeypatch):
+        import autogen_agents
+
+        monkeypatch.setattr(
+            agent_tools,
+            "generate_comprehensive_game_review",
+            lambda game_name, include_recommendations=True: _large_review(game_name),
+        )
+        executor = SharedToolExecutor(rate_limit=0)
+        http_client = create_shared_http_client()
+        first, second = (
+            build_analysis_team(tool_executor=executor, http_client=http_client)
+            for _ in range(2)
+        )
+
+        assert first.data_collector is not second.data_collector
+        assert first.compactor is not second.compactor
+        for team in (first, second):
+            oai_client = team.data_collector.client._clients[0]._oai_client
+            assert oai_client._client is http_client
+
+        first.user_proxy.function_map["generate_comprehensive_game_review"](
+            game_name="Hades"
+        )
+        assert first.compactor.get_statistics()["compacted_calls"] == 1
+        assert second.compactor.get_statistics()["tool_calls"] == 0
+        assert (
+            executor.get_statistics()["per_tool"]["generate_comprehensive_game_review"][
+                "calls"
+            ]
+            == 1
+        )
+
+        first.reset()
+        assert first.compactor.get_statistics()["tool_calls"] == 0
+        http_client.close()
+
+    def test_games_analyzed_concurrently_in_isolation(
+        self, monkeypatch, stub_llm_server
+    ):
+        import config.llm_config as llm_config
+
+        base_config = llm_config.get_llm_config
+        cache_config = llm_config.get_completion_cache_config
+
+        def stub_config():
+            config = base_config()
+            config["config_list"][0]["base_url"] = stub_llm_server.base_url
+            return config
+
+        def uncached_config():
+            config = cache_config()
+            config["agents"] = {name: False for name in config["agents"]}
+            return config
+
+        monkeypatch.setattr(llm_config, "get_llm_config", stub_config)
+        monkeypatch.setattr(llm_config, "get_completion_cache_config", uncached_config)
+
+        games = ["Hades", "Celeste", "Hollow Knight"]
+        outcome = conversation_manager.analyze_games_concurrently(
+            games, max_concurrent=2, mode="fsm"
+        )
+
+        assert [result["game_name"] for result in outcome["results"]] == games
+        assert outcome["succeeded"] == 3
+        assert outcome["pool"]["teams_created"] <= 2
+        assert outcome["pool"]["acquisitions"] == 3
+        # Four stages per game, each request sees a single conversation
+        assert len(stub_llm_server.requests) == 12
+        for request in stub_llm_server.requests:
+            prompt = json.dumps(request["messages"])
+            assert sum(game in prompt for game in games) == 1
+
+
+class TestToolRegistry:
+    """Pakiet agent_tools: grupy narzędzi ładowane leniwie z rejestru"""
+
+    @staticmethod
+    def _module_functions(group):
+        path = f"{agent_tools.__path__[0]}/{group.module.rsplit('.', 1)[1]}.py"
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        return [node.name for node in tree.body if isinstance(node, ast.FunctionDef)]
+
+    @pytest.mark.unit
+    def test_tool_lists_match_modules_without_duplicates(self):
+        for group in TOOL_GROUPS:
+            functions = self._module_functions(group)
+            assert len(functions) == len(set(functions)), group.name
+            public = [name for name in functions if not name.startswith("_")]
+            assert list(group.tools) == public, group.name
+
+    @pytest.mark.unit
+    def test_resolve_loads_only_the_tool_group(self):
+        registry = ToolRegistry(TOOL_GROUPS)
+        assert registry.group_of("calculate_value_score") == "value"
+        assert not any(s["loaded"] for s in registry.get_import_statistics().values())
+
+        tool = registry.resolve("calculate_value_score")
+        assert tool is agent_tools.value.calculate_value_score
+
+        stats = registry.get_import_statistics()
+        assert stats["value"]["loaded"] and stats["value"]["import_seconds"] >= 0
+        assert not stats["collection"]["loaded"]
+        assert stats["collection"]["import_seconds"] is None
+
+        with pytest.raises(AttributeError):
+            registry.resolve("no_such_tool")
+
+    @pytest.mark.unit
+    def test_function_map_built_on_demand_sees_replacements(self, monkeypatch):
+        def cached_search(game_name):
+            return {"success": False, "error": "cached"}
+
+        monkeypatch.setattr(agent_tools, "search_and_scrape_game", cached_search)
+        function_map = agent_tools.build_function_map(groups=["scrape", "value"])
+
+        assert set(function_map) == set(
+            agent_tools.tool_registry.tool_names(["scrape", "value"])
+        )
+        assert function_map["search_and_scrape_game"] is cached_search
+
+    @pytest.mark.unit
+    def test_analysis_team_tools_come_from_registry(self):
+        team = build_analysis_team()
+        schemas = {
+            tool["function"]["name"]: tool["function"]
+            for tool in team.review_generator.llm_config["tools"]
+        }
+        review = schemas["generate_comprehensive_game_review"]
+        assert review["description"] == agent_tools.tool_registry.describe(
+            "generate_comprehensive_game_review"
+        )
+        assert "context" not in review["parameters"]["properties"]
+        assert "search_and_scrape_game" in team.user_proxy.function_map
+        assert "search_and_scrape_game" not in schemas
+
+    @pytest.mark.unit
+    def test_register_tools_uses_marker_descriptions(self):
+        registered = {"llm": {}, "execution": []}
+
+        def register_for_llm(name, description):
+            return lambda func: registered["llm"].setdefault(name, description)
+
+        def register_for_execution(name):
+            return lambda func: registered["execution"].append(name)
+
+        caller = SimpleNamespace(register_for_llm=register_for_llm)
+        executor = SimpleNamespace(register_for_execution=register_for_execution)
+        agent_tools.register_tools(
+            caller,
+            executor,
+            tool_names=["check_if_game_owned", "calculate_value_score"],
+        )
+
+        assert registered["execution"] == [
+            "check_if_game_owned",
+            "calculate_value_score",
+        ]
+        assert registered["llm"]["check_if_game_owned"].startswith(
+            "Check if current user owns a specific game"
+        )
+        assert (
+            registered["llm"]["calculate_value_score"]
+            == "Calculate objective value-for-money indicator"
+        )
@@ -0,0 +1,444 @@
+"""
+📈 Monitoring & Analytics Tests
+Test usage analytics storage (append-only event log), its queries and the
+streaming aggregates behind usage statistics, the performance monitor's
+buffered recording path and span tracing
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from utils.latency_sketch import LatencySketch
+from utils.performance_monitor import PerformanceMonitor
+from utils.usage_aggregates import (
+    HOUR_SECONDS,
+    HyperLogLog,
+    UsageAggregator,
+    hour_start,
+)
+from utils.usage_analytics import EventType, UsageAnalytics
+from utils.tracing import (
+    NOOP_SPAN,
+    add_span_attributes,
+    get_tracer,
+    propagate_context,
+    trace_span,
+)
+from utils.usage_event_log import UsageEventLog
+
+
+def _event(event_id, timestamp, user_id="user_a", event_type="game_analysis", **extra):
+    return {
+        "event_id": event_id,
+        "session_id": "session_1",
+        "user_id": user_id,
+        "event_type": event_type,
+        "timestamp": timestamp,
+        **extra,
+    }
+
+
+@pytest.fixture
+def tracer():
+    tracer = get_tracer()
+    tracer.clear()
+    tracer.enable()
+    yield tracer
+    tracer.disable()
+    tracer.clear()
+
+
+@pytest.fixture
+def analytics(tmp_path):
+    analytics = UsageAnalytics(data_dir=str(tmp_path / "analytics"))
+    yield analytics
+    analytics.event_log.close()
+
+
+class TestUsageEventLog:
+    """Segmenty dzienne, zapis wsadowy i zapytania po indeksach"""
+
+    @pytest.mark.unit
+    def test_segments_rotate_daily_and_queries_read_the_window(self, tmp_path):
+        log = UsageEventLog(tmp_path / "events")
+        now = datetime.now().replace(hour=12)
+        for days_ago in (4, 2, 0):
+            stamp = now - timedelta(days=days_ago)
+            log.append(_event(f"event_{days_ago}_a", stamp, game_name="Hades"))
+            log.append(
+                _event(
+                    f"event_{days_ago}_b", stamp, user_id="user_b", event_type="error"
+                )
+            )
+        log.flush()
+
+        assert len(list((tmp_path / "events").glob("events-*.db"))) == 3
+        assert log.get_statistics()["segments"] == 3
+
+        window = log.query(start=now - timedelta(days=3))
+        assert [event["event_id"] for event in window] == [
+            "event_2_a",
+            "event_2_b",
+            "event_0_a",
+            "event_0_b",
+        ]
+        assert window[0]["timestamp"] == now - timedelta(days=2)
+        assert window[0]["game_name"] == "Hades" and window[0]["success"] is True
+
+        assert [e["event_id"] for e in log.query(user_id="user_b", limit=2)] == [
+            "event_4_b",
+            "event_2_b",
+        ]
+        assert log.count(event_type="error") == 3
+        assert log.count(start=now - timedelta(days=1), user_id="user_a") == 1
+        assert log.distinct("user_id", start=now - timedelta(days=1)) == {
+            "user_a",
+            "user_b",
+        }
+        log.close()
+
+    @pytest.mark.unit
+    def test_background_flush_and_retention(self, tmp_path):
+        log = UsageEventLog(tmp_path / "events", retention_days=7, flush_interval=0.05)
+        log.append(_event("recent", datetime.now(), parameters={"type": "quick"}))
+        log.append(_event("expired", datetime.now() - timedelta(days=30)))
+
+        # Written by the flusher thread, no explicit flush
+        deadline = time.monotonic() + 5
+        stats = log.get_statistics()
+        while stats["written"] + stats["expired"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+            stats = log.get_statistics()
+        assert stats["written"] == 1 and stats["expired"] == 1
+
+        (tmp_path / "events" / "events-20000101.db").touch()
+        log.close()
+
+        reopened = UsageEventLog(tmp_path / "events", retention_days=7)
+        assert not (tmp_path / "events" / "events-20000101.db").exists()
+        assert [e["parameters"] for e in reopened.query()] == [{"type": "quick"}]
+        reopened.close()
+
+        with pytest.raises(RuntimeError):
+            log.append(_event("late", datetime.now()))
+
+
+class TestUsageAnalyticsStorage:
+    """UsageAnalytics na dzienniku zdarzeń"""
+
+    @pytest.mark.unit
+    def test_statistics_and_insights_come_from_the_log(self, analytics):
+        for index in range(30):
+            analytics.track_event(
+                EventType.GAME_ANALYSIS,
+                success=index % 10 != 0,
+                game_name=f"Game {index % 3}",
+                command="analyze",
+            )
+        analytics.track_event(EventType.CACHE_HIT)
+
+        stats = analytics.get_usage_statistics("1d")
+        assert stats.total_events == 32  # + session start
+        assert stats.unique_games_analyzed == 3
+        assert stats.most_used_commands == [{"command": "analyze", "count": 30}]
+        assert stats.cache_hit_rate == 100.0
+
+        insights = analytics.get_user_insights()
+        assert insights["activity_summary"]["total_events"] == 32
+        summary = analytics.get_analytics_summary()
+        assert summary["data_summary"]["total_events"] == 32
+        assert summary["recent_activity"]["active_users_today"] == 1
+
+    @pytest.mark.unit
+    def test_events_persist_without_rewriting_json(self, tmp_path):
+        data_dir = tmp_path / "analytics"
+        data_dir.mkdir()
+        legacy = {
+            "events": [
+                {
+                    "event_id": "event_legacy",
+                    "session_id": "session_old",
+                    "user_id": "user_old",
+                    "event_type": "comparison",
+                    "timestamp": (datetime.now() - timedelta(hours=2)).isoformat(),
+                    "success": True,
+                    "execution_time": 1.5,
+                }
+            ]
+        }
+        (data_dir / "usage_events.json").write_text(json.dumps(legacy))
+
+        first = UsageAnalytics(data_dir=str(data_dir))
+        first.track_event(EventType.QUICK_ANALYSIS, game_name="Celeste")
+        first.end_session()
+        first.close()
+
+        assert not (data_dir / "usage_events.json").exists()
+        second = UsageAnalytics(data_dir=str(data_dir))
+        events = second.event_log.query()
+        assert events[0]["event_id"] == "event_legacy"
+        assert second.get_usage_statistics("1d").most_popular_games == [
+            {"game": "Celeste", "count": 1}
+        ]
+        second.event_log.close()
+
+
+class TestUsageAggregates:
+    """Kubełki godzinowe i szkice HyperLogLog"""
+
+    @pytest.mark.unit
+    def test_hyperloglog_estimates_merges_and_round_trips(self):
+        small, large, other = HyperLogLog(), HyperLogLog(), HyperLogLog()
+        for index in range(5):
+            small.add(f"user_{index % 3}")
+        for index in range(20000):
+            (large if index % 2 else other).add(f"game_{index}")
+
+        assert small.count() == 3
+        assert abs(large.count() - 10000) < 10000 * 0.05
+        merged = HyperLogLog.from_dict(large.to_dict()).merge(other)
+        assert abs(merged.count() - 20000) < 20000 * 0.05
+        assert HyperLogLog.from_dict(small.to_dict()).count() == 3
+
+    @pytest.mark.unit
+    def test_period_is_a_merge_of_hour_buckets(self):
+        aggregator = UsageAggregator(retention_days=2)
+        base = datetime.fromtimestamp(hour_start(time.time()) - 5 * HOUR_SECONDS)
+        for hour in range(5):
+            for index in range(10):
+                aggregator.add(
+                    _event(
+                        f"event_{hour}_{index}",
+                        base + timedelta(hours=hour, minutes=index),
+                        user_id=f"user_{index % 2}",
+                        game_name=f"Game {hour}",
+                        success=index != 0,
+                        parameters={"analysis_type": "price"} if hour == 0 else {},
+                    )
+                )
+
+        last_two = aggregator.merge_hours(base.timestamp() + 3 * HOUR_SECONDS)
+        assert last_two.events == 20 and last_two.errors == 2
+        assert last_two.games == {"Game 3": 10, "Game 4": 10}
+        assert last_two.users.count() == 2
+        assert aggregator.merge_hours().unique_games.count() == 5
+
+        summary = aggregator.user_summary("user_0")
+        assert summary["events"] == 25 and summary["unique_games"] == 5
+        assert summary["price_focus_events"] == 5
+
+        # Buckets past retention are dropped (with the user's totals)
+        aggregator.add(_event("late", datetime.now() + timedelta(days=3)))
+        assert aggregator.user_summary("user_0") is None
+        assert aggregator.merge_hours().events == 1
+
+        restored = UsageAggregator.from_dict(
+            json.loads(json.dumps(aggregator.to_dict()))
+        )
+        assert restored.user_summary("user_a")["events"] == 1
+        assert restored.last_ts == aggregator.last_ts
+
+    @pytest.mark.unit
+    def test_statistics_do_not_scan_events(self, analytics, monkeypatch):
+        for index in range(50):
+            analytics.track_event(EventType.GAME_ANALYSIS, game_name=f"Game {index}")
+
+        scanned = []
+        query = analytics.event_log.query
+
+        def counting_query(**filters):
+            events = query(**filters)
+            scanned.extend(events)
+            return events
+
+        monkeypatch.setattr(analytics.event_log, "query", counting_query)
+        stats = analytics.get_usage_statistics("7d")
+        analytics.get_user_insights()
+        analytics.get_analytics_summary()
+
+        assert stats.total_events == 51
+        assert stats.unique_games_analyzed == 50
+        assert scanned == []  # Only partial hours at period edges are read
+
+    @pytest.mark.unit
+    def test_aggregates_snapshot_and_replay(self, tmp_path):
+        data_dir = str(tmp_path / "analytics")
+        first = UsageAnalytics(data_dir=data_dir)
+        first.track_event(EventType.GAME_ANALYSIS, game_name="Hades")
+        first._save_data()
+        first.track_event(EventType.GAME_ANALYSIS, game_name="Celeste")
+        first.event_log.close()  # Crash after the snapshot: no final save
+
+        second = UsageAnalytics(data_dir=data_dir)
+        stats = second.get_usage_statistics("1d")
+        assert stats.total_events == 4  # Two events, two session starts
+        assert {game["game"] for game in stats.most_popular_games} == {
+            "Hades",
+            "Celeste",
+        }
+        second.event_log.close()
+
+
+class TestPerformanceMonitor:
+    """Bufory wątków, szkice percentyli i zapis w tle"""
+
+    @pytest.mark.unit
+    def test_latency_sketch_quantiles_merge_and_round_trip(self):
+        first, second = LatencySketch(), LatencySketch()
+        values = [index / 1000 for index in range(1, 10001)]
+        for index, value in enumerate(values):
+            (first if index % 2 else second).add(value)
+
+        merged = LatencySketch.from_dict(first.to_dict()).merge(second)
+        assert merged.count == 10000
+        for q in (0.5, 0.95, 0.99):
+            expected = values[int(len(values) * q)]
+            assert abs(merged.quantile(q) - expected) <= expected * 0.01
+        assert LatencySketch().quantile(0.5) is None
+
+    @pytest.mark.unit
+    def test_recording_is_buffered_per_thread(self, tmp_path, monkeypatch):
+        monitor = PerformanceMonitor(
+            data_dir=str(tmp_path / "perf"), flush_interval=60, save_interval=60
+        )
+        resource_samples = []
+        monkeypatch.setattr(
+            monitor, "_sample_resources", lambda: resource_samples.append(1)
+        )
+
+        def record(offset):
+            for index in range(500):
+                monitor.record_performance(
+                    "search", (index + offset) / 1000, success=index % 50 != 0
+                )
+
+        workers = [threading.Thread(target=record, args=(o,)) for o in (0, 500)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        # Nothing processed (or sampled per call) until the buffers are drained
+        assert monitor.get_statistics()["pending"] == 1000
+        assert "search" not in monitor.profiles
+        assert len(resource_samples) == 1  # Once, when the worker started
+
+        summary = monitor.get_performance_summary("1h")
+        assert summary["total_metrics"] == 1000
+        search = summary["function_performance"]["search"]
+        assert search["errors"] == 20
+        assert abs(search["p95_time"] - 0.95) <= 0.95 * 0.01
+        profile = monitor.profiles["search"]
+        assert profile.total_calls == 1000 and profile.success_rate == 98.0
+        assert abs(profile.p99_execution_time - 0.99) <= 0.99 * 0.01
+        assert monitor.get_statistics()["thread_buffers"] == 0  # Finished threads
+        monitor.close()
+
+    @pytest.mark.unit
+    def test_background_save_and_reload(self, tmp_path):
+        data_dir = str(tmp_path / "perf")
+        monitor = PerformanceMonitor(
+            data_dir=data_dir, flush_interval=0.02, save_interval=0.05
+        )
+        with monitor.measure_performance("scrape"):
+            pass
+        monitor.record_performance("parse", 12.0)
+
+        deadline = time.monotonic() + 5
+        while not monitor.get_statistics()["saves"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert (tmp_path / "perf" / "performance_stats.json").exists()
+        assert not list((tmp_path / "perf").glob("*.tmp"))
+        monitor.close()
+
+        reopened = PerformanceMonitor(data_dir=data_dir)
+        summary = reopened.get_performance_summary("24h")
+        assert summary["total_metrics"] == 2
+        assert summary["function_performance"]["parse"]["p95_time"] == 12.0
+        assert reopened.profiles["parse"].performance_level.value == "critical"
+        assert summary["active_alerts"] == 1  # slow_performance for parse
+        reopened.close()
+
+
+class TestTracing:
+    """Zagnieżdżone spany, propagacja kontekstu i eksport Chrome trace"""
+
+    @pytest.mark.unit
+    def test_disabled_tracing_records_nothing(self):
+        assert not get_tracer().enabled
+        with trace_span("search", game="Hades") as span:
+            add_span_attributes(cache_tier="memory")
+        assert span is NOOP_SPAN
+        assert get_tracer().finished_spans() == []
+
+    @pytest.mark.unit
+    def test_spans_nest_across_executor_threads(self, tracer, tmp_path):
+        def step(name):
+            with trace_span(name) as span:
+                span.set_attribute("bytes", 1024)
+            return threading.get_ident()
+
+        with trace_span("analyze_game", game="Hades"):
+            with trace_span("cache_lookup"):
+                add_span_attributes(cache_tier="disk")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(propagate_context(step), name)
+                    for name in ("value_analysis", "review_generation")
+                ]
+                worker_threads = {future.result() for future in futures}
+            with pytest.raises(ValueError):
+                with trace_span("parse"):
+                    raise ValueError("bad html")
+
+        spans = {span.name: span for span in tracer.finished_spans()}
+        root = spans["analyze_game"]
+        assert root.parent_id is None and root.attributes == {"game": "Hades"}
+        assert spans["cache_lookup"].attributes == {"cache_tier": "disk"}
+        for name in ("value_analysis", "review_generation"):
+            assert spans[name].parent_id == root.span_id
+            assert spans[name].trace_id == root.trace_id
+            assert spans[name].thread_id in worker_threads
+            assert root.start_ns <= spans[name].start_ns <= spans[name].end_ns
+        assert spans["parse"].error == "ValueError: bad html"
+
+        trace_file = tmp_path / "trace.json"
+        assert tracer.export_chrome_trace(trace_file) == 5
+        events = json.loads(trace_file.read_text())["traceEvents"]
+        complete = {e["name"]: e for e in events if e["ph"] == "X"}
+        assert complete["cache_lookup"]["args"]["cache_tier"] == "disk"
+        assert complete["analyze_game"]["dur"] >= complete["cache_lookup"]["dur"]
+        assert {e["ph"] for e in events} == {"M", "X", "s", "f"}
+        assert len([e for e in events if e["ph"] == "s"]) == 2  # Worker spans
+
+    @pytest.mark.unit
+    def test_batch_tasks_are_children_of_the_batch(self, tracer, monkeypatch):
+        import agent_tools
+        from utils.batch_processor import BatchAnalysisManager
+
+        def fake_quick_opinion(game_name):
+            with trace_span("review", game=game_name):
+                return {"success": True, "game": game_name}
+
+        monkeypatch.setattr(
+            agent_tools, "generate_quick_game_opinion", fake_quick_opinion
+        )
+        manager = BatchAnalysisManager(max_concurrent=2, rate_limit=1000)
+        batch_id = manager.create_batch_session(["Hades", "Celeste"], "quick")
+        assert manager.start_batch_analysis(batch_id)
+
+        spans = tracer.finished_spans()
+        batch = next(span for span in spans if span.name == "batch")
+        tasks = {s.span_id: s for s in spans if s.name == "batch_task"}
+        reviews = [span for span in spans if span.name == "review"]
+        assert {task.parent_id for task in tasks.values()} == {batch.span_id}
+        assert {tasks[r.parent_id].attributes["game"] for r in reviews} == {
+            "Hades",
+            "Celeste",
+        }
+        assert all(r.trace_id == batch.trace_id for r in reviews)
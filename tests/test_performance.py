@@ -3,6 +3,9 @@
 Benchmark system performance and identify bottlenecks
 """
 
+import os
+import subprocess
+import sys
 import pytest
 import time
 import statistics
@@ -374,6 +377,133 @@ class TestSystemPerformance:
         ), f"Average system response too slow: {avg_response:.2f}s"
 
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold-start budgets (seconds) and modules that must stay out of each path
+HELP_IMPORT_BUDGET = 0.6
+QUICK_IMPORT_BUDGET = 1.2
+HELP_FORBIDDEN_MODULES = {
+    "autogen",
+    "openai",
+    "conversation_manager",
+    "agent_tools",
+    "deku_tools",
+    "sklearn",
+    "numpy",
+    "psutil",
+}
+QUICK_FORBIDDEN_MODULES = {
+    "autogen",
+    "openai",
+    "conversation_manager",
+    "sklearn",
+    "numpy",
+    "psutil",
+}
+
+
+def _import_profile(code: str) -> Dict[str, Any]:
+    """Runs code in a fresh interpreter with ``-X importtime``"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "OPENAI_API_KEY": "test-key"},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+
+    modules = set()
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        modules.add(name.strip())
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return {"modules": modules, "seconds": total_us / 1_000_000}
+
+
+class TestStartupPerformance:
+    """Cold start of enhanced_cli.py (lazy import graph)"""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_help_cold_start(self):
+        """--help imports only the CLI shell"""
+        profile = _import_profile("import enhanced_cli")
+
+        loaded = {name.split(".")[0] for name in profile["modules"]}
+        assert not loaded & HELP_FORBIDDEN_MODULES
+        assert profile["seconds"] < HELP_IMPORT_BUDGET
+
+        completed = subprocess.run(
+            [sys.executable, "enhanced_cli.py", "--help"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert completed.returncode == 0
+        assert "--quick" in completed.stdout
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_quick_mode_cold_start(self):
+        """--quick loads the tool layer but not AutoGen or the ML stack"""
+        profile = _import_profile(
+            "import enhanced_cli; cli = enhanced_cli.EnhancedCLI(); "
+            "enhanced_cli.agent_tools.load()"
+        )
+
+        loaded = {name.split(".")[0] for name in profile["modules"]}
+        assert "agent_tools" in loaded
+        assert not loaded & QUICK_FORBIDDEN_MODULES
+        assert profile["seconds"] < QUICK_IMPORT_BUDGET
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_tool_groups_load_lazily(self):
+        """import agent_tools loads no tool group; a tool loads only its group"""
+        profile = _import_profile("import agent_tools")
+        groups = {
+            name for name in profile["modules"] if name.startswith("agent_tools.")
+        }
+        assert groups == {"agent_tools.registry"}
+
+        profile = _import_profile("from agent_tools import calculate_value_score")
+        groups = {
+            name for name in profile["modules"] if name.startswith("agent_tools.")
+        }
+        assert groups == {"agent_tools.registry", "agent_tools.value"}
+        assert "deku_tools" not in profile["modules"]
+
+    @pytest.mark.performance
+    @pytest.mark.unit
+    def test_lazy_module_defers_import(self, tmp_path, monkeypatch):
+        """LazyModule imports on first attribute access and runs hooks once"""
+        from utils.lazy_imports import LazyModule
+
+        (tmp_path / "lazy_probe_module.py").write_text("VALUE = 42\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "lazy_probe_module", raising=False)
+
+        module = LazyModule("lazy_probe_module")
+        seen = []
+        module.when_loaded(lambda loaded: seen.append(loaded.VALUE))
+        assert not module.loaded and "lazy_probe_module" not in sys.modules
+
+        assert module.VALUE == 42 and module.VALUE == 42
+        assert module.loaded and seen == [42]
+
+        module.when_loaded(lambda loaded: seen.append("late"))
+        assert seen == [42, "late"]
+
+
 class TestPerformanceRegression:
     """Test for performance regressions"""
 
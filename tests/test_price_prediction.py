@@ -0,0 +1,997 @@
+"""
+🧠 Price Prediction Storage Tests
+Test pooled SQLite storage and bulk price history ingestion
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from bs4 import BeautifulSoup
+
+from deku_tools import parse_price_history_points
+from utils.price_history_ingestion import PriceHistoryBackfillJob, PriceHistoryIngestor
+from utils.price_backtest import PriceBacktester
+from utils.price_model_registry import (
+    PriceModelRegistry,
+    SeriesState,
+    _to_days,
+    history_features,
+)
+from utils.price_prediction_ml import PriceDataPoint, PricePredictionEngine
+from utils.price_series_store import PriceSeriesStore
+from utils.price_watch import PriceWatchEngine
+from utils.price_trend_batch import PriceSeriesBatch, compute_trend_statistics
+from utils.sqlite_pool import SQLiteConnectionPool
+from utils.time_series import (
+    significant_drop_indices,
+    sliding_window_max,
+    sliding_window_min,
+    window_drop_rate,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Price prediction engine backed by a temporary database"""
+    engine = PricePredictionEngine(data_dir=str(tmp_path / "price_data"))
+    yield engine
+    engine.close()
+
+
+class TestSQLiteConnectionPool:
+    """Thread-local pooled connections"""
+
+    @pytest.mark.unit
+    def test_connections_are_reused_per_thread(self, tmp_path):
+        pool = SQLiteConnectionPool(tmp_path / "pool.db")
+        main_conn = pool.connection()
+        assert pool.connection() is main_conn
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(pool.connection()))
+        thread.start()
+        thread.join()
+        assert other[0] is not main_conn
+        pool.close()
+
+    @pytest.mark.unit
+    def test_worker_thread_connections_close_on_exit(self, tmp_path):
+        pool = SQLiteConnectionPool(tmp_path / "pool.db")
+        pool.connection()
+
+        def query():
+            pool.connection().execute("SELECT 1").fetchone()
+
+        for _ in range(50):
+            thread = threading.Thread(target=query)
+            thread.start()
+            thread.join()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: query(), range(20)))
+
+        assert pool.open_connections == 1  # Only the main thread's
+        pool.close()
+        assert pool.open_connections == 0
+
+    @pytest.mark.unit
+    def test_wal_mode_enabled(self, tmp_path):
+        pool = SQLiteConnectionPool(tmp_path / "pool.db")
+        mode = pool.connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == "wal"
+        pool.close()
+
+    @pytest.mark.unit
+    def test_write_rolls_back_on_error(self, tmp_path):
+        pool = SQLiteConnectionPool(tmp_path / "pool.db")
+        with pool.write() as conn:
+            conn.execute("CREATE TABLE items (name TEXT)")
+
+        with pytest.raises(RuntimeError):
+            with pool.write() as conn:
+                conn.execute("INSERT INTO items VALUES ('lost')")
+                raise RuntimeError("abort")
+
+        count = pool.connection().execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        assert count == 0
+        pool.close()
+
+
+class TestPriceStorage:
+    """Recording and reading price history through the pool"""
+
+    @pytest.mark.unit
+    def test_record_reports_duplicates(self, engine):
+        date = datetime.now() - timedelta(days=3)
+        assert engine.record_price_data("Celeste", 19.99, date)
+        assert not engine.record_price_data("Celeste", 19.99, date)
+        assert engine.record_price_data("Celeste", 9.99, date + timedelta(days=1))
+
+        history = engine.get_price_history("Celeste")
+        assert [point.price for point in history] == [19.99, 9.99]
+
+    @pytest.mark.unit
+    def test_bulk_record(self, engine):
+        start = datetime.now() - timedelta(days=30)
+        records = [
+            ("Hades", 24.99 - day * 0.1, start + timedelta(days=day), None)
+            for day in range(30)
+        ]
+        assert engine.record_price_data_bulk(records) == 30
+        assert engine.record_price_data_bulk(records[:10]) == 0
+        assert len(engine.get_price_history("Hades")) == 30
+
+    @pytest.mark.performance
+    def test_concurrent_recording(self, engine):
+        start = datetime.now() - timedelta(days=200)
+
+        def record(game_index):
+            for day in range(50):
+                engine.record_price_data(
+                    f"Game {game_index}", 10.0 + day, start + timedelta(days=day)
+                )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(record, range(8)))
+
+        for game_index in range(8):
+            assert len(engine.get_price_history(f"Game {game_index}")) == 50
+
+
+CHART_PAGE = """
+<div id="price-history">
+  <canvas data-chart='{"datasets": [{"data": [
+      {"x": "2024-01-05", "y": 59.99},
+      {"x": "2024-03-10", "y": "$39.99"},
+      {"x": "2024-02-01", "y": 49.99}
+  ]}]}'></canvas>
+</div>
+"""
+
+TABLE_PAGE = """
+<div id="price-history">
+  <table>
+    <tr><td>Jan 5, 2024</td><td class="text-right">$59.99</td></tr>
+    <tr><td>March 10, 2024</td><td class="text-right">$39.99</td></tr>
+    <tr><td><strong>All time low</strong></td></tr>
+  </table>
+</div>
+"""
+
+
+class TestPriceHistoryIngestion:
+    """Parsing item-page history and bulk ingestion"""
+
+    @pytest.mark.unit
+    def test_parse_chart_data(self):
+        points = parse_price_history_points(BeautifulSoup(CHART_PAGE, "html.parser"))
+        assert [p["price"] for p in points] == [59.99, 49.99, 39.99]
+        assert points[0]["date"].startswith("2024-01-05")
+
+    @pytest.mark.unit
+    def test_parse_table_rows(self):
+        points = parse_price_history_points(BeautifulSoup(TABLE_PAGE, "html.parser"))
+        assert [p["price"] for p in points] == [59.99, 39.99]
+        assert points[1]["date"].startswith("2024-03-10")
+
+    @pytest.mark.unit
+    def test_ingest_game_details(self, engine):
+        details = {
+            "title": "Metroid Dread",
+            "current_eshop_price": "$29.99",
+            "price_history_points": [
+                {"date": (datetime.now() - timedelta(days=d)).isoformat(), "price": p}
+                for d, p in [(90, 59.99), (60, 39.99), (30, 49.99)]
+            ],
+        }
+        ingestor = PriceHistoryIngestor(engine)
+        assert ingestor.ingest_game_details(details)["inserted"] == 4
+        assert [p.price for p in engine.get_price_history("Metroid Dread")] == [
+            59.99,
+            39.99,
+            49.99,
+            29.99,
+        ]
+
+    @pytest.mark.unit
+    def test_ingest_before_prediction_stores_current_price_once(self, engine):
+        details = {
+            "title": "Celeste",
+            "current_eshop_price": "$19.99",
+            "price_history_points": [
+                {
+                    "date": (datetime.now() - timedelta(days=30)).isoformat(),
+                    "price": 9.99,
+                }
+            ],
+        }
+        PriceHistoryIngestor(engine).ingest_game_details(
+            details, include_current_price=False
+        )
+        engine.generate_price_prediction("Celeste", 19.99)
+        assert [p.price for p in engine.get_price_history("Celeste")] == [
+            9.99,
+            19.99,
+        ]
+
+    @pytest.mark.unit
+    def test_ingest_csv_and_json_dumps(self, engine, tmp_path):
+        day = datetime.now() - timedelta(days=10)
+        csv_path = tmp_path / "dump.csv"
+        csv_path.write_text(
+            "game_title,date,price,promotion_type\n"
+            f"Hades,{day.date()},24.99,\n"
+            f"Hades,{(day + timedelta(days=1)).date()},$19.99,sale\n"
+            "Hades,not-a-date,9.99,\n"
+        )
+        json_path = tmp_path / "dump.json"
+        json_path.write_text(
+            json.dumps({"Celeste": [{"date": day.isoformat(), "price": 19.99}]})
+        )
+
+        ingestor = PriceHistoryIngestor(engine)
+        assert ingestor.ingest_file(csv_path)["inserted"] == 2
+        assert ingestor.ingest_file(json_path)["inserted"] == 1
+        assert engine.get_price_history("Hades")[1].promotion_type == "sale"
+
+        with pytest.raises(ValueError):
+            ingestor.ingest_file(tmp_path / "dump.xml")
+
+    @pytest.mark.unit
+    def test_backfill_covers_tracked_catalog(self, engine):
+        engine.record_price_data("Hades", 24.99, datetime.now() - timedelta(days=5))
+        engine.record_price_data("Celeste", 19.99, datetime.now() - timedelta(days=5))
+
+        def fetch(title):
+            if title == "Celeste":
+                return None
+            return {
+                "title": "HADES (Switch)",
+                "current_eshop_price": "$14.99",
+                "price_history_points": [
+                    {
+                        "date": (datetime.now() - timedelta(days=40)).isoformat(),
+                        "price": 29.99,
+                    }
+                ],
+            }
+
+        job = PriceHistoryBackfillJob(
+            PriceHistoryIngestor(engine), fetch_details=fetch, max_workers=2
+        )
+        summary = job.run_once()
+
+        assert summary["games"] == 2
+        assert summary["failed_games"] == ["Celeste"]
+        assert summary["points_inserted"] == 2
+        assert len(engine.get_price_history("Hades")) == 3
+
+
+def _random_history(rng, length, start=None):
+    """Synthetic daily-ish price history with sales"""
+    start = start or datetime.now() - timedelta(days=length * 3)
+    points = []
+    price = rng.uniform(20, 70)
+    day = 0
+    for _ in range(length):
+        day += int(rng.integers(1, 6))
+        if rng.random() < 0.15:
+            price *= rng.uniform(0.5, 0.8)
+        elif rng.random() < 0.2:
+            price = min(price * rng.uniform(1.1, 1.6), 80)
+        points.append(PriceDataPoint(start + timedelta(days=day), round(price, 2)))
+    return points
+
+
+def _reference_window_drop_rate(prices, threshold=0.15):
+    """Original nested-rescan drop window rate"""
+    drops = total = 0
+    for i in range(len(prices) - 30, len(prices)):
+        if i < 0:
+            continue
+        window = prices[max(0, i - 30) : i + 1]
+        if len(window) < 2:
+            continue
+        high, low = max(window), min(window)
+        if high > 0 and (high - low) / high >= threshold:
+            drops += 1
+        total += 1
+    return drops / total if total else None
+
+
+class TestVectorizedTrendStatistics:
+    """Closed-form batch statistics match per-game model fits"""
+
+    @pytest.mark.unit
+    def test_batch_matches_per_game_reference(self):
+        from sklearn.linear_model import LinearRegression
+
+        rng = np.random.default_rng(3)
+        histories = {
+            f"Game {i}": _random_history(rng, int(rng.integers(3, 120)))
+            for i in range(25)
+        }
+        histories["Flat"] = [
+            PriceDataPoint(datetime(2024, 1, d), 19.99) for d in range(1, 8)
+        ]
+
+        batch = PriceSeriesBatch.from_histories(histories)
+        stats = compute_trend_statistics(batch).by_title()
+
+        for title, history in histories.items():
+            prices = np.array([p.price for p in history])
+            days = np.array([(p.date - history[0].date).days for p in history])
+            model = LinearRegression().fit(days.reshape(-1, 1), prices)
+            recent = LinearRegression().fit(days[-30:].reshape(-1, 1), prices[-30:])
+            game = stats[title]
+
+            assert game.slope == pytest.approx(model.coef_[0], abs=1e-9)
+            assert game.r_squared == pytest.approx(
+                model.score(days.reshape(-1, 1), prices), abs=1e-9
+            )
+            assert game.recent_slope == pytest.approx(recent.coef_[0], abs=1e-9)
+            assert game.recent_intercept == pytest.approx(recent.intercept_, abs=1e-6)
+            assert game.volatility == pytest.approx(prices.std() / prices.mean())
+            assert game.q1 == pytest.approx(np.percentile(prices, 25))
+            assert game.minimum == prices.min()
+            assert game.window_drop_rate == pytest.approx(
+                _reference_window_drop_rate(list(prices))
+            )
+
+    @pytest.mark.unit
+    def test_batch_predictions_match_single(self, engine):
+        rng = np.random.default_rng(11)
+        histories = {f"Game {i}": _random_history(rng, 40) for i in range(5)}
+        engine.record_price_data_bulk(
+            (title, p.price, p.date, None)
+            for title, history in histories.items()
+            for p in history
+        )
+        current = {title: history[-1].price for title, history in histories.items()}
+
+        batch = engine.generate_price_predictions(current)
+        for title, price in current.items():
+            single = engine._build_prediction(
+                title, price, engine.get_price_history(title)
+            ).to_dict()
+            batched = batch[title].to_dict()
+            for key in ("next_significant_drop_date",):
+                single.pop(key), batched.pop(key)
+            assert batched == single
+
+    @pytest.mark.performance
+    def test_batch_statistics_throughput(self):
+        rng = np.random.default_rng(5)
+        histories = {f"Game {i}": _random_history(rng, 200) for i in range(500)}
+        batch = PriceSeriesBatch.from_histories(histories)
+
+        start = time.perf_counter()
+        stats = compute_trend_statistics(batch)
+        duration = time.perf_counter() - start
+
+        assert len(stats) == 500
+        assert duration < 1.0, f"Statistics for 500 games took {duration:.3f}s"
+
+
+class TestTimeSeriesWindows:
+    """Monotonic-deque windows match brute-force rescans"""
+
+    @pytest.mark.unit
+    def test_sliding_extremes_match_brute_force(self):
+        rng = np.random.default_rng(17)
+        values = rng.integers(0, 20, size=200).astype(float)
+
+        for window in (1, 2, 7, 31, 500):
+            expected_max = [
+                values[max(0, i - window + 1) : i + 1].max() for i in range(200)
+            ]
+            expected_min = [
+                values[max(0, i - window + 1) : i + 1].min() for i in range(200)
+            ]
+            assert sliding_window_max(values, window).tolist() == expected_max
+            assert sliding_window_min(values, window).tolist() == expected_min
+
+    @pytest.mark.unit
+    def test_window_drop_rate_matches_nested_rescan(self):
+        rng = np.random.default_rng(19)
+        for length in (0, 1, 2, 5, 30, 31, 45, 300):
+            prices = [p.price for p in _random_history(rng, length)]
+            expected = _reference_window_drop_rate(prices)
+            if expected is None:
+                assert window_drop_rate(prices) is None
+            else:
+                assert window_drop_rate(prices) == pytest.approx(expected)
+
+    @pytest.mark.unit
+    def test_significant_drop_indices(self):
+        prices = [60.0, 59.0, 40.0, 40.0, 0.0, 10.0, 8.0]
+        assert significant_drop_indices(prices, 0.15).tolist() == [2, 4, 6]
+        assert significant_drop_indices([10.0]).tolist() == []
+
+
+class TestPriceModelRegistry:
+    """Persisted price models with incremental retraining"""
+
+    @pytest.mark.unit
+    def test_series_state_matches_history_features(self):
+        history = _random_history(np.random.default_rng(23), 60)
+        prices = np.array([p.price for p in history])
+        dates = [p.date for p in history]
+
+        state = SeriesState.from_history(prices[:-1], dates[:-1], 0.15)
+        expected = history_features(prices, _to_days(dates), 0.15)
+
+        assert state.features() == pytest.approx(expected[-2])
+        appended = state.appended(prices[-1], dates[-1], 0.15)
+        assert appended.features() == pytest.approx(expected[-1])
+
+    @pytest.mark.unit
+    def test_incremental_update_matches_full_refit(self, tmp_path):
+        history = _random_history(np.random.default_rng(29), 120)
+        incremental = PriceModelRegistry(tmp_path / "incremental")
+        full = PriceModelRegistry(tmp_path / "full")
+
+        assert incremental.update("Hades", history[:70])
+        assert incremental.update("Hades", history)
+        assert not incremental.update("Hades", history)
+        assert full.update("Hades", history)
+
+        expected = full.model_for("Hades")
+        model = incremental.model_for("Hades")
+        assert model.samples == expected.samples
+        assert model.coefficients == pytest.approx(expected.coefficients)
+        assert incremental.predict("Hades") == pytest.approx(full.predict("Hades"))
+
+        # A point backfilled before the watermark forces a full refit
+        backfilled = sorted(
+            history + [PriceDataPoint(history[10].date + timedelta(hours=1), 9.99)],
+            key=lambda p: p.date,
+        )
+        assert incremental.update("Hades", backfilled)
+        full.update("Hades", backfilled)
+        assert incremental.model_for("Hades").coefficients == pytest.approx(
+            full.model_for("Hades").coefficients
+        )
+
+    @pytest.mark.unit
+    def test_append_matches_full_refit(self, tmp_path):
+        history = _random_history(np.random.default_rng(41), 150)
+        incremental = PriceModelRegistry(tmp_path / "incremental")
+        full = PriceModelRegistry(tmp_path / "full")
+
+        assert incremental.append("Hades", history, 0) is None  # No model yet
+        assert incremental.update("Hades", history[:60])
+        assert incremental.save()
+
+        # Pending samples survive a reload and are completed by new points
+        reloaded = PriceModelRegistry(tmp_path / "incremental")
+        assert reloaded.watermark("Hades") == history[59].date
+        assert reloaded.append("Hades", history[60:100], 60)
+        assert reloaded.append("Hades", history[100:], 100)
+        assert not reloaded.append("Hades", [], 150)
+        assert reloaded.append("Hades", history[150:], 149) is None  # Backfill
+        assert full.update("Hades", history)
+
+        model = reloaded.model_for("Hades")
+        expected = full.model_for("Hades")
+        assert model.samples == expected.samples
+        assert model.coefficients == pytest.approx(expected.coefficients)
+        assert np.allclose(model.pending, expected.pending)
+
+    @pytest.mark.unit
+    def test_pooled_fallback_and_persistence(self, tmp_path):
+        rng = np.random.default_rng(31)
+        registry = PriceModelRegistry(tmp_path)
+        registry.register_game("Hades", genres=["Action"], publisher="Supergiant")
+        registry.register_game("Dead Cells", genres=["Action"], publisher="Nieznany")
+        registry.register_game("Pyre", genres=["RPG"], publisher="Supergiant")
+        registry.update("Hades", _random_history(rng, 120))
+        registry.update("Dead Cells", _random_history(rng, 3))
+        registry.update("Pyre", _random_history(rng, 3))
+
+        assert registry.model_for("Hades").key == "Hades"
+        assert registry.model_for("Dead Cells").key == "genre:Action"
+        assert registry.model_for("Pyre").key == "publisher:Supergiant"
+        assert registry.model_for("Unknown Game").key == "global"
+        assert registry.predict("Unknown Game", current_price=20.0) > 0
+
+        assert registry.save()
+        assert not registry.save()
+
+        reloaded = PriceModelRegistry(tmp_path)
+        assert reloaded.model_for("Dead Cells").key == "genre:Action"
+        for title in ("Hades", "Dead Cells", "Pyre"):
+            assert reloaded.predict(title, current_price=20.0) == pytest.approx(
+                registry.predict(title, current_price=20.0)
+            )
+
+    @pytest.mark.unit
+    def test_engine_predicts_from_registry(self, engine):
+        history = _random_history(np.random.default_rng(37), 80)
+        engine.record_price_data_bulk(("Hades", p.price, p.date, None) for p in history)
+
+        prediction = engine.generate_price_prediction(
+            "Hades", 24.99, genres=["Action"], publisher="Supergiant"
+        )
+        model_price = engine.model_registry.predict("Hades")
+
+        assert engine.model_registry.model_for("Hades").key == "Hades"
+        assert prediction.predicted_price == round(
+            min(max(model_price, 24.99 * 0.5), 24.99 * 1.5), 2
+        )
+        # Models are saved periodically and on close, not per prediction
+        assert not (engine.models_dir / "price_models.json").exists()
+        engine.close()
+        assert (engine.models_dir / "price_models.json").exists()
+
+        reloaded = PricePredictionEngine(data_dir=str(engine.data_dir))
+        assert reloaded.model_registry.predict("Hades") == pytest.approx(model_price)
+        reloaded.close()
+
+    @pytest.mark.unit
+    def test_engine_trains_on_rows_past_watermark(self, engine, monkeypatch):
+        start = datetime.now() - timedelta(days=900)
+        history = _random_history(np.random.default_rng(43), 250, start=start)
+        engine.record_price_data_bulk(("Hades", p.price, p.date, None) for p in history)
+        engine.generate_price_prediction("Hades", 24.99)
+        samples = engine.model_registry.model_for("Hades").samples
+
+        # Later predictions append only the new rows, never refitting
+        def full_refit(*args):
+            raise AssertionError("full refit")
+
+        monkeypatch.setattr(engine.model_registry, "update", full_refit)
+        for price in (19.99, 14.99):
+            engine.generate_price_prediction("Hades", price)
+            time.sleep(0.001)  # Distinct "now" timestamps
+        monkeypatch.undo()
+        model = engine.model_registry.model_for("Hades")
+        assert model.samples == samples
+        assert model.points == len(history) + 3  # Plus the recorded prices
+
+        # Same model as a fit on the full stored history (older than 365 days)
+        full = PriceModelRegistry(engine.data_dir / "full")
+        full.update("Hades", engine.get_price_history("Hades", days_back=None))
+        assert model.coefficients == pytest.approx(full.model_for("Hades").coefficients)
+
+
+class TestPriceSeriesStore:
+    """Memory-mapped columnar copy of the price history"""
+
+    @pytest.mark.unit
+    def test_sync_gives_zero_copy_views(self, engine, tmp_path):
+        start = datetime(2024, 1, 1)
+        engine.record_price_data_bulk(
+            [("Hades", 24.99 - i, start + timedelta(days=i), None) for i in range(5)]
+            + [("Celeste", 19.99, start, None)]
+        )
+
+        hades = engine.get_price_series("Hades", days_back=100000)
+        assert hades.prices.dtype == np.float32 and hades.days.dtype == np.int32
+        assert hades.prices.tolist() == pytest.approx(
+            [24.99, 23.99, 22.99, 21.99, 20.99]
+        )
+        assert np.diff(hades.days).tolist() == [1, 1, 1, 1]
+        assert hades.dates[0] == start
+        assert np.shares_memory(hades.prices, engine.series_store._snapshot[0])
+        assert engine.get_price_series("Unknown") is None
+
+        # Only changed games are rewritten; earlier views stay valid
+        engine.record_price_data("Celeste", 9.99, start + timedelta(days=3))
+        assert engine.sync_series_store() == 1
+        assert hades.prices[0] == pytest.approx(24.99)
+        assert len(engine.get_price_series("Celeste", days_back=100000)) == 2
+
+        reopened = PriceSeriesStore(engine.data_dir / "series")
+        assert reopened.titles() == engine.series_store.titles()
+        assert reopened.series("Celeste").prices.tolist() == pytest.approx(
+            [19.99, 9.99]
+        )
+
+    @pytest.mark.unit
+    def test_compaction_drops_superseded_segments(self, engine, monkeypatch):
+        monkeypatch.setattr("utils.price_series_store.COMPACT_MIN_POINTS", 0)
+        start = datetime(2024, 1, 1)
+        for i in range(6):
+            engine.record_price_data("Hades", 30.0 - i, start + timedelta(days=i))
+            engine.sync_series_store()
+
+        statistics = engine.series_store.get_statistics()
+        assert statistics["points"] == 6
+        assert statistics["superseded_points"] < statistics["points"]
+        assert engine.series_store.series("Hades").prices[-1] == pytest.approx(25.0)
+
+    @pytest.mark.unit
+    def test_trend_statistics_accept_series_arrays(self, engine):
+        rng = np.random.default_rng(41)
+        history = [
+            PriceDataPoint(datetime(p.date.year, p.date.month, p.date.day), p.price)
+            for p in _random_history(rng, 90, start=datetime(2024, 1, 1))
+        ]
+        engine.record_price_data_bulk(("Hades", p.price, p.date, None) for p in history)
+        series = engine.get_price_series("Hades", days_back=100000)
+
+        from_arrays = engine.compute_trend_statistics({"Hades": series})["Hades"]
+        from_points = engine.compute_trend_statistics({"Hades": history})["Hades"]
+
+        assert from_arrays.slope == pytest.approx(from_points.slope, rel=1e-5)
+        assert from_arrays.q1 == pytest.approx(from_points.q1, rel=1e-5)
+        assert from_arrays.window_drop_rate == pytest.approx(
+            from_points.window_drop_rate
+        )
+        assert from_arrays.last_drop_date == from_points.last_drop_date
+        assert engine.analyze_price_trend(series)["trend"] == (
+            engine.analyze_price_trend(history)["trend"]
+        )
+
+
+def _rollup_tables(engine):
+    with engine._pool.read() as conn:
+        return {
+            table: sorted(conn.execute(f"SELECT * FROM {table}").fetchall())
+            for table in (
+                "game_price_summary",
+                "price_rollups",
+                "group_price_rollups",
+                "price_drops",
+                "price_rollups_backfill",
+            )
+        }
+
+
+def _assert_rollups_match_rebuild(engine):
+    incremental = _rollup_tables(engine)
+    engine.rollups.rebuild()
+    rebuilt = _rollup_tables(engine)
+    for table, rows in incremental.items():
+        assert len(rows) == len(rebuilt[table]), table
+        for row, expected in zip(rows, rebuilt[table]):
+            assert row == pytest.approx(expected), table
+
+
+class TestPriceRollups:
+    """Trigger-maintained price aggregates and analytics queries"""
+
+    @pytest.mark.unit
+    def test_incremental_rollups_match_rebuild(self, engine):
+        rng = np.random.default_rng(38)
+        start = datetime.now() - timedelta(days=120)
+        engine.register_game_groups("Hades", ["Action", "Roguelike"], "Supergiant")
+        engine.register_game_groups("Pyre", ["RPG"], "Supergiant")
+        histories = {
+            title: _random_history(rng, 60, start=start)
+            for title in ("Hades", "Pyre", "Celeste")
+        }
+        for title, history in histories.items():
+            engine.record_price_data_bulk(
+                (title, p.price, p.date, "sale") for p in history[:40]
+            )
+            for point in history[40:]:
+                engine.record_price_data(title, point.price, point.date)
+
+        _assert_rollups_match_rebuild(engine)
+
+        prices = np.array([p.price for p in histories["Hades"]])
+        summary = engine.rollups.game_summary("Hades")
+        assert summary["data_points"] == 60
+        assert summary["all_time_low"] == pytest.approx(prices.min())
+        assert summary["current_price"] == pytest.approx(prices[-1])
+        assert summary["average_price"] == pytest.approx(prices.mean())
+
+        drops = engine.rollups.price_drops("Hades", days_back=365)
+        expected = significant_drop_indices(prices, 0.15)
+        assert [d["to_price"] for d in drops] == pytest.approx(
+            prices[expected].tolist()
+        )
+        assert (
+            sum(w["data_points"] for w in engine.rollups.game_rollups("Hades", "week"))
+            == 60
+        )
+
+    @pytest.mark.unit
+    def test_out_of_order_inserts_match_rebuild(self, engine):
+        engine.register_game_groups("G", ["Action"], "Supergiant")
+        engine.record_price_data("G", 20.0, datetime(2026, 10, 1))
+        engine.record_price_data_bulk(
+            ("G", price, datetime(2026, 9, day), None)
+            for price, day in ((40.0, 1), (20.0, 15), (40.0, 20))
+        )
+
+        drops = engine.rollups.price_drops("G", days_back=100000)
+        assert [(d["date"][:10], d["from_price"], d["to_price"]) for d in drops] == [
+            ("2026-09-15", 40.0, 20.0),
+            ("2026-10-01", 40.0, 20.0),
+        ]
+        buckets = {
+            period: {
+                r["bucket"]: r["max_discount_percentage"]
+                for r in engine.rollups.game_rollups("G", period, days_back=100000)
+            }
+            for period in ("day", "week")
+        }
+        assert buckets["day"]["2026-10-01"] == 50.0
+        assert buckets["week"]["2026-09-28"] == 50.0
+        _assert_rollups_match_rebuild(engine)
+
+        # Shuffled histories across games sharing groups
+        rng = np.random.default_rng(39)
+        engine.register_game_groups("Hades", ["Action", "Roguelike"], "Supergiant")
+        engine.register_game_groups("Pyre", ["RPG"], "Supergiant")
+        start = datetime.now() - timedelta(days=200)
+        points = [
+            (title, p.price, p.date, None)
+            for title in ("Hades", "Pyre", "Celeste")
+            for p in _random_history(rng, 50, start=start)
+        ]
+        for index in rng.permutation(len(points)):
+            engine.record_price_data(*points[index])
+        _assert_rollups_match_rebuild(engine)
+
+        # A reversed bulk write is recomputed once, in its transaction
+        engine.record_price_data_bulk(
+            ("Pyre", p.price, p.date, None)
+            for p in reversed(_random_history(rng, 50, start=start))
+        )
+        _assert_rollups_match_rebuild(engine)
+
+    @pytest.mark.unit
+    def test_discount_depth_and_all_time_low_queries(self, engine):
+        now = datetime.now()
+        engine.register_game_groups("Hades", ["Action"], "Supergiant")
+        engine.register_game_groups("Celeste", ["Platformer"], "Nieznany")
+        engine.record_price_data_bulk(
+            [
+                ("Hades", 20.0, now - timedelta(days=10), None),
+                ("Hades", 10.0, now - timedelta(days=5), "sale"),
+                ("Celeste", 20.0, now - timedelta(days=10), None),
+                ("Celeste", 15.0, now - timedelta(days=5), "sale"),
+                ("Celeste", 20.0, now - timedelta(days=1), None),
+            ]
+        )
+
+        depth = engine.rollups.discount_depth_by_group("genre", days_back=90)
+        assert [g["group"] for g in depth] == ["Action", "Platformer"]
+        assert depth[0]["average_discount_percentage"] == pytest.approx(25.0)
+        assert depth[0]["max_discount_percentage"] == pytest.approx(50.0)
+        assert depth[1]["games"] == 1 and depth[1]["data_points"] == 3
+
+        publishers = engine.rollups.discount_depth_by_group("publisher")
+        assert [g["group"] for g in publishers] == ["Supergiant"]
+
+        at_low = engine.rollups.games_at_all_time_low()
+        assert [g["game_title"] for g in at_low] == ["Hades"]
+        assert at_low[0]["discount_percentage"] == pytest.approx(50.0)
+        assert (
+            engine.rollups.games_at_all_time_low(
+                tolerance=0.2, group_type="genre", group_name="Platformer"
+            )
+            == []
+        )
+
+        # Moving a game between groups recomputes both groups
+        engine.register_game_groups("Hades", ["Platformer"], "Supergiant")
+        depth = engine.rollups.discount_depth_by_group("genre")
+        assert [g["group"] for g in depth] == ["Platformer"]
+        assert depth[0]["data_points"] == 5 and depth[0]["games"] == 2
+
+    @pytest.mark.unit
+    def test_existing_history_is_rolled_up_on_open(self, tmp_path):
+        data_dir = tmp_path / "price_data"
+        data_dir.mkdir()
+        pool = SQLiteConnectionPool(data_dir / "price_history.db")
+        with pool.write() as conn:
+            conn.execute(
+                """
+                CREATE TABLE price_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    game_title TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    price REAL NOT NULL,
+                    source TEXT DEFAULT 'dekudeals',
+                    promotion_type TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(game_title, date, price)
+                )
+                """
+            )
+            conn.executemany(
+                "INSERT INTO price_history (game_title, date, price) VALUES (?, ?, ?)",
+                [
+                    ("Hades", "2024-01-01T00:00:00", 25.0),
+                    ("Hades", "2024-01-02T00:00:00", 20.0),
+                ],
+            )
+        pool.close()
+
+        engine = PricePredictionEngine(data_dir=str(data_dir))
+        try:
+            summary = engine.rollups.game_summary("Hades")
+            assert summary["data_points"] == 2
+            assert summary["all_time_high"] == 25.0
+            assert summary["at_all_time_low"]
+            assert engine.rollups.price_drops("Hades", days_back=100000)[0][
+                "drop_percentage"
+            ] == pytest.approx(20.0)
+        finally:
+            engine.close()
+
+
+class _FixedEngine(PricePredictionEngine):
+    """Engine predicting no change, a certain drop and a 20% lower target"""
+
+    def _build_prediction(self, game_title, current_price, price_history, **kwargs):
+        prediction = self._generate_limited_prediction(game_title, current_price)
+        prediction.predicted_price = current_price
+        prediction.price_drop_probability = 1.0
+        prediction.target_price = current_price * 0.8
+        return prediction
+
+
+class TestPriceBacktest:
+    """Moving-cutoff replay of stored histories"""
+
+    @pytest.mark.unit
+    def test_scores_against_future_prices(self, engine):
+        start = datetime(2024, 1, 1)
+        prices = [20.0] * 6 + [10.0] * 4  # Points every 10 days, drop on day 60
+        engine.record_price_data_bulk(
+            ("Hades", price, start + timedelta(days=10 * i), None)
+            for i, price in enumerate(prices)
+        )
+
+        report = PriceBacktester(
+            engine, engine_factory=_FixedEngine, horizon_days=30, step_days=10
+        ).run(["Hades", "Unknown"])
+
+        samples = report.samples
+        # Cutoffs from the 5th point (day 40) to day 60 (last point minus horizon)
+        assert [(s.cutoff - start).days for s in samples] == [40, 50, 60]
+        assert [s.actual_price for s in samples] == [10.0, 10.0, 10.0]
+        assert [s.dropped for s in samples] == [True, True, False]
+        assert [s.target_hit for s in samples] == [True, True, False]
+
+        summary = report.summary()
+        assert report.skipped_games == ["Unknown"]
+        assert summary["price_mae"] == pytest.approx(20 / 3)
+        assert summary["naive_price_mae"] == pytest.approx(20 / 3)
+        assert summary["brier_score"] == pytest.approx(1 / 3)
+        assert summary["target_hit_rate"] == pytest.approx(2 / 3)
+        assert summary["predictions_per_second"] > 0
+
+    @pytest.mark.unit
+    def test_replay_leaves_source_engine_untouched(self, engine):
+        rng = np.random.default_rng(39)
+        for title in ("Hades", "Celeste"):
+            engine.record_price_data_bulk(
+                (title, p.price, p.date, None)
+                for p in _random_history(rng, 80, start=datetime(2023, 1, 1))
+            )
+
+        baseline = PriceBacktester(engine, step_days=20).run()
+        candidate = PriceBacktester(
+            engine, engine_factory=_FixedEngine, step_days=20
+        ).run()
+
+        summary = baseline.summary()
+        assert summary["games"] == 2 and summary["predictions"] > 10
+        assert 0.0 <= summary["brier_score"] <= 1.0
+        assert {s.cutoff for s in baseline.samples} == {
+            s.cutoff for s in candidate.samples
+        }
+        assert "price_mae" in candidate.compare(baseline)
+        assert engine.model_registry.get_statistics()["games"] == 0
+
+    @pytest.mark.unit
+    def test_predict_as_of_uses_only_points_up_to_date(self, engine, tmp_path):
+        history = _random_history(np.random.default_rng(47), 120)
+        engine.record_price_data_bulk(("Hades", p.price, p.date, None) for p in history)
+        as_of = history[80].date
+
+        prediction = engine.predict_as_of("Hades", [], as_of)
+        assert engine.model_registry.watermark("Hades") == as_of
+        assert prediction.current_price == history[80].price
+
+        # Same as an engine that only ever saw the past
+        past_only = PricePredictionEngine(data_dir=str(tmp_path / "past_only"))
+        expected = past_only.predict_as_of("Hades", history, as_of)
+        assert len(past_only.get_price_history("Hades", days_back=None)) == 81
+        past_only.close()
+        assert prediction.predicted_price == expected.predicted_price
+        assert prediction.price_drop_probability == expected.price_drop_probability
+        assert prediction.target_price == expected.target_price
+
+
+class TestPriceWatchEngine:
+    """Bulk wishlist price watches"""
+
+    @pytest.fixture
+    def watches(self, engine, tmp_path):
+        from utils.alerting_system import AlertingSystem
+        from utils.game_collection_manager import GameEntry, GameStatus
+
+        prices = {"Hades": 14.0, "Celeste": 9.0}
+        collections = SimpleNamespace(
+            user_collections={
+                "alice": {
+                    "hades": GameEntry(
+                        "Hades", GameStatus.WISHLIST, current_price=20.0
+                    ),
+                    "celeste": GameEntry("Celeste", GameStatus.OWNED),
+                },
+                "bob": {
+                    "hades": GameEntry(
+                        "Hades", GameStatus.WISHLIST, current_price=20.0
+                    ),
+                },
+            }
+        )
+        fetched = []
+
+        def fetch(title, url):
+            fetched.append(title)
+            return prices.get(title), url or f"https://example.test/{title}"
+
+        watches = PriceWatchEngine(
+            price_engine=engine,
+            collection_manager=collections,
+            alerting=AlertingSystem(data_dir=str(tmp_path / "alerting")),
+            fetch_price=fetch,
+        )
+        yield SimpleNamespace(
+            engine=watches, prices=prices, collections=collections, fetched=fetched
+        )
+        watches.close()
+
+    @pytest.mark.unit
+    def test_wishlist_sync_creates_and_removes_watches(self, watches):
+        collections, watches = watches.collections, watches.engine
+        assert watches.sync_wishlists() == {"added": 2, "removed": 0}
+        assert {(w.user_id, w.target_price) for w in watches.get_watches()} == {
+            ("alice", 15.0),
+            ("bob", 15.0),
+        }
+
+        del collections.user_collections["bob"]["hades"]
+        assert watches.sync_wishlists() == {"added": 0, "removed": 1}
+        assert [w.user_id for w in watches.get_watches()] == ["alice"]
+
+    @pytest.mark.unit
+    def test_scan_emits_events_once_per_target_hit(self, watches):
+        from utils.alerting_system import AlertCategory
+
+        prices, fetched, watches = watches.prices, watches.fetched, watches.engine
+        summary = watches.run_once()
+        assert fetched == ["Hades"]
+        assert {e["user_id"] for e in summary["events"]} == {"alice", "bob"}
+        assert summary["events"][0]["current_price"] == 14.0
+        alerts = list(watches.alerting.alerts.values())
+        assert len(alerts) == 2 and alerts[0].category == AlertCategory.PRICE
+        assert watches.get_watches("alice")[0].game_url == "https://example.test/Hades"
+
+        # Same price again: no duplicate events
+        assert watches.run_once()["events"] == []
+
+        # A further drop alerts again; climbing above target re-arms
+        prices["Hades"] = 12.0
+        assert len(watches.run_once()["events"]) == 2
+        prices["Hades"] = 25.0
+        assert watches.run_once()["events"] == []
+        prices["Hades"] = 13.0
+        assert len(watches.run_once()["events"]) == 2
+
+    @pytest.mark.unit
+    def test_predictions_never_override_manual_targets(self, watches):
+        watches = watches.engine
+        watches.sync_wishlists()
+        watches.set_target("bob", "Hades", 10.0)
+
+        prediction = SimpleNamespace(game_title="Hades", target_price=12.5)
+        assert watches.record_prediction("alice", prediction)
+        assert not watches.record_prediction("bob", prediction)
+        targets = {w.user_id: w.target_price for w in watches.get_watches()}
+        assert targets == {"alice": 12.5, "bob": 10.0}
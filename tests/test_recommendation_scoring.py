@@ -0,0 +1,680 @@
+"""
+🎯 Recommendation Scoring Tests
+Test vectorized collection scoring and incremental preference vectors
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from utils.candidate_index import CandidateIndex
+from utils.collection_batch_scorer import (
+    EXTENDED_GENRE_KEYWORDS,
+    INDIE_TITLE_KEYWORDS,
+    MATCH_DEVELOPER_PATTERNS,
+    POPULARITY_SCORES,
+    SIMILARITY_DEVELOPER_PATTERNS,
+    SIMILARITY_GENRE_KEYWORDS,
+    BatchCollectionScorer,
+    rank_top_indices,
+)
+from utils.collection_recommendation_engine import (
+    CollectionPreferences,
+    CollectionRecommendationEngine,
+    RecommendationType,
+)
+from utils.game_collection_manager import GameCollectionManager, GameEntry, GameStatus
+from utils.preference_vectors import PreferenceVector, PreferenceVectorStore
+from utils.recommendation_engine import RecommendationEngine
+
+CATEGORIES = [
+    "hottest",
+    "most-wanted",
+    "highest-rated",
+    "recently-released",
+    "upcoming-releases",
+    "staff-picks",
+    "trending",
+    "indie",
+    "",
+]
+TITLE_WORDS = [
+    "Super",
+    "Mario",
+    "Hollow Knight",
+    "Hades",
+    "Pixel",
+    "Quest",
+    "Racing",
+    "Puzzle",
+    "Legend",
+    "Farm",
+    "Tennis",
+    "Brawl",
+    "Odyssey",
+    "Roguelike",
+]
+GENRES = ["Action", "Adventure", "RPG", "Puzzle", "Metroidvania", "Strategy"]
+
+
+@pytest.fixture(scope="module")
+def scalar_engine():
+    """Engine without subsystem initialization, for per-game helpers only"""
+    return CollectionRecommendationEngine.__new__(CollectionRecommendationEngine)
+
+
+# Per-game reference scoring (one game at a time, same keyword tables); the
+# batch scorer must rank every candidate exactly like this
+
+
+def _title_genres(game, keywords):
+    title = game.get("title", "").lower()
+    genres = BatchCollectionScorer._explicit_genres(game.get("genres"))
+    genres.update(
+        genre for genre, words in keywords.items() if any(w in title for w in words)
+    )
+    return genres
+
+
+def _rating_compatibility(game, preferences):
+    if preferences.average_rating == 0:
+        return 0.7
+    estimated = BatchCollectionScorer._estimate_rating(
+        game.get("title", "").lower(), game.get("source_category", "")
+    )
+    return max(0.0, 1.0 - abs(estimated - preferences.average_rating) / 5.0)
+
+
+def _popularity(game):
+    return POPULARITY_SCORES.get(game.get("source_category", ""), 0.5)
+
+
+def _diversity_bonus(game, preferences):
+    genres = _title_genres(game, EXTENDED_GENRE_KEYWORDS)
+    if not genres:
+        return 0.5
+    favorites = {g[0].lower() for g in preferences.favorite_genres}
+    return 1.0 - len(genres & favorites) / len(genres)
+
+
+def _reference_similarity(game, preferences):
+    if not preferences.favorite_genres:
+        genre_score = 0.5
+    else:
+        genres = _title_genres(game, SIMILARITY_GENRE_KEYWORDS)
+        total = sum(score for _, score in preferences.favorite_genres)
+        genre_score = 0.3
+        if genres:
+            genre_score = min(
+                1.0,
+                sum(
+                    score / total if total > 0 else 0
+                    for genre, score in preferences.favorite_genres
+                    if genre.lower() in genres
+                ),
+            )
+
+    title = game.get("title", "").lower()
+    developers = {
+        dev
+        for dev, patterns in SIMILARITY_DEVELOPER_PATTERNS.items()
+        if any(pattern in title for pattern in patterns)
+    }
+    if "indie" in game.get("source_category", ""):
+        developers.add("indie")
+    developer_score = 0.5
+    if preferences.favorite_developers and developers:
+        developer_score = next(
+            (
+                min(1.0, score)
+                for dev, score in preferences.favorite_developers
+                if dev.lower() in developers
+            ),
+            0.3,
+        )
+
+    category = game.get("source_category", "")
+    score = (
+        genre_score * 0.4
+        + developer_score * 0.2
+        + _rating_compatibility(game, preferences) * 0.2
+        + _popularity(game) * 0.1
+        + BatchCollectionScorer._category_score(category) * 0.1
+    )
+    return min(1.0, max(0.0, score))
+
+
+def _reference_discovery(game, preferences, underrepresented, favorites):
+    genres = _title_genres(game, EXTENDED_GENRE_KEYWORDS)
+    innovation = BatchCollectionScorer._innovation_score(
+        game.get("title", "").lower(), game.get("source_category", "")
+    )
+    score = (
+        min(0.3 * len(genres & underrepresented), 0.4) * 0.4
+        - min(0.2 * len(genres & favorites), 0.3) * 0.2
+        + innovation * 0.3
+        + _rating_compatibility(game, preferences) * 0.2
+        + _diversity_bonus(game, preferences) * 0.1
+    )
+    return min(1.0, max(0.0, score))
+
+
+def _reference_developer(game, preferences, favorite_devs):
+    title = game.get("title", "").lower()
+    developers = {
+        dev
+        for dev, patterns in MATCH_DEVELOPER_PATTERNS.items()
+        if any(pattern in title for pattern in patterns)
+    }
+    if "staff-picks" in game.get("source_category", ""):
+        developers.update({"curated developers", "staff favorites"})
+    if any(keyword in title for keyword in INDIE_TITLE_KEYWORDS):
+        developers.update({"indie", "independent games"})
+
+    match = max(
+        (
+            score
+            for favorite, score in favorite_devs.items()
+            for dev in developers
+            if favorite.lower() in dev or dev in favorite.lower()
+        ),
+        default=0.0,
+    )
+    score = (
+        match * 0.7
+        + _rating_compatibility(game, preferences) * 0.2
+        + _popularity(game) * 0.1
+    )
+    return min(1.0, max(0.0, score))
+
+
+def _reference_complementary(game, preferences, gaps, represented):
+    missing = set(gaps.get("missing_genres", []))
+    gap_score = sum(
+        0.4 if genre in missing else 0.2
+        for genre in _title_genres(game, EXTENDED_GENRE_KEYWORDS)
+        if genre in missing or genre not in represented
+    )
+    score = (
+        min(gap_score, 0.5) * 0.5
+        + _rating_compatibility(game, preferences) * 0.25
+        + _diversity_bonus(game, preferences) * 0.15
+        + _popularity(game) * 0.1
+    )
+    return min(1.0, max(0.0, score))
+
+
+@pytest.fixture(scope="module")
+def candidate_games():
+    """Deterministic pool of synthetic candidate games"""
+    rng = random.Random(42)
+    games = []
+    for i in range(300):
+        game = {
+            "title": " ".join(rng.sample(TITLE_WORDS, rng.randint(1, 3))) + f" {i}",
+            "source_category": rng.choice(CATEGORIES),
+        }
+        if rng.random() < 0.5:
+            game["genres"] = rng.sample(GENRES, rng.randint(1, 3))
+        games.append(game)
+    return games
+
+
+@pytest.fixture(scope="module")
+def preferences():
+    """Collection preferences with genre and developer favorites"""
+    return CollectionPreferences(
+        favorite_genres=[("Action", 0.8), ("Puzzle", 0.6), ("Metroidvania", 0.5)],
+        underrepresented_genres=["RPG", "Strategy"],
+        favorite_developers=[("Nintendo", 0.9), ("Indie", 0.6), ("Team Cherry", 0.5)],
+        average_rating=8.2,
+        diversity_score=0.4,
+        collection_size=12,
+    )
+
+
+class TestBatchCollectionScorer:
+    """Batch scores must match the per-game reference scoring"""
+
+    @pytest.mark.unit
+    def test_similarity_matches_scalar(self, candidate_games, preferences):
+        scorer = BatchCollectionScorer()
+        encoded = scorer.encode_candidates(candidate_games)
+        batch = scorer.similarity_scores(encoded, preferences)
+        scalar = [_reference_similarity(game, preferences) for game in candidate_games]
+        assert batch == pytest.approx(scalar)
+
+    @pytest.mark.unit
+    def test_discovery_matches_scalar(self, candidate_games, preferences):
+        scorer = BatchCollectionScorer()
+        encoded = scorer.encode_candidates(candidate_games)
+        batch = scorer.discovery_scores(encoded, preferences)
+        underrepresented = {g.lower() for g in preferences.underrepresented_genres}
+        favorites = {g[0].lower() for g in preferences.favorite_genres[:3]}
+        scalar = [
+            _reference_discovery(game, preferences, underrepresented, favorites)
+            for game in candidate_games
+        ]
+        assert batch == pytest.approx(scalar)
+
+    @pytest.mark.unit
+    def test_developer_matches_scalar(self, candidate_games, preferences):
+        scorer = BatchCollectionScorer()
+        encoded = scorer.encode_candidates(candidate_games)
+        batch = scorer.developer_scores(encoded, preferences)
+        favorite_devs = dict(preferences.favorite_developers[:3])
+        scalar = [
+            _reference_developer(game, preferences, favorite_devs)
+            for game in candidate_games
+        ]
+        assert batch == pytest.approx(scalar)
+
+    @pytest.mark.unit
+    def test_complementary_matches_scalar(
+        self, scalar_engine, candidate_games, preferences
+    ):
+        scorer = BatchCollectionScorer()
+        encoded = scorer.encode_candidates(candidate_games)
+        gaps = scalar_engine._identify_collection_gaps(preferences)
+        represented = {g[0].lower() for g in preferences.favorite_genres}
+        batch = scorer.complementary_scores(encoded, preferences, gaps, represented)
+        scalar = [
+            _reference_complementary(game, preferences, gaps, represented)
+            for game in candidate_games
+        ]
+        assert batch == pytest.approx(scalar)
+
+    @pytest.mark.unit
+    def test_empty_preferences_use_neutral_scores(self, candidate_games):
+        scorer = BatchCollectionScorer()
+        encoded = scorer.encode_candidates(candidate_games)
+        empty = CollectionPreferences()
+        assert np.all(scorer.genre_similarity(encoded, empty) == 0.5)
+        assert np.all(scorer.developer_similarity(encoded, empty) == 0.5)
+        assert np.all(scorer.rating_compatibility(encoded, empty) == 0.7)
+
+    @pytest.mark.unit
+    def test_rank_top_indices_is_stable(self):
+        scores = np.array([0.5, 0.9, 0.5, 0.1, 0.9])
+        mask = scores > 0.2
+        assert list(rank_top_indices(scores, mask)) == [1, 4, 0, 2]
+
+
+def _normalized(fields):
+    """Round floats and sort lists so field sets compare order-independently"""
+
+    def normalize(value):
+        if isinstance(value, float):
+            return round(value, 9)
+        if isinstance(value, dict):
+            return {k: normalize(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            items = [normalize(v) for v in value]
+            return sorted(items, key=repr) if isinstance(value, list) else tuple(items)
+        return value
+
+    return normalize(fields)
+
+
+def _collection_entries():
+    """Sample collection entries covering tags, notes, ratings and prices"""
+    old = datetime.now() - timedelta(days=200)
+    return {
+        "hollow_knight": GameEntry(
+            "Hollow Knight", GameStatus.OWNED, user_rating=9.5, tags=["Metroidvania"]
+        ),
+        "celeste": GameEntry(
+            "Celeste",
+            GameStatus.COMPLETED,
+            user_rating=9.0,
+            purchase_price=20.0,
+            tags=["Platformer", "Indie"],
+        ),
+        "hades": GameEntry(
+            "Hades", GameStatus.OWNED, notes="roguelike action", current_price=80.0
+        ),
+        "limbo": GameEntry(
+            "Limbo", GameStatus.OWNED, user_rating=4.0, tags=["Puzzle"], date_added=old
+        ),
+        "zelda": GameEntry("Zelda", GameStatus.WISHLIST, user_rating=10.0),
+    }
+
+
+class TestPreferenceVectors:
+    """Incremental preference vectors must match a full rebuild"""
+
+    @pytest.mark.unit
+    def test_incremental_updates_match_rebuild(self):
+        entries = _collection_entries()
+        vector = PreferenceVector(user_id="test")
+        for game_id, entry in entries.items():
+            vector.upsert_game(game_id, entry)
+
+        # Update a rating, complete a game, drop one from the collection
+        entries["hades"].user_rating = 8.5
+        vector.upsert_game("hades", entries["hades"])
+        entries["hollow_knight"].status = GameStatus.COMPLETED
+        vector.upsert_game("hollow_knight", entries["hollow_knight"])
+        del entries["limbo"]
+        vector.remove_game("limbo")
+
+        rebuilt = PreferenceVector.from_collection("test", entries)
+        assert _normalized(vector.to_preference_fields()) == _normalized(
+            rebuilt.to_preference_fields()
+        )
+
+    @pytest.mark.unit
+    def test_preference_fields(self):
+        vector = PreferenceVector.from_collection("test", _collection_entries())
+        fields = vector.to_preference_fields()
+
+        assert fields["collection_size"] == 4  # wishlist games are not analyzed
+        assert fields["average_rating"] == pytest.approx((9.5 + 9.0 + 4.0) / 3)
+        assert fields["high_rated_games"] == ["Hollow Knight", "Celeste"]
+        assert fields["preferred_price_range"] == (20.0, 80.0)
+        assert fields["completion_rate"] == pytest.approx(0.25)
+        assert "Puzzle" in fields["avoided_genres"]
+        assert "Puzzle" not in fields["recent_preferences"]
+        assert fields["favorite_genres"][0][0] == "Metroidvania"
+
+    @pytest.mark.game_collection
+    def test_manager_keeps_vector_in_sync(self, tmp_path):
+        manager = GameCollectionManager(collections_dir=str(tmp_path))
+        manager.add_game("Hollow Knight", GameStatus.OWNED, user_rating=9.5)
+        manager.add_game("Celeste", GameStatus.OWNED, tags=["Platformer"])
+        manager.update_game("Celeste", user_rating=8.0)
+        manager.remove_game("Hollow Knight")
+
+        user_id = manager._get_current_user_id()
+        vector = manager.get_preference_vector(user_id)
+        rebuilt = PreferenceVector.from_collection(
+            user_id, manager.user_collections[user_id]
+        )
+        assert _normalized(vector.to_preference_fields()) == _normalized(
+            rebuilt.to_preference_fields()
+        )
+
+        # A fresh manager reads the persisted vector instead of rebuilding it
+        reloaded = GameCollectionManager(collections_dir=str(tmp_path))
+        assert reloaded.get_preference_vector(user_id).version == vector.version
+
+    @pytest.mark.game_collection
+    def test_rebuild_invalidates_cached_preferences(self, tmp_path):
+        store = PreferenceVectorStore(str(tmp_path))
+        entries = _collection_entries()
+        first = store.rebuild("test", {"limbo": entries["limbo"]})
+        engine = CollectionRecommendationEngine.__new__(CollectionRecommendationEngine)
+        engine.collection_manager = SimpleNamespace(
+            get_preference_vector=lambda user_id: store.get(user_id)
+        )
+        engine.preferences_cache, engine.preferences_versions = {}, {}
+        assert engine.analyze_collection_preferences("test").collection_size == 1
+
+        # An import replaces the vector: its version moves past the cached one
+        rebuilt = store.rebuild("test", entries)
+        assert rebuilt.version > first.version
+        assert engine.analyze_collection_preferences("test").collection_size == 4
+
+
+class TestCandidateRetrieval:
+    """Top-K retrieval over a large catalog"""
+
+    @pytest.mark.unit
+    def test_partial_top_k_matches_full_sort(self):
+        rng = np.random.default_rng(7)
+        scores = rng.integers(0, 20, size=500).astype(float)
+        mask = rng.random(500) > 0.3
+        full = rank_top_indices(scores, mask)
+        for k in (1, 10, 57, 1000):
+            assert list(rank_top_indices(scores, mask, k=k)) == list(full[:k])
+
+    @pytest.mark.unit
+    def test_nearest_games_follow_preferences(self, preferences):
+        catalog = [
+            {"title": "Puzzle Quest Legends", "genres": ["Puzzle"]},
+            {"title": "Metroid Action Chronicles", "genres": ["Action"]},
+            {"title": "Soccer Manager", "genres": ["Sports"]},
+            {"title": "Farm Life", "genres": ["Simulation"]},
+        ]
+        index = CandidateIndex(catalog)
+        nearest = index.nearest_games(preferences, k=2)
+        assert {g["title"] for g in nearest} == {
+            "Puzzle Quest Legends",
+            "Metroid Action Chronicles",
+        }
+
+        owned = {"metroid action chronicles"}
+        nearest = index.nearest_games(preferences, k=1, exclude_titles=owned)
+        assert nearest[0]["title"] == "Puzzle Quest Legends"
+
+    @pytest.mark.performance
+    def test_catalog_query_latency(self, candidate_games, preferences):
+        catalog = [
+            dict(game, title=f"{game['title']} #{copy}")
+            for copy in range(70)
+            for game in candidate_games
+        ]
+        index = CandidateIndex(catalog)
+        query = index.encode_preferences(preferences)
+
+        start = time.perf_counter()
+        top = index.top_k(query, 100)
+        duration = time.perf_counter() - start
+
+        assert len(top) == 100
+        assert (
+            duration < 0.1
+        ), f"Top-K query over {len(catalog)} games took {duration:.3f}s"
+
+    @pytest.mark.unit
+    def test_index_reused_until_candidates_change(self, candidate_games, preferences):
+        engine = CollectionRecommendationEngine.__new__(CollectionRecommendationEngine)
+        engine.batch_scorer = BatchCollectionScorer()
+        engine.retrieval_pool_size = 50
+        engine.candidate_indexes = OrderedDict()
+        engine.candidate_index_cache_size = 4
+        engine._candidate_indexes_lock = threading.Lock()
+        catalog = [dict(game) for game in candidate_games]
+
+        with patch(
+            "utils.collection_recommendation_engine.CandidateIndex",
+            wraps=CandidateIndex,
+        ) as index_class:
+            first = engine._retrieve_candidates(
+                RecommendationType.SIMILAR, preferences, catalog
+            )
+            again = engine._retrieve_candidates(
+                RecommendationType.DEVELOPER,
+                preferences,
+                [dict(game) for game in catalog],
+            )
+            assert index_class.call_count == 1
+            assert again == first
+
+            catalog[0]["current_price"] = "19.99 zł"
+            engine._retrieve_candidates(
+                RecommendationType.SIMILAR, preferences, catalog
+            )
+            assert index_class.call_count == 2
+
+    @pytest.mark.unit
+    def test_failed_recommendations_are_backfilled(self, preferences):
+        engine = CollectionRecommendationEngine.__new__(CollectionRecommendationEngine)
+        games = [{"title": f"Game {i}", "broken": i < 5} for i in range(10)]
+        scores = np.arange(10, 0, -1, dtype=float)
+        engine._create_recommendation = lambda game, **kwargs: (
+            None if game["broken"] else game["title"]
+        )
+
+        def build(eligible, k):
+            return engine._build_ranked_recommendations(
+                games,
+                scores,
+                eligible,
+                RecommendationType.SIMILAR,
+                preferences,
+                "similar",
+                k,
+            )
+
+        assert build(np.ones(10, dtype=bool), 3) == ["Game 5", "Game 6", "Game 7"]
+        assert build(scores >= 4, 3) == ["Game 5", "Game 6"]
+        assert build(np.ones(10, dtype=bool), 0) == []
+
+
+def _scraped_game(title, price, score, genres):
+    """Minimal successful scrape result"""
+    return {
+        "success": True,
+        "title": title,
+        "current_eshop_price": f"{price:.2f} zł",
+        "MSRP": f"{price * 2:.2f} zł",
+        "lowest_historical_price": f"{price * 0.8:.2f} zł",
+        "metacritic_score": str(score),
+        "opencritic_score": str(score),
+        "genres": genres,
+    }
+
+
+class TestBatchRecommendationPipeline:
+    """Games are fetched concurrently and analyzed once for all profiles"""
+
+    GAMES = {
+        "Hollow Knight": _scraped_game("Hollow Knight", 15.0, 90, ["Metroidvania"]),
+        "Celeste": _scraped_game("Celeste", 20.0, 92, ["Platformer", "Indie"]),
+        "Zelda": _scraped_game("Zelda", 60.0, 97, ["Action", "Adventure"]),
+        "Tetris": _scraped_game("Tetris", 10.0, 70, ["Puzzle"]),
+    }
+
+    @pytest.fixture
+    def tools(self):
+        import agent_tools
+
+        threads = set()
+
+        def fake_scrape(name):
+            threads.add(threading.get_ident())
+            time.sleep(0.05)
+            if name not in self.GAMES:
+                return {"success": False, "error": "Game not found"}
+            return dict(self.GAMES[name])
+
+        with patch.object(
+            agent_tools, "search_and_scrape_game", fake_scrape
+        ), patch.object(agent_tools, "record_user_interaction"), patch.object(
+            agent_tools, "get_smart_user_profiler"
+        ):
+            yield agent_tools, threads
+
+    @pytest.mark.unit
+    def test_multi_profile_matches_per_profile(self, tools):
+        agent_tools, _ = tools
+        names = list(self.GAMES) + ["Unknown Game"]
+
+        batch = agent_tools.generate_recommendations_for_all_profiles(names)
+        assert batch["success"]
+        assert batch["statistics"]["failed_games"] == ["Unknown Game"]
+
+        for preference, profile_result in batch["profiles"].items():
+            single = agent_tools.generate_personalized_recommendations(
+                names, preference
+            )
+            assert profile_result["recommendations"] == single["recommendations"]
+
+    @pytest.mark.unit
+    def test_each_game_analyzed_once(self, tools):
+        agent_tools, _ = tools
+        with patch.object(
+            agent_tools,
+            "calculate_value_score",
+            wraps=agent_tools.calculate_value_score,
+        ) as basic:
+            result = agent_tools.generate_recommendations_for_all_profiles(
+                list(self.GAMES)
+            )
+
+        assert result["statistics"]["profiles_scored"] == 5
+        assert basic.call_count == len(self.GAMES)
+
+    @pytest.mark.performance
+    def test_games_fetched_concurrently(self, tools):
+        agent_tools, threads = tools
+        names = [f"Game {i}" for i in range(10)]
+
+        start = time.perf_counter()
+        games_data, successful, failed = agent_tools._scrape_games_concurrently(names)
+        duration = time.perf_counter() - start
+
+        assert failed == names
+        assert len(threads) > 1
+        assert duration < 0.05 * len(names) / 2
+
+    @pytest.mark.unit
+    def test_recommend_for_profiles_orders_by_score(self):
+        engine = RecommendationEngine()
+        profiles = list(engine.get_predefined_profiles().values())
+        analyzed = engine.analyze_games(list(self.GAMES.values()))
+
+        with patch("agent_tools.record_user_interaction"):
+            results = engine.recommend_for_profiles(analyzed, profiles, 2)
+
+        assert set(results) == {profile.user_id for profile in profiles}
+        for recommendations in results.values():
+            scores = [rec.recommendation_score for rec in recommendations]
+            assert len(scores) == 2
+            assert scores == sorted(scores, reverse=True)
+
+
+class TestGameAnalysisContext:
+    """Scraped data and analyses are reused across profiles and stages"""
+
+    @pytest.fixture
+    def counted_tools(self):
+        import agent_tools
+
+        game = _scraped_game("Celeste", 20.0, 92, ["Platformer", "Indie"])
+        with patch.object(
+            agent_tools, "search_and_scrape_game", return_value=game
+        ) as scrape, patch.object(
+            agent_tools,
+            "calculate_value_score",
+            wraps=agent_tools.calculate_value_score,
+        ) as basic, patch.object(
+            agent_tools,
+            "calculate_advanced_value_analysis",
+            wraps=agent_tools.calculate_advanced_value_analysis,
+        ) as advanced, patch.object(
+            agent_tools, "record_user_interaction"
+        ):
+            yield agent_tools, scrape, basic, advanced
+
+    @pytest.mark.unit
+    def test_insights_analyze_once_for_all_profiles(self, counted_tools):
+        agent_tools, scrape, basic, advanced = counted_tools
+
+        result = agent_tools.get_recommendation_insights("Celeste")
+
+        assert result["success"]
+        assert len(result["user_analyses"]) == 5
+        assert scrape.call_count == 1
+        assert basic.call_count == 1
+        assert advanced.call_count == 1
+
+    @pytest.mark.unit
+    def test_review_reuses_context(self, counted_tools):
+        agent_tools, scrape, basic, advanced = counted_tools
+
+        result = agent_tools.generate_comprehensive_game_review("Celeste")
+
+        assert result["success"]
+        assert result["underlying_analyses"]["recommendation_analysis_success"]
+        assert scrape.call_count == 1
+        assert basic.call_count == 1
+        assert advanced.call_count == 1
@@ -22,6 +22,8 @@ from pathlib import Path
 import threading
 import logging
 
+from utils.tracing import add_span_attributes
+
 logger = logging.getLogger(__name__)
 
 
@@ -163,6 +165,7 @@ class AdvancedCacheSystem:
                     entry.update_access()
                     self.stats.memory_hits += 1
                     self._update_retrieval_time(start_time)
+                    add_span_attributes(cache_tier="memory")
                     logger.debug(
                         f"💾 Memory cache HIT for '{key}' (access #{entry.access_count})"
                     )
@@ -180,6 +183,7 @@ class AdvancedCacheSystem:
                     self._promote_to_memory(cache_key, entry)
 
                     self._update_retrieval_time(start_time)
+                    add_span_attributes(cache_tier="disk")
                     logger.debug(f"💿 Disk cache HIT for '{key}' (promoted to memory)")
                     return entry.data
                 elif entry:
@@ -189,6 +193,7 @@ class AdvancedCacheSystem:
 
             # Cache miss
             self.stats.misses += 1
+            add_span_attributes(cache_tier="miss")
             logger.debug(f"🔍 Cache MISS for '{key}'")
             return None
 
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+
+"""
+Agent Team Pool for AutoGen DekuDeals
+=====================================
+
+Concurrent agent conversations over shared resources.
+
+The module-level agents in ``autogen_agents.py`` keep their chat history and
+tool registrations in one place, so two analyses cannot run at the same time.
+This module provides:
+- ``AnalysisTeamPool``: isolated agent teams (``build_analysis_team``),
+  built on demand up to ``size`` and reset and reused between conversations
+- ``SharedToolExecutor``: one concurrency and rate limit for tool calls of
+  every team (scraping DekuDeals stays polite however many chats run)
+- ``SharedHTTPClient``: one keep-alive connection pool for the LLM clients
+  of every agent
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import functools
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class SharedHTTPClient(httpx.Client):
+    """
+    Klient HTTP współdzielony przez klientów LLM wszystkich agentów.
+
+    AutoGen deep-copies ``llm_config`` for every agent; returning the same
+    instance keeps one connection pool for all of them.
+    """
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "SharedHTTPClient":
+        return self
+
+
+def create_shared_http_client(
+    max_connections: int = 20, max_keepalive_connections: int = 10
+) -> SharedHTTPClient:
+    """Tworzy klienta HTTP z pulą połączeń keep-alive dla API LLM."""
+    return SharedHTTPClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+
+
+class SharedToolExecutor:
+    """
+    Wspólny limit współbieżności i częstotliwości wywołań narzędzi.
+
+    Usage:
+        executor = SharedToolExecutor(max_concurrent=4, rate_limit=2.0)
+        tool = executor.wrap(search_and_scrape_game)
+    """
+
+    def __init__(self, max_concurrent: int = 4, rate_limit: float = 2.0):
+        """
+        Args:
+            max_concurrent: Maksymalna liczba jednocześnie wykonywanych narzędzi
+            rate_limit: Maksymalna liczba rozpoczętych wywołań na sekundę
+                (0 = bez limitu)
+        """
+        self.max_concurrent = max_concurrent
+        self.rate_limit = rate_limit
+
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._rate_lock = threading.Lock()
+        self._next_start = 0.0
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._stats: Dict[str, Any] = {
+            "calls": 0,
+            "errors": 0,
+            "max_in_flight": 0,
+            "rate_wait_seconds": 0.0,
+            "per_tool": {},
+        }
+
+    def _wait_for_rate_limit(self) -> float:
+        """Rezerwuje termin startu wywołania (odstęp 1 / rate_limit)."""
+        if self.rate_limit <= 0:
+            return 0.0
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + 1.0 / self.rate_limit
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+        return max(delay, 0.0)
+
+    def run(self, tool_name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Wykonuje narzędzie w ramach limitów."""
+        with self._slots:
+            waited = self._wait_for_rate_limit()
+            with self._stats_lock:
+                self._in_flight += 1
+                self._stats["max_in_flight"] = max(
+                    self._stats["max_in_flight"], self._in_flight
+                )
+            started = time.perf_counter()
+            failed = False
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                self._record(tool_name, time.perf_counter() - started, waited, failed)
+
+    def _record(self, tool_name: str, seconds: float, waited: float, failed: bool):
+        with self._stats_lock:
+            self._in_flight -= 1
+            tool = self._stats["per_tool"].setdefault(
+                tool_name, {"calls": 0, "errors": 0, "total_seconds": 0.0}
+            )
+            self._stats["calls"] += 1
+            self._stats["rate_wait_seconds"] += waited
+            tool["calls"] += 1
+            tool["total_seconds"] += seconds
+            if failed:
+                self._stats["errors"] += 1
+                tool["errors"] += 1
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Narzędzie agenta wykonywane przez executor."""
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.run(func.__name__, func, *args, **kwargs)
+
+        return wrapper
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statystyki wywołań narzędzi."""
+        with self._stats_lock:
+            per_tool = {
+                name: {**tool, "total_seconds": round(tool["total_seconds"], 3)}
+                for name, tool in self._stats["per_tool"].items()
+            }
+            return {
+                **self._stats,
+                "rate_wait_seconds": round(self._stats["rate_wait_seconds"], 3),
+                "in_flight": self._in_flight,
+                "max_concurrent": self.max_concurrent,
+                "rate_limit": self.rate_limit,
+                "per_tool": per_tool,
+            }
+
+
+class AnalysisTeamPool:
+    """
+    Pula izolowanych zespołów agentów.
+
+    Usage:
+        pool = AnalysisTeamPool(size=4)
+        with pool.team() as team:
+            team.user_proxy.initiate_chat(manager, message=prompt)
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        tool_executor: Optional[SharedToolExecutor] = None,
+        http_client: Optional[httpx.Client] = None,
+        team_factory: Optional[Callable[..., Any]] = None,
+    ):
+        """
+        Args:
+            size: Maksymalna liczba zespołów (= równoległych konwersacji)
+            tool_executor: Wspólny executor narzędzi (domyślnie nowy)
+            http_client: Wspólny klient HTTP LLM (domyślnie nowy)
+            team_factory: Fabryka zespołu (domyślnie ``build_analysis_team``)
+        """
+        if team_factory is None:
+            from autogen_agents import build_analysis_team
+
+            team_factory = build_analysis_team
+
+        self.size = size
+        self.tool_executor = tool_executor or SharedToolExecutor()
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or create_shared_http_client()
+        self.team_factory = team_factory
+
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._stats = {"acquisitions": 0, "waits": 0}
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """Pobiera wolny zespół (buduje nowy, gdy pula nie jest pełna)."""
+        try:
+            team = self._idle.get_nowait()
+        except queue.Empty:
+            team = None
+            with self._lock:
+                build = self._created < self.size
+                if build:
+                    self._created += 1
+            if build:
+                try:
+                    team = self.team_factory(
+                        tool_executor=self.tool_executor, http_client=self.http_client
+                    )
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+                logger.info(f"👥 Built analysis team {self._created}/{self.size}")
+            else:
+                with self._lock:
+                    self._stats["waits"] += 1
+                team = self._idle.get(timeout=timeout)
+
+        with self._lock:
+            self._stats["acquisitions"] += 1
+        return team
+
+    def release(self, team: Any):
+        """Zwraca zespół do puli (historia konwersacji jest czyszczona)."""
+        try:
+            team.reset()
+        except Exception as e:
+            logger.warning(f"⚠️ Discarding analysis team after failed reset: {e}")
+            with self._lock:
+                self._created -= 1
+            return
+        self._idle.put(team)
+
+    @contextmanager
+    def team(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Context manager: zespół na czas jednej konwersacji."""
+        team = self.acquire(timeout)
+        try:
+            yield team
+        finally:
+            self.release(team)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statystyki puli i wspólnego executora narzędzi."""
+        with self._lock:
+            stats = {
+                **self._stats,
+                "size": self.size,
+                "teams_created": self._created,
+                "idle_teams": self._idle.qsize(),
+            }
+        stats["tool_executor"] = self.tool_executor.get_statistics()
+        return stats
+
+    def close(self):
+        """Zamyka wspólnego klienta HTTP utworzonego przez pulę."""
+        if self._owns_http_client:
+            self.http_client.close()
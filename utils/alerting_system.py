@@ -7,6 +7,7 @@ import json
 import time
 import threading
 import smtplib
+import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable, Union
 from dataclasses import dataclass, asdict
@@ -40,6 +41,7 @@ class AlertCategory(Enum):
     QUALITY = "quality"
     SECURITY = "security"
     BUSINESS = "business"
+    PRICE = "price"
 
 
 class AlertStatus(Enum):
@@ -554,6 +556,45 @@ class AlertingSystem:
         self.logger.warning(f"Alert triggered: {alert.title} (ID: {alert_id})")
         return alert_id
 
+    def emit_alert(
+        self,
+        title: str,
+        message: str,
+        category: AlertCategory,
+        severity: AlertSeverity = AlertSeverity.INFO,
+        trigger_value: float = 0.0,
+        threshold_value: float = 0.0,
+        context: Optional[Dict[str, Any]] = None,
+        channels: Optional[List[NotificationChannel]] = None,
+        source: str = "event",
+    ) -> str:
+        """Create an alert for an application event (not rule-based)"""
+        alert_id = f"alert_{int(time.time())}_{source}_{uuid.uuid4().hex[:8]}"
+
+        alert = Alert(
+            alert_id=alert_id,
+            rule_id=source,
+            title=title,
+            message=message,
+            severity=severity,
+            category=category,
+            status=AlertStatus.ACTIVE,
+            created_at=datetime.now(),
+            acknowledged_at=None,
+            resolved_at=None,
+            trigger_value=trigger_value,
+            threshold_value=threshold_value,
+            context=context or {},
+            notifications_sent=[],
+            metadata={},
+        )
+
+        with self._lock:
+            self.alerts[alert_id] = alert
+
+        self._send_notifications(alert, channels or [NotificationChannel.LOG])
+        return alert_id
+
     def _send_notifications(self, alert: Alert, channels: List[NotificationChannel]):
         """Send alert notifications through configured channels"""
         for channel in channels:
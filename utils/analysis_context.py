@@ -0,0 +1,75 @@
+"""
+Game Analysis Context for AutoGen DekuDeals
+Kontekst analizy gry dla AutoGen DekuDeals
+
+Carries scraped game data together with memoized basic and advanced value
+analyses through a single request, so every user profile and pipeline
+stage reuses the same results instead of re-scraping or re-analyzing.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GameAnalysisContext:
+    """Dane gry z leniwie obliczanymi i zapamiętywanymi analizami wartości."""
+
+    game_data: Dict[str, Any]
+    game_name: Optional[str] = None
+    _basic_analysis: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    _advanced_analysis: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+    @classmethod
+    def from_game_name(cls, game_name: str) -> "GameAnalysisContext":
+        """
+        Pobiera dane gry z DekuDeals i tworzy kontekst.
+
+        Args:
+            game_name: Nazwa gry do wyszukania
+
+        Returns:
+            GameAnalysisContext: Kontekst (sprawdź ``success`` przed użyciem)
+        """
+        # Import here to avoid circular imports
+        from agent_tools import search_and_scrape_game
+
+        return cls(game_data=search_and_scrape_game(game_name), game_name=game_name)
+
+    @property
+    def success(self) -> bool:
+        """Czy dane gry zostały pobrane poprawnie."""
+        return bool(self.game_data.get("success", False))
+
+    @property
+    def title(self) -> str:
+        """Tytuł gry (lub nazwa z zapytania, gdy brak tytułu)."""
+        return self.game_data.get("title") or self.game_name or "Unknown"
+
+    @property
+    def basic_analysis(self) -> Dict[str, Any]:
+        """Podstawowa analiza wartości (obliczana raz)."""
+        if self._basic_analysis is None:
+            from agent_tools import calculate_value_score
+
+            self._basic_analysis = calculate_value_score(self.game_data)
+        return self._basic_analysis
+
+    @property
+    def advanced_analysis(self) -> Dict[str, Any]:
+        """Zaawansowana analiza wartości (obliczana raz)."""
+        if self._advanced_analysis is None:
+            from agent_tools import calculate_advanced_value_analysis
+
+            self._advanced_analysis = calculate_advanced_value_analysis(self.game_data)
+        return self._advanced_analysis
+
+    @property
+    def analyses_successful(self) -> bool:
+        """Czy obie analizy wartości zakończyły się sukcesem."""
+        return bool(
+            self.basic_analysis.get("success") and self.advanced_analysis.get("success")
+        )
@@ -0,0 +1,223 @@
+"""
+Deterministic Analysis Pipeline for AutoGen DekuDeals
+Deterministyczny pipeline analizy gry dla AutoGen DekuDeals
+
+Runs the analysis workflow of the agent team (data collection → price/value
+analysis → review → quality assurance) directly on the ``agent_tools``
+functions, without an LLM round-trip per step. The LLM is used at most once,
+to write the final narrative from the precomputed facts.
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.analysis_context import GameAnalysisContext
+
+logger = logging.getLogger(__name__)
+
+SYNTHESIS_SYSTEM_MESSAGE = """You are a game critic writing the final analysis for a Nintendo Switch game.
+All facts were already collected and validated by deterministic tools; use only
+the facts provided, do not invent prices, scores or features.
+
+Write a concise analysis with:
+- a short overview of the game
+- price and value assessment (current price vs MSRP and historical low)
+- strengths and weaknesses, and who the game is for
+- a final BUY/WAIT/SKIP recommendation with its reasoning"""
+
+
+@dataclass
+class PipelineStage:
+    """Wynik czasowy jednego kroku pipeline'u."""
+
+    name: str
+    seconds: float
+    success: bool
+
+
+@dataclass
+class AnalysisFacts:
+    """Wyniki wszystkich kroków analizy jednej gry."""
+
+    game_name: str
+    context: GameAnalysisContext
+    validation: Dict[str, Any] = field(default_factory=dict)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    review: Dict[str, Any] = field(default_factory=dict)
+    quality: Dict[str, Any] = field(default_factory=dict)
+    stages: List[PipelineStage] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """Czy dane gry zostały pobrane (pozostałe kroki mają fallbacki)."""
+        return self.context.success
+
+    @property
+    def quality_passed(self) -> bool:
+        """Czy analiza przeszła bramki jakości."""
+        assessment = self.quality.get("quality_assessment", {})
+        return bool(assessment.get("passes_quality_gates", False))
+
+    def prompt_facts(self) -> Dict[str, Any]:
+        """Zwięzłe fakty dla jednego wywołania LLM (bez surowych danych)."""
+        game_data = self.context.game_data
+        value_metrics = self.context.basic_analysis.get("value_metrics", {})
+        advanced = self.context.advanced_analysis.get("comprehensive_analysis", {})
+        review = self.review.get("review_data", {})
+        quality = self.quality.get("quality_assessment", {})
+
+        return {
+            "title": self.context.title,
+            "developer": game_data.get("developer"),
+            "publisher": game_data.get("publisher"),
+            "genres": game_data.get("genres"),
+            "current_price": game_data.get("current_eshop_price"),
+            "msrp": game_data.get("MSRP"),
+            "lowest_historical_price": game_data.get("lowest_historical_price"),
+            "metacritic_score": game_data.get("metacritic_score"),
+            "opencritic_score": game_data.get("opencritic_score"),
+            "data_completeness": self.validation.get("completeness_score"),
+            "value_score": value_metrics.get("value_score"),
+            "buy_timing": value_metrics.get("buy_timing"),
+            "price_recommendation": value_metrics.get("recommendation"),
+            "comprehensive_score": advanced.get("comprehensive_score"),
+            "advanced_recommendation": advanced.get("advanced_recommendation"),
+            "insights": self.context.advanced_analysis.get("insights", []),
+            "overall_rating": review.get("overall_rating"),
+            "recommendation": review.get("recommendation"),
+            "strengths": review.get("strengths", []),
+            "weaknesses": review.get("weaknesses", []),
+            "target_audience": review.get("target_audience", []),
+            "timing_advice": review.get("timing_advice"),
+            "final_verdict": review.get("final_verdict"),
+            "quality_level": quality.get("quality_level"),
+        }
+
+    def quality_input(self) -> Dict[str, Any]:
+        """Dane w formacie oczekiwanym przez ``perform_quality_validation``."""
+        value_metrics = self.context.basic_analysis.get("value_metrics", {})
+        return {
+            **self.context.game_data,
+            "value_analysis": {"recommendation": value_metrics.get("recommendation")},
+            "review": self.review.get("review_data", {}),
+        }
+
+
+def _timed(
+    facts: AnalysisFacts, name: str, step: Callable[[], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Wykonuje krok i zapisuje jego czas (błędy kroku nie przerywają analizy)."""
+    started = time.perf_counter()
+    try:
+        result = step()
+        success = bool(result.get("success", True))
+    except Exception as e:
+        logger.warning(f"⚠️ Pipeline step '{name}' failed: {e}")
+        result, success = {"success": False, "error": str(e)}, False
+
+    facts.stages.append(PipelineStage(name, time.perf_counter() - started, success))
+    return result
+
+
+def _value_analysis(context: GameAnalysisContext) -> Dict[str, Any]:
+    """Liczy obie analizy wartości w tym kroku (recenzja użyje zapamiętanych)."""
+    basic = context.basic_analysis
+    advanced = context.advanced_analysis
+    return {"success": bool(basic.get("success") and advanced.get("success"))}
+
+
+def run_analysis_pipeline(
+    game_name: str, context: Optional[GameAnalysisContext] = None
+) -> AnalysisFacts:
+    """
+    Przeprowadza pełną analizę gry deterministycznie (bez LLM).
+
+    Args:
+        game_name: Nazwa gry
+        context: Opcjonalny kontekst z już pobranymi danymi gry
+
+    Returns:
+        AnalysisFacts: Wyniki kroków (sprawdź ``success`` przed użyciem)
+    """
+    from agent_tools import (
+        extract_key_metrics,
+        generate_comprehensive_game_review,
+        perform_quality_validation,
+        validate_game_data,
+    )
+
+    started = time.perf_counter()
+    if context is None:
+        context = GameAnalysisContext.from_game_name(game_name)
+    facts = AnalysisFacts(game_name=game_name, context=context)
+    facts.stages.append(
+        PipelineStage("data_collection", time.perf_counter() - started, context.success)
+    )
+    if not context.success:
+        return facts
+
+    facts.validation = _timed(
+        facts, "data_validation", lambda: validate_game_data(context.game_data)
+    )
+    facts.metrics = _timed(
+        facts, "key_metrics", lambda: extract_key_metrics(context.game_data)
+    )
+    _timed(facts, "value_analysis", lambda: _value_analysis(context))
+    facts.review = _timed(
+        facts,
+        "review_generation",
+        lambda: generate_comprehensive_game_review(game_name, context=context),
+    )
+    facts.quality = _timed(
+        facts,
+        "quality_assurance",
+        lambda: perform_quality_validation(facts.quality_input()),
+    )
+
+    logger.info(
+        f"⚙️ Analysis pipeline for {context.title}: "
+        f"{sum(stage.seconds for stage in facts.stages):.2f}s, "
+        f"quality gates {'passed' if facts.quality_passed else 'not passed'}"
+    )
+    return facts
+
+
+def synthesize_narrative(
+    facts: AnalysisFacts, llm_config: Optional[Dict[str, Any]] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Pisze końcową analizę jednym wywołaniem LLM na podstawie gotowych faktów.
+
+    Args:
+        facts: Wyniki pipeline'u
+        llm_config: Konfiguracja LLM (domyślnie konfiguracja REVIEW_GENERATOR)
+
+    Returns:
+        Tuple[str, Dict]: Tekst analizy i zużycie tokenów
+    """
+    import autogen
+
+    from config.llm_config import get_review_generator_config
+
+    client = autogen.OpenAIWrapper(**(llm_config or get_review_generator_config()))
+    response = client.create(
+        messages=[
+            {"role": "system", "content": SYNTHESIS_SYSTEM_MESSAGE},
+            {
+                "role": "user",
+                "content": "Facts (JSON):\n"
+                + json.dumps(facts.prompt_facts(), ensure_ascii=False, default=str),
+            },
+        ]
+    )
+
+    narrative = client.extract_text_or_completion_object(response)[0]
+    usage = getattr(response, "usage", None)
+    return str(narrative), {
+        "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+        "completion_tokens": getattr(usage, "completion_tokens", 0),
+        "total_tokens": getattr(usage, "total_tokens", 0),
+    }
@@ -19,6 +19,8 @@ from enum import Enum
 from threading import Lock
 from typing import Any, Dict, List, Optional, Callable
 
+from utils.tracing import propagate_context, trace_span
+
 logger = logging.getLogger(__name__)
 
 
@@ -251,8 +253,13 @@ class BatchAnalysisManager:
             def analyze_game(game_name: str) -> Dict[str, Any]:
                 return generate_quick_game_opinion(game_name)
 
-        # Process tasks with thread pool
-        with ThreadPoolExecutor(max_workers=session.max_concurrent) as executor:
+        # Process tasks with thread pool (one trace, a child span per task)
+        with trace_span(
+            "batch",
+            batch_id=session.batch_id,
+            games=len(session.tasks),
+            analysis_type=session.tasks[0].analysis_type,
+        ), ThreadPoolExecutor(max_workers=session.max_concurrent) as executor:
             # Submit all tasks
             future_to_task = {}
             for task in session.tasks:
@@ -262,7 +269,9 @@ class BatchAnalysisManager:
                 # Rate limiting
                 self._wait_for_rate_limit()
 
-                future = executor.submit(self._execute_task, task, analyze_game)
+                future = executor.submit(
+                    propagate_context(self._execute_task), task, analyze_game
+                )
                 future_to_task[future] = task
 
             # Process completed tasks
@@ -317,7 +326,13 @@ class BatchAnalysisManager:
         logger.info(f"🔄 Starting analysis: {task.game_name}")
 
         try:
-            result = analyze_func(task.game_name)
+            with trace_span(
+                "batch_task",
+                game=task.game_name,
+                task_id=task.task_id,
+                analysis_type=task.analysis_type,
+            ):
+                result = analyze_func(task.game_name)
             return result
         except Exception as e:
             logger.error(f"❌ Analysis failed for {task.game_name}: {e}")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+"""
+Candidate Index for AutoGen DekuDeals
+=====================================
+
+Brute-force vectorized nearest-neighbour index over catalog games.
+
+Every game is embedded once into a fixed feature vector made of weighted
+blocks:
+- genres (one-hot over the catalog genre vocabulary)
+- developers (one-hot over known developer patterns)
+- price bucket (soft one-hot over price ranges)
+- quality (critic score, or category-based estimate when missing)
+
+A user's ``CollectionPreferences`` are embedded into the same space, and
+retrieval is a single matrix-vector product followed by partial top-K
+selection, so the whole catalog can be searched per request instead of a
+truncated candidate list.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .collection_batch_scorer import (
+    MATCH_DEVELOPER_COLUMNS,
+    BatchCollectionScorer,
+    rank_top_indices,
+)
+from .price_calculator import extract_price, extract_score
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of price buckets (last bucket is open-ended)
+PRICE_BUCKETS = [15.0, 30.0, 60.0, 100.0, float("inf")]
+
+# Relative weight of each feature block in the similarity (applied as the
+# square root on both the game and the query side)
+BLOCK_WEIGHTS = {
+    "genre": 0.5,
+    "developer": 0.2,
+    "price": 0.15,
+    "quality": 0.15,
+}
+
+
+def _normalize_rows(block: np.ndarray) -> np.ndarray:
+    """L2-normalize rows, leaving all-zero rows untouched."""
+    norms = np.linalg.norm(block, axis=1, keepdims=True)
+    return np.divide(block, norms, out=np.zeros_like(block), where=norms > 0)
+
+
+def _price_bucket(price: float) -> int:
+    """Index of the price bucket for a price."""
+    for idx, upper in enumerate(PRICE_BUCKETS):
+        if price < upper:
+            return idx
+    return len(PRICE_BUCKETS) - 1
+
+
+class CandidateIndex:
+    """
+    Vectorized nearest-neighbour index over candidate games.
+
+    Usage:
+        index = CandidateIndex(catalog_games)
+        nearest = index.nearest_games(preferences, k=200)
+    """
+
+    def __init__(
+        self,
+        games: Sequence[Dict[str, Any]],
+        scorer: Optional[BatchCollectionScorer] = None,
+    ):
+        """
+        Build the index.
+
+        Args:
+            games: Catalog game dicts (title, genres, current_price, scores...)
+            scorer: Optional scorer used to encode genres/developers
+        """
+        self.games = list(games)
+        self.scorer = scorer or BatchCollectionScorer()
+        self.encoded = self.scorer.encode_candidates(self.games)
+        self.titles = [title.lower().strip() for title in self.encoded.titles]
+
+        genre_block = _normalize_rows(self.encoded.extracted_genres)
+        developer_block = _normalize_rows(self.encoded.match_developers)
+        price_block = self._price_block()
+        quality_block = self._quality_block()
+
+        self.embeddings = self._weighted(
+            [genre_block, developer_block, price_block, quality_block]
+        )
+
+        logger.info(
+            f"✅ Candidate index built: {len(self.games)} games, "
+            f"{self.embeddings.shape[1]} features"
+        )
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def encode_preferences(self, preferences) -> np.ndarray:
+        """
+        Embed collection preferences into the index feature space.
+
+        Args:
+            preferences: CollectionPreferences of the user
+
+        Returns:
+            np.ndarray: Query vector
+        """
+        vocabulary = self.encoded.genre_vocabulary
+        genre_query = np.zeros(len(vocabulary))
+        for genre, score in preferences.favorite_genres:
+            idx = vocabulary.get(genre.lower())
+            if idx is not None:
+                genre_query[idx] += score
+
+        developer_query = np.zeros(len(MATCH_DEVELOPER_COLUMNS))
+        for developer, score in preferences.favorite_developers:
+            developer_lower = developer.lower()
+            for idx, column in enumerate(MATCH_DEVELOPER_COLUMNS):
+                if developer_lower in column or column in developer_lower:
+                    developer_query[idx] = max(developer_query[idx], score)
+
+        price_query = np.zeros(len(PRICE_BUCKETS))
+        if preferences.collection_size:
+            low, high = preferences.preferred_price_range
+            price_query[_price_bucket(low) : _price_bucket(high) + 1] = 1.0
+
+        quality_query = np.array([preferences.average_rating / 10.0])
+
+        blocks = [
+            _normalize_rows(block[np.newaxis, :])
+            for block in (genre_query, developer_query, price_query)
+        ]
+        # Quality is a magnitude, so it is not normalized
+        blocks.append(quality_query[np.newaxis, :])
+
+        return self._weighted(blocks)[0]
+
+    def top_k(
+        self,
+        query: np.ndarray,
+        k: int,
+        exclude_titles: Optional[Set[str]] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Return the ``k`` games most similar to a query vector.
+
+        Uses partial selection, so cost is O(n) plus O(k log k) for ordering.
+
+        Args:
+            query: Query vector from ``encode_preferences``
+            k: Number of games to return
+            exclude_titles: Normalized titles to skip (e.g. owned games)
+
+        Returns:
+            List[Tuple[int, float]]: (game index, similarity), best first
+        """
+        if not self.games or k <= 0:
+            return []
+
+        similarities = self.embeddings @ query
+        mask = None
+        if exclude_titles:
+            mask = np.array([title not in exclude_titles for title in self.titles])
+
+        top = rank_top_indices(similarities, mask, k=k)
+        return [(int(idx), float(similarities[idx])) for idx in top]
+
+    def nearest_games(
+        self,
+        preferences,
+        k: int,
+        exclude_titles: Optional[Set[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the ``k`` catalog games nearest to the user's preferences."""
+        query = self.encode_preferences(preferences)
+        return [self.games[idx] for idx, _ in self.top_k(query, k, exclude_titles)]
+
+    @staticmethod
+    def _weighted(blocks: List[np.ndarray]) -> np.ndarray:
+        """Concatenate feature blocks scaled by their block weights."""
+        weights = [
+            BLOCK_WEIGHTS[name] for name in ("genre", "developer", "price", "quality")
+        ]
+        return np.hstack(
+            [block * np.sqrt(weight) for block, weight in zip(blocks, weights)]
+        ).astype(np.float32)
+
+    def _price_block(self) -> np.ndarray:
+        """Soft one-hot price buckets (neighbouring buckets get half weight)."""
+        block = np.zeros((len(self.games), len(PRICE_BUCKETS)))
+        for i, game in enumerate(self.games):
+            price = extract_price(
+                game.get("current_price") or game.get("current_eshop_price")
+            )
+            if price is None:
+                continue
+            bucket = _price_bucket(price)
+            block[i, bucket] = 1.0
+            if bucket > 0:
+                block[i, bucket - 1] = 0.5
+            if bucket < len(PRICE_BUCKETS) - 1:
+                block[i, bucket + 1] = 0.5
+        return _normalize_rows(block)
+
+    def _quality_block(self) -> np.ndarray:
+        """Quality on a 0-1 scale from critic scores or the category estimate."""
+        quality = self.encoded.estimated_ratings / 10.0
+        for i, game in enumerate(self.games):
+            score = extract_score(
+                game.get("metacritic_score") or game.get("opencritic_score")
+            )
+            if score is not None:
+                quality[i] = score / 100.0
+        return quality[:, np.newaxis]
@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+
+"""
+Batch Collection Scorer for AutoGen DekuDeals
+=============================================
+
+Vectorized scoring backend for the Collection-Based Recommendation Engine.
+
+Candidates are encoded once into NumPy genre/developer one-hot matrices and
+per-game feature columns (estimated rating, popularity, innovation, ...).
+Preferences are encoded once into weight vectors over the same vocabulary,
+so similarity, discovery, developer and complementary scores for the whole
+candidate pool are computed with a handful of matrix operations instead of
+calling the per-game helpers in a Python loop.
+
+This module is the single source of the scoring rules and keyword tables;
+``tests/test_recommendation_scoring.py`` keeps a per-game reference
+implementation built on the same tables to check the vectorized math.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Title keywords used by genre similarity scoring
+SIMILARITY_GENRE_KEYWORDS = {
+    "action": ["action", "fighter", "shooter", "beat"],
+    "adventure": ["adventure", "quest", "journey"],
+    "rpg": ["rpg", "role", "fantasy", "dragon", "quest"],
+    "strategy": ["strategy", "tactical", "civilization", "war"],
+    "puzzle": ["puzzle", "brain", "logic", "tetris"],
+    "platformer": ["platform", "mario", "sonic", "jump"],
+    "indie": ["indie", "pixel", "retro"],
+    "simulation": ["simulation", "sim", "city", "farm"],
+}
+
+# Title keywords used by genre extraction (discovery/complementary scoring)
+EXTENDED_GENRE_KEYWORDS = {
+    **SIMILARITY_GENRE_KEYWORDS,
+    "racing": ["racing", "kart", "speed", "motor"],
+    "sports": ["sports", "football", "soccer", "tennis"],
+    "fighting": ["fighting", "fighter", "combat", "brawl"],
+}
+
+# Developer patterns used by developer similarity scoring
+SIMILARITY_DEVELOPER_PATTERNS = {
+    "nintendo": ["mario", "zelda", "metroid", "kirby", "pokemon", "nintendo"],
+    "supergiant": ["hades", "bastion", "transistor", "pyre"],
+    "team cherry": ["hollow knight"],
+    "indie": ["pixel", "retro", "indie", "8-bit", "16-bit"],
+}
+
+# Developer patterns used by developer recommendation scoring
+MATCH_DEVELOPER_PATTERNS = {
+    "nintendo": [
+        "mario",
+        "zelda",
+        "metroid",
+        "kirby",
+        "pokemon",
+        "nintendo",
+        "splatoon",
+        "pikmin",
+    ],
+    "supergiant games": ["hades", "bastion", "transistor", "pyre"],
+    "team cherry": ["hollow knight"],
+    "indie": ["pixel", "retro", "indie", "8-bit", "16-bit"],
+    "nintendo platform": [
+        "mario",
+        "zelda",
+        "metroid",
+        "kirby",
+        "pokemon",
+        "splatoon",
+    ],
+}
+MATCH_DEVELOPER_COLUMNS = list(MATCH_DEVELOPER_PATTERNS) + [
+    "curated developers",
+    "staff favorites",
+    "independent games",
+]
+INDIE_TITLE_KEYWORDS = ["indie", "pixel", "retro", "8-bit", "16-bit"]
+
+QUALITY_INDICATORS = [
+    "award",
+    "goty",
+    "deluxe",
+    "ultimate",
+    "remastered",
+    "definitive",
+    "collection",
+    "trilogy",
+    "chronicles",
+    "legend",
+    "final fantasy",
+    "zelda",
+    "mario",
+    "metroid",
+]
+
+INNOVATION_KEYWORDS = [
+    "vr",
+    "ar",
+    "roguelike",
+    "procedural",
+    "experimental",
+    "unique",
+    "innovative",
+    "creative",
+    "artistic",
+    "narrative",
+    "indie",
+    "pixel",
+    "retro",
+]
+
+POPULARITY_SCORES = {
+    "hottest": 1.0,
+    "most-wanted": 0.9,
+    "highest-rated": 0.8,
+    "recent-releases": 0.7,
+    "indie": 0.6,
+    "new-releases": 0.6,
+    "coming-soon": 0.5,
+}
+
+
+@dataclass
+class EncodedCandidates:
+    """Candidate games encoded once into matrices and feature columns."""
+
+    titles: List[str]
+    categories: np.ndarray  # (n,) object array of source categories
+    genre_vocabulary: Dict[str, int]
+    similarity_genres: np.ndarray  # (n, V) float one-hot, similarity keywords
+    extracted_genres: np.ndarray  # (n, V) float one-hot, extended keywords
+    similarity_developers: np.ndarray  # (n, len(SIMILARITY_DEVELOPER_PATTERNS))
+    match_developers: np.ndarray  # (n, len(MATCH_DEVELOPER_COLUMNS))
+    estimated_ratings: np.ndarray  # (n,) estimated quality on a 10-point scale
+    popularity: np.ndarray  # (n,)
+    category_scores: np.ndarray  # (n,)
+    innovation: np.ndarray  # (n,)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+
+class BatchCollectionScorer:
+    """
+    Vectorized scorer for collection-based recommendation candidates.
+
+    Usage:
+        encoded = scorer.encode_candidates(candidate_games)
+        scores = scorer.similarity_scores(encoded, preferences)
+    """
+
+    def encode_candidates(
+        self, candidate_games: Sequence[Dict[str, Any]]
+    ) -> EncodedCandidates:
+        """
+        Encode candidate games into one-hot matrices and feature columns.
+
+        Args:
+            candidate_games: Candidate game dicts (title, genres, source_category)
+
+        Returns:
+            EncodedCandidates: Encoded candidate pool
+        """
+        n = len(candidate_games)
+        vocabulary: Dict[str, int] = {}
+        similarity_rows: List[List[int]] = []
+        extracted_rows: List[List[int]] = []
+
+        sim_dev_names = list(SIMILARITY_DEVELOPER_PATTERNS)
+        similarity_developers = np.zeros((n, len(sim_dev_names)))
+        match_developers = np.zeros((n, len(MATCH_DEVELOPER_COLUMNS)))
+
+        titles: List[str] = []
+        categories = np.empty(n, dtype=object)
+        estimated_ratings = np.empty(n)
+        popularity = np.empty(n)
+        category_scores = np.empty(n)
+        innovation = np.empty(n)
+
+        for i, game in enumerate(candidate_games):
+            title = str(game.get("title") or "")
+            title_lower = title.lower()
+            category = str(game.get("source_category") or "")
+            titles.append(title)
+            categories[i] = category
+
+            # Genres listed explicitly in game data
+            explicit = self._explicit_genres(game.get("genres"))
+            title_genres = {
+                genre
+                for genre, keywords in EXTENDED_GENRE_KEYWORDS.items()
+                if any(keyword in title_lower for keyword in keywords)
+            }
+            similarity_set = explicit | (
+                title_genres & SIMILARITY_GENRE_KEYWORDS.keys()
+            )
+            extracted_set = explicit | title_genres
+
+            similarity_rows.append(
+                [vocabulary.setdefault(g, len(vocabulary)) for g in similarity_set]
+            )
+            extracted_rows.append(
+                [vocabulary.setdefault(g, len(vocabulary)) for g in extracted_set]
+            )
+
+            # Developers detected by similarity patterns
+            for j, dev in enumerate(sim_dev_names):
+                patterns = SIMILARITY_DEVELOPER_PATTERNS[dev]
+                if any(pattern in title_lower for pattern in patterns):
+                    similarity_developers[i, j] = 1.0
+            if "indie" in category:
+                similarity_developers[i, sim_dev_names.index("indie")] = 1.0
+
+            # Developers detected by developer recommendation patterns
+            for j, dev in enumerate(MATCH_DEVELOPER_PATTERNS):
+                patterns = MATCH_DEVELOPER_PATTERNS[dev]
+                if any(pattern in title_lower for pattern in patterns):
+                    match_developers[i, j] = 1.0
+            if "staff-picks" in category:
+                match_developers[
+                    i, MATCH_DEVELOPER_COLUMNS.index("curated developers")
+                ] = 1.0
+                match_developers[
+                    i, MATCH_DEVELOPER_COLUMNS.index("staff favorites")
+                ] = 1.0
+            if any(keyword in title_lower for keyword in INDIE_TITLE_KEYWORDS):
+                match_developers[i, MATCH_DEVELOPER_COLUMNS.index("indie")] = 1.0
+                match_developers[
+                    i, MATCH_DEVELOPER_COLUMNS.index("independent games")
+                ] = 1.0
+
+            estimated_ratings[i] = self._estimate_rating(title_lower, category)
+            popularity[i] = POPULARITY_SCORES.get(category, 0.5)
+            category_scores[i] = self._category_score(category)
+            innovation[i] = self._innovation_score(title_lower, category)
+
+        similarity_genres = self._one_hot(similarity_rows, len(vocabulary))
+        extracted_genres = self._one_hot(extracted_rows, len(vocabulary))
+
+        logger.debug(f"Encoded {n} candidates over {len(vocabulary)} genres")
+
+        return EncodedCandidates(
+            titles=titles,
+            categories=categories,
+            genre_vocabulary=vocabulary,
+            similarity_genres=similarity_genres,
+            extracted_genres=extracted_genres,
+            similarity_developers=similarity_developers,
+            match_developers=match_developers,
+            estimated_ratings=estimated_ratings,
+            popularity=popularity,
+            category_scores=category_scores,
+            innovation=innovation,
+        )
+
+    # ------------------------------------------------------------------
+    # Composite scores
+    # ------------------------------------------------------------------
+
+    def similarity_scores(self, encoded: EncodedCandidates, preferences) -> np.ndarray:
+        """Genres 40%, developers 20%, rating 20%, popularity and category 10% each."""
+        score = np.zeros(len(encoded))
+        score += self.genre_similarity(encoded, preferences) * 0.4
+        score += self.developer_similarity(encoded, preferences) * 0.2
+        score += self.rating_compatibility(encoded, preferences) * 0.2
+        score += encoded.popularity * 0.1
+        score += encoded.category_scores * 0.1
+        return np.clip(score, 0.0, 1.0)
+
+    def discovery_scores(self, encoded: EncodedCandidates, preferences) -> np.ndarray:
+        """Unexplored genres, innovation, quality and diversity over familiar genres."""
+        underrepresented = {g.lower() for g in preferences.underrepresented_genres[:5]}
+        favorite_genres = {g[0].lower() for g in preferences.favorite_genres[:3]}
+
+        underrep_counts = encoded.extracted_genres @ self._genre_mask(
+            encoded, underrepresented
+        )
+        familiar_counts = encoded.extracted_genres @ self._genre_mask(
+            encoded, favorite_genres
+        )
+
+        score = np.zeros(len(encoded))
+        score += np.minimum(underrep_counts * 0.3, 0.4) * 0.4
+        score -= np.minimum(familiar_counts * 0.2, 0.3) * 0.2
+        score += encoded.innovation * 0.3
+        score += self.rating_compatibility(encoded, preferences) * 0.2
+        score += self.diversity_bonus(encoded, preferences) * 0.1
+        return np.clip(score, 0.0, 1.0)
+
+    def developer_scores(self, encoded: EncodedCandidates, preferences) -> np.ndarray:
+        """Favorite developer match 70%, rating 20%, popularity 10%."""
+        favorite_devs = dict(preferences.favorite_developers[:3])
+
+        developer_match = np.zeros(len(encoded))
+        if favorite_devs:
+            names = [dev.lower() for dev in favorite_devs]
+            weights = np.array(list(favorite_devs.values()), dtype=float)
+            # (columns x favorites) substring match in either direction
+            match_matrix = np.array(
+                [
+                    [fav in column or column in fav for fav in names]
+                    for column in MATCH_DEVELOPER_COLUMNS
+                ],
+                dtype=float,
+            )
+            hits = (encoded.match_developers @ match_matrix) > 0
+            developer_match = np.max(np.where(hits, weights, 0.0), axis=1, initial=0.0)
+
+        score = np.zeros(len(encoded))
+        score += developer_match * 0.7
+        score += self.rating_compatibility(encoded, preferences) * 0.2
+        score += encoded.popularity * 0.1
+        return np.clip(score, 0.0, 1.0)
+
+    def complementary_scores(
+        self,
+        encoded: EncodedCandidates,
+        preferences,
+        collection_gaps: Dict[str, Any],
+        represented_genres: Iterable[str],
+    ) -> np.ndarray:
+        """Collection gap filling 50%, rating 25%, diversity 15%, popularity 10%."""
+        missing = set(collection_gaps.get("missing_genres", []))
+        represented = set(represented_genres)
+
+        gap_weights = np.zeros(len(encoded.genre_vocabulary))
+        for genre, idx in encoded.genre_vocabulary.items():
+            if genre in missing:
+                gap_weights[idx] = 0.4
+            elif genre not in represented:
+                gap_weights[idx] = 0.2
+        gap_scores = encoded.extracted_genres @ gap_weights
+
+        score = np.zeros(len(encoded))
+        score += np.minimum(gap_scores, 0.5) * 0.5
+        score += self.rating_compatibility(encoded, preferences) * 0.25
+        score += self.diversity_bonus(encoded, preferences) * 0.15
+        score += encoded.popularity * 0.1
+        return np.clip(score, 0.0, 1.0)
+
+    # ------------------------------------------------------------------
+    # Component scores
+    # ------------------------------------------------------------------
+
+    def genre_similarity(self, encoded: EncodedCandidates, preferences) -> np.ndarray:
+        """Preference-weighted share of favorite genres found in each game."""
+        if not preferences.favorite_genres:
+            return np.full(len(encoded), 0.5)
+
+        total_weight = sum(score for _, score in preferences.favorite_genres)
+        weights = np.zeros(len(encoded.genre_vocabulary))
+        if total_weight > 0:
+            for genre, pref_score in preferences.favorite_genres:
+                idx = encoded.genre_vocabulary.get(genre.lower())
+                if idx is not None:
+                    weights[idx] += pref_score / total_weight
+
+        match_scores = np.minimum(1.0, encoded.similarity_genres @ weights)
+        has_genres = encoded.similarity_genres.any(axis=1)
+        return np.where(has_genres, match_scores, 0.3)
+
+    def developer_similarity(
+        self, encoded: EncodedCandidates, preferences
+    ) -> np.ndarray:
+        """Score of the first favorite developer detected in each game."""
+        n = len(encoded)
+        if not preferences.favorite_developers:
+            return np.full(n, 0.5)
+
+        sim_dev_names = list(SIMILARITY_DEVELOPER_PATTERNS)
+        matches = np.zeros((n, len(preferences.favorite_developers)), dtype=bool)
+        weights = np.empty(len(preferences.favorite_developers))
+        for j, (dev, pref_score) in enumerate(preferences.favorite_developers):
+            weights[j] = min(1.0, pref_score)
+            if dev.lower() in sim_dev_names:
+                column = sim_dev_names.index(dev.lower())
+                matches[:, j] = encoded.similarity_developers[:, column] > 0
+
+        # First matching favorite (in preference order) wins
+        first_match = np.argmax(matches, axis=1)
+        scores = np.where(matches.any(axis=1), weights[first_match], 0.3)
+        has_developers = encoded.similarity_developers.any(axis=1)
+        return np.where(has_developers, scores, 0.5)
+
+    def rating_compatibility(
+        self, encoded: EncodedCandidates, preferences
+    ) -> np.ndarray:
+        """Closeness of the estimated rating to the collection average."""
+        if preferences.average_rating == 0:
+            return np.full(len(encoded), 0.7)
+
+        rating_diff = np.abs(encoded.estimated_ratings - preferences.average_rating)
+        return np.maximum(0.0, 1.0 - (rating_diff / 5.0))
+
+    def diversity_bonus(self, encoded: EncodedCandidates, preferences) -> np.ndarray:
+        """Share of each game's genres that are not among the favorites."""
+        favorite_genres = {g[0].lower() for g in preferences.favorite_genres}
+        genre_counts = encoded.extracted_genres.sum(axis=1)
+        familiar_counts = encoded.extracted_genres @ self._genre_mask(
+            encoded, favorite_genres
+        )
+        unfamiliarity = 1.0 - familiar_counts / np.maximum(genre_counts, 1)
+        return np.where(genre_counts > 0, unfamiliarity, 0.5)
+
+    # ------------------------------------------------------------------
+    # Encoding helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _explicit_genres(genres: Any) -> set:
+        """Normalize the ``genres`` field of game data into a lowercase set."""
+        if not genres:
+            return set()
+        if isinstance(genres, list):
+            return {str(g).lower() for g in genres}
+        if isinstance(genres, str):
+            return {g.lower().strip() for g in genres.split(",")}
+        return set()
+
+    @staticmethod
+    def _one_hot(rows: List[List[int]], width: int) -> np.ndarray:
+        """Build a dense one-hot matrix from per-row column indices."""
+        matrix = np.zeros((len(rows), width))
+        row_idx = [i for i, cols in enumerate(rows) for _ in cols]
+        col_idx = [c for cols in rows for c in cols]
+        if row_idx:
+            matrix[row_idx, col_idx] = 1.0
+        return matrix
+
+    @staticmethod
+    def _genre_mask(encoded: EncodedCandidates, genres: Iterable[str]) -> np.ndarray:
+        """Indicator vector over the genre vocabulary for the given genres."""
+        mask = np.zeros(len(encoded.genre_vocabulary))
+        for genre in genres:
+            idx = encoded.genre_vocabulary.get(genre)
+            if idx is not None:
+                mask[idx] = 1.0
+        return mask
+
+    @staticmethod
+    def _estimate_rating(title_lower: str, category: str) -> float:
+        """Estimate game quality from category and title keywords."""
+        estimated_rating = 7.0
+        if "highest-rated" in category:
+            estimated_rating = 8.5
+        elif "hottest" in category or "most-wanted" in category:
+            estimated_rating = 8.0
+        elif "indie" in category:
+            estimated_rating = 7.5
+        elif "recent-releases" in category:
+            estimated_rating = 7.0
+
+        if any(indicator in title_lower for indicator in QUALITY_INDICATORS):
+            estimated_rating += 0.5
+        return estimated_rating
+
+    @staticmethod
+    def _category_score(category: str) -> float:
+        """Category relevance score for similarity recommendations."""
+        if category in ["hottest", "highest-rated", "most-wanted"]:
+            return 0.8
+        elif category in ["recent-releases", "indie"]:
+            return 0.6
+        return 0.4
+
+    @staticmethod
+    def _innovation_score(title_lower: str, category: str) -> float:
+        """Innovation/novelty score from category and title keywords."""
+        if "staff-picks" in category:
+            return 0.8
+        elif "recently-released" in category or "upcoming-releases" in category:
+            return 0.7
+        elif "trending" in category:
+            return 0.6
+        if any(keyword in title_lower for keyword in INNOVATION_KEYWORDS):
+            return 0.7
+        return 0.5
+
+
+def rank_top_indices(
+    scores: np.ndarray, mask: Optional[np.ndarray] = None, k: Optional[int] = None
+) -> np.ndarray:
+    """
+    Indices of candidates ordered by descending score.
+
+    Ties keep candidate order, matching a stable ``list.sort(reverse=True)``.
+    When ``k`` is given, only the best ``k`` are returned, found by partial
+    selection instead of sorting the whole pool.
+
+    Args:
+        scores: Candidate scores
+        mask: Optional boolean mask of candidates eligible for ranking
+        k: Optional number of top candidates to return
+
+    Returns:
+        np.ndarray: Candidate indices, best first
+    """
+    indices = np.flatnonzero(mask) if mask is not None else np.arange(len(scores))
+
+    if k is not None and k < len(indices):
+        if k <= 0:
+            return indices[:0]
+        candidate_scores = scores[indices]
+        kth_score = np.partition(candidate_scores, len(indices) - k)[len(indices) - k]
+        above = indices[candidate_scores > kth_score]
+        ties = indices[candidate_scores == kth_score][: k - len(above)]
+        indices = np.sort(np.concatenate([above, ties]))
+
+    return indices[np.argsort(-scores[indices], kind="stable")]
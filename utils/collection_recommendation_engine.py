@@ -10,6 +10,7 @@ to generate personalized recommendations based on owned games.
 Features:
 - Collection preference analysis (genres, developers, themes)
 - Similarity-based recommendations
+- Top-K nearest-neighbour retrieval over the whole candidate catalog
 - Discovery recommendations (new genres/developers)
 - Complementary recommendations (fill collection gaps)
 - ML integration with Smart User Profiler
@@ -20,12 +21,15 @@ Author: AutoGen DekuDeals Team
 Version: 1.0.0
 """
 
+import hashlib
+import heapq
 import json
 import logging
+import threading
 import numpy as np
-from collections import Counter, defaultdict
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Set
@@ -37,6 +41,12 @@ from .game_collection_manager import GameCollectionManager, GameEntry, GameStatu
 from .smart_user_profiler import SmartUserProfiler, GamePreferencePattern
 from .recommendation_engine import RecommendationEngine, UserProfile, UserPreference
 from .user_management import UserManager
+from .collection_batch_scorer import (
+    EXTENDED_GENRE_KEYWORDS,
+    BatchCollectionScorer,
+    rank_top_indices,
+)
+from .candidate_index import CandidateIndex
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -160,6 +170,18 @@ class CollectionRecommendationEngine:
         self.recommendation_engine = RecommendationEngine()
         self.user_manager = UserManager()
 
+        # Vectorized scorer for candidate pools
+        self.batch_scorer = BatchCollectionScorer()
+
+        # Nearest-neighbour retrieval narrows large catalogs to this many
+        # candidates before full scoring (similar/developer recommendations)
+        self.retrieval_pool_size = 300
+
+        # Built indexes, keyed by candidate set fingerprint (LRU)
+        self.candidate_indexes: "OrderedDict[str, CandidateIndex]" = OrderedDict()
+        self.candidate_index_cache_size = 4
+        self._candidate_indexes_lock = threading.Lock()
+
         # Algorithm weights for recommendation scoring
         self.similarity_weights = {
             "genre_match": 0.3,
@@ -196,9 +218,9 @@ class CollectionRecommendationEngine:
             },
         }
 
-        # Cache for analyzed preferences
+        # Cache for analyzed preferences, keyed by preference vector version
         self.preferences_cache: Dict[str, CollectionPreferences] = {}
-        self.cache_ttl = timedelta(hours=24)  # Cache for 24 hours
+        self.preferences_versions: Dict[str, int] = {}
 
         logger.info("✅ Collection Recommendation Engine initialized")
 
@@ -208,6 +230,10 @@ class CollectionRecommendationEngine:
         """
         Analyze user's collection to extract preferences and patterns.
 
+        Preferences are derived from the user's precomputed preference vector,
+        which GameCollectionManager keeps up to date as games are added,
+        updated or removed, so no collection scan happens here.
+
         Args:
             user_id: Optional user ID, defaults to current user
 
@@ -217,43 +243,31 @@ class CollectionRecommendationEngine:
         if not user_id:
             user_id = self._get_current_user_id()
 
-        # Check cache first
+        # Read the precomputed preference vector (updated on collection changes)
+        vector = self.collection_manager.get_preference_vector(user_id)
+
         cache_key = f"{user_id}_preferences"
-        if cache_key in self.preferences_cache:
-            cached_prefs = self.preferences_cache[cache_key]
-            if datetime.now() - cached_prefs.analysis_date < self.cache_ttl:
-                logger.debug(f"Using cached preferences for user {user_id}")
-                return cached_prefs
-
-        # Get user's collection
-        collection = self._get_user_collection(user_id)
-        if not collection:
+        cached = self.preferences_cache.get(cache_key)
+        if cached and self.preferences_versions.get(cache_key) == vector.version:
+            logger.debug(f"Using cached preferences for user {user_id}")
+            return cached
+
+        if vector.size == 0:
             logger.warning(f"No collection found for user {user_id}")
             return CollectionPreferences()
 
         logger.info(
-            f"🔍 Analyzing collection preferences for user {user_id} ({len(collection)} games)"
+            f"🔍 Reading collection preferences for user {user_id} ({vector.size} games)"
         )
 
-        # Initialize preferences
-        preferences = CollectionPreferences()
-        preferences.collection_size = len(collection)
-        preferences.games_analyzed = len(collection)
-
-        # Analyze different aspects
-        self._analyze_genre_preferences(collection, preferences)
-        self._analyze_developer_preferences(collection, preferences)
-        self._analyze_rating_patterns(collection, preferences)
-        self._analyze_price_preferences(collection, preferences)
-        self._analyze_platform_preferences(collection, preferences)
-        self._analyze_collection_characteristics(collection, preferences)
-        self._analyze_temporal_patterns(collection, preferences)
+        preferences = CollectionPreferences(**vector.to_preference_fields())
 
         # Calculate overall confidence
         preferences.confidence_level = self._calculate_confidence_level(preferences)
 
-        # Cache the results
+        # Cache the results for this vector version
         self.preferences_cache[cache_key] = preferences
+        self.preferences_versions[cache_key] = vector.version
 
         logger.info(
             f"✅ Collection analysis complete: {len(preferences.favorite_genres)} genre preferences, "
@@ -308,6 +322,11 @@ class CollectionRecommendationEngine:
             logger.warning("No candidate games available for recommendations")
             return []
 
+        # Narrow large catalogs down to the nearest candidates
+        candidate_games = self._retrieve_candidates(
+            recommendation_type, preferences, candidate_games
+        )
+
         logger.info(
             f"🎯 Generating {recommendation_type.value} recommendations for {len(candidate_games)} candidates"
         )
@@ -338,9 +357,10 @@ class CollectionRecommendationEngine:
         # Apply ML adjustments from Smart User Profiler
         recommendations = self._apply_ml_adjustments(recommendations, user_id)
 
-        # Sort by final score and return top recommendations
-        recommendations.sort(key=lambda x: x.final_score, reverse=True)
-        final_recommendations = recommendations[:max_recommendations]
+        # Select top recommendations by final score
+        final_recommendations = heapq.nlargest(
+            max_recommendations, recommendations, key=lambda x: x.final_score
+        )
 
         logger.info(
             f"✅ Generated {len(final_recommendations)} {recommendation_type.value} recommendations"
@@ -348,6 +368,63 @@ class CollectionRecommendationEngine:
 
         return final_recommendations
 
+    def _retrieve_candidates(
+        self,
+        recommendation_type: RecommendationType,
+        preferences: CollectionPreferences,
+        candidate_games: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the candidates nearest to the user's preferences.
+
+        Only applies to preference-matching types (similar/developer) and
+        catalogs larger than ``retrieval_pool_size``; discovery and
+        complementary recommendations look for games *unlike* the collection,
+        so they keep the full pool (scored in one vectorized pass).
+        """
+        if recommendation_type not in (
+            RecommendationType.SIMILAR,
+            RecommendationType.DEVELOPER,
+        ):
+            return candidate_games
+        if len(candidate_games) <= self.retrieval_pool_size:
+            return candidate_games
+
+        index = self._get_candidate_index(candidate_games)
+        nearest = index.nearest_games(preferences, self.retrieval_pool_size)
+
+        logger.info(
+            f"🔎 Retrieved {len(nearest)} nearest candidates out of {len(candidate_games)}"
+        )
+        return nearest
+
+    def _get_candidate_index(
+        self, candidate_games: List[Dict[str, Any]]
+    ) -> CandidateIndex:
+        """
+        Index for a candidate set, built once while the set is unchanged.
+
+        The fingerprint covers the full game dicts, so a changed price or
+        score in the catalog builds a fresh index.
+        """
+        fingerprint = hashlib.sha1(
+            json.dumps(candidate_games, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+        with self._candidate_indexes_lock:
+            index = self.candidate_indexes.get(fingerprint)
+            if index is not None:
+                self.candidate_indexes.move_to_end(fingerprint)
+                return index
+
+        index = CandidateIndex(candidate_games, scorer=self.batch_scorer)
+
+        with self._candidate_indexes_lock:
+            self.candidate_indexes[fingerprint] = index
+            while len(self.candidate_indexes) > self.candidate_index_cache_size:
+                self.candidate_indexes.popitem(last=False)
+        return index
+
     def _get_current_user_id(self) -> str:
         """Get current user ID from Multi-User system."""
         try:
@@ -380,351 +457,6 @@ class CollectionRecommendationEngine:
             logger.error(f"Error getting collection for user {user_id}: {e}")
             return []
 
-    def _analyze_genre_preferences(
-        self, collection: List[GameEntry], preferences: CollectionPreferences
-    ):
-        """Analyze genre preferences from collection."""
-        genre_ratings = defaultdict(list)
-        genre_counts = Counter()
-
-        # Collect genre data from available sources
-        for game in collection:
-            genres = []
-
-            # Primary source: tags (if available and not empty)
-            if hasattr(game, "tags") and game.tags:
-                genres.extend(game.tags)
-
-            # Secondary source: extract from notes if they contain genre keywords
-            if hasattr(game, "notes") and game.notes:
-                genre_keywords = [
-                    "action",
-                    "adventure",
-                    "rpg",
-                    "puzzle",
-                    "platformer",
-                    "indie",
-                    "metroidvania",
-                    "roguelike",
-                    "strategy",
-                    "simulation",
-                    "sports",
-                    "racing",
-                    "fighting",
-                    "shooter",
-                    "horror",
-                    "survival",
-                ]
-                notes_lower = game.notes.lower()
-                for keyword in genre_keywords:
-                    if keyword in notes_lower:
-                        genres.append(keyword.title())
-
-            # Fallback: use platform as a broad category
-            if not genres and game.platform:
-                genres = [game.platform]
-
-            # If still no genres, create a general category
-            if not genres:
-                genres = ["General"]
-
-            for genre in genres:
-                genre_counts[genre] += 1
-                if game.user_rating:
-                    genre_ratings[genre].append(game.user_rating)
-
-        # Calculate favorite genres with more lenient requirements
-        favorite_genres = []
-        for genre in genre_counts:  # Loop over ALL genres, not just rated ones
-            ratings = genre_ratings.get(genre, [])  # Get ratings (might be empty)
-            frequency = genre_counts[genre] / len(collection)
-
-            if len(ratings) >= 1:  # At least 1 rated game
-                avg_rating = sum(ratings) / len(ratings)
-                # Combine rating and frequency for preference score
-                preference_score = (avg_rating / 10.0) * 0.7 + frequency * 0.3
-
-                if avg_rating >= 6.0:  # Lower threshold: 6.0 instead of 7.0
-                    favorite_genres.append((genre, preference_score))
-            else:
-                # For unrated games, use frequency-based scoring
-                if frequency >= 0.15:  # At least 15% of collection
-                    # Default to neutral rating for unrated games
-                    preference_score = (
-                        0.5 * 0.7 + frequency * 0.3
-                    )  # Assume 5.0/10 rating
-                    favorite_genres.append((genre, preference_score))
-
-        # Sort by preference score
-        favorite_genres.sort(key=lambda x: x[1], reverse=True)
-        preferences.favorite_genres = favorite_genres[:8]  # Top 8 genres
-
-        # Identify underrepresented genres (low frequency but available)
-        all_genres = set(genre_counts.keys())
-        represented_genres = {genre for genre, _ in favorite_genres}
-        underrepresented = list(all_genres - represented_genres)
-        preferences.underrepresented_genres = underrepresented[:5]  # Top 5 gaps
-
-        # Identify avoided genres (low ratings)
-        avoided_genres = []
-        for genre, ratings in genre_ratings.items():
-            if len(ratings) >= 1:  # At least 1 rating
-                avg_rating = sum(ratings) / len(ratings)
-                if avg_rating < 5.0:  # Low average rating
-                    avoided_genres.append(genre)
-
-        preferences.avoided_genres = avoided_genres
-
-    def _analyze_developer_preferences(
-        self, collection: List[GameEntry], preferences: CollectionPreferences
-    ):
-        """Analyze developer preferences from collection."""
-        developer_ratings = defaultdict(list)
-        developer_counts = Counter()
-
-        # Collect developer data from available sources
-        for game in collection:
-            developers = []
-
-            # Try to extract developer info from notes
-            if hasattr(game, "notes") and game.notes:
-                # Look for common developer patterns in notes
-                notes = game.notes.lower()
-                developer_keywords = [
-                    "nintendo",
-                    "capcom",
-                    "team cherry",
-                    "supergiant",
-                    "playdead",
-                    "motion twin",
-                    "moon studios",
-                    "ori",
-                    "celeste",
-                    "matt makes games",
-                    "indie",
-                    "ubisoft",
-                    "ea",
-                    "activision",
-                    "bethesda",
-                    "square enix",
-                ]
-                for keyword in developer_keywords:
-                    if keyword in notes:
-                        developers.append(keyword.title())
-
-            # Extract potential developer from game title (common patterns)
-            if hasattr(game, "title") and game.title:
-                title_lower = game.title.lower()
-                # Some games have developer in title
-                if "team cherry" in title_lower or "hollow knight" in title_lower:
-                    developers.append("Team Cherry")
-                elif (
-                    "supergiant" in title_lower
-                    or "hades" in title_lower
-                    or "bastion" in title_lower
-                ):
-                    developers.append("Supergiant Games")
-                elif (
-                    "nintendo" in title_lower
-                    or "mario" in title_lower
-                    or "zelda" in title_lower
-                ):
-                    developers.append("Nintendo")
-                elif (
-                    "playdead" in title_lower
-                    or "inside" in title_lower
-                    or "limbo" in title_lower
-                ):
-                    developers.append("Playdead")
-
-            # Fallback: use platform as publisher/developer category
-            if not developers and game.platform:
-                if "nintendo" in game.platform.lower():
-                    developers.append("Nintendo Platform")
-                elif "steam" in game.platform.lower():
-                    developers.append("PC/Steam Platform")
-                else:
-                    developers.append(f"{game.platform} Platform")
-
-            # If still no developers, create a general category based on import source
-            if not developers:
-                if hasattr(game, "import_source"):
-                    developers.append(f"{game.import_source.value.title()} Games")
-                else:
-                    developers.append("Independent Games")
-
-            for developer in developers:
-                developer_counts[developer] += 1
-                if game.user_rating:
-                    developer_ratings[developer].append(game.user_rating)
-
-        # Calculate favorite developers with more lenient requirements
-        favorite_developers = []
-        for (
-            developer
-        ) in developer_counts:  # Loop over ALL developers, not just rated ones
-            ratings = developer_ratings.get(
-                developer, []
-            )  # Get ratings (might be empty)
-            game_count = developer_counts[developer]
-
-            if len(ratings) >= 1:  # At least 1 rated game
-                avg_rating = sum(ratings) / len(ratings)
-                # Preference score based on rating and number of games
-                preference_score = (avg_rating / 10.0) * 0.8 + min(
-                    game_count / 3, 1.0
-                ) * 0.2
-
-                if avg_rating >= 6.0:  # Lower threshold: 6.0 instead of 7.0
-                    favorite_developers.append((developer, preference_score))
-            else:
-                # For unrated games, use frequency-based scoring
-                if game_count >= 2:  # At least 2 games from this developer
-                    # Default to neutral rating for unrated games
-                    preference_score = (
-                        0.5 * 0.8 + min(game_count / 3, 1.0) * 0.2
-                    )  # Assume 5.0/10 rating
-                    favorite_developers.append((developer, preference_score))
-
-        # Sort by preference score
-        favorite_developers.sort(key=lambda x: x[1], reverse=True)
-        preferences.favorite_developers = favorite_developers[:5]  # Top 5 developers
-
-        # Calculate developer diversity (more realistic calculation)
-        unique_developers = len(set(developer_counts.keys()))
-        total_games = len(collection)
-        preferences.developer_diversity_score = min(
-            unique_developers / max(total_games * 0.3, 1), 1.0
-        )  # More realistic expectation
-
-    def _analyze_rating_patterns(
-        self, collection: List[GameEntry], preferences: CollectionPreferences
-    ):
-        """Analyze rating patterns from collection."""
-        ratings = [game.user_rating for game in collection if game.user_rating]
-
-        if not ratings:
-            return
-
-        # Calculate average rating
-        preferences.average_rating = sum(ratings) / len(ratings)
-
-        # Calculate rating distribution
-        rating_dist = Counter()
-        for rating in ratings:
-            rating_bucket = int(rating)  # Group by integer ratings
-            rating_dist[rating_bucket] += 1
-
-        preferences.rating_distribution = dict(rating_dist)
-
-        # Identify high-rated games (8+)
-        high_rated_games = [
-            game.title
-            for game in collection
-            if game.user_rating and game.user_rating >= 8.0
-        ]
-        preferences.high_rated_games = high_rated_games
-
-    def _analyze_price_preferences(
-        self, collection: List[GameEntry], preferences: CollectionPreferences
-    ):
-        """Analyze price preferences from collection."""
-        prices = []
-
-        for game in collection:
-            if game.purchase_price:
-                prices.append(game.purchase_price)
-            elif game.current_price:
-                prices.append(game.current_price)
-
-        if prices:
-            # Calculate preferred price range (25th to 75th percentile)
-            sorted_prices = sorted(prices)
-            q1_idx = len(sorted_prices) // 4
-            q3_idx = 3 * len(sorted_prices) // 4
-
-            min_price = (
-                sorted_prices[q1_idx]
-                if q1_idx < len(sorted_prices)
-                else sorted_prices[0]
-            )
-            max_price = (
-                sorted_prices[q3_idx]
-                if q3_idx < len(sorted_prices)
-                else sorted_prices[-1]
-            )
-
-            preferences.preferred_price_range = (min_price, max_price)
-
-            # Calculate price sensitivity (lower average price = higher sensitivity)
-            avg_price = sum(prices) / len(prices)
-            preferences.price_sensitivity = max(
-                0.0, min(1.0, 1.0 - (avg_price / 100.0))
-            )
-
-    def _analyze_platform_preferences(
-        self, collection: List[GameEntry], preferences: CollectionPreferences
-    ):
-        """Analyze platform preferences from collection."""
-        platform_counts = Counter()
-
-        for game in collection:
-            platform_counts[game.platform] += 1
-
-        preferences.platform_preferences = dict(platform_counts)
-
-    def _analyze_collection_characteristics(
-        self, collection: List[GameEntry], preferences: CollectionPreferences
-    ):
-        """Analyze overall collection characteristics."""
-        if not collection:
-            return
-
-        # Calculate completion rate
-        completed_games = len(
-            [game for game in collection if game.status == GameStatus.COMPLETED]
-        )
-        preferences.completion_rate = completed_games / len(collection)
-
-        # Calculate diversity score based on genre and developer spread
-        genre_diversity = len(
-            set(tag for game in collection for tag in (game.tags or []))
-        )
-        developer_diversity = len(
-            set(getattr(game, "developer", "Unknown") for game in collection)
-        )
-
-        # Normalize diversity scores
-        max_possible_diversity = max(len(collection), 10)  # Reasonable max
-        normalized_genre_diversity = min(genre_diversity / max_possible_diversity, 1.0)
-        normalized_dev_diversity = min(
-            developer_diversity / max_possible_diversity, 1.0
-        )
-
-        preferences.diversity_score = (
-            normalized_genre_diversity + normalized_dev_diversity
-        ) / 2
-
-    def _analyze_temporal_patterns(
-        self, collection: List[GameEntry], preferences: CollectionPreferences
-    ):
-        """Analyze temporal patterns in collection."""
-        # Get recent additions (last 3 months)
-        recent_cutoff = datetime.now() - timedelta(days=90)
-        recent_games = [game for game in collection if game.date_added >= recent_cutoff]
-
-        # Extract preferences from recent games
-        recent_preferences = []
-        for game in recent_games:
-            if game.tags:
-                recent_preferences.extend(game.tags)
-
-        # Get most common recent preferences
-        recent_counter = Counter(recent_preferences)
-        preferences.recent_preferences = [
-            genre for genre, _ in recent_counter.most_common(5)
-        ]
-
     def _calculate_confidence_level(
         self, preferences: CollectionPreferences
     ) -> RecommendationConfidence:
@@ -873,29 +605,9 @@ class CollectionRecommendationEngine:
                 f"✅ Found {len(unique_candidates)} unique candidate games for {recommendation_type.value} recommendations"
             )
 
-            # Limit to reasonable number to avoid overwhelming the system
-            max_candidates = 100
-            if len(unique_candidates) > max_candidates:
-                # Prioritize games from certain categories
-                priority_categories = ["hottest", "highest-rated", "most-wanted"]
-                priority_games = [
-                    g
-                    for g in unique_candidates
-                    if g.get("source_category") in priority_categories
-                ]
-                other_games = [
-                    g
-                    for g in unique_candidates
-                    if g.get("source_category") not in priority_categories
-                ]
-
-                # Take priority games first, then fill with others
-                unique_candidates = (
-                    priority_games[: max_candidates // 2]
-                    + other_games[: max_candidates // 2]
-                )
-
-            return unique_candidates[:max_candidates]
+            # No truncation here: large pools are narrowed by nearest-neighbour
+            # retrieval and scored in one vectorized pass
+            return unique_candidates
 
         except Exception as e:
             logger.error(f"Error getting candidate games: {e}")
@@ -978,243 +690,68 @@ class CollectionRecommendationEngine:
             f"Generating similar recommendations from {len(candidate_games)} candidates"
         )
 
-        # Get favorite genres and their scores
-        favorite_genres = dict(preferences.favorite_genres[:5])  # Top 5 genres
-        high_rated_games = preferences.high_rated_games[:10]  # Top 10 rated games
-
-        for game in candidate_games:
-            try:
-                # Calculate similarity score
-                similarity_score = self._calculate_similarity_score(game, preferences)
-
-                if similarity_score < 0.3:  # Skip games with very low similarity
-                    continue
-
-                # Create recommendation
-                recommendation = self._create_recommendation(
-                    game=game,
-                    recommendation_type=RecommendationType.SIMILAR,
-                    score=similarity_score,
-                    preferences=preferences,
-                    reason_type="similar",
-                )
-
-                if recommendation:
-                    recommendations.append(recommendation)
-
-            except Exception as e:
-                logger.error(
-                    f"Error processing candidate game {game.get('title', 'Unknown')}: {e}"
-                )
-                continue
-
-        # Sort by similarity score and return top recommendations
-        recommendations.sort(key=lambda x: x.final_score, reverse=True)
-        final_recommendations = recommendations[:max_recommendations]
+        encoded = self.batch_scorer.encode_candidates(candidate_games)
+        scores = self.batch_scorer.similarity_scores(encoded, preferences)
+
+        # Skip games with very low similarity, keep the best ones
+        final_recommendations = self._build_ranked_recommendations(
+            candidate_games,
+            scores,
+            scores >= 0.3,
+            RecommendationType.SIMILAR,
+            preferences,
+            "similar",
+            max_recommendations,
+        )
 
         logger.info(
             f"✅ Generated {len(final_recommendations)} similar recommendations"
         )
         return final_recommendations
 
-    def _calculate_similarity_score(
-        self, game: Dict[str, Any], preferences: CollectionPreferences
-    ) -> float:
-        """Calculate similarity score between a candidate game and user preferences."""
-        score = 0.0
-
-        # Genre similarity (40% weight)
-        genre_score = self._calculate_genre_similarity(game, preferences)
-        score += genre_score * 0.4
-
-        # Developer similarity (20% weight)
-        dev_score = self._calculate_developer_similarity(game, preferences)
-        score += dev_score * 0.2
-
-        # Rating compatibility (20% weight)
-        rating_score = self._calculate_rating_compatibility(game, preferences)
-        score += rating_score * 0.2
-
-        # Popularity bonus (10% weight)
-        popularity_score = self._calculate_popularity_score(game)
-        score += popularity_score * 0.1
-
-        # Category bonus (10% weight)
-        category_score = self._calculate_category_score(game)
-        score += category_score * 0.1
-
-        return min(1.0, max(0.0, score))  # Clamp between 0 and 1
-
-    def _calculate_genre_similarity(
-        self, game: Dict[str, Any], preferences: CollectionPreferences
-    ) -> float:
-        """Calculate genre similarity score."""
-        if not preferences.favorite_genres:
-            return 0.5  # Default score if no preferences
-
-        # Get game genres from different sources
-        game_genres = set()
-
-        # From game data
-        if "genres" in game and game["genres"]:
-            if isinstance(game["genres"], list):
-                game_genres.update([g.lower() for g in game["genres"]])
-            elif isinstance(game["genres"], str):
-                game_genres.update(
-                    [g.lower().strip() for g in game["genres"].split(",")]
-                )
-
-        # From title (common keywords)
-        title = game.get("title", "").lower()
-        genre_keywords = {
-            "action": ["action", "fighter", "shooter", "beat"],
-            "adventure": ["adventure", "quest", "journey"],
-            "rpg": ["rpg", "role", "fantasy", "dragon", "quest"],
-            "strategy": ["strategy", "tactical", "civilization", "war"],
-            "puzzle": ["puzzle", "brain", "logic", "tetris"],
-            "platformer": ["platform", "mario", "sonic", "jump"],
-            "indie": ["indie", "pixel", "retro"],
-            "simulation": ["simulation", "sim", "city", "farm"],
-        }
-
-        for genre, keywords in genre_keywords.items():
-            if any(keyword in title for keyword in keywords):
-                game_genres.add(genre)
+    def _build_ranked_recommendations(
+        self,
+        candidate_games: List[Dict[str, Any]],
+        scores: np.ndarray,
+        eligible: np.ndarray,
+        recommendation_type: RecommendationType,
+        preferences: CollectionPreferences,
+        reason_type: str,
+        max_recommendations: int,
+    ) -> List[CollectionRecommendation]:
+        """
+        Create recommendations for the best-scoring eligible candidates only.
 
-        if not game_genres:
-            return 0.3  # Low score for games without identifiable genres
+        Candidates whose recommendation cannot be created are backfilled from
+        the next-best ones, fetching a doubled ranking prefix each time.
+        """
+        recommendations = []
+        fetch = max_recommendations
+        created = 0
 
-        # Calculate match score
-        match_score = 0.0
-        total_preference_weight = sum(score for _, score in preferences.favorite_genres)
+        while len(recommendations) < max_recommendations:
+            ranked = rank_top_indices(scores, eligible, k=fetch)
 
-        for genre, pref_score in preferences.favorite_genres:
-            if genre.lower() in game_genres:
-                normalized_pref = (
-                    pref_score / total_preference_weight
-                    if total_preference_weight > 0
-                    else 0
+            for idx in ranked[created:]:
+                recommendation = self._create_recommendation(
+                    game=candidate_games[idx],
+                    recommendation_type=recommendation_type,
+                    score=float(scores[idx]),
+                    preferences=preferences,
+                    reason_type=reason_type,
                 )
-                match_score += normalized_pref
-
-        return min(1.0, match_score)
-
-    def _calculate_developer_similarity(
-        self, game: Dict[str, Any], preferences: CollectionPreferences
-    ) -> float:
-        """Calculate developer similarity score."""
-        if not preferences.favorite_developers:
-            return 0.5  # Neutral score
-
-        game_title = game.get("title", "").lower()
-
-        # Check for developer patterns in title
-        dev_patterns = {
-            "nintendo": ["mario", "zelda", "metroid", "kirby", "pokemon", "nintendo"],
-            "supergiant": ["hades", "bastion", "transistor", "pyre"],
-            "team cherry": ["hollow knight"],
-            "indie": ["pixel", "retro", "indie", "8-bit", "16-bit"],
-        }
-
-        game_developers = set()
-        for dev, patterns in dev_patterns.items():
-            if any(pattern in game_title for pattern in patterns):
-                game_developers.add(dev)
-
-        # If no specific developer found, assign based on category
-        category = game.get("source_category", "")
-        if "indie" in category:
-            game_developers.add("indie")
-
-        if not game_developers:
-            return 0.5  # Neutral score
-
-        # Calculate match score
-        for dev, pref_score in preferences.favorite_developers:
-            if dev.lower() in [g.lower() for g in game_developers]:
-                return min(1.0, pref_score)
 
-        return 0.3  # Low score for unmatched developers
-
-    def _calculate_rating_compatibility(
-        self, game: Dict[str, Any], preferences: CollectionPreferences
-    ) -> float:
-        """Calculate rating compatibility score."""
-        if preferences.average_rating == 0:
-            return 0.7  # Default score
-
-        # Estimate game quality based on category and title
-        estimated_rating = 7.0  # Default
-
-        category = game.get("source_category", "")
-        title = game.get("title", "").lower()
-
-        # Adjust based on category
-        if "highest-rated" in category:
-            estimated_rating = 8.5
-        elif "hottest" in category or "most-wanted" in category:
-            estimated_rating = 8.0
-        elif "indie" in category:
-            estimated_rating = 7.5
-        elif "recent-releases" in category:
-            estimated_rating = 7.0
-
-        # Adjust based on known high-quality titles
-        quality_indicators = [
-            "award",
-            "goty",
-            "deluxe",
-            "ultimate",
-            "remastered",
-            "definitive",
-            "collection",
-            "trilogy",
-            "chronicles",
-            "legend",
-            "final fantasy",
-            "zelda",
-            "mario",
-            "metroid",
-        ]
-
-        if any(indicator in title for indicator in quality_indicators):
-            estimated_rating += 0.5
-
-        # Calculate compatibility (prefer games close to user's average rating)
-        rating_diff = abs(estimated_rating - preferences.average_rating)
-        compatibility = max(0.0, 1.0 - (rating_diff / 5.0))  # 5-point scale difference
-
-        return compatibility
-
-    def _calculate_popularity_score(self, game: Dict[str, Any]) -> float:
-        """Calculate popularity score based on category."""
-        category = game.get("source_category", "")
-
-        popularity_scores = {
-            "hottest": 1.0,
-            "most-wanted": 0.9,
-            "highest-rated": 0.8,
-            "recent-releases": 0.7,
-            "indie": 0.6,
-            "new-releases": 0.6,
-            "coming-soon": 0.5,
-        }
-
-        return popularity_scores.get(category, 0.5)
-
-    def _calculate_category_score(self, game: Dict[str, Any]) -> float:
-        """Calculate category relevance score."""
-        category = game.get("source_category", "")
+                if recommendation:
+                    recommendations.append(recommendation)
+                    if len(recommendations) == max_recommendations:
+                        break
 
-        # Prefer certain categories for similarity recommendations
-        preferred_categories = ["hottest", "highest-rated", "most-wanted"]
+            if len(ranked) < fetch:
+                break
+            created = len(ranked)
+            fetch *= 2
 
-        if category in preferred_categories:
-            return 0.8
-        elif category in ["recent-releases", "indie"]:
-            return 0.6
-        else:
-            return 0.4
+        return recommendations
 
     def _create_recommendation(
         self,
@@ -1382,21 +919,7 @@ class CollectionRecommendationEngine:
 
         # From title (common keywords)
         title = game.get("title", "").lower()
-        genre_keywords = {
-            "action": ["action", "fighter", "shooter", "beat"],
-            "adventure": ["adventure", "quest", "journey"],
-            "rpg": ["rpg", "role", "fantasy", "dragon", "quest"],
-            "strategy": ["strategy", "tactical", "civilization", "war"],
-            "puzzle": ["puzzle", "brain", "logic", "tetris"],
-            "platformer": ["platform", "mario", "sonic", "jump"],
-            "indie": ["indie", "pixel", "retro"],
-            "simulation": ["simulation", "sim", "city", "farm"],
-            "racing": ["racing", "kart", "speed", "motor"],
-            "sports": ["sports", "football", "soccer", "tennis"],
-            "fighting": ["fighting", "fighter", "combat", "brawl"],
-        }
-
-        for genre, keywords in genre_keywords.items():
+        for genre, keywords in EXTENDED_GENRE_KEYWORDS.items():
             if any(keyword in title for keyword in keywords):
                 game_genres.add(genre)
 
@@ -1419,12 +942,6 @@ class CollectionRecommendationEngine:
             f"Generating discovery recommendations from {len(candidate_games)} candidates"
         )
 
-        # Get underrepresented genres and avoided genres
-        underrepresented = set(
-            g.lower() for g in preferences.underrepresented_genres[:5]
-        )
-        favorite_genres = set(g[0].lower() for g in preferences.favorite_genres[:3])
-
         # Focus on recent releases and curated picks for discovery
         discovery_categories = [
             "recently-released",
@@ -1433,147 +950,30 @@ class CollectionRecommendationEngine:
             "trending",
         ]
 
-        for game in candidate_games:
-            try:
-                # Calculate discovery score
-                discovery_score = self._calculate_discovery_score(
-                    game, preferences, underrepresented, favorite_genres
-                )
+        encoded = self.batch_scorer.encode_candidates(candidate_games)
+        scores = self.batch_scorer.discovery_scores(encoded, preferences)
 
-                if discovery_score < 0.25:  # Skip games with very low discovery value
-                    continue
+        # Skip games with very low discovery value
+        eligible = scores >= 0.25
 
-                # Boost games from discovery-focused categories
-                category = game.get("source_category", "")
-                if category in discovery_categories:
-                    discovery_score += 0.15
+        # Boost games from discovery-focused categories
+        scores = scores + np.isin(encoded.categories, discovery_categories) * 0.15
 
-                # Create recommendation
-                recommendation = self._create_recommendation(
-                    game=game,
-                    recommendation_type=RecommendationType.DISCOVERY,
-                    score=discovery_score,
-                    preferences=preferences,
-                    reason_type="discovery",
-                )
-
-                if recommendation:
-                    recommendations.append(recommendation)
-
-            except Exception as e:
-                logger.error(
-                    f"Error processing discovery candidate {game.get('title', 'Unknown')}: {e}"
-                )
-                continue
-
-        # Sort by discovery score and return top recommendations
-        recommendations.sort(key=lambda x: x.final_score, reverse=True)
-        final_recommendations = recommendations[:max_recommendations]
+        final_recommendations = self._build_ranked_recommendations(
+            candidate_games,
+            scores,
+            eligible,
+            RecommendationType.DISCOVERY,
+            preferences,
+            "discovery",
+            max_recommendations,
+        )
 
         logger.info(
             f"✅ Generated {len(final_recommendations)} discovery recommendations"
         )
         return final_recommendations
 
-    def _calculate_discovery_score(
-        self,
-        game: Dict[str, Any],
-        preferences: CollectionPreferences,
-        underrepresented: set,
-        favorite_genres: set,
-    ) -> float:
-        """Calculate discovery score for exploring new genres/types."""
-        score = 0.0
-
-        # Get game genres
-        game_genres = self._extract_game_genres(game)
-
-        # Bonus for underrepresented genres (40% weight)
-        underrep_bonus = 0.0
-        for genre in game_genres:
-            if genre.lower() in underrepresented:
-                underrep_bonus += 0.3
-        score += min(underrep_bonus, 0.4) * 0.4
-
-        # Penalty for over-represented genres (reduce familiar choices)
-        familiar_penalty = 0.0
-        for genre in game_genres:
-            if genre.lower() in favorite_genres:
-                familiar_penalty += 0.2
-        score -= min(familiar_penalty, 0.3) * 0.2
-
-        # Indie/innovation bonus (30% weight)
-        innovation_score = self._calculate_innovation_score(game)
-        score += innovation_score * 0.3
-
-        # Quality baseline (20% weight) - still want good games
-        quality_score = self._calculate_rating_compatibility(game, preferences)
-        score += quality_score * 0.2
-
-        # Diversity bonus (10% weight)
-        diversity_score = self._calculate_diversity_bonus(game, preferences)
-        score += diversity_score * 0.1
-
-        return min(1.0, max(0.0, score))
-
-    def _calculate_innovation_score(self, game: Dict[str, Any]) -> float:
-        """Calculate innovation/novelty score."""
-        title = game.get("title", "").lower()
-        category = game.get("source_category", "")
-
-        # Staff picks and trending games often showcase innovation
-        if "staff-picks" in category:
-            return 0.8
-        elif "recently-released" in category or "upcoming-releases" in category:
-            return 0.7
-        elif "trending" in category:
-            return 0.6
-
-        # Check for innovative keywords in title
-        innovation_keywords = [
-            "vr",
-            "ar",
-            "roguelike",
-            "procedural",
-            "experimental",
-            "unique",
-            "innovative",
-            "creative",
-            "artistic",
-            "narrative",
-            "indie",
-            "pixel",
-            "retro",  # indie-style keywords
-        ]
-
-        if any(keyword in title for keyword in innovation_keywords):
-            return 0.7
-
-        return 0.5
-
-    def _calculate_diversity_bonus(
-        self, game: Dict[str, Any], preferences: CollectionPreferences
-    ) -> float:
-        """Calculate bonus for adding diversity to collection."""
-        # Games that are different from user's typical choices get bonus
-        game_genres = self._extract_game_genres(game)
-
-        # If no genres identified, give neutral score
-        if not game_genres:
-            return 0.5
-
-        # Calculate how different this is from collection
-        familiar_count = 0
-        favorite_genres = set(g[0].lower() for g in preferences.favorite_genres)
-
-        for genre in game_genres:
-            if genre.lower() in favorite_genres:
-                familiar_count += 1
-
-        # More unfamiliar = higher diversity score
-        unfamiliarity = 1.0 - (familiar_count / max(len(game_genres), 1))
-        return unfamiliarity
-
     def _generate_developer_recommendations(
         self,
         preferences: CollectionPreferences,
@@ -1595,124 +995,25 @@ class CollectionRecommendationEngine:
             f"Generating developer recommendations from {len(candidate_games)} candidates"
         )
 
-        # Get favorite developers
-        favorite_devs = dict(preferences.favorite_developers[:3])  # Top 3 developers
-
-        for game in candidate_games:
-            try:
-                # Calculate developer match score
-                dev_score = self._calculate_developer_match_score(
-                    game, preferences, favorite_devs
-                )
-
-                if dev_score < 0.3:  # Skip games with low developer relevance
-                    continue
-
-                # Create recommendation
-                recommendation = self._create_recommendation(
-                    game=game,
-                    recommendation_type=RecommendationType.DEVELOPER,
-                    score=dev_score,
-                    preferences=preferences,
-                    reason_type="developer",
-                )
-
-                if recommendation:
-                    recommendations.append(recommendation)
-
-            except Exception as e:
-                logger.error(
-                    f"Error processing developer candidate {game.get('title', 'Unknown')}: {e}"
-                )
-                continue
-
-        # Sort by developer score and return top recommendations
-        recommendations.sort(key=lambda x: x.final_score, reverse=True)
-        final_recommendations = recommendations[:max_recommendations]
+        encoded = self.batch_scorer.encode_candidates(candidate_games)
+        scores = self.batch_scorer.developer_scores(encoded, preferences)
+
+        # Skip games with low developer relevance
+        final_recommendations = self._build_ranked_recommendations(
+            candidate_games,
+            scores,
+            scores >= 0.3,
+            RecommendationType.DEVELOPER,
+            preferences,
+            "developer",
+            max_recommendations,
+        )
 
         logger.info(
             f"✅ Generated {len(final_recommendations)} developer recommendations"
         )
         return final_recommendations
 
-    def _calculate_developer_match_score(
-        self,
-        game: Dict[str, Any],
-        preferences: CollectionPreferences,
-        favorite_devs: dict,
-    ) -> float:
-        """Calculate developer match score."""
-        score = 0.0
-        game_title = game.get("title", "").lower()
-        category = game.get("source_category", "")
-
-        # Check for developer patterns in title
-        dev_patterns = {
-            "nintendo": [
-                "mario",
-                "zelda",
-                "metroid",
-                "kirby",
-                "pokemon",
-                "nintendo",
-                "splatoon",
-                "pikmin",
-            ],
-            "supergiant games": ["hades", "bastion", "transistor", "pyre"],
-            "team cherry": ["hollow knight"],
-            "indie": ["pixel", "retro", "indie", "8-bit", "16-bit"],
-            "nintendo platform": [
-                "mario",
-                "zelda",
-                "metroid",
-                "kirby",
-                "pokemon",
-                "splatoon",
-            ],
-        }
-
-        game_developers = set()
-        for dev, patterns in dev_patterns.items():
-            if any(pattern in game_title for pattern in patterns):
-                game_developers.add(dev)
-
-        # Category-based developer assignment
-        if "staff-picks" in category:
-            game_developers.add("curated developers")
-            game_developers.add("staff favorites")
-
-        # Check for indie keywords in title for indie developer classification
-        if any(
-            keyword in game_title
-            for keyword in ["indie", "pixel", "retro", "8-bit", "16-bit"]
-        ):
-            game_developers.add("indie")
-            game_developers.add("independent games")
-
-        # Check for matches with favorite developers
-        developer_match_score = 0.0
-        for fav_dev, pref_score in favorite_devs.items():
-            fav_dev_lower = fav_dev.lower()
-            for game_dev in game_developers:
-                if (
-                    fav_dev_lower in game_dev.lower()
-                    or game_dev.lower() in fav_dev_lower
-                ):
-                    developer_match_score = max(developer_match_score, pref_score)
-
-        # Developer match is primary factor (70% weight)
-        score += developer_match_score * 0.7
-
-        # Quality compatibility (20% weight)
-        quality_score = self._calculate_rating_compatibility(game, preferences)
-        score += quality_score * 0.2
-
-        # Popularity bonus (10% weight)
-        popularity_score = self._calculate_popularity_score(game)
-        score += popularity_score * 0.1
-
-        return min(1.0, max(0.0, score))
-
     def _generate_complementary_recommendations(
         self,
         preferences: CollectionPreferences,
@@ -1736,37 +1037,21 @@ class CollectionRecommendationEngine:
         collection_gaps = self._identify_collection_gaps(preferences)
         represented_genres = set(g[0].lower() for g in preferences.favorite_genres)
 
-        for game in candidate_games:
-            try:
-                # Calculate complementary score
-                complement_score = self._calculate_complementary_score(
-                    game, preferences, collection_gaps, represented_genres
-                )
-
-                if complement_score < 0.25:  # Skip games that don't fill gaps
-                    continue
-
-                # Create recommendation
-                recommendation = self._create_recommendation(
-                    game=game,
-                    recommendation_type=RecommendationType.COMPLEMENTARY,
-                    score=complement_score,
-                    preferences=preferences,
-                    reason_type="complementary",
-                )
-
-                if recommendation:
-                    recommendations.append(recommendation)
-
-            except Exception as e:
-                logger.error(
-                    f"Error processing complementary candidate {game.get('title', 'Unknown')}: {e}"
-                )
-                continue
+        encoded = self.batch_scorer.encode_candidates(candidate_games)
+        scores = self.batch_scorer.complementary_scores(
+            encoded, preferences, collection_gaps, represented_genres
+        )
 
-        # Sort by complementary score and return top recommendations
-        recommendations.sort(key=lambda x: x.final_score, reverse=True)
-        final_recommendations = recommendations[:max_recommendations]
+        # Skip games that don't fill gaps
+        final_recommendations = self._build_ranked_recommendations(
+            candidate_games,
+            scores,
+            scores >= 0.25,
+            RecommendationType.COMPLEMENTARY,
+            preferences,
+            "complementary",
+            max_recommendations,
+        )
 
         logger.info(
             f"✅ Generated {len(final_recommendations)} complementary recommendations"
@@ -1813,43 +1098,6 @@ class CollectionRecommendationEngine:
 
         return gaps
 
-    def _calculate_complementary_score(
-        self,
-        game: Dict[str, Any],
-        preferences: CollectionPreferences,
-        collection_gaps: dict,
-        represented_genres: set,
-    ) -> float:
-        """Calculate how well a game complements the collection."""
-        score = 0.0
-        game_genres = self._extract_game_genres(game)
-
-        # Gap-filling bonus (50% weight)
-        gap_score = 0.0
-        missing_genres = set(collection_gaps.get("missing_genres", []))
-
-        for genre in game_genres:
-            if genre.lower() in missing_genres:
-                gap_score += 0.4  # Strong bonus for filling genre gaps
-            elif genre.lower() not in represented_genres:
-                gap_score += 0.2  # Moderate bonus for new genres
-
-        score += min(gap_score, 0.5) * 0.5
-
-        # Quality assurance (25% weight) - still want good games
-        quality_score = self._calculate_rating_compatibility(game, preferences)
-        score += quality_score * 0.25
-
-        # Diversity bonus (15% weight)
-        diversity_bonus = self._calculate_diversity_bonus(game, preferences)
-        score += diversity_bonus * 0.15
-
-        # Popularity factor (10% weight) - some recognition is good
-        popularity_score = self._calculate_popularity_score(game)
-        score += popularity_score * 0.1
-
-        return min(1.0, max(0.0, score))
-
     def _apply_ml_adjustments(
         self, recommendations: List[CollectionRecommendation], user_id: str
     ) -> List[CollectionRecommendation]:
@@ -15,6 +15,7 @@ Features:
 - Collection-aware recommendations
 - Multi-user collection management
 - Integration with Smart User Profiler for enhanced personalization
+- Incrementally maintained per-user preference vectors
 
 Author: AutoGen DekuDeals Team
 Version: 1.0.0
@@ -34,6 +35,7 @@ from urllib.parse import quote
 
 # Import Multi-User system
 from .user_management import UserManager
+from .preference_vectors import PreferenceVector, PreferenceVectorStore
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -141,6 +143,11 @@ class GameCollectionManager:
         self.user_collections: Dict[str, Dict[str, GameEntry]] = {}
         self.collection_stats: Dict[str, CollectionStats] = {}
 
+        # Precomputed preference vectors, updated on every collection change
+        self.preference_store = PreferenceVectorStore(
+            str(self.collections_dir / "preference_vectors")
+        )
+
         # Load existing collections
         self._load_all_collections()
 
@@ -199,6 +206,9 @@ class GameCollectionManager:
                 else:
                     self.collection_stats[user_id] = CollectionStats()
 
+                # Make sure the preference vector matches the stored collection
+                self.preference_store.ensure(user_id, games)
+
                 logger.info(
                     f"✅ Loaded collection for user {user_id}: {len(games)} games"
                 )
@@ -333,6 +343,7 @@ class GameCollectionManager:
 
         # Add to collection
         self.user_collections[user_id][game_id] = game_entry
+        self.preference_store.record_upsert(user_id, game_id, game_entry)
 
         # Save collection
         self._save_user_collection(user_id)
@@ -362,6 +373,7 @@ class GameCollectionManager:
                 setattr(game_entry, field, value)
 
         game_entry.last_updated = datetime.now()
+        self.preference_store.record_upsert(user_id, game_id, game_entry)
 
         # Save collection
         self._save_user_collection(user_id)
@@ -382,6 +394,7 @@ class GameCollectionManager:
             return False
 
         del self.user_collections[user_id][game_id]
+        self.preference_store.record_remove(user_id, game_id)
 
         # Save collection
         self._save_user_collection(user_id)
@@ -418,6 +431,16 @@ class GameCollectionManager:
 
         return list(games)
 
+    def get_preference_vector(self, user_id: Optional[str] = None) -> PreferenceVector:
+        """Get the precomputed preference vector for a user (current by default)."""
+        user_id = user_id or self._get_current_user_id()
+        vector = self.preference_store.get(user_id)
+        if vector is None:
+            vector = self.preference_store.rebuild(
+                user_id, self.user_collections.get(user_id, {})
+            )
+        return vector
+
     def get_collection_stats(self) -> CollectionStats:
         """Get current user's collection statistics."""
         user_id = self._get_current_user_id()
@@ -490,6 +513,7 @@ class GameCollectionManager:
                 time.sleep(0.1)
 
             # Save collection
+            self.preference_store.rebuild(user_id, self.user_collections[user_id])
             self._save_user_collection(user_id)
 
             message = f"Successfully imported {imported_count} games from Steam"
@@ -572,6 +596,7 @@ class GameCollectionManager:
                     imported_count += 1
 
             # Save collection
+            self.preference_store.rebuild(user_id, self.user_collections[user_id])
             self._save_user_collection(user_id)
 
             message = f"Successfully imported {imported_count} games from CSV"
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+"""
+Latency Sketch for AutoGen DekuDeals
+====================================
+
+Streaming percentile sketch for execution times recorded by the
+``PerformanceMonitor``.
+
+``LatencySketch`` is a log-bucketed histogram (the DDSketch / HDR histogram
+idea): a value ``v`` is counted in bucket ``ceil(log(v) / log(gamma))``, so
+every quantile is returned with a bounded *relative* error (1% by default)
+whatever the distribution. Sketches are small (a few hundred buckets cover
+microseconds to hours), mergeable - per-hour sketches are merged for any
+time range - and serialisable to JSON.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+
+class LatencySketch:
+    """
+    Szkic percentyli czasu wykonania ze stałym błędem względnym.
+
+    Values at or below ``min_value`` (sub-microsecond timings, zeros) share a
+    single bucket reported as ``0.0``.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-6):
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1):
+        if value <= self.min_value:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += count
+
+    def merge(self, other: "LatencySketch") -> "LatencySketch":
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+
+    def _value(self, key: int) -> float:
+        # Midpoint (in relative terms) of (gamma^(key-1), gamma^key]
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Wartość kwantyla ``q`` (0-1), ``None`` dla pustego szkicu."""
+        if self.count == 0:
+            return None
+        # Nearest rank, as ``sorted(values)[int(n * q)]``
+        rank = min(int(self.count * q), self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.buckets))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "min_value": self.min_value,
+            "zero_count": self.zero_count,
+            "buckets": {str(key): count for key, count in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencySketch":
+        sketch = cls(data["relative_accuracy"], data["min_value"])
+        sketch.buckets = {int(key): count for key, count in data["buckets"].items()}
+        sketch.zero_count = data["zero_count"]
+        sketch.count = sketch.zero_count + sum(sketch.buckets.values())
+        return sketch
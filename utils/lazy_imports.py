@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+"""
+Lazy Imports for AutoGen DekuDeals
+==================================
+
+Deferred module loading for fast CLI startup.
+
+``enhanced_cli.py`` reaches nearly every subsystem through ``agent_tools``
+and ``conversation_manager`` (AutoGen, OpenAI, scraping, ML). Most commands
+need only a few of them and ``--help`` needs none, so entry points hold a
+``LazyModule`` instead and the module is imported on first attribute access:
+
+    agent_tools = LazyModule("agent_tools")
+    agent_tools.search_and_scrape_game("Celeste")  # imports agent_tools here
+
+Code that must run right after the import (e.g. installing a cached wrapper
+over a tool) is registered with ``when_loaded``.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import threading
+from types import ModuleType
+from typing import Any, Callable, List, Optional
+
+
+class LazyModule:
+    """
+    Moduł importowany przy pierwszym użyciu atrybutu.
+
+    Usage:
+        conversation_manager = LazyModule("conversation_manager")
+        conversation_manager.loaded  # False
+        conversation_manager.GameAnalysisManager()  # import happens here
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Pełna nazwa modułu, np. "utils.price_prediction_ml"
+        """
+        self._name = name
+        self._module: Optional[ModuleType] = None
+        self._callbacks: List[Callable[[ModuleType], Any]] = []
+        self._lock = threading.RLock()
+
+    @property
+    def loaded(self) -> bool:
+        """Czy moduł został już zaimportowany przez ten obiekt."""
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        """Importuje moduł (raz) i uruchamia zarejestrowane callbacki."""
+        module = self._module
+        if module is not None:
+            return module
+        with self._lock:
+            if self._module is None:
+                # __import__ (not importlib) keeps deferred imports visible
+                # in ``python -X importtime`` profiles
+                module = __import__(self._name, fromlist=["__name__"])
+                callbacks, self._callbacks = self._callbacks, []
+                for callback in callbacks:
+                    callback(module)
+                self._module = module
+            return self._module
+
+    def when_loaded(self, callback: Callable[[ModuleType], Any]):
+        """Uruchamia callback po imporcie modułu (od razu, gdy już załadowany)."""
+        with self._lock:
+            if self._module is None:
+                self._callbacks.append(callback)
+                return
+        callback(self._module)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+
+"""
+LLM Completion Cache for AutoGen DekuDeals
+==========================================
+
+Disk-backed, content-addressed cache of chat completions for agent turns.
+
+Repeated analyses of the same game resend near-identical prompts and tool
+outputs; agents running at (near) zero temperature answer them the same way.
+The cache implements the ``autogen.cache.AbstractCache`` protocol and is
+attached to an agent as its ``client_cache`` (``llm_config`` itself rejects
+extra keys), so ``OpenAIWrapper.create`` looks a completion up before
+calling the API.
+
+Keys are SHA-256 hashes of the request parameters (model, sampling config,
+tools) and a normalized message history:
+- tool call ids are renumbered by position (the API returns random ids)
+- timestamps inside message content are masked
+- trailing whitespace is dropped
+
+Entries expire after ``ttl_seconds``; the least recently used entries are
+evicted above ``max_entries`` / ``max_bytes``. Hit rate and the tokens and
+cost saved are reported by ``get_statistics``.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from .sqlite_pool import SQLiteConnectionPool
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS llm_completions (
+        key TEXT PRIMARY KEY,
+        model TEXT,
+        created_at REAL NOT NULL,
+        last_accessed REAL NOT NULL,
+        hits INTEGER NOT NULL DEFAULT 0,
+        size INTEGER NOT NULL,
+        value BLOB NOT NULL
+    ) WITHOUT ROWID;
+
+    CREATE INDEX IF NOT EXISTS idx_llm_completions_created
+        ON llm_completions(created_at);
+    CREATE INDEX IF NOT EXISTS idx_llm_completions_accessed
+        ON llm_completions(last_accessed);
+"""
+
+SELECT_SQL = "SELECT created_at, value FROM llm_completions WHERE key = ?"
+
+TOUCH_SQL = """
+    UPDATE llm_completions SET last_accessed = ?, hits = hits + 1 WHERE key = ?
+"""
+
+UPSERT_SQL = """
+    INSERT INTO llm_completions (key, model, created_at, last_accessed, size, value)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        created_at = excluded.created_at,
+        last_accessed = excluded.last_accessed,
+        size = excluded.size,
+        value = excluded.value
+"""
+
+DELETE_EXPIRED_SQL = "DELETE FROM llm_completions WHERE created_at < ?"
+
+# Least recently used entries beyond the entry limit
+EVICT_ENTRIES_SQL = """
+    DELETE FROM llm_completions WHERE key IN (
+        SELECT key FROM llm_completions
+        ORDER BY last_accessed DESC, created_at DESC LIMIT -1 OFFSET ?
+    )
+"""
+
+# Least recently used entries beyond the size limit
+EVICT_BYTES_SQL = """
+    DELETE FROM llm_completions WHERE key IN (
+        SELECT key FROM (
+            SELECT key, SUM(size) OVER (
+                ORDER BY last_accessed DESC, created_at DESC
+            ) AS running_size
+            FROM llm_completions
+        ) WHERE running_size > ?
+    )
+"""
+
+STATS_SQL = """
+    SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0)
+    FROM llm_completions
+"""
+
+# ISO 8601 / "YYYY-MM-DD HH:MM:SS" timestamps in tool outputs
+TIMESTAMP_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?"
+)
+TRAILING_WHITESPACE = re.compile(r"[ \t]+(?=\n|$)")
+
+
+def _normalize_content(content: Any) -> Any:
+    if isinstance(content, str):
+        content = TIMESTAMP_PATTERN.sub("<timestamp>", content)
+        return TRAILING_WHITESPACE.sub("", content).strip()
+    if isinstance(content, list):
+        return [_normalize_content(part) for part in content]
+    if isinstance(content, dict):
+        return {key: _normalize_content(value) for key, value in content.items()}
+    return content
+
+
+def normalize_messages(messages: Iterable[Dict[str, Any]]) -> list:
+    """
+    Normalizuje historię wiadomości do postaci niezależnej od przebiegu.
+
+    Tool call ids are replaced by their position in the conversation and
+    timestamps in content are masked; empty fields are dropped.
+    """
+    call_ids: Dict[str, str] = {}
+
+    def call_id(original: Any) -> str:
+        return call_ids.setdefault(str(original), f"call_{len(call_ids)}")
+
+    normalized = []
+    for message in messages:
+        item = {
+            key: value
+            for key, value in message.items()
+            if value not in (None, "", [], {})
+        }
+        if "content" in item:
+            item["content"] = _normalize_content(item["content"])
+        if "tool_calls" in item:
+            item["tool_calls"] = [
+                {**call, "id": call_id(call.get("id"))} for call in item["tool_calls"]
+            ]
+        if "tool_call_id" in item:
+            item["tool_call_id"] = call_id(item["tool_call_id"])
+        if "tool_responses" in item:
+            item["tool_responses"] = [
+                {
+                    **response,
+                    "tool_call_id": call_id(response.get("tool_call_id")),
+                    "content": _normalize_content(response.get("content")),
+                }
+                for response in item["tool_responses"]
+            ]
+        normalized.append(item)
+    return normalized
+
+
+def completion_key(params: Dict[str, Any]) -> str:
+    """Klucz cache: hash modelu, konfiguracji i znormalizowanych wiadomości."""
+    request = {key: value for key, value in params.items() if key != "messages"}
+    request["messages"] = normalize_messages(params.get("messages") or [])
+    payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCompletionCache:
+    """
+    Cache odpowiedzi LLM (protokół ``autogen.cache.AbstractCache``).
+
+    Usage:
+        cache = LLMCompletionCache("cache/llm_completions.db")
+        agent.client_cache = cache
+        ...
+        cache.get_statistics()["hit_rate"]
+    """
+
+    def __init__(
+        self,
+        db_path: str = "cache/llm_completions.db",
+        ttl_seconds: int = 24 * 3600,
+        max_entries: int = 5000,
+        max_bytes: int = 50 * 1024 * 1024,
+    ):
+        """
+        Args:
+            db_path: Plik bazy SQLite z odpowiedziami
+            ttl_seconds: Czas życia wpisu (0 = bez wygasania)
+            max_entries: Maksymalna liczba wpisów
+            max_bytes: Maksymalny łączny rozmiar odpowiedzi
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._pool: Optional[SQLiteConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.reset_statistics()
+
+    def _connection_pool(self) -> SQLiteConnectionPool:
+        """Otwiera bazę przy pierwszym użyciu (import agentów nie tworzy pliku)."""
+        with self._pool_lock:
+            if self._pool is None:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                pool = SQLiteConnectionPool(self.db_path)
+                pool.connection().executescript(SCHEMA_SQL)
+                self._pool = pool
+            return self._pool
+
+    def _count(self, name: str, amount: float = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    # AbstractCache protocol
+
+    def get(self, key: Any, default: Optional[Any] = None) -> Optional[Any]:
+        """Zwraca zapisaną odpowiedź dla parametrów zapytania."""
+        digest = key if isinstance(key, str) else completion_key(key)
+        pool = self._connection_pool()
+        now = time.time()
+
+        with pool.read() as conn:
+            row = conn.execute(SELECT_SQL, (digest,)).fetchone()
+
+        if row is None:
+            self._count("misses")
+            return default
+        if self._is_expired(row[0], now):
+            with pool.write() as conn:
+                conn.execute("DELETE FROM llm_completions WHERE key = ?", (digest,))
+            self._count("misses")
+            self._count("expired")
+            return default
+
+        try:
+            value = pickle.loads(row[1])
+        except Exception as e:
+            logger.warning(f"⚠️ Unreadable cached completion dropped: {e}")
+            with pool.write() as conn:
+                conn.execute("DELETE FROM llm_completions WHERE key = ?", (digest,))
+            self._count("misses")
+            return default
+
+        with pool.write() as conn:
+            conn.execute(TOUCH_SQL, (now, digest))
+        usage = getattr(value, "usage", None)
+        self._count("hits")
+        self._count("tokens_saved", getattr(usage, "total_tokens", 0) or 0)
+        self._count("cost_saved", getattr(value, "cost", 0.0) or 0.0)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Zapisuje odpowiedź i egzekwuje limity TTL i rozmiaru."""
+        digest = key if isinstance(key, str) else completion_key(key)
+        model = None if isinstance(key, str) else key.get("model")
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"⚠️ Completion not cached (not serializable): {e}")
+            return
+
+        now = time.time()
+        with self._connection_pool().write() as conn:
+            conn.execute(UPSERT_SQL, (digest, model, now, now, len(blob), blob))
+            if self.ttl_seconds > 0:
+                conn.execute(DELETE_EXPIRED_SQL, (now - self.ttl_seconds,))
+            evicted = conn.execute(EVICT_ENTRIES_SQL, (self.max_entries,)).rowcount
+            evicted += conn.execute(EVICT_BYTES_SQL, (self.max_bytes,)).rowcount
+        self._count("stores")
+        self._count("evictions", evicted)
+
+    def close(self) -> None:
+        """Zamyka połączenia z bazą."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+
+    def __enter__(self) -> "LLMCompletionCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # OpenAIWrapper enters the cache on every call; the cache stays open
+        return None
+
+    # Maintenance and metrics
+
+    def clear(self):
+        """Usuwa wszystkie wpisy."""
+        with self._connection_pool().write() as conn:
+            conn.execute("DELETE FROM llm_completions")
+
+    def reset_statistics(self):
+        """Zeruje liczniki trafień."""
+        with self._stats_lock:
+            self._stats = {
+                "hits": 0,
+                "misses": 0,
+                "expired": 0,
+                "stores": 0,
+                "evictions": 0,
+                "tokens_saved": 0,
+                "cost_saved": 0.0,
+            }
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statystyki cache (trafienia, zaoszczędzone tokeny, rozmiar)."""
+        with self._connection_pool().read() as conn:
+            entries, size, stored_hits = conn.execute(STATS_SQL).fetchone()
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            **stats,
+            "cost_saved": round(stats["cost_saved"], 6),
+            "lookups": lookups,
+            "hit_rate": round(stats["hits"] / lookups * 100, 2) if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+            "lifetime_hits": stored_hits,
+            "ttl_seconds": self.ttl_seconds,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+
+_completion_cache: Optional[LLMCompletionCache] = None
+_completion_cache_lock = threading.Lock()
+
+
+def get_llm_completion_cache() -> LLMCompletionCache:
+    """Globalna instancja cache skonfigurowana w ``config/llm_config.py``."""
+    global _completion_cache
+    with _completion_cache_lock:
+        if _completion_cache is None:
+            from config.llm_config import get_completion_cache_config
+
+            config = get_completion_cache_config()
+            _completion_cache = LLMCompletionCache(
+                db_path=config["db_path"],
+                ttl_seconds=config["ttl_seconds"],
+                max_entries=config["max_entries"],
+                max_bytes=config["max_bytes"],
+            )
+        return _completion_cache
+
+
+def attach_completion_cache(
+    agents: Iterable[Any], cache: Optional[LLMCompletionCache] = None
+) -> Dict[str, bool]:
+    """
+    Podłącza cache do agentów, dla których jest włączony w konfiguracji.
+
+    Returns:
+        Dict[str, bool]: Nazwa agenta → czy cache jest podłączony
+    """
+    from config.llm_config import get_completion_cache_config
+
+    enabled_agents = get_completion_cache_config()["agents"]
+    attached = {}
+    for agent in agents:
+        enabled = bool(enabled_agents.get(agent.name, False))
+        if enabled:
+            agent.client_cache = cache or get_llm_completion_cache()
+        attached[agent.name] = enabled
+    return attached
@@ -1,23 +1,36 @@
 # ===================================================================
 # 🎮 AutoGen DekuDeals - Performance Monitoring (APM)
 # Advanced Application Performance Monitoring system
+#
+# Recording is cheap: a measurement is appended to a buffer owned by the
+# calling thread (no lock) and tagged with the last resource sample. A
+# background thread samples memory/CPU on a fixed cadence, drains the thread
+# buffers into per-function hourly statistics (latency sketches for
+# percentiles) and a fixed-size ring of recent metrics, refreshes profiles
+# and alerts, and persists everything periodically with atomic writes.
 # ===================================================================
 
+import atexit
+import math
+import os
 import time
 import threading
 import functools
-import traceback
 import psutil
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable, Union
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, List, Optional, Any, Callable
+from dataclasses import dataclass, field
 from enum import Enum
-import statistics
 import json
 from pathlib import Path
 import logging
 from contextlib import contextmanager
 
+from utils.latency_sketch import LatencySketch
+from utils.tracing import get_tracer
+from utils.usage_aggregates import HOUR_SECONDS, hour_start
+
 # ===================================================================
 # Performance Data Models
 # ===================================================================
@@ -83,6 +96,90 @@ class PerformanceAlert:
     resolved: bool
 
 
+@dataclass
+class FunctionStats:
+    """Aggregated measurements of a function (one hour or a merged range)"""
+
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    min_time: float = math.inf
+    max_time: float = 0.0
+    total_memory: float = 0.0
+    max_memory: float = 0.0
+    total_cpu: float = 0.0
+    latency: LatencySketch = field(default_factory=LatencySketch)
+
+    def add(self, metric: PerformanceMetric):
+        execution_time = metric.execution_time
+        self.calls += 1
+        if not metric.success:
+            self.errors += 1
+        self.total_time += execution_time
+        self.min_time = min(self.min_time, execution_time)
+        self.max_time = max(self.max_time, execution_time)
+        self.total_memory += metric.memory_usage_mb
+        self.max_memory = max(self.max_memory, metric.memory_usage_mb)
+        self.total_cpu += metric.cpu_usage_percent
+        self.latency.add(execution_time)
+
+    def merge(self, other: "FunctionStats") -> "FunctionStats":
+        self.calls += other.calls
+        self.errors += other.errors
+        self.total_time += other.total_time
+        self.min_time = min(self.min_time, other.min_time)
+        self.max_time = max(self.max_time, other.max_time)
+        self.total_memory += other.total_memory
+        self.max_memory = max(self.max_memory, other.max_memory)
+        self.total_cpu += other.total_cpu
+        self.latency.merge(other.latency)
+        return self
+
+    def percentile(self, q: float) -> float:
+        """Percentyl czasu wykonania (ze szkicu, przycięty do min/max)"""
+        value = self.latency.quantile(q)
+        if value is None:
+            return 0.0
+        return min(max(value, self.min_time), self.max_time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_time": self.total_time,
+            "min_time": self.min_time if self.calls else None,
+            "max_time": self.max_time,
+            "total_memory": self.total_memory,
+            "max_memory": self.max_memory,
+            "total_cpu": self.total_cpu,
+            "latency": self.latency.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FunctionStats":
+        return cls(
+            calls=data["calls"],
+            errors=data["errors"],
+            total_time=data["total_time"],
+            min_time=(data["min_time"] if data["min_time"] is not None else math.inf),
+            max_time=data["max_time"],
+            total_memory=data["total_memory"],
+            max_memory=data["max_memory"],
+            total_cpu=data["total_cpu"],
+            latency=LatencySketch.from_dict(data["latency"]),
+        )
+
+
+class _ThreadBuffer:
+    """Pending metrics of one thread; only that thread appends to it"""
+
+    __slots__ = ("thread", "metrics")
+
+    def __init__(self):
+        self.thread = threading.current_thread()
+        self.metrics: Deque[PerformanceMetric] = deque()
+
+
 # ===================================================================
 # Performance Monitoring System
 # ===================================================================
@@ -99,9 +196,21 @@ class PerformanceMonitor:
     - Performance alerts and thresholds
     - Bottleneck identification
     - Historical performance data
+
+    ``record_performance`` only appends to a per-thread buffer; statistics,
+    profiles and alerts are updated by a background thread (or by ``flush``,
+    which every query calls first). Summaries merge per-function hourly
+    statistics instead of scanning metrics.
     """
 
-    def __init__(self, data_dir: str = "performance_data"):
+    def __init__(
+        self,
+        data_dir: str = "performance_data",
+        flush_interval: float = 0.5,
+        sample_interval: float = 1.0,
+        save_interval: float = 30.0,
+        retention_days: int = 7,
+    ):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
 
@@ -109,14 +218,15 @@ class PerformanceMonitor:
         self.metrics_file = self.data_dir / "performance_metrics.json"
         self.profiles_file = self.data_dir / "performance_profiles.json"
         self.alerts_file = self.data_dir / "performance_alerts.json"
-
-        # In-memory storage
-        self.metrics: List[PerformanceMetric] = []
-        self.profiles: Dict[str, PerformanceProfile] = {}
-        self.alerts: List[PerformanceAlert] = []
+        self.stats_file = self.data_dir / "performance_stats.json"
 
         # Configuration
         self.max_metrics_in_memory = 10000
+        self.thread_buffer_size = 10000
+        self.flush_interval = flush_interval
+        self.sample_interval = sample_interval
+        self.save_interval = save_interval
+        self.retention_days = retention_days
         self.alert_thresholds = {
             "execution_time": 10.0,  # seconds
             "memory_usage": 500.0,  # MB
@@ -124,8 +234,30 @@ class PerformanceMonitor:
             "error_rate": 5.0,  # percent
         }
 
-        # Thread safety
-        self._lock = threading.Lock()
+        # In-memory storage
+        self.metrics: Deque[PerformanceMetric] = deque(
+            maxlen=self.max_metrics_in_memory
+        )  # Ring of recent metrics
+        self.profiles: Dict[str, PerformanceProfile] = {}
+        self.alerts: List[PerformanceAlert] = []
+        self._hourly: Dict[str, Dict[int, FunctionStats]] = {}
+        self._newest_hour = 0
+
+        # Thread safety: statistics under _lock, buffer registry under
+        # _buffers_lock; recording itself takes no lock
+        self._lock = threading.RLock()
+        self._buffers_lock = threading.Lock()
+        self._local = threading.local()
+        self._buffers: List[_ThreadBuffer] = []
+
+        # Background resource sampling / draining / persistence
+        self._process: Optional[psutil.Process] = None
+        self._resources = (0.0, 0.0)  # (memory MB, CPU %) of the last sample
+        self._worker: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._closed = False
+        self._dirty = False
+        self._counters = {"drained": 0, "samples": 0, "saves": 0}
 
         # Setup logging
         self.logger = logging.getLogger(__name__)
@@ -140,7 +272,7 @@ class PerformanceMonitor:
             if self.metrics_file.exists():
                 with open(self.metrics_file, "r") as f:
                     data = json.load(f)
-                    cutoff = datetime.now() - timedelta(days=7)
+                    cutoff = datetime.now() - timedelta(days=self.retention_days)
                     for item in data.get("metrics", []):
                         timestamp = datetime.fromisoformat(item["timestamp"])
                         if timestamp > cutoff:
@@ -158,6 +290,24 @@ class PerformanceMonitor:
                             )
                             self.metrics.append(metric)
 
+            # Load hourly statistics (rebuilt from metrics for older data dirs)
+            if self.stats_file.exists():
+                with open(self.stats_file, "r") as f:
+                    data = json.load(f)
+                    for name, hours in data.get("functions", {}).items():
+                        self._hourly[name] = {
+                            int(start): FunctionStats.from_dict(stats)
+                            for start, stats in hours.items()
+                        }
+                self._newest_hour = max(
+                    (start for hours in self._hourly.values() for start in hours),
+                    default=0,
+                )
+            else:
+                for metric in self.metrics:
+                    self._add_to_hour(metric)
+            self._prune_hours()
+
             # Load profiles
             if self.profiles_file.exists():
                 with open(self.profiles_file, "r") as f:
@@ -217,14 +367,8 @@ class PerformanceMonitor:
     ) -> None:
         """Record a performance measurement"""
 
-        # Get system resource usage
-        try:
-            process = psutil.Process()
-            memory_usage = process.memory_info().rss / 1024 / 1024  # MB
-            cpu_usage = process.cpu_percent()
-        except:
-            memory_usage = 0.0
-            cpu_usage = 0.0
+        # System resource usage from the last background sample
+        memory_usage, cpu_usage = self._resources
 
         metric = PerformanceMetric(
             function_name=function_name,
@@ -239,48 +383,169 @@ class PerformanceMonitor:
             tags=tags or {},
         )
 
-        with self._lock:
-            self.metrics.append(metric)
+        buffer = getattr(self._local, "buffer", None) or self._register_buffer()
+        buffer.metrics.append(metric)
+        if len(buffer.metrics) >= self.thread_buffer_size:
+            self.flush()  # Worker fell behind - keep memory bounded
+
+    def _register_buffer(self) -> _ThreadBuffer:
+        """Create the calling thread's buffer (and start the worker)"""
+        buffer = _ThreadBuffer()
+        self._local.buffer = buffer
+        with self._buffers_lock:
+            self._buffers.append(buffer)
+            if self._worker is None and not self._closed:
+                self._sample_resources()
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="performance-monitor", daemon=True
+                )
+                self._worker.start()
+        return buffer
 
-            # Keep only recent metrics in memory
-            if len(self.metrics) > self.max_metrics_in_memory:
-                cutoff = datetime.now() - timedelta(days=1)
-                self.metrics = [m for m in self.metrics if m.timestamp > cutoff]
+    def _sample_resources(self):
+        """Sample process memory and CPU usage"""
+        try:
+            if self._process is None:
+                self._process = psutil.Process()
+            memory_usage = self._process.memory_info().rss / 1024 / 1024  # MB
+            cpu_usage = self._process.cpu_percent()
+            self._resources = (memory_usage, cpu_usage)
+            self._counters["samples"] += 1
+        except Exception:
+            pass  # Keep the previous sample
+
+    def _run_worker(self):
+        """Background loop: resource sampling, draining, periodic saving"""
+        next_sample = time.monotonic() + self.sample_interval
+        next_save = time.monotonic() + self.save_interval
+        while not self._stop.wait(min(self.flush_interval, self.sample_interval)):
+            now = time.monotonic()
+            if now >= next_sample:
+                self._sample_resources()
+                next_sample = now + self.sample_interval
+            try:
+                self.flush()
+                if self._dirty and now >= next_save:
+                    self._save_data()
+                    next_save = now + self.save_interval
+            except Exception as e:
+                self.logger.error(f"Performance monitor worker error: {e}")
+
+    def flush(self) -> int:
+        """
+        Move buffered metrics into statistics, profiles and alerts.
+
+        Returns:
+            int: Number of metrics processed
+        """
+        with self._lock:
+            with self._buffers_lock:
+                buffers = list(self._buffers)
+
+            drained: List[PerformanceMetric] = []
+            for buffer in buffers:
+                pending = buffer.metrics
+                while pending:  # Single consumer (under _lock), owner only appends
+                    drained.append(pending.popleft())
+
+            with self._buffers_lock:
+                for buffer in buffers:
+                    if not buffer.thread.is_alive() and not buffer.metrics:
+                        self._buffers.remove(buffer)
+
+            if not drained:
+                return 0
+
+            drained.sort(key=lambda metric: metric.timestamp)
+            newest_hour = self._newest_hour
+            touched = set()
+            for metric in drained:
+                self.metrics.append(metric)
+                self._add_to_hour(metric)
+                touched.add(metric.function_name)
+            if self._newest_hour != newest_hour:
+                self._prune_hours()  # Only when a new hour starts
+
+            # Update profiles and check alerts
+            for function_name in touched:
+                self._update_performance_profile(function_name)
+            for metric in drained:
+                self._check_performance_alerts(metric)
+
+            self._counters["drained"] += len(drained)
+            self._dirty = True
+            return len(drained)
+
+    def _add_to_hour(self, metric: PerformanceMetric):
+        """Add a metric to its function's hourly statistics"""
+        start = hour_start(metric.timestamp.timestamp())
+        hours = self._hourly.setdefault(metric.function_name, {})
+        stats = hours.get(start)
+        if stats is None:
+            stats = hours[start] = FunctionStats()
+        stats.add(metric)
+        self._newest_hour = max(self._newest_hour, start)
+
+    def _prune_hours(self):
+        """Drop hourly statistics older than the retention period"""
+        cutoff = hour_start(time.time() - self.retention_days * 86400)
+        for name in list(self._hourly):
+            hours = self._hourly[name]
+            for start in [start for start in hours if start < cutoff]:
+                del hours[start]
+            if not hours:
+                del self._hourly[name]
+
+    def _merge_hours(self, function_name: str, since: float) -> FunctionStats:
+        """Merged statistics of a function for whole hours from ``since``"""
+        merged = FunctionStats()
+        first_hour = hour_start(since)
+        for start, stats in self._hourly.get(function_name, {}).items():
+            if start >= first_hour:
+                merged.merge(stats)
+        return merged
+
+    def _window_stats(self, cutoff: float) -> Dict[str, FunctionStats]:
+        """
+        Per-function statistics of metrics newer than ``cutoff``.
+
+        Whole hours come from the hourly statistics; the hour containing the
+        cutoff is read from the ring of recent metrics when it reaches back
+        that far (otherwise the whole hour is counted).
+        """
+        edge = hour_start(cutoff)
+        exact_edge = (
+            cutoff > edge
+            and bool(self.metrics)
+            and self.metrics[0].timestamp.timestamp() <= cutoff
+        )
 
-        # Update profile and check alerts
-        self._update_performance_profile(function_name)
-        self._check_performance_alerts(metric)
+        window: Dict[str, FunctionStats] = {}
+        for name, hours in self._hourly.items():
+            for start, stats in hours.items():
+                if start > edge or (start == edge and not exact_edge):
+                    window.setdefault(name, FunctionStats()).merge(stats)
 
-        # Save periodically
-        if len(self.metrics) % 100 == 0:
-            self._save_data()
+        if exact_edge:
+            edge_end = edge + HOUR_SECONDS
+            for metric in self.metrics:
+                timestamp = metric.timestamp.timestamp()
+                if timestamp >= edge_end:
+                    break
+                if timestamp > cutoff:
+                    window.setdefault(metric.function_name, FunctionStats()).add(metric)
+        return window
 
     def _update_performance_profile(self, function_name: str):
         """Update performance profile for a function"""
-        # Get metrics for this function (last 24 hours)
-        cutoff = datetime.now() - timedelta(hours=24)
-        function_metrics = [
-            m
-            for m in self.metrics
-            if m.function_name == function_name and m.timestamp > cutoff
-        ]
-
-        if not function_metrics:
-            return
+        # Hourly statistics for this function (last 24 hours)
+        stats = self._merge_hours(function_name, time.time() - 24 * HOUR_SECONDS)
 
-        # Calculate statistics
-        execution_times = [m.execution_time for m in function_metrics]
-        memory_usages = [m.memory_usage_mb for m in function_metrics]
-        cpu_usages = [m.cpu_usage_percent for m in function_metrics]
-        success_count = sum(1 for m in function_metrics if m.success)
-
-        # Percentiles
-        execution_times.sort()
-        p95_index = int(len(execution_times) * 0.95)
-        p99_index = int(len(execution_times) * 0.99)
+        if not stats.calls:
+            return
 
         # Performance level
-        avg_time = statistics.mean(execution_times)
+        avg_time = stats.total_time / stats.calls
         if avg_time < 1.0:
             performance_level = PerformanceLevel.EXCELLENT
         elif avg_time < 3.0:
@@ -304,23 +569,15 @@ class PerformanceMonitor:
         # Create/update profile
         profile = PerformanceProfile(
             function_name=function_name,
-            total_calls=len(function_metrics),
+            total_calls=stats.calls,
             avg_execution_time=avg_time,
-            min_execution_time=min(execution_times),
-            max_execution_time=max(execution_times),
-            p95_execution_time=(
-                execution_times[p95_index]
-                if p95_index < len(execution_times)
-                else max(execution_times)
-            ),
-            p99_execution_time=(
-                execution_times[p99_index]
-                if p99_index < len(execution_times)
-                else max(execution_times)
-            ),
-            success_rate=(success_count / len(function_metrics)) * 100,
-            avg_memory_usage=statistics.mean(memory_usages),
-            avg_cpu_usage=statistics.mean(cpu_usages),
+            min_execution_time=stats.min_time,
+            max_execution_time=stats.max_time,
+            p95_execution_time=stats.percentile(0.95),
+            p99_execution_time=stats.percentile(0.99),
+            success_rate=((stats.calls - stats.errors) / stats.calls) * 100,
+            avg_memory_usage=stats.total_memory / stats.calls,
+            avg_cpu_usage=stats.total_cpu / stats.calls,
             performance_level=performance_level,
             trend=trend,
             last_updated=datetime.now(),
@@ -374,19 +631,11 @@ class PerformanceMonitor:
 
         # Error rate alert
         if not metric.success:
-            # Check recent error rate for this function
-            recent_metrics = [
-                m
-                for m in self.metrics
-                if m.function_name == metric.function_name
-                and m.timestamp > datetime.now() - timedelta(hours=1)
-            ]
+            # Check recent error rate for this function (whole hours)
+            recent = self._merge_hours(metric.function_name, time.time() - HOUR_SECONDS)
 
-            if recent_metrics:
-                error_rate = (
-                    1
-                    - sum(1 for m in recent_metrics if m.success) / len(recent_metrics)
-                ) * 100
+            if recent.calls:
+                error_rate = (recent.errors / recent.calls) * 100
                 if error_rate > self.alert_thresholds["error_rate"]:
                     alerts_to_create.append(
                         {
@@ -419,26 +668,20 @@ class PerformanceMonitor:
     def measure_performance(
         self, function_name: str, tags: Optional[Dict[str, str]] = None
     ):
-        """Context manager for measuring performance"""
-        start_time = time.time()
-        start_memory = 0
+        """Context manager for measuring performance (also a trace span)"""
+        start_time = time.perf_counter()
         error_message = None
         success = True
 
         try:
-            process = psutil.Process()
-            start_memory = process.memory_info().rss / 1024 / 1024
-        except:
-            pass
-
-        try:
-            yield
+            with get_tracer().span(function_name, **(tags or {})):
+                yield
         except Exception as e:
             success = False
             error_message = str(e)
             raise
         finally:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.record_performance(
                 function_name=function_name,
                 execution_time=execution_time,
@@ -476,62 +719,45 @@ class PerformanceMonitor:
         else:
             cutoff = datetime.now() - timedelta(hours=24)
 
-        # Filter metrics
-        recent_metrics = [m for m in self.metrics if m.timestamp > cutoff]
+        self.flush()
+        with self._lock:
+            function_window = self._window_stats(cutoff.timestamp())
+            active_alerts = [
+                a for a in self.alerts if not a.resolved and a.timestamp > cutoff
+            ]
+            profiles_count = len(self.profiles)
 
-        if not recent_metrics:
+        if not function_window:
             return {"error": "No metrics found for the specified time range"}
 
-        # Overall statistics
-        execution_times = [m.execution_time for m in recent_metrics]
-        memory_usages = [m.memory_usage_mb for m in recent_metrics]
-        cpu_usages = [m.cpu_usage_percent for m in recent_metrics]
-        success_count = sum(1 for m in recent_metrics if m.success)
-
-        # Function performance breakdown
+        # Overall statistics and function performance breakdown
+        overall = FunctionStats()
         function_stats = {}
-        for metric in recent_metrics:
-            name = metric.function_name
-            if name not in function_stats:
-                function_stats[name] = {
-                    "calls": 0,
-                    "total_time": 0.0,
-                    "max_time": 0.0,
-                    "errors": 0,
-                }
-
-            stats = function_stats[name]
-            stats["calls"] += 1
-            stats["total_time"] += metric.execution_time
-            stats["max_time"] = max(stats["max_time"], metric.execution_time)
-            if not metric.success:
-                stats["errors"] += 1
-
-        # Calculate averages and error rates
-        for name, stats in function_stats.items():
-            stats["avg_time"] = stats["total_time"] / stats["calls"]
-            stats["error_rate"] = (stats["errors"] / stats["calls"]) * 100
-
-        # Active alerts
-        active_alerts = [
-            a for a in self.alerts if not a.resolved and a.timestamp > cutoff
-        ]
+        for name, stats in function_window.items():
+            overall.merge(stats)
+            function_stats[name] = {
+                "calls": stats.calls,
+                "total_time": stats.total_time,
+                "max_time": stats.max_time,
+                "errors": stats.errors,
+                "avg_time": stats.total_time / stats.calls,
+                "p95_time": stats.percentile(0.95),
+                "p99_time": stats.percentile(0.99),
+                "error_rate": (stats.errors / stats.calls) * 100,
+            }
 
         return {
             "time_range": time_range,
-            "total_metrics": len(recent_metrics),
+            "total_metrics": overall.calls,
             "overall_stats": {
-                "avg_execution_time": statistics.mean(execution_times),
-                "p95_execution_time": (
-                    sorted(execution_times)[int(len(execution_times) * 0.95)]
-                    if execution_times
-                    else 0
-                ),
-                "max_execution_time": max(execution_times) if execution_times else 0,
-                "avg_memory_usage": statistics.mean(memory_usages),
-                "max_memory_usage": max(memory_usages) if memory_usages else 0,
-                "avg_cpu_usage": statistics.mean(cpu_usages),
-                "success_rate": (success_count / len(recent_metrics)) * 100,
+                "avg_execution_time": overall.total_time / overall.calls,
+                "p95_execution_time": overall.percentile(0.95),
+                "max_execution_time": overall.max_time,
+                "avg_memory_usage": overall.total_memory / overall.calls,
+                "max_memory_usage": overall.max_memory,
+                "avg_cpu_usage": overall.total_cpu / overall.calls,
+                "success_rate": ((overall.calls - overall.errors) / overall.calls)
+                * 100,
             },
             "function_performance": dict(
                 sorted(
@@ -539,15 +765,19 @@ class PerformanceMonitor:
                 )
             ),
             "active_alerts": len(active_alerts),
-            "performance_profiles": len(self.profiles),
+            "performance_profiles": profiles_count,
             "last_updated": datetime.now().isoformat(),
         }
 
     def get_bottlenecks(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Identify performance bottlenecks"""
+        self.flush()
         bottlenecks = []
 
-        for name, profile in self.profiles.items():
+        with self._lock:
+            profiles = list(self.profiles.items())
+
+        for name, profile in profiles:
             # Calculate bottleneck score based on multiple factors
             time_score = min(profile.avg_execution_time / 10.0, 1.0)  # Normalize to 0-1
             memory_score = min(
@@ -615,77 +845,121 @@ class PerformanceMonitor:
         return recommendations
 
     def _save_data(self):
-        """Save performance data to disk"""
+        """Save performance data to disk (snapshot under lock, atomic writes)"""
         try:
-            # Save metrics
-            metrics_data = {"timestamp": datetime.now().isoformat(), "metrics": []}
-
-            for metric in self.metrics:
-                metrics_data["metrics"].append(
-                    {
-                        "function_name": metric.function_name,
-                        "execution_time": metric.execution_time,
-                        "memory_usage_mb": metric.memory_usage_mb,
-                        "cpu_usage_percent": metric.cpu_usage_percent,
-                        "timestamp": metric.timestamp.isoformat(),
-                        "success": metric.success,
-                        "error_message": metric.error_message,
-                        "input_size": metric.input_size,
-                        "output_size": metric.output_size,
-                        "tags": metric.tags,
-                    }
-                )
-
-            with open(self.metrics_file, "w") as f:
-                json.dump(metrics_data, f, indent=2)
-
-            # Save profiles
-            profiles_data = {"timestamp": datetime.now().isoformat(), "profiles": {}}
+            with self._lock:
+                self._dirty = False
+                saved_at = datetime.now().isoformat()
+                metrics_data = {
+                    "timestamp": saved_at,
+                    "metrics": [
+                        {
+                            "function_name": metric.function_name,
+                            "execution_time": metric.execution_time,
+                            "memory_usage_mb": metric.memory_usage_mb,
+                            "cpu_usage_percent": metric.cpu_usage_percent,
+                            "timestamp": metric.timestamp.isoformat(),
+                            "success": metric.success,
+                            "error_message": metric.error_message,
+                            "input_size": metric.input_size,
+                            "output_size": metric.output_size,
+                            "tags": metric.tags,
+                        }
+                        for metric in self.metrics
+                    ],
+                }
 
-            for name, profile in self.profiles.items():
-                profiles_data["profiles"][name] = {
-                    "function_name": profile.function_name,
-                    "total_calls": profile.total_calls,
-                    "avg_execution_time": profile.avg_execution_time,
-                    "min_execution_time": profile.min_execution_time,
-                    "max_execution_time": profile.max_execution_time,
-                    "p95_execution_time": profile.p95_execution_time,
-                    "p99_execution_time": profile.p99_execution_time,
-                    "success_rate": profile.success_rate,
-                    "avg_memory_usage": profile.avg_memory_usage,
-                    "avg_cpu_usage": profile.avg_cpu_usage,
-                    "performance_level": profile.performance_level.value,
-                    "trend": profile.trend,
-                    "last_updated": profile.last_updated.isoformat(),
+                stats_data = {
+                    "timestamp": saved_at,
+                    "functions": {
+                        name: {
+                            str(start): stats.to_dict()
+                            for start, stats in hours.items()
+                        }
+                        for name, hours in self._hourly.items()
+                    },
                 }
 
-            with open(self.profiles_file, "w") as f:
-                json.dump(profiles_data, f, indent=2)
-
-            # Save alerts
-            alerts_data = {"timestamp": datetime.now().isoformat(), "alerts": []}
-
-            for alert in self.alerts:
-                alerts_data["alerts"].append(
-                    {
-                        "alert_id": alert.alert_id,
-                        "function_name": alert.function_name,
-                        "alert_type": alert.alert_type,
-                        "severity": alert.severity,
-                        "message": alert.message,
-                        "threshold_value": alert.threshold_value,
-                        "actual_value": alert.actual_value,
-                        "timestamp": alert.timestamp.isoformat(),
-                        "resolved": alert.resolved,
+                profiles_data = {"timestamp": saved_at, "profiles": {}}
+                for name, profile in self.profiles.items():
+                    profiles_data["profiles"][name] = {
+                        "function_name": profile.function_name,
+                        "total_calls": profile.total_calls,
+                        "avg_execution_time": profile.avg_execution_time,
+                        "min_execution_time": profile.min_execution_time,
+                        "max_execution_time": profile.max_execution_time,
+                        "p95_execution_time": profile.p95_execution_time,
+                        "p99_execution_time": profile.p99_execution_time,
+                        "success_rate": profile.success_rate,
+                        "avg_memory_usage": profile.avg_memory_usage,
+                        "avg_cpu_usage": profile.avg_cpu_usage,
+                        "performance_level": profile.performance_level.value,
+                        "trend": profile.trend,
+                        "last_updated": profile.last_updated.isoformat(),
                     }
-                )
 
-            with open(self.alerts_file, "w") as f:
-                json.dump(alerts_data, f, indent=2)
+                alerts_data = {
+                    "timestamp": saved_at,
+                    "alerts": [
+                        {
+                            "alert_id": alert.alert_id,
+                            "function_name": alert.function_name,
+                            "alert_type": alert.alert_type,
+                            "severity": alert.severity,
+                            "message": alert.message,
+                            "threshold_value": alert.threshold_value,
+                            "actual_value": alert.actual_value,
+                            "timestamp": alert.timestamp.isoformat(),
+                            "resolved": alert.resolved,
+                        }
+                        for alert in self.alerts
+                    ],
+                }
+
+            self._write_json(self.metrics_file, metrics_data)
+            self._write_json(self.stats_file, stats_data)
+            self._write_json(self.profiles_file, profiles_data, indent=2)
+            self._write_json(self.alerts_file, alerts_data, indent=2)
+            self._counters["saves"] += 1
 
         except Exception as e:
             self.logger.error(f"Could not save performance data: {e}")
 
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any], indent: Optional[int] = None):
+        """Write JSON atomically (temporary file + rename)"""
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(data, f, indent=indent)
+        os.replace(temp_path, path)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statystyki samego monitora (bufory, próbkowanie, zapisy)"""
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        with self._lock:
+            return {
+                **self._counters,
+                "pending": sum(len(buffer.metrics) for buffer in buffers),
+                "thread_buffers": len(buffers),
+                "ring_size": len(self.metrics),
+                "functions": len(self._hourly),
+                "hour_buckets": sum(len(hours) for hours in self._hourly.values()),
+                "memory_usage_mb": self._resources[0],
+                "cpu_usage_percent": self._resources[1],
+            }
+
+    def close(self):
+        """Stop the background worker, process pending metrics and save"""
+        with self._buffers_lock:
+            self._closed = True
+            worker = self._worker
+        self._stop.set()
+        if worker is not None:
+            worker.join()
+        if self.flush() or self._dirty:
+            self._save_data()
+
 
 # ===================================================================
 # Global Performance Monitor Instance
@@ -700,6 +974,7 @@ def get_performance_monitor() -> PerformanceMonitor:
     global _global_monitor
     if _global_monitor is None:
         _global_monitor = PerformanceMonitor()
+        atexit.register(_global_monitor.close)
     return _global_monitor
 
 
@@ -746,4 +1021,4 @@ if __name__ == "__main__":
     print("\nBottlenecks:", json.dumps(bottlenecks, indent=2))
 
     # Save data
-    monitor._save_data()
+    monitor.close()
@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+
+"""
+Preference Vectors for AutoGen DekuDeals
+========================================
+
+Precomputed, persisted per-user preference vectors for collection-based
+recommendations.
+
+Instead of re-scanning the whole collection on every recommendation request,
+each user keeps a ``PreferenceVector`` of running aggregates (genre/developer
+counts and rating sums, rating distribution, sorted prices, platform and tag
+counts, recent additions). The vector is updated incrementally when
+``GameCollectionManager`` adds, updates or removes a game, and turned into
+``CollectionPreferences`` fields without touching individual ``GameEntry``
+objects.
+
+Features:
+- Per-game contributions, so updates/removals subtract exactly what was added
+- Incremental add/update/remove in O(genres + developers + log n)
+- JSON persistence per user, reloaded when another process updates the file
+- Full rebuild from a collection for bulk imports
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import bisect
+import json
+import logging
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Statuses that count towards collection preferences
+ANALYZED_STATUSES = {"owned", "completed"}
+
+# Genre keywords recognized in game notes
+NOTES_GENRE_KEYWORDS = [
+    "action",
+    "adventure",
+    "rpg",
+    "puzzle",
+    "platformer",
+    "indie",
+    "metroidvania",
+    "roguelike",
+    "strategy",
+    "simulation",
+    "sports",
+    "racing",
+    "fighting",
+    "shooter",
+    "horror",
+    "survival",
+]
+
+# Developer keywords recognized in game notes
+NOTES_DEVELOPER_KEYWORDS = [
+    "nintendo",
+    "capcom",
+    "team cherry",
+    "supergiant",
+    "playdead",
+    "motion twin",
+    "moon studios",
+    "ori",
+    "celeste",
+    "matt makes games",
+    "indie",
+    "ubisoft",
+    "ea",
+    "activision",
+    "bethesda",
+    "square enix",
+]
+
+RECENT_WINDOW = timedelta(days=90)
+
+
+def _status_value(entry: Any) -> str:
+    """Return the status of a game entry as a plain string."""
+    status = getattr(entry, "status", "")
+    return getattr(status, "value", status)
+
+
+def extract_collection_genres(entry: Any) -> List[str]:
+    """Extract genres for a collection game from tags, notes and platform."""
+    genres = []
+
+    # Primary source: tags (if available and not empty)
+    if getattr(entry, "tags", None):
+        genres.extend(entry.tags)
+
+    # Secondary source: extract from notes if they contain genre keywords
+    notes = getattr(entry, "notes", "")
+    if notes:
+        notes_lower = notes.lower()
+        for keyword in NOTES_GENRE_KEYWORDS:
+            if keyword in notes_lower:
+                genres.append(keyword.title())
+
+    # Fallback: use platform as a broad category
+    if not genres and entry.platform:
+        genres = [entry.platform]
+
+    # If still no genres, create a general category
+    if not genres:
+        genres = ["General"]
+
+    return genres
+
+
+def extract_collection_developers(entry: Any) -> List[str]:
+    """Extract developers for a collection game from notes, title and platform."""
+    developers = []
+
+    # Try to extract developer info from notes
+    notes = getattr(entry, "notes", "")
+    if notes:
+        notes_lower = notes.lower()
+        for keyword in NOTES_DEVELOPER_KEYWORDS:
+            if keyword in notes_lower:
+                developers.append(keyword.title())
+
+    # Some games have developer in title
+    title_lower = (getattr(entry, "title", "") or "").lower()
+    if title_lower:
+        if "team cherry" in title_lower or "hollow knight" in title_lower:
+            developers.append("Team Cherry")
+        elif (
+            "supergiant" in title_lower
+            or "hades" in title_lower
+            or "bastion" in title_lower
+        ):
+            developers.append("Supergiant Games")
+        elif (
+            "nintendo" in title_lower
+            or "mario" in title_lower
+            or "zelda" in title_lower
+        ):
+            developers.append("Nintendo")
+        elif (
+            "playdead" in title_lower
+            or "inside" in title_lower
+            or "limbo" in title_lower
+        ):
+            developers.append("Playdead")
+
+    # Fallback: use platform as publisher/developer category
+    if not developers and entry.platform:
+        if "nintendo" in entry.platform.lower():
+            developers.append("Nintendo Platform")
+        elif "steam" in entry.platform.lower():
+            developers.append("PC/Steam Platform")
+        else:
+            developers.append(f"{entry.platform} Platform")
+
+    # If still no developers, create a general category based on import source
+    if not developers:
+        import_source = getattr(entry, "import_source", None)
+        if import_source is not None:
+            developers.append(
+                f"{getattr(import_source, 'value', import_source).title()} Games"
+            )
+        else:
+            developers.append("Independent Games")
+
+    return developers
+
+
+@dataclass
+class GameContribution:
+    """What a single collection game contributes to the preference vector."""
+
+    title: str
+    genres: List[str]
+    developers: List[str]
+    rating: Optional[float]
+    price: Optional[float]
+    platform: str
+    completed: bool
+    tags: List[str]
+    date_added: str
+
+    @classmethod
+    def from_entry(cls, entry: Any) -> "GameContribution":
+        """Create a contribution from a ``GameEntry``."""
+        return cls(
+            title=entry.title,
+            genres=extract_collection_genres(entry),
+            developers=extract_collection_developers(entry),
+            rating=entry.user_rating or None,
+            price=entry.purchase_price or entry.current_price or None,
+            platform=entry.platform,
+            completed=_status_value(entry) == "completed",
+            tags=list(entry.tags or []),
+            date_added=entry.date_added.isoformat(),
+        )
+
+
+def _bump(counter: Dict[Any, float], key: Any, delta: float):
+    """Add ``delta`` to a running count, dropping keys that reach zero."""
+    value = counter.get(key, 0) + delta
+    if abs(value) < 1e-9:
+        counter.pop(key, None)
+    else:
+        counter[key] = value
+
+
+@dataclass
+class PreferenceVector:
+    """Running preference aggregates for one user's analyzed collection."""
+
+    user_id: str
+    games: Dict[str, GameContribution] = field(default_factory=dict)
+
+    genre_counts: Dict[str, int] = field(default_factory=dict)
+    genre_rating_sums: Dict[str, float] = field(default_factory=dict)
+    genre_rating_counts: Dict[str, int] = field(default_factory=dict)
+
+    developer_counts: Dict[str, int] = field(default_factory=dict)
+    developer_rating_sums: Dict[str, float] = field(default_factory=dict)
+    developer_rating_counts: Dict[str, int] = field(default_factory=dict)
+
+    rating_sum: float = 0.0
+    rating_count: int = 0
+    rating_distribution: Dict[int, int] = field(default_factory=dict)
+    high_rated_games: Dict[str, str] = field(default_factory=dict)
+
+    sorted_prices: List[float] = field(default_factory=list)
+    platform_counts: Dict[str, int] = field(default_factory=dict)
+    tag_counts: Dict[str, int] = field(default_factory=dict)
+    completed_count: int = 0
+    recent_index: List[List[str]] = field(default_factory=list)  # [date, game_id]
+
+    version: int = 0
+    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def size(self) -> int:
+        """Number of analyzed games in the vector."""
+        return len(self.games)
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def upsert_game(self, game_id: str, entry: Any):
+        """Add or replace a game, counting it only if it is owned/completed."""
+        self._remove(game_id)
+        if _status_value(entry) in ANALYZED_STATUSES:
+            contribution = GameContribution.from_entry(entry)
+            self.games[game_id] = contribution
+            self._apply(game_id, contribution, 1)
+        self._touch()
+
+    def remove_game(self, game_id: str):
+        """Remove a game's contribution, if any."""
+        self._remove(game_id)
+        self._touch()
+
+    def _remove(self, game_id: str):
+        contribution = self.games.pop(game_id, None)
+        if contribution:
+            self._apply(game_id, contribution, -1)
+
+    def _touch(self):
+        self.version += 1
+        self.updated_at = datetime.now().isoformat()
+
+    def _apply(self, game_id: str, c: GameContribution, sign: int):
+        """Add (sign=1) or subtract (sign=-1) a contribution."""
+        for genre in c.genres:
+            _bump(self.genre_counts, genre, sign)
+            if c.rating:
+                _bump(self.genre_rating_counts, genre, sign)
+                _bump(self.genre_rating_sums, genre, sign * c.rating)
+                if genre not in self.genre_rating_counts:
+                    self.genre_rating_sums.pop(genre, None)
+
+        for developer in c.developers:
+            _bump(self.developer_counts, developer, sign)
+            if c.rating:
+                _bump(self.developer_rating_counts, developer, sign)
+                _bump(self.developer_rating_sums, developer, sign * c.rating)
+                if developer not in self.developer_rating_counts:
+                    self.developer_rating_sums.pop(developer, None)
+
+        if c.rating:
+            self.rating_count += sign
+            self.rating_sum = (
+                self.rating_sum + sign * c.rating if self.rating_count else 0.0
+            )
+            _bump(self.rating_distribution, int(c.rating), sign)
+            if c.rating >= 8.0:
+                if sign > 0:
+                    self.high_rated_games[game_id] = c.title
+                else:
+                    self.high_rated_games.pop(game_id, None)
+
+        if c.price:
+            if sign > 0:
+                bisect.insort(self.sorted_prices, c.price)
+            else:
+                idx = bisect.bisect_left(self.sorted_prices, c.price)
+                if idx < len(self.sorted_prices):
+                    del self.sorted_prices[idx]
+
+        _bump(self.platform_counts, c.platform, sign)
+        for tag in c.tags:
+            _bump(self.tag_counts, tag, sign)
+        if c.completed:
+            self.completed_count += sign
+
+        key = [c.date_added, game_id]
+        if sign > 0:
+            bisect.insort(self.recent_index, key)
+        else:
+            idx = bisect.bisect_left(self.recent_index, key)
+            if idx < len(self.recent_index) and self.recent_index[idx] == key:
+                del self.recent_index[idx]
+
+    # ------------------------------------------------------------------
+    # Preference extraction
+    # ------------------------------------------------------------------
+
+    def to_preference_fields(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Derive ``CollectionPreferences`` fields from the running aggregates.
+
+        Args:
+            now: Reference time for recent preferences (defaults to now)
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for ``CollectionPreferences``
+        """
+        total = self.size
+        if total == 0:
+            return {}
+
+        fields: Dict[str, Any] = {
+            "collection_size": total,
+            "games_analyzed": total,
+        }
+        fields.update(self._genre_fields(total))
+        fields.update(self._developer_fields(total))
+
+        # Rating patterns
+        if self.rating_count:
+            fields["average_rating"] = self.rating_sum / self.rating_count
+            fields["rating_distribution"] = {
+                int(k): int(v) for k, v in self.rating_distribution.items()
+            }
+            fields["high_rated_games"] = list(self.high_rated_games.values())
+
+        # Price preferences (25th to 75th percentile)
+        prices = self.sorted_prices
+        if prices:
+            fields["preferred_price_range"] = (
+                prices[len(prices) // 4],
+                prices[3 * len(prices) // 4],
+            )
+            avg_price = sum(prices) / len(prices)
+            fields["price_sensitivity"] = max(0.0, min(1.0, 1.0 - (avg_price / 100.0)))
+
+        fields["platform_preferences"] = {
+            k: int(v) for k, v in self.platform_counts.items()
+        }
+
+        # Collection characteristics
+        fields["completion_rate"] = self.completed_count / total
+        max_possible_diversity = max(total, 10)
+        normalized_genre_diversity = min(
+            len(self.tag_counts) / max_possible_diversity, 1.0
+        )
+        # Collection entries carry no developer field, so they share one bucket
+        normalized_dev_diversity = min(1 / max_possible_diversity, 1.0)
+        fields["diversity_score"] = (
+            normalized_genre_diversity + normalized_dev_diversity
+        ) / 2
+
+        # Temporal patterns (last 3 months)
+        cutoff = ((now or datetime.now()) - RECENT_WINDOW).isoformat()
+        start = bisect.bisect_left(self.recent_index, [cutoff, ""])
+        recent_counter = Counter(
+            tag
+            for _, game_id in self.recent_index[start:]
+            for tag in self.games[game_id].tags
+        )
+        fields["recent_preferences"] = [
+            genre for genre, _ in recent_counter.most_common(5)
+        ]
+
+        return fields
+
+    def _genre_fields(self, total: int) -> Dict[str, Any]:
+        """Favorite, underrepresented and avoided genres."""
+        favorite_genres = []
+        for genre, count in self.genre_counts.items():
+            frequency = count / total
+            rated = self.genre_rating_counts.get(genre, 0)
+
+            if rated >= 1:
+                avg_rating = self.genre_rating_sums[genre] / rated
+                if avg_rating >= 6.0:
+                    favorite_genres.append(
+                        (genre, (avg_rating / 10.0) * 0.7 + frequency * 0.3)
+                    )
+            elif frequency >= 0.15:
+                # Assume neutral 5.0/10 rating for unrated genres
+                favorite_genres.append((genre, 0.5 * 0.7 + frequency * 0.3))
+
+        favorite_genres.sort(key=lambda x: x[1], reverse=True)
+        represented = {genre for genre, _ in favorite_genres}
+
+        return {
+            "favorite_genres": favorite_genres[:8],
+            "underrepresented_genres": [
+                g for g in self.genre_counts if g not in represented
+            ][:5],
+            "avoided_genres": [
+                genre
+                for genre, rated in self.genre_rating_counts.items()
+                if self.genre_rating_sums[genre] / rated < 5.0
+            ],
+        }
+
+    def _developer_fields(self, total: int) -> Dict[str, Any]:
+        """Favorite developers and developer diversity."""
+        favorite_developers = []
+        for developer, count in self.developer_counts.items():
+            rated = self.developer_rating_counts.get(developer, 0)
+            count_factor = min(count / 3, 1.0) * 0.2
+
+            if rated >= 1:
+                avg_rating = self.developer_rating_sums[developer] / rated
+                if avg_rating >= 6.0:
+                    favorite_developers.append(
+                        (developer, (avg_rating / 10.0) * 0.8 + count_factor)
+                    )
+            elif count >= 2:
+                # Assume neutral 5.0/10 rating for unrated developers
+                favorite_developers.append((developer, 0.5 * 0.8 + count_factor))
+
+        favorite_developers.sort(key=lambda x: x[1], reverse=True)
+
+        return {
+            "favorite_developers": favorite_developers[:5],
+            "developer_diversity_score": min(
+                len(self.developer_counts) / max(total * 0.3, 1), 1.0
+            ),
+        }
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data = asdict(self)
+        data["rating_distribution"] = {
+            str(k): v for k, v in self.rating_distribution.items()
+        }
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PreferenceVector":
+        """Create PreferenceVector from dictionary."""
+        data = dict(data)
+        data["games"] = {
+            game_id: GameContribution(**contribution)
+            for game_id, contribution in data.get("games", {}).items()
+        }
+        data["rating_distribution"] = {
+            int(k): v for k, v in data.get("rating_distribution", {}).items()
+        }
+        return cls(**data)
+
+    @classmethod
+    def from_collection(
+        cls, user_id: str, games: Mapping[str, Any], previous_version: int = 0
+    ) -> "PreferenceVector":
+        """
+        Build a vector from scratch for a whole collection.
+
+        ``previous_version`` is the version of the vector it replaces; the
+        result is newer, so caches keyed by version see the change.
+        """
+        vector = cls(user_id=user_id, version=previous_version)
+        for game_id, entry in games.items():
+            if _status_value(entry) in ANALYZED_STATUSES:
+                contribution = GameContribution.from_entry(entry)
+                vector.games[game_id] = contribution
+                vector._apply(game_id, contribution, 1)
+        vector._touch()
+        return vector
+
+
+class PreferenceVectorStore:
+    """Persists preference vectors per user and applies collection events."""
+
+    def __init__(self, storage_dir: str = "game_collections/preference_vectors"):
+        """Initialize the preference vector store."""
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+
+        self.vectors: Dict[str, PreferenceVector] = {}
+        self._loaded_mtimes: Dict[str, float] = {}
+
+    def _get_vector_file(self, user_id: str) -> Path:
+        """Get preference vector file path for user."""
+        return self.storage_dir / f"{user_id}_preferences.json"
+
+    def get(self, user_id: str) -> Optional[PreferenceVector]:
+        """Get a user's vector, reloading it if the file changed on disk."""
+        vector_file = self._get_vector_file(user_id)
+        try:
+            mtime = vector_file.stat().st_mtime
+        except FileNotFoundError:
+            return self.vectors.get(user_id)
+
+        if user_id not in self.vectors or self._loaded_mtimes.get(user_id) != mtime:
+            try:
+                with open(vector_file, "r", encoding="utf-8") as f:
+                    self.vectors[user_id] = PreferenceVector.from_dict(json.load(f))
+                self._loaded_mtimes[user_id] = mtime
+            except Exception as e:
+                logger.error(f"Error loading preference vector for {user_id}: {e}")
+                return self.vectors.get(user_id)
+
+        return self.vectors[user_id]
+
+    def rebuild(self, user_id: str, games: Mapping[str, Any]) -> PreferenceVector:
+        """Rebuild a user's vector from the full collection and persist it."""
+        previous = self.get(user_id)
+        vector = PreferenceVector.from_collection(
+            user_id, games, previous.version if previous else 0
+        )
+        self.vectors[user_id] = vector
+        self._save(vector)
+        logger.info(
+            f"✅ Rebuilt preference vector for user {user_id}: {vector.size} games"
+        )
+        return vector
+
+    def ensure(self, user_id: str, games: Mapping[str, Any]) -> PreferenceVector:
+        """Get a user's vector, rebuilding it if missing or out of sync."""
+        vector = self.get(user_id)
+        if vector is None or not self._in_sync(vector, games):
+            vector = self.rebuild(user_id, games)
+        return vector
+
+    def record_upsert(self, user_id: str, game_id: str, entry: Any):
+        """Apply a game add/update event."""
+        vector = self.get(user_id) or PreferenceVector(user_id=user_id)
+        vector.upsert_game(game_id, entry)
+        self.vectors[user_id] = vector
+        self._save(vector)
+
+    def record_remove(self, user_id: str, game_id: str):
+        """Apply a game removal event."""
+        vector = self.get(user_id)
+        if vector is None:
+            return
+        vector.remove_game(game_id)
+        self._save(vector)
+
+    @staticmethod
+    def _in_sync(vector: PreferenceVector, games: Mapping[str, Any]) -> bool:
+        """Check that the vector tracks exactly the analyzed games."""
+        analyzed = {
+            game_id
+            for game_id, entry in games.items()
+            if _status_value(entry) in ANALYZED_STATUSES
+        }
+        return analyzed == set(vector.games)
+
+    def _save(self, vector: PreferenceVector):
+        """Save a user's vector."""
+        vector_file = self._get_vector_file(vector.user_id)
+        try:
+            with open(vector_file, "w", encoding="utf-8") as f:
+                json.dump(vector.to_dict(), f, ensure_ascii=False)
+            self._loaded_mtimes[vector.user_id] = vector_file.stat().st_mtime
+        except Exception as e:
+            logger.error(f"Error saving preference vector for {vector.user_id}: {e}")
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+
+"""
+Price Prediction Backtesting for AutoGen DekuDeals
+==================================================
+
+Offline replay of stored price histories against a prediction engine.
+
+For every game the history is cut at moving dates (``step_days`` apart).
+The engine under test records the points up to the cutoff and predicts
+as of that date with ``predict_as_of`` - the same database reads, model
+training and saves as a live prediction, which is what the latency
+measures; the following ``horizon_days`` score the prediction:
+- future price: MAE against the price in effect at the horizon (with the
+  "price stays the same" MAE as a baseline)
+- drop probability: Brier score against whether the price fell by the
+  significant-drop threshold within the horizon
+- target price: hit rate (the price reached the target within the horizon)
+- speed: per-prediction latency and predictions per second
+
+Predictions run on a scratch engine (``engine_factory`` in a temporary
+directory), so its models are trained only on the replayed past and the
+source engine's database and models are never modified. Running the same
+backtest with different factories compares engines.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .price_prediction_ml import (
+    PriceDataPoint,
+    PricePredictionEngine,
+    get_price_prediction_engine,
+)
+
+logger = logging.getLogger(__name__)
+
+# Whole stored history
+ALL_HISTORY_DAYS = 365 * 100
+
+EngineFactory = Callable[..., PricePredictionEngine]
+
+
+@dataclass
+class BacktestSample:
+    """One prediction made at a cutoff and its observed outcome."""
+
+    game_title: str
+    cutoff: datetime
+    current_price: float
+    predicted_price: float
+    actual_price: float
+    drop_probability: float
+    dropped: bool
+    target_price: Optional[float]
+    target_hit: bool
+    latency_ms: float
+
+
+def _mean(values: List[float]) -> Optional[float]:
+    return float(np.mean(values)) if values else None
+
+
+def _score(samples: List[BacktestSample], seconds: float) -> Dict[str, Any]:
+    """Accuracy and speed metrics of a set of samples."""
+    if not samples:
+        return {"predictions": 0}
+
+    predicted = np.array([s.predicted_price for s in samples])
+    actual = np.array([s.actual_price for s in samples])
+    current = np.array([s.current_price for s in samples])
+    probability = np.array([s.drop_probability for s in samples])
+    dropped = np.array([s.dropped for s in samples], dtype=float)
+    targets = [s for s in samples if s.target_price is not None]
+    latency = np.array([s.latency_ms for s in samples])
+
+    return {
+        "predictions": len(samples),
+        "price_mae": float(np.abs(predicted - actual).mean()),
+        "naive_price_mae": float(np.abs(current - actual).mean()),
+        "price_mape": float(
+            (np.abs(predicted - actual) / np.where(actual > 0, actual, 1.0)).mean()
+            * 100
+        ),
+        "brier_score": float(((probability - dropped) ** 2).mean()),
+        "drop_rate": float(dropped.mean()),
+        "target_hit_rate": _mean([float(s.target_hit) for s in targets]),
+        "target_coverage": len(targets) / len(samples),
+        "latency_ms_p50": float(np.percentile(latency, 50)),
+        "latency_ms_p95": float(np.percentile(latency, 95)),
+        "predictions_per_second": len(samples) / seconds if seconds > 0 else None,
+    }
+
+
+@dataclass
+class GameBacktest:
+    """Samples of one game and the time spent predicting them."""
+
+    game_title: str
+    samples: List[BacktestSample] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def metrics(self) -> Dict[str, Any]:
+        return {"game_title": self.game_title, **_score(self.samples, self.seconds)}
+
+
+@dataclass
+class BacktestReport:
+    """Backtest results over many games."""
+
+    horizon_days: int
+    step_days: int
+    games: List[GameBacktest]
+    skipped_games: List[str]
+    seconds: float
+
+    @property
+    def samples(self) -> List[BacktestSample]:
+        return [sample for game in self.games for sample in game.samples]
+
+    def summary(self) -> Dict[str, Any]:
+        """Metrics over all games."""
+        prediction_seconds = sum(game.seconds for game in self.games)
+        return {
+            "games": len(self.games),
+            "skipped_games": len(self.skipped_games),
+            "horizon_days": self.horizon_days,
+            "step_days": self.step_days,
+            "total_seconds": round(self.seconds, 3),
+            **_score(self.samples, prediction_seconds),
+        }
+
+    def compare(self, baseline: "BacktestReport") -> Dict[str, Dict[str, float]]:
+        """
+        Metric changes against a baseline run (candidate minus baseline).
+
+        Lower is better for errors, Brier score and latency; higher is
+        better for hit rate and throughput.
+        """
+        current, previous = self.summary(), baseline.summary()
+        deltas = {}
+        for name in (
+            "price_mae",
+            "brier_score",
+            "target_hit_rate",
+            "latency_ms_p95",
+            "predictions_per_second",
+        ):
+            if current.get(name) is not None and previous.get(name) is not None:
+                deltas[name] = {
+                    "baseline": previous[name],
+                    "candidate": current[name],
+                    "delta": current[name] - previous[name],
+                }
+        return deltas
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "summary": self.summary(),
+            "games": [game.metrics() for game in self.games],
+            "skipped_games": self.skipped_games,
+        }
+
+
+class PriceBacktester:
+    """
+    Moving-cutoff backtest of price predictions.
+
+    Usage:
+        backtester = PriceBacktester(get_price_prediction_engine())
+        report = backtester.run()
+        report.summary()["brier_score"]
+
+        candidate = PriceBacktester(engine, engine_factory=MyEngine).run()
+        candidate.compare(report)
+    """
+
+    def __init__(
+        self,
+        source_engine: PricePredictionEngine,
+        engine_factory: EngineFactory = PricePredictionEngine,
+        horizon_days: Optional[int] = None,
+        step_days: int = 14,
+        min_history_points: Optional[int] = None,
+    ):
+        """
+        Initialize the backtester.
+
+        Args:
+            source_engine: Engine whose stored price history is replayed
+            engine_factory: Builds the engine under test (``data_dir`` keyword)
+            horizon_days: Days after each cutoff used for scoring
+                (default: the source engine's prediction timeframe)
+            step_days: Days between consecutive cutoffs
+            min_history_points: Points required before the first cutoff
+                (default: the source engine's minimum for a prediction)
+        """
+        self.source_engine = source_engine
+        self.engine_factory = engine_factory
+        self.horizon_days = horizon_days or source_engine.prediction_timeframe_days
+        self.step_days = step_days
+        self.min_history_points = min_history_points or source_engine.min_data_points
+        self.drop_threshold = source_engine.significant_drop_threshold
+
+    def run(self, game_titles: Optional[List[str]] = None) -> BacktestReport:
+        """
+        Replay histories and score every prediction.
+
+        Args:
+            game_titles: Games to replay (default: every tracked game)
+
+        Returns:
+            BacktestReport: Per-game samples and summary metrics
+        """
+        started = time.perf_counter()
+        titles = (
+            game_titles
+            if game_titles is not None
+            else self.source_engine.get_tracked_games()
+        )
+        histories = self.source_engine.get_price_histories(titles, ALL_HISTORY_DAYS)
+
+        games, skipped = [], []
+        with tempfile.TemporaryDirectory(prefix="price_backtest_") as scratch_dir:
+            engine = self.engine_factory(data_dir=scratch_dir)
+            try:
+                for title in titles:
+                    game = self._replay(engine, title, histories.get(title, []))
+                    if game.samples:
+                        games.append(game)
+                    else:
+                        skipped.append(title)
+            finally:
+                engine.close()
+
+        report = BacktestReport(
+            horizon_days=self.horizon_days,
+            step_days=self.step_days,
+            games=games,
+            skipped_games=skipped,
+            seconds=time.perf_counter() - started,
+        )
+        summary = report.summary()
+        logger.info(
+            f"🧪 Backtest complete: {summary.get('predictions', 0)} predictions "
+            f"over {len(games)} games ({len(skipped)} skipped)"
+        )
+        return report
+
+    def cutoffs(self, history: List[PriceDataPoint]) -> List[datetime]:
+        """Cutoff dates with enough history before and a full horizon after."""
+        if len(history) < self.min_history_points:
+            return []
+
+        cutoff = history[self.min_history_points - 1].date
+        last_cutoff = history[-1].date - timedelta(days=self.horizon_days)
+        dates = []
+        while cutoff <= last_cutoff:
+            dates.append(cutoff)
+            cutoff += timedelta(days=self.step_days)
+        return dates
+
+    def _replay(
+        self,
+        engine: PricePredictionEngine,
+        game_title: str,
+        history: List[PriceDataPoint],
+    ) -> GameBacktest:
+        """Predict at every cutoff of one game."""
+        game = GameBacktest(game_title)
+        dates = [point.date for point in history]
+        recorded = 0
+
+        for cutoff in self.cutoffs(history):
+            known = bisect_right(dates, cutoff)
+            horizon_end = bisect_right(
+                dates, cutoff + timedelta(days=self.horizon_days)
+            )
+            current_price = history[known - 1].price
+
+            # Only points new since the previous cutoff are recorded
+            started = time.perf_counter()
+            prediction = engine.predict_as_of(
+                game_title, history[recorded:known], cutoff, current_price
+            )
+            elapsed = time.perf_counter() - started
+            recorded = known
+            game.seconds += elapsed
+
+            # Prices are step functions: the last point before a date is in effect
+            future_low = min(
+                [point.price for point in history[known:horizon_end]],
+                default=current_price,
+            )
+            target = prediction.target_price
+            game.samples.append(
+                BacktestSample(
+                    game_title=game_title,
+                    cutoff=cutoff,
+                    current_price=current_price,
+                    predicted_price=prediction.predicted_price,
+                    actual_price=history[horizon_end - 1].price,
+                    drop_probability=prediction.price_drop_probability,
+                    dropped=future_low <= current_price * (1 - self.drop_threshold),
+                    target_price=target,
+                    target_hit=target is not None and future_low <= target,
+                    latency_ms=elapsed * 1000,
+                )
+            )
+
+        return game
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backtest price predictions")
+    parser.add_argument("games", nargs="*", help="Games to replay (default: all)")
+    parser.add_argument("--step-days", type=int, default=14)
+    parser.add_argument("--horizon-days", type=int, default=None)
+    parser.add_argument("--details", action="store_true", help="Per-game metrics")
+    args = parser.parse_args()
+
+    backtest = PriceBacktester(
+        get_price_prediction_engine(),
+        horizon_days=args.horizon_days,
+        step_days=args.step_days,
+    ).run(args.games or None)
+
+    output = backtest.to_dict() if args.details else backtest.summary()
+    print(json.dumps(output, indent=2, default=str))
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+
+"""
+Price History Ingestion for AutoGen DekuDeals
+=============================================
+
+Bulk loading of historical prices into the PricePredictionEngine store.
+
+Sources:
+- Price-history chart data parsed from DekuDeals item pages
+  (``price_history_points`` in ``scrape_game_details`` output)
+- CSV dumps (``game_title,date,price[,promotion_type]``)
+- JSON dumps (list of records, or ``{game_title: [points]}``)
+
+Every ingestion call writes all of its points in a single transaction.
+``PriceHistoryBackfillJob`` periodically re-scrapes the tracked catalog so
+games accumulate enough history for model-based predictions.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import csv
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .price_calculator import extract_price
+from .price_prediction_ml import PricePredictionEngine, get_price_prediction_engine
+
+logger = logging.getLogger(__name__)
+
+PriceRecord = Tuple[str, float, Optional[datetime], Optional[str]]
+
+
+def _parse_record_date(raw: Any) -> Optional[datetime]:
+    """Parse an ISO date (or datetime) from a dump record."""
+    if isinstance(raw, datetime):
+        return raw
+    if not raw:
+        return None
+    try:
+        return datetime.fromisoformat(str(raw).strip().replace("Z", ""))
+    except ValueError:
+        return None
+
+
+def _parse_record_price(raw: Any) -> Optional[float]:
+    """Parse a price that may be a number or a currency string."""
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    return extract_price(raw) if raw else None
+
+
+class PriceHistoryIngestor:
+    """
+    Writes batches of historical price points into the price store.
+
+    Usage:
+        ingestor = PriceHistoryIngestor()
+        ingestor.ingest_game_details(scrape_game_details(url))
+        ingestor.ingest_file("exports/price_dump.csv")
+    """
+
+    def __init__(self, engine: Optional[PricePredictionEngine] = None):
+        """
+        Initialize the ingestor.
+
+        Args:
+            engine: Target engine (defaults to the shared engine)
+        """
+        self.engine = engine or get_price_prediction_engine()
+
+    def ingest_records(self, records: Iterable[PriceRecord]) -> Dict[str, int]:
+        """
+        Store validated records in one transaction.
+
+        Args:
+            records: (game_title, price, date, promotion_type) tuples
+
+        Returns:
+            Dict: ``received``, ``valid`` and ``inserted`` counts
+        """
+        received = 0
+        valid_records = []
+        for game_title, price, date, promotion_type in records:
+            received += 1
+            if not game_title or price is None or price < 0:
+                continue
+            valid_records.append((game_title, price, date, promotion_type))
+
+        inserted = self.engine.record_price_data_bulk(valid_records)
+        return {
+            "received": received,
+            "valid": len(valid_records),
+            "inserted": inserted,
+        }
+
+    def ingest_points(
+        self, game_title: str, points: Iterable[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Store parsed price-history points of one game.
+
+        Args:
+            game_title: Game title
+            points: Dicts with ``date`` and ``price`` (optional ``promotion_type``)
+
+        Returns:
+            Dict: Ingestion counts
+        """
+        return self.ingest_records(
+            (
+                game_title,
+                _parse_record_price(point.get("price")),
+                _parse_record_date(point.get("date")),
+                point.get("promotion_type"),
+            )
+            for point in points
+            if _parse_record_date(point.get("date"))
+        )
+
+    def ingest_game_details(
+        self, game_details: Dict[str, Any], include_current_price: bool = True
+    ) -> Dict[str, int]:
+        """
+        Store the full price history and current price from scraped details.
+
+        Args:
+            game_details: Output of ``scrape_game_details``/``search_and_scrape_game``
+            include_current_price: Also store the current price (stamped now).
+                Pass False when ``generate_price_prediction`` follows - it
+                records the current price itself.
+
+        Returns:
+            Dict: Ingestion counts
+        """
+        game_title = game_details.get("title")
+        if not game_title:
+            return {"received": 0, "valid": 0, "inserted": 0}
+
+        points = list(game_details.get("price_history_points") or [])
+        current_price = extract_price(game_details.get("current_eshop_price"))
+        if include_current_price and current_price is not None:
+            points.append({"date": datetime.now(), "price": current_price})
+
+        result = self.ingest_points(game_title, points)
+        logger.debug(
+            f"📈 Ingested {result['inserted']} new price points for {game_title}"
+        )
+        return result
+
+    def ingest_file(self, path: Union[str, Path]) -> Dict[str, int]:
+        """
+        Store a CSV or JSON price dump in one transaction.
+
+        Args:
+            path: ``.csv`` or ``.json`` file
+
+        Returns:
+            Dict: Ingestion counts
+
+        Raises:
+            ValueError: For unsupported file types
+        """
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix == ".csv":
+            records = self._read_csv(path)
+        elif suffix == ".json":
+            records = self._read_json(path)
+        else:
+            raise ValueError(f"Unsupported price dump format: {path.suffix}")
+
+        result = self.ingest_records(records)
+        logger.info(
+            f"📥 Ingested {path.name}: {result['inserted']} new of "
+            f"{result['received']} price points"
+        )
+        return result
+
+    @staticmethod
+    def _read_csv(path: Path) -> List[PriceRecord]:
+        """Read ``game_title,date,price[,promotion_type]`` rows."""
+        with open(path, newline="", encoding="utf-8") as f:
+            return [
+                (
+                    (row.get("game_title") or "").strip(),
+                    _parse_record_price(row.get("price")),
+                    _parse_record_date(row.get("date")),
+                    row.get("promotion_type") or None,
+                )
+                for row in csv.DictReader(f)
+                if _parse_record_date(row.get("date"))
+            ]
+
+    @staticmethod
+    def _read_json(path: Path) -> List[PriceRecord]:
+        """Read a record list or a ``{game_title: [points]}`` mapping."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        if isinstance(data, dict):
+            data = [
+                dict(point, game_title=game_title)
+                for game_title, points in data.items()
+                for point in points
+            ]
+
+        return [
+            (
+                record.get("game_title", ""),
+                _parse_record_price(record.get("price")),
+                _parse_record_date(record.get("date")),
+                record.get("promotion_type"),
+            )
+            for record in data
+            if _parse_record_date(record.get("date"))
+        ]
+
+
+class PriceHistoryBackfillJob:
+    """
+    Scheduled backfill of price history over the catalog.
+
+    By default the catalog is every game already tracked in the price store;
+    a custom ``titles_provider`` can add category listings or collections.
+    """
+
+    def __init__(
+        self,
+        ingestor: Optional[PriceHistoryIngestor] = None,
+        titles_provider: Optional[Callable[[], List[str]]] = None,
+        fetch_details: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+        interval_hours: float = 24.0,
+        max_workers: int = 4,
+    ):
+        """
+        Initialize the job.
+
+        Args:
+            ingestor: Ingestor used for writing (defaults to a new one)
+            titles_provider: Returns the game titles to backfill
+            fetch_details: Returns scraped details for a title
+            interval_hours: Time between scheduled runs
+            max_workers: Concurrent page fetches
+        """
+        self.ingestor = ingestor or PriceHistoryIngestor()
+        self.titles_provider = titles_provider or self.ingestor.engine.get_tracked_games
+        self.fetch_details = fetch_details or _fetch_game_details
+        self.interval_hours = interval_hours
+        self.max_workers = max_workers
+
+        self.last_run: Optional[Dict[str, Any]] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self, titles: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Backfill the given titles (or the whole catalog) once.
+
+        Returns:
+            Dict: Run summary with per-run counts and failed titles
+        """
+        start = time.time()
+        titles = list(
+            dict.fromkeys(titles if titles is not None else self.titles_provider())
+        )
+        logger.info(f"🔄 Price history backfill started for {len(titles)} games")
+
+        inserted = 0
+        failed = []
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            futures = {
+                executor.submit(self.fetch_details, title): title for title in titles
+            }
+            for future in as_completed(futures):
+                title = futures[future]
+                try:
+                    details = future.result()
+                except Exception as e:
+                    logger.warning(f"⚠️ Backfill fetch failed for {title}: {e}")
+                    details = None
+
+                if not details:
+                    failed.append(title)
+                    continue
+
+                # Keep the stored title stable for tracked games
+                details = dict(details, title=title)
+                inserted += self.ingestor.ingest_game_details(details)["inserted"]
+
+        # Retrain price models on the newly stored points
+        models = self.ingestor.engine.refresh_models(
+            [title for title in titles if title not in failed]
+        )
+
+        self.last_run = {
+            "started_at": datetime.fromtimestamp(start).isoformat(),
+            "duration_seconds": round(time.time() - start, 2),
+            "games": len(titles),
+            "failed_games": failed,
+            "points_inserted": inserted,
+            "models_retrained": models["retrained"],
+        }
+        logger.info(
+            f"✅ Price history backfill finished: {inserted} new points, "
+            f"{len(failed)} failed games"
+        )
+        return self.last_run
+
+    def start(self):
+        """Start running the backfill periodically in a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._schedule_loop, daemon=True)
+        self._thread.start()
+        logger.info(f"⏰ Price history backfill scheduled every {self.interval_hours}h")
+
+    def stop(self):
+        """Stop the scheduled backfill."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        logger.info("Price history backfill stopped")
+
+    def _schedule_loop(self):
+        """Background loop: run, then wait for the next interval."""
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Error in price history backfill: {e}")
+            self._stop_event.wait(self.interval_hours * 3600)
+
+
+def _fetch_game_details(game_title: str) -> Optional[Dict[str, Any]]:
+    """Search DekuDeals for a title and scrape its item page."""
+    from deku_tools import scrape_game_details, search_deku_deals
+
+    game_url = search_deku_deals(game_title)
+    return scrape_game_details(game_url) if game_url else None
@@ -0,0 +1,706 @@
+#!/usr/bin/env python3
+
+"""
+Price Model Registry for AutoGen DekuDeals
+==========================================
+
+Persisted, incrementally trained future-price models.
+
+Each model is a small ridge regression predicting the ratio between the
+price ``horizon_days`` ahead and the price at a point in time, from
+features of the history up to that point. Models are kept as sufficient
+statistics (``XᵀX``, ``Xᵀy``), so:
+- per-game models retrain incrementally: only samples whose target lands
+  past the stored data watermark are added. ``append`` takes just the
+  points stored after the watermark; the features of points still waiting
+  for their target (the last ``horizon_days``) are kept with the model
+- pooled models (per genre, per publisher and one global model) are sums
+  of their member games' statistics and need no extra pass over the data
+- inference is a lookup of cached coefficients plus one dot product with
+  features derived from a compact per-game series state
+
+Models are stored as JSON in ``price_data/models/price_models.json``.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .time_series import significant_drop_indices
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_FILE = "price_models.json"
+REGISTRY_VERSION = 1
+
+FEATURE_NAMES = [
+    "bias",
+    "price_to_max",
+    "price_to_mean",
+    "momentum",
+    "days_since_drop",
+]
+
+MOMENTUM_LAG = 5  # Points between the momentum price pair
+DROP_DAYS_CAP = 365.0  # Days-since-drop saturates (and scales) at one year
+RIDGE_PENALTY = 1e-3
+GLOBAL_MODEL_KEY = "global"
+
+# Placeholder values scraped when a field is missing
+UNKNOWN_GROUP_VALUES = {"", "Nieznany", "Unknown", "N/A"}
+
+SECONDS_PER_DAY = 86400.0
+
+
+def _to_days(dates: Sequence[datetime]) -> np.ndarray:
+    """Timestamps as fractional days."""
+    return np.fromiter(
+        (d.timestamp() / SECONDS_PER_DAY for d in dates), float, len(dates)
+    )
+
+
+def history_features(
+    prices: np.ndarray, days: np.ndarray, drop_threshold: float
+) -> np.ndarray:
+    """
+    Feature matrix with one row per history point.
+
+    Args:
+        prices: Prices in date order
+        days: Point times in (fractional) days
+        drop_threshold: Fractional drop counted as significant
+
+    Returns:
+        np.ndarray: (points, len(FEATURE_NAMES)) features
+    """
+    n = len(prices)
+    positions = np.arange(n)
+
+    prefix_max = np.maximum.accumulate(prices)
+    prefix_mean = np.cumsum(prices) / (positions + 1)
+    lagged = prices[np.maximum(positions - MOMENTUM_LAG, 0)]
+
+    last_drop = np.full(n, -1)
+    drops = significant_drop_indices(prices, drop_threshold)
+    last_drop[drops] = drops
+    last_drop = np.maximum.accumulate(last_drop)
+    since_drop = np.where(
+        last_drop >= 0, days - days[np.maximum(last_drop, 0)], DROP_DAYS_CAP
+    )
+
+    return np.column_stack(
+        [
+            np.ones(n),
+            np.divide(prices, prefix_max, out=np.ones(n), where=prefix_max > 0),
+            np.divide(prices, prefix_mean, out=np.ones(n), where=prefix_mean > 0),
+            np.divide(prices, lagged, out=np.ones(n), where=lagged > 0) - 1.0,
+            np.minimum(since_drop, DROP_DAYS_CAP) / DROP_DAYS_CAP,
+        ]
+    )
+
+
+def history_targets(
+    prices: np.ndarray, days: np.ndarray, horizon_days: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Future price ratio per point.
+
+    The target of point ``t`` is the first point at least ``horizon_days``
+    later; points without one (or with a zero price) are not valid samples.
+
+    Returns:
+        Tuple: (ratios, target indices, valid mask)
+    """
+    n = len(prices)
+    target_index = np.searchsorted(days, days + horizon_days, side="left")
+    valid = (target_index < n) & (prices > 0)
+    safe_index = np.minimum(target_index, n - 1)
+    ratios = np.divide(prices[safe_index], prices, out=np.ones(n), where=prices > 0)
+    return ratios, target_index, valid
+
+
+@dataclass
+class SeriesState:
+    """Running summary of a game's history, enough to build its features."""
+
+    count: int
+    total: float
+    maximum: float
+    tail: List[float]  # Last MOMENTUM_LAG + 1 prices
+    last_date: datetime
+    last_drop_date: Optional[datetime]
+
+    @classmethod
+    def from_history(
+        cls, prices: np.ndarray, dates: Sequence[datetime], drop_threshold: float
+    ) -> "SeriesState":
+        """Summarize a full history."""
+        drops = significant_drop_indices(prices, drop_threshold)
+        return cls(
+            count=len(prices),
+            total=float(prices.sum()),
+            maximum=float(prices.max()),
+            tail=prices[-(MOMENTUM_LAG + 1) :].tolist(),
+            last_date=dates[-1],
+            last_drop_date=dates[int(drops[-1])] if len(drops) else None,
+        )
+
+    def appended(
+        self, price: float, date: datetime, drop_threshold: float
+    ) -> "SeriesState":
+        """State after a (not stored) new observation."""
+        last_price = self.tail[-1]
+        dropped = last_price > 0 and (last_price - price) / last_price >= drop_threshold
+        return SeriesState(
+            count=self.count + 1,
+            total=self.total + price,
+            maximum=max(self.maximum, price),
+            tail=(self.tail + [price])[-(MOMENTUM_LAG + 1) :],
+            last_date=date,
+            last_drop_date=date if dropped else self.last_drop_date,
+        )
+
+    def features(self) -> np.ndarray:
+        """Features of the latest point (same as its ``history_features`` row)."""
+        price = self.tail[-1]
+        mean = self.total / self.count
+        lagged = self.tail[0]
+        if self.last_drop_date is None:
+            since_drop = DROP_DAYS_CAP
+        else:
+            since_drop = (
+                self.last_date - self.last_drop_date
+            ).total_seconds() / SECONDS_PER_DAY
+
+        return np.array(
+            [
+                1.0,
+                price / self.maximum if self.maximum > 0 else 1.0,
+                price / mean if mean > 0 else 1.0,
+                price / lagged - 1.0 if lagged > 0 else 0.0,
+                min(since_drop, DROP_DAYS_CAP) / DROP_DAYS_CAP,
+            ]
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "maximum": self.maximum,
+            "tail": self.tail,
+            "last_date": self.last_date.isoformat(),
+            "last_drop_date": (
+                self.last_drop_date.isoformat() if self.last_drop_date else None
+            ),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SeriesState":
+        return cls(
+            count=data["count"],
+            total=data["total"],
+            maximum=data["maximum"],
+            tail=list(data["tail"]),
+            last_date=datetime.fromisoformat(data["last_date"]),
+            last_drop_date=(
+                datetime.fromisoformat(data["last_drop_date"])
+                if data.get("last_drop_date")
+                else None
+            ),
+        )
+
+
+def _empty_xtx() -> np.ndarray:
+    return np.zeros((len(FEATURE_NAMES), len(FEATURE_NAMES)))
+
+
+def _empty_xty() -> np.ndarray:
+    return np.zeros(len(FEATURE_NAMES))
+
+
+@dataclass
+class PriceModel:
+    """Ridge model kept as sufficient statistics plus solved coefficients."""
+
+    key: str
+    xtx: np.ndarray = field(default_factory=_empty_xtx)
+    xty: np.ndarray = field(default_factory=_empty_xty)
+    samples: int = 0
+    coefficients: Optional[np.ndarray] = None
+    trained_at: Optional[datetime] = None
+
+    # Per-game models only
+    watermark: Optional[datetime] = None  # Date of the last consumed point
+    first_date: Optional[datetime] = None
+    points: int = 0  # History points consumed up to the watermark
+    state: Optional[SeriesState] = None
+    # [day, price, *features] of points whose target has not arrived yet
+    pending: Optional[List[List[float]]] = None
+
+    def reset(self):
+        """Drop accumulated statistics before a full refit."""
+        self.xtx = _empty_xtx()
+        self.xty = _empty_xty()
+        self.samples = 0
+
+    def accumulate(self, features: np.ndarray, targets: np.ndarray):
+        """Add training samples."""
+        self.xtx += features.T @ features
+        self.xty += features.T @ targets
+        self.samples += len(targets)
+
+    def solve(self, min_samples: int):
+        """Solve for coefficients (None while there are too few samples)."""
+        self.trained_at = datetime.now()
+        if self.samples < min_samples:
+            self.coefficients = None
+            return
+
+        penalty = RIDGE_PENALTY * self.samples * np.eye(len(FEATURE_NAMES))
+        try:
+            self.coefficients = np.linalg.solve(self.xtx + penalty, self.xty)
+        except np.linalg.LinAlgError:
+            self.coefficients = np.linalg.lstsq(
+                self.xtx + penalty, self.xty, rcond=None
+            )[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "xtx": self.xtx.tolist(),
+            "xty": self.xty.tolist(),
+            "samples": self.samples,
+            "coefficients": (
+                self.coefficients.tolist() if self.coefficients is not None else None
+            ),
+            "trained_at": self.trained_at.isoformat() if self.trained_at else None,
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "first_date": self.first_date.isoformat() if self.first_date else None,
+            "points": self.points,
+            "state": self.state.to_dict() if self.state else None,
+            "pending": self.pending,
+        }
+
+    @classmethod
+    def from_dict(cls, key: str, data: Dict[str, Any]) -> "PriceModel":
+        def parse_date(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            key=key,
+            xtx=np.array(data["xtx"], dtype=float),
+            xty=np.array(data["xty"], dtype=float),
+            samples=data["samples"],
+            coefficients=(
+                np.array(data["coefficients"], dtype=float)
+                if data.get("coefficients") is not None
+                else None
+            ),
+            trained_at=parse_date(data.get("trained_at")),
+            watermark=parse_date(data.get("watermark")),
+            first_date=parse_date(data.get("first_date")),
+            points=data.get("points", 0),
+            state=SeriesState.from_dict(data["state"]) if data.get("state") else None,
+            pending=data.get("pending"),
+        )
+
+
+class PriceModelRegistry:
+    """
+    Per-game and pooled future-price models with incremental retraining.
+
+    Usage:
+        registry = PriceModelRegistry("price_data/models")
+        registry.register_game("Hades", genres=["Action"], publisher="Supergiant")
+        registry.update("Hades", price_history)
+        registry.save()
+        predicted = registry.predict("Hades")
+    """
+
+    def __init__(
+        self,
+        models_dir: Union[str, Path],
+        horizon_days: int = 30,
+        drop_threshold: float = 0.15,
+        min_samples: int = 10,
+        save_interval: float = 60.0,
+    ):
+        """
+        Initialize the registry and load persisted models.
+
+        Args:
+            models_dir: Directory holding the registry file
+            horizon_days: Days ahead predicted by the models
+            drop_threshold: Fractional drop counted as significant
+            min_samples: Training samples required before a model is used
+            save_interval: Minimum seconds between ``save_if_due`` writes
+        """
+        self.models_dir = Path(models_dir)
+        self.models_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.models_dir / REGISTRY_FILE
+        self.horizon_days = horizon_days
+        self.drop_threshold = drop_threshold
+        self.min_samples = min_samples
+        self.save_interval = save_interval
+        self._last_save = time.monotonic()
+
+        self._lock = threading.RLock()
+        self._games: Dict[str, PriceModel] = {}
+        self._groups: Dict[str, PriceModel] = {}
+        self._memberships: Dict[str, Dict[str, Any]] = {}
+        self._groups_stale = False
+        self._dirty = False
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Training
+    # ------------------------------------------------------------------
+
+    def register_game(
+        self,
+        game_title: str,
+        genres: Optional[List[str]] = None,
+        publisher: Optional[str] = None,
+    ):
+        """Record the genre/publisher groups a game's data is pooled into."""
+        membership = {
+            "genres": sorted(
+                {g for g in genres or [] if g not in UNKNOWN_GROUP_VALUES}
+            ),
+            "publisher": (publisher if publisher not in UNKNOWN_GROUP_VALUES else None),
+        }
+        with self._lock:
+            if self._memberships.get(game_title) != membership:
+                self._memberships[game_title] = membership
+                self._groups_stale = self._dirty = True
+
+    def update(self, game_title: str, price_history: Sequence) -> bool:
+        """
+        Train a game's model on points past its watermark.
+
+        A full refit happens for new games and when the history changed
+        before the watermark (backfilled points or a moved history window).
+
+        Args:
+            game_title: Game title
+            price_history: ``PriceDataPoint``-like objects sorted by date
+
+        Returns:
+            bool: Whether the model was retrained
+        """
+        if not price_history:
+            return False
+
+        dates = [point.date for point in price_history]
+        with self._lock:
+            model = self._games.get(game_title)
+            consumed = (
+                bisect_right(dates, model.watermark) if model and model.watermark else 0
+            )
+            incremental = (
+                model is not None
+                and model.first_date == dates[0]
+                and consumed == model.points
+            )
+            if incremental and consumed == len(dates):
+                return False
+
+            prices = np.fromiter(
+                (point.price for point in price_history), float, len(dates)
+            )
+            days = _to_days(dates)
+            features = history_features(prices, days, self.drop_threshold)
+            targets, target_index, valid = history_targets(
+                prices, days, self.horizon_days
+            )
+
+            if incremental:
+                # Only samples whose target point arrived after the watermark
+                valid &= target_index >= consumed
+            else:
+                model = self._games.setdefault(game_title, PriceModel(game_title))
+                model.reset()
+
+            model.accumulate(features[valid], targets[valid])
+            model.solve(self.min_samples)
+            model.watermark = dates[-1]
+            model.first_date = dates[0]
+            model.points = len(dates)
+            model.state = SeriesState.from_history(prices, dates, self.drop_threshold)
+            waiting = target_index >= len(dates)
+            model.pending = np.column_stack(
+                [days[waiting], prices[waiting], features[waiting]]
+            ).tolist()
+
+            self._groups_stale = self._dirty = True
+
+        logger.debug(
+            f"🧮 {'Updated' if incremental else 'Fitted'} price model for "
+            f"{game_title} ({model.samples} samples)"
+        )
+        return True
+
+    def append(
+        self, game_title: str, new_points: Sequence, stored_before: int
+    ) -> Optional[bool]:
+        """
+        Train a game's model on points stored after its watermark only.
+
+        Each new point completes the samples of pending points at least
+        ``horizon_days`` older, then becomes pending itself; its features
+        come from the stored series state. The result equals ``update`` on
+        the full history.
+
+        Args:
+            game_title: Game title
+            new_points: ``PriceDataPoint``-like objects after the watermark,
+                sorted by date
+            stored_before: Points stored up to the watermark now
+
+        Returns:
+            Optional[bool]: Whether the model was retrained, or None when it
+            cannot be updated incrementally (no model yet, or points were
+            stored before the watermark) and needs ``update`` on the full
+            history
+        """
+        with self._lock:
+            model = self._games.get(game_title)
+            if (
+                model is None
+                or model.state is None
+                or model.pending is None
+                or stored_before != model.points
+            ):
+                return None
+            if not new_points:
+                return False
+
+            state, pending = model.state, model.pending
+            features, targets = [], []
+            for point in new_points:
+                day = point.date.timestamp() / SECONDS_PER_DAY
+                waiting = []
+                for row in pending:
+                    if row[0] + self.horizon_days <= day:
+                        if row[1] > 0:  # First point past the horizon
+                            features.append(row[2:])
+                            targets.append(point.price / row[1])
+                    else:
+                        waiting.append(row)
+                state = state.appended(point.price, point.date, self.drop_threshold)
+                waiting.append([day, point.price, *state.features().tolist()])
+                pending = waiting
+
+            if targets:
+                model.accumulate(np.array(features), np.array(targets))
+            model.solve(self.min_samples)
+            model.watermark = new_points[-1].date
+            model.points += len(new_points)
+            model.state, model.pending = state, pending
+
+            self._groups_stale = self._dirty = True
+        return True
+
+    def watermark(self, game_title: str) -> Optional[datetime]:
+        """Date of the last point a game's model was trained on."""
+        with self._lock:
+            model = self._games.get(game_title)
+            return model.watermark if model else None
+
+    def _refresh_groups(self):
+        """Rebuild pooled models from member statistics."""
+        groups: Dict[str, PriceModel] = {GLOBAL_MODEL_KEY: PriceModel(GLOBAL_MODEL_KEY)}
+
+        for title, model in self._games.items():
+            for key in [GLOBAL_MODEL_KEY, *self._group_keys(title)]:
+                group = groups.setdefault(key, PriceModel(key))
+                group.xtx += model.xtx
+                group.xty += model.xty
+                group.samples += model.samples
+
+        for group in groups.values():
+            group.solve(self.min_samples)
+
+        self._groups = groups
+        self._groups_stale = False
+
+    def _group_keys(self, game_title: str) -> List[str]:
+        """Pooled model keys of a game (genres first, then publisher)."""
+        membership = self._memberships.get(game_title) or {}
+        keys = [f"genre:{genre}" for genre in membership.get("genres", [])]
+        if membership.get("publisher"):
+            keys.append(f"publisher:{membership['publisher']}")
+        return keys
+
+    # ------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------
+
+    def model_for(self, game_title: str) -> Optional[PriceModel]:
+        """
+        Most specific trained model for a game.
+
+        Order: the game's own model, its best-trained genre model, its
+        publisher model, then the global model.
+        """
+        with self._lock:
+            model = self._games.get(game_title)
+            if model is not None and model.coefficients is not None:
+                return model
+
+            if self._groups_stale:
+                self._refresh_groups()
+
+            membership = self._memberships.get(game_title) or {}
+            genre_models = [
+                self._groups.get(f"genre:{genre}")
+                for genre in membership.get("genres", [])
+            ]
+            genre_models = [m for m in genre_models if m and m.coefficients is not None]
+            if genre_models:
+                return max(genre_models, key=lambda m: m.samples)
+
+            for key in (f"publisher:{membership.get('publisher')}", GLOBAL_MODEL_KEY):
+                model = self._groups.get(key)
+                if model is not None and model.coefficients is not None:
+                    return model
+            return None
+
+    def predict(
+        self,
+        game_title: str,
+        current_price: Optional[float] = None,
+        date: Optional[datetime] = None,
+    ) -> Optional[float]:
+        """
+        Predicted price ``horizon_days`` ahead.
+
+        Without ``current_price`` the prediction is made from the game's last
+        stored point; otherwise ``current_price`` is treated as a new
+        observation at ``date`` (default now) without storing it.
+
+        Returns:
+            Optional[float]: Predicted price, or None without a usable model
+        """
+        with self._lock:
+            game = self._games.get(game_title)
+            state = game.state if game else None
+            model = self.model_for(game_title)
+        if model is None:
+            return None
+
+        if current_price is not None:
+            if state is None:
+                features = np.array([1.0, 1.0, 1.0, 0.0, 1.0])
+            else:
+                state = state.appended(
+                    current_price, date or datetime.now(), self.drop_threshold
+                )
+                features = state.features()
+            base_price = current_price
+        elif state is not None:
+            features = state.features()
+            base_price = state.tail[-1]
+        else:
+            return None
+
+        return float(base_price * (features @ model.coefficients))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Registry summary."""
+        with self._lock:
+            if self._groups_stale:
+                self._refresh_groups()
+            return {
+                "games": len(self._games),
+                "trained_games": sum(
+                    m.coefficients is not None for m in self._games.values()
+                ),
+                "pooled_models": len(self._groups),
+                "total_samples": sum(m.samples for m in self._games.values()),
+            }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save_if_due(self) -> bool:
+        """Save at most every ``save_interval`` seconds (prediction path)."""
+        if time.monotonic() - self._last_save < self.save_interval:
+            return False
+        return self.save()
+
+    def save(self) -> bool:
+        """Write the registry if it changed (atomic replace)."""
+        with self._lock:
+            self._last_save = time.monotonic()
+            if not self._dirty:
+                return False
+            if self._groups_stale:
+                self._refresh_groups()
+
+            data = {
+                "version": REGISTRY_VERSION,
+                "feature_names": FEATURE_NAMES,
+                "horizon_days": self.horizon_days,
+                "drop_threshold": self.drop_threshold,
+                "memberships": self._memberships,
+                "games": {t: m.to_dict() for t, m in self._games.items()},
+                "groups": {k: m.to_dict() for k, m in self._groups.items()},
+            }
+            temp_path = self.path.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+
+        logger.debug(f"💾 Saved {len(self._games)} price models to {self.path}")
+        return True
+
+    def _load(self):
+        """Load persisted models (ignored if trained with other settings)."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+
+            compatible = (
+                data.get("version") == REGISTRY_VERSION
+                and data.get("feature_names") == FEATURE_NAMES
+                and data.get("horizon_days") == self.horizon_days
+                and data.get("drop_threshold") == self.drop_threshold
+            )
+            if not compatible:
+                logger.info(
+                    "🔄 Price models were trained with other settings, refitting"
+                )
+                return
+
+            self._memberships = data.get("memberships", {})
+            self._games = {
+                title: PriceModel.from_dict(title, model)
+                for title, model in data.get("games", {}).items()
+            }
+            self._groups = {
+                key: PriceModel.from_dict(key, model)
+                for key, model in data.get("groups", {}).items()
+            }
+            logger.info(f"🧮 Loaded {len(self._games)} price models from {self.path}")
+
+        except Exception as e:
+            logger.error(f"❌ Error loading price models: {e}")
+            self._games, self._groups, self._memberships = {}, {}, {}
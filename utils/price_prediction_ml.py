@@ -17,22 +17,82 @@ Version: 7.1.0
 
 import json
 import logging
-import sqlite3
-import statistics
+import threading
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-import numpy as np
-from sklearn.linear_model import LinearRegression
+from typing import Dict, Iterable, List, Optional, Tuple, Any, Union
 from sklearn.preprocessing import StandardScaler
 import pickle
 
+from utils.price_model_registry import PriceModelRegistry
+from utils.price_rollups import PriceRollups
+from utils.price_series_store import PriceSeriesStore, StoredSeries, day_number
+from utils.price_trend_batch import (
+    GameTrendStatistics,
+    PriceSeriesBatch,
+    compute_trend_statistics,
+)
+from utils.sqlite_pool import SQLiteConnectionPool
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Statements are kept constant so pooled connections reuse their prepared form
+INSERT_PRICE_SQL = """
+    INSERT OR IGNORE INTO price_history
+    (game_title, date, price, promotion_type)
+    VALUES (?, ?, ?, ?)
+"""
+
+SELECT_PRICE_HISTORIES_SQL = """
+    SELECT game_title, date, price, promotion_type
+    FROM price_history
+    WHERE game_title IN ({placeholders}) AND date >= ?
+    ORDER BY game_title, date ASC
+"""
+
+# Titles per IN (...) query, below SQLite's bound parameter limit
+HISTORY_QUERY_CHUNK = 500
+
+SELECT_PRICE_HISTORY_SQL = """
+    SELECT date, price, promotion_type
+    FROM price_history
+    WHERE game_title = ? AND date >= ? AND date <= ?
+    ORDER BY date ASC
+"""
+
+# Points past a model watermark (incremental training)
+SELECT_PRICES_AFTER_SQL = """
+    SELECT date, price, promotion_type
+    FROM price_history
+    WHERE game_title = ? AND date > ? AND date <= ?
+    ORDER BY date ASC
+"""
+
+# Upper date bound of queries without an ``as_of`` date
+LATEST_DATE = datetime.max.isoformat()
+
+COUNT_PRICES_UNTIL_SQL = """
+    SELECT COUNT(*)
+    FROM price_history
+    WHERE game_title = ? AND date <= ?
+"""
+
+SELECT_RECENT_PRICES_SQL = """
+    SELECT date, price, promotion_type
+    FROM price_history
+    WHERE game_title = ? AND date >= ?
+    ORDER BY date DESC
+    LIMIT ?
+"""
+
+
+# Point lists, or zero-copy arrays from the columnar series store
+PriceHistory = Union[List["PriceDataPoint"], StoredSeries]
+
 
 class PriceTrend(Enum):
     """Price trend classifications."""
@@ -138,24 +198,38 @@ class PricePredictionEngine:
 
         # Database for price history
         self.db_path = self.data_dir / "price_history.db"
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_database()
 
-        # ML models cache
-        self.models_dir = self.data_dir / "models"
-        self.models_dir.mkdir(exist_ok=True)
+        # Memory-mapped columnar copy of the history for array reads
+        self.series_store = PriceSeriesStore(self.data_dir / "series")
+        self._series_lock = threading.Lock()
+        self._series_stale = True
 
         # Prediction parameters
         self.min_data_points = 5
         self.prediction_timeframe_days = 30
         self.significant_drop_threshold = 0.15  # 15% drop
 
+        # Persisted, incrementally trained future-price models
+        self.models_dir = self.data_dir / "models"
+        self.model_registry = PriceModelRegistry(
+            self.models_dir,
+            horizon_days=self.prediction_timeframe_days,
+            drop_threshold=self.significant_drop_threshold,
+        )
+
+        # Daily/weekly aggregates maintained by a trigger on price_history
+        self.rollups = PriceRollups(self._pool, self.significant_drop_threshold)
+        self.rollups.ensure_schema()
+
         logger.info(
             f"🧠 PricePredictionEngine initialized with data_dir: {self.data_dir}"
         )
 
     def _init_database(self):
         """Initialize SQLite database for price history."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.write() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS price_history (
@@ -180,6 +254,11 @@ class PricePredictionEngine:
 
             logger.info("📊 Price history database initialized")
 
+    def close(self):
+        """Save price models and close pooled database connections."""
+        self.model_registry.save()
+        self._pool.close()
+
     def record_price_data(
         self,
         game_title: str,
@@ -192,23 +271,15 @@ class PricePredictionEngine:
             if date is None:
                 date = datetime.now()
 
-            point = PriceDataPoint(
-                date=date, price=price, promotion_type=promotion_type
-            )
-
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO price_history 
-                    (game_title, date, price, promotion_type)
-                    VALUES (?, ?, ?, ?)
-                """,
+            with self._pool.write() as conn:
+                rows_affected = conn.execute(
+                    INSERT_PRICE_SQL,
                     (game_title, date.isoformat(), price, promotion_type),
-                )
-
-                rows_affected = conn.total_changes
+                ).rowcount
+                self.rollups.apply_backfills(conn)
 
             if rows_affected > 0:
+                self._series_stale = True
                 logger.debug(
                     f"📈 Recorded price data: {game_title} = ${price:.2f} on {date.date()}"
                 )
@@ -223,33 +294,91 @@ class PricePredictionEngine:
             logger.error(f"❌ Error recording price data: {e}")
             return False
 
+    def record_price_data_bulk(
+        self,
+        records: Iterable[Tuple[str, float, Optional[datetime], Optional[str]]],
+    ) -> int:
+        """
+        Record many price data points in a single transaction.
+
+        Args:
+            records: (game_title, price, date, promotion_type) tuples;
+                a missing date means now
+
+        Returns:
+            int: Number of new price points stored (duplicates are ignored)
+        """
+        try:
+            now = datetime.now()
+            rows = [
+                (game_title, (date or now).isoformat(), price, promotion_type)
+                for game_title, price, date, promotion_type in records
+            ]
+            if not rows:
+                return 0
+
+            with self._pool.write() as conn:
+                inserted = conn.executemany(INSERT_PRICE_SQL, rows).rowcount
+                # Backfilled games are recomputed once per transaction
+                self.rollups.apply_backfills(conn)
+
+            if inserted > 0:
+                self._series_stale = True
+            logger.debug(f"📈 Recorded {inserted}/{len(rows)} price data points")
+            return inserted
+
+        except Exception as e:
+            logger.error(f"❌ Error recording bulk price data: {e}")
+            return 0
+
+    def get_tracked_games(self) -> List[str]:
+        """Get titles of all games with stored price history."""
+        try:
+            with self._pool.read() as conn:
+                rows = conn.execute(
+                    "SELECT DISTINCT game_title FROM price_history ORDER BY game_title"
+                ).fetchall()
+            return [row[0] for row in rows]
+
+        except Exception as e:
+            logger.error(f"❌ Error getting tracked games: {e}")
+            return []
+
     def get_price_history(
-        self, game_title: str, days_back: int = 365
+        self,
+        game_title: str,
+        days_back: Optional[int] = 365,
+        as_of: Optional[datetime] = None,
     ) -> List[PriceDataPoint]:
-        """Get historical price data for a game."""
+        """
+        Get historical price data for a game.
+
+        Args:
+            game_title: Name of the game
+            days_back: Days of history before ``as_of`` (None: all of it)
+            as_of: Last date included (default: now, with nothing excluded)
+        """
         try:
-            cutoff_date = datetime.now() - timedelta(days=days_back)
+            cutoff = (
+                ((as_of or datetime.now()) - timedelta(days=days_back)).isoformat()
+                if days_back is not None
+                else ""
+            )
+            until = as_of.isoformat() if as_of else LATEST_DATE
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.read() as conn:
                 cursor = conn.execute(
-                    """
-                    SELECT date, price, promotion_type
-                    FROM price_history 
-                    WHERE game_title = ? AND date >= ?
-                    ORDER BY date ASC
-                """,
-                    (game_title, cutoff_date.isoformat()),
+                    SELECT_PRICE_HISTORY_SQL, (game_title, cutoff, until)
                 )
 
-                history = []
-                for row in cursor.fetchall():
-                    history.append(
-                        PriceDataPoint(
-                            date=datetime.fromisoformat(row[0]),
-                            price=row[1],
-                            promotion_type=row[2],
-                        )
+                history = [
+                    PriceDataPoint(
+                        date=datetime.fromisoformat(row[0]),
+                        price=row[1],
+                        promotion_type=row[2],
                     )
+                    for row in cursor.fetchall()
+                ]
 
                 logger.debug(
                     f"📊 Retrieved {len(history)} price points for {game_title}"
@@ -260,8 +389,148 @@ class PricePredictionEngine:
             logger.error(f"❌ Error getting price history: {e}")
             return []
 
+    def get_recent_price_points(
+        self, game_title: str, limit: int = 30, days_back: int = 365
+    ) -> List[PriceDataPoint]:
+        """Get the most recent ``limit`` price points of a game, oldest first."""
+        try:
+            cutoff_date = datetime.now() - timedelta(days=days_back)
+            with self._pool.read() as conn:
+                rows = conn.execute(
+                    SELECT_RECENT_PRICES_SQL,
+                    (game_title, cutoff_date.isoformat(), limit),
+                ).fetchall()
+
+            return [
+                PriceDataPoint(
+                    date=datetime.fromisoformat(date),
+                    price=price,
+                    promotion_type=promotion_type,
+                )
+                for date, price, promotion_type in reversed(rows)
+            ]
+
+        except Exception as e:
+            logger.error(f"❌ Error getting recent price points: {e}")
+            return []
+
+    def get_price_histories(
+        self, game_titles: List[str], days_back: int = 365
+    ) -> Dict[str, List[PriceDataPoint]]:
+        """Get historical price data for many games with batched queries."""
+        histories: Dict[str, List[PriceDataPoint]] = {
+            title: [] for title in game_titles
+        }
+        try:
+            cutoff = (datetime.now() - timedelta(days=days_back)).isoformat()
+            titles = list(histories)
+
+            with self._pool.read() as conn:
+                for start in range(0, len(titles), HISTORY_QUERY_CHUNK):
+                    chunk = titles[start : start + HISTORY_QUERY_CHUNK]
+                    sql = SELECT_PRICE_HISTORIES_SQL.format(
+                        placeholders=", ".join("?" * len(chunk))
+                    )
+                    for title, date, price, promotion_type in conn.execute(
+                        sql, (*chunk, cutoff)
+                    ):
+                        histories[title].append(
+                            PriceDataPoint(
+                                date=datetime.fromisoformat(date),
+                                price=price,
+                                promotion_type=promotion_type,
+                            )
+                        )
+
+            return histories
+
+        except Exception as e:
+            logger.error(f"❌ Error getting price histories: {e}")
+            return histories
+
+    def sync_series_store(self) -> int:
+        """Copy new SQLite rows into the columnar series store."""
+        with self._series_lock:
+            self._series_stale = False
+            return self.series_store.sync(self._pool)
+
+    def get_price_series(
+        self, game_title: str, days_back: int = 365
+    ) -> Optional[StoredSeries]:
+        """
+        Get a game's price history as zero-copy float32/int32 array views.
+
+        Args:
+            game_title: Game title
+            days_back: Days of history to include
+
+        Returns:
+            Optional[StoredSeries]: Series (day resolution), None if untracked
+        """
+        return self.get_price_series_many([game_title], days_back).get(game_title)
+
+    def get_price_series_many(
+        self, game_titles: List[str], days_back: int = 365
+    ) -> Dict[str, StoredSeries]:
+        """Get array-backed price histories of many games (tracked ones only)."""
+        try:
+            if self._series_stale:
+                self.sync_series_store()
+
+            since_day = day_number(datetime.now() - timedelta(days=days_back))
+            series = {}
+            for title in game_titles:
+                game_series = self.series_store.series(title, since_day)
+                if game_series is not None:
+                    series[title] = game_series
+            return series
+
+        except Exception as e:
+            logger.error(f"❌ Error getting price series: {e}")
+            return {}
+
+    def compute_trend_statistics(
+        self, histories: Dict[str, PriceHistory]
+    ) -> Dict[str, GameTrendStatistics]:
+        """
+        Compute trend statistics for many games in one vectorized pass.
+
+        Args:
+            histories: Price history per game (sorted by date), as point
+                lists or ``StoredSeries`` arrays
+
+        Returns:
+            Dict[str, GameTrendStatistics]: Statistics per game title
+        """
+        batch = PriceSeriesBatch.from_histories(histories)
+        return compute_trend_statistics(
+            batch,
+            drop_threshold=self.significant_drop_threshold,
+            drop_window=self.prediction_timeframe_days,
+        ).by_title()
+
+    def _trend_statistics(self, price_history: PriceHistory) -> GameTrendStatistics:
+        """Trend statistics of a single history."""
+        return self.compute_trend_statistics({"": price_history})[""]
+
+    @staticmethod
+    def _classify_trend(slope: float, volatility: float) -> PriceTrend:
+        """Classify a trend from its slope and volatility."""
+        if abs(slope) < 0.01:  # Very small slope
+            return PriceTrend.STABLE
+        elif slope < -0.05:  # Declining
+            return PriceTrend.DECLINING
+        elif slope > 0.05:  # Rising
+            return PriceTrend.RISING
+        elif volatility > 0.3:  # High volatility
+            return PriceTrend.VOLATILE
+        else:
+            return PriceTrend.STABLE
+
     def analyze_price_trend(
-        self, price_history: List[PriceDataPoint]
+        self,
+        price_history: PriceHistory,
+        trend_stats: Optional[GameTrendStatistics] = None,
     ) -> Dict[str, Any]:
         """Analyze price trend from historical data."""
         if len(price_history) < 3:
@@ -273,44 +542,16 @@ class PricePredictionEngine:
                 "analysis": "Insufficient data for trend analysis",
             }
 
-        # Convert to numerical data
-        prices = [point.price for point in price_history]
-        dates = [(point.date - price_history[0].date).days for point in price_history]
-
-        # Calculate trend using linear regression
         try:
-            X = np.array(dates).reshape(-1, 1)
-            y = np.array(prices)
-
-            model = LinearRegression()
-            model.fit(X, y)
-
-            slope = model.coef_[0]
-            r_squared = model.score(X, y)
-
-            # Calculate volatility (coefficient of variation)
-            price_std = np.std(prices)
-            price_mean = np.mean(prices)
-            volatility = price_std / price_mean if price_mean > 0 else 0
-
-            # Determine trend
-            if abs(slope) < 0.01:  # Very small slope
-                trend = PriceTrend.STABLE
-            elif slope < -0.05:  # Declining
-                trend = PriceTrend.DECLINING
-            elif slope > 0.05:  # Rising
-                trend = PriceTrend.RISING
-            elif volatility > 0.3:  # High volatility
-                trend = PriceTrend.VOLATILE
-            else:
-                trend = PriceTrend.STABLE
+            stats = trend_stats or self._trend_statistics(price_history)
+            trend = self._classify_trend(stats.slope, stats.volatility)
 
             return {
                 "trend": trend,
-                "confidence": r_squared,
-                "slope": slope,
-                "volatility": volatility,
-                "analysis": f"Trend: {trend.value}, R²: {r_squared:.3f}, Volatility: {volatility:.3f}",
+                "confidence": stats.r_squared,
+                "slope": stats.slope,
+                "volatility": stats.volatility,
+                "analysis": f"Trend: {trend.value}, R²: {stats.r_squared:.3f}, Volatility: {stats.volatility:.3f}",
             }
 
         except Exception as e:
@@ -324,49 +565,28 @@ class PricePredictionEngine:
             }
 
     def calculate_price_drop_probability(
-        self, game_title: str, price_history: List[PriceDataPoint]
+        self,
+        game_title: str,
+        price_history: PriceHistory,
+        trend_stats: Optional[GameTrendStatistics] = None,
+        trend_analysis: Optional[Dict[str, Any]] = None,
+        as_of: Optional[datetime] = None,
     ) -> float:
         """Calculate probability of significant price drop in next 30 days."""
         if len(price_history) < self.min_data_points:
             return 0.5  # Default uncertainty
 
         try:
-            prices = [point.price for point in price_history]
-            current_price = prices[-1]
-
-            # Analyze historical drops
-            significant_drops = 0
-            total_periods = 0
-
-            for i in range(len(prices) - 30, len(prices)):
-                if i < 0:
-                    continue
-
-                # Look at 30-day periods
-                period_start = max(0, i - 30)
-                period_prices = prices[period_start : i + 1]
+            stats = trend_stats or self._trend_statistics(price_history)
 
-                if len(period_prices) < 2:
-                    continue
-
-                period_high = max(period_prices)
-                period_low = min(period_prices)
-
-                if period_high > 0:
-                    drop_percentage = (period_high - period_low) / period_high
-                    if drop_percentage >= self.significant_drop_threshold:
-                        significant_drops += 1
-
-                total_periods += 1
-
-            if total_periods == 0:
+            # Base probability from historical 30-day windows
+            if stats.window_drop_rate is None:
                 return 0.5
-
-            # Base probability from historical pattern
-            base_probability = significant_drops / total_periods
+            base_probability = stats.window_drop_rate
 
             # Adjust based on trend analysis
-            trend_analysis = self.analyze_price_trend(price_history)
+            if trend_analysis is None:
+                trend_analysis = self.analyze_price_trend(price_history, stats)
             trend = trend_analysis["trend"]
 
             if trend == PriceTrend.DECLINING:
@@ -377,7 +597,9 @@ class PricePredictionEngine:
                 base_probability *= 1.1  # Slightly higher for volatile
 
             # Adjust based on time since last significant drop
-            days_since_last_drop = self._days_since_last_significant_drop(price_history)
+            days_since_last_drop = self._days_since_last_significant_drop(
+                price_history, stats, as_of
+            )
             if days_since_last_drop > 90:  # 3 months
                 base_probability *= 1.2
             elif days_since_last_drop < 30:  # 1 month
@@ -390,51 +612,43 @@ class PricePredictionEngine:
             return 0.5
 
     def _days_since_last_significant_drop(
-        self, price_history: List[PriceDataPoint]
+        self,
+        price_history: PriceHistory,
+        trend_stats: Optional[GameTrendStatistics] = None,
+        as_of: Optional[datetime] = None,
     ) -> int:
-        """Calculate days since last significant price drop."""
+        """Calculate days since last significant price drop (as of now by default)."""
         if len(price_history) < 2:
             return 999  # Large number indicating no recent drops
 
-        prices = [point.price for point in price_history]
-        dates = [point.date for point in price_history]
-
-        # Look for last significant drop
-        for i in range(len(prices) - 1, 0, -1):
-            current_price = prices[i]
-            previous_price = prices[i - 1]
-
-            if previous_price > 0:
-                drop_percentage = (previous_price - current_price) / previous_price
-                if drop_percentage >= self.significant_drop_threshold:
-                    days_ago = (datetime.now() - dates[i]).days
-                    return max(0, days_ago)
-
-        return 999
+        stats = trend_stats or self._trend_statistics(price_history)
+        return stats.days_since_last_drop(as_of)
 
     def predict_target_price(
         self,
         game_title: str,
-        price_history: List[PriceDataPoint],
+        price_history: PriceHistory,
         user_budget_preference: Optional[float] = None,
+        trend_stats: Optional[GameTrendStatistics] = None,
+        trend_analysis: Optional[Dict[str, Any]] = None,
     ) -> Optional[float]:
         """Predict optimal target price for purchase."""
         if len(price_history) < self.min_data_points:
             return None
 
         try:
-            prices = [point.price for point in price_history]
+            stats = trend_stats or self._trend_statistics(price_history)
 
             # Calculate statistical targets
-            historical_low = min(prices)
-            median_price = statistics.median(prices)
-            q1_price = np.percentile(prices, 25)  # 25th percentile
+            historical_low = stats.minimum
+            q1_price = stats.q1  # 25th percentile
 
             # Base target on historical patterns
             base_target = (historical_low + q1_price) / 2
 
             # Adjust based on trend
-            trend_analysis = self.analyze_price_trend(price_history)
+            if trend_analysis is None:
+                trend_analysis = self.analyze_price_trend(price_history, stats)
             trend = trend_analysis["trend"]
 
             if trend == PriceTrend.DECLINING:
@@ -458,7 +672,12 @@ class PricePredictionEngine:
             return None
 
     def generate_price_prediction(
-        self, game_title: str, current_price: float, user_id: Optional[str] = None
+        self,
+        game_title: str,
+        current_price: float,
+        user_id: Optional[str] = None,
+        genres: Optional[List[str]] = None,
+        publisher: Optional[str] = None,
     ) -> PricePrediction:
         """
         Generate comprehensive ML price prediction for a game.
@@ -467,6 +686,8 @@ class PricePredictionEngine:
             game_title: Name of the game
             current_price: Current price of the game
             user_id: Optional user ID for personalized predictions
+            genres: Game genres (pooled models for sparse histories)
+            publisher: Game publisher (pooled models for sparse histories)
 
         Returns:
             PricePrediction: Comprehensive prediction with ML insights
@@ -482,67 +703,275 @@ class PricePredictionEngine:
             # Get historical data
             price_history = self.get_price_history(game_title)
 
-            if len(price_history) < self.min_data_points:
-                return self._generate_limited_prediction(game_title, current_price)
-
-            # Analyze trend
-            trend_analysis = self.analyze_price_trend(price_history)
-            trend = trend_analysis["trend"]
-
-            # Calculate drop probability
-            drop_probability = self.calculate_price_drop_probability(
-                game_title, price_history
+            if genres or publisher:
+                self.register_game_groups(game_title, genres, publisher)
+            prediction = self._build_prediction(
+                game_title, current_price, price_history
             )
+            self.model_registry.save_if_due()
+            return prediction
 
-            # Predict target price
-            target_price = self.predict_target_price(game_title, price_history)
+        except Exception as e:
+            logger.error(f"❌ Error generating price prediction: {e}")
+            return self._generate_error_prediction(game_title, current_price, str(e))
 
-            # Determine confidence level
-            confidence = self._calculate_prediction_confidence(
-                trend_analysis, len(price_history)
-            )
+    def predict_as_of(
+        self,
+        game_title: str,
+        price_history: List[PriceDataPoint],
+        as_of: datetime,
+        current_price: Optional[float] = None,
+    ) -> PricePrediction:
+        """
+        Generate a prediction as it would have been made at ``as_of``.
 
-            # Generate prediction reasons
-            reasons = self._generate_prediction_reasons(
-                trend_analysis, drop_probability, price_history, current_price
-            )
+        Goes through the same path as ``generate_price_prediction`` - price
+        recording, history reads, model training and saves - with ``as_of``
+        replacing now. Used by the backtest to replay stored histories.
 
-            # Calculate additional metrics
-            prices = [point.price for point in price_history]
-            historical_low = min(prices) if prices else current_price
-            avg_discount = self._calculate_average_discount(prices, current_price)
+        Args:
+            game_title: Name of the game
+            price_history: Points to record first; points after ``as_of``
+                and already stored points are ignored
+            as_of: Date the prediction is made at
+            current_price: Price at ``as_of`` (default: last stored price)
 
-            # Predict next significant drop (simplified heuristic)
-            next_drop_date = self._predict_next_drop_date(
-                price_history, drop_probability
+        Returns:
+            PricePrediction: Prediction using data up to ``as_of`` only
+        """
+        try:
+            self.record_price_data_bulk(
+                (game_title, point.price, point.date, point.promotion_type)
+                for point in price_history
+                if point.date <= as_of
             )
+            history = self.get_price_history(game_title, as_of=as_of)
+            if current_price is None:
+                current_price = history[-1].price if history else 0.0
 
-            # ML prediction of future price (30 days)
-            predicted_price = self._predict_future_price(price_history, current_price)
-
-            prediction = PricePrediction(
-                game_title=game_title,
-                current_price=current_price,
-                predicted_price=predicted_price,
-                price_drop_probability=drop_probability,
-                trend=trend,
-                confidence=confidence,
-                target_price=target_price,
-                prediction_timeframe=self.prediction_timeframe_days,
-                historical_low=historical_low,
-                average_discount_percentage=avg_discount,
-                reasons=reasons,
-                next_significant_drop_date=next_drop_date,
+            prediction = self._build_prediction(
+                game_title, current_price, history, as_of=as_of
             )
+            self.model_registry.save_if_due()
+            return prediction
 
-            logger.info(
-                f"✅ Price prediction complete: {trend.value} trend, {drop_probability:.1%} drop probability"
+        except Exception as e:
+            logger.error(f"❌ Error generating price prediction as of {as_of}: {e}")
+            return self._generate_error_prediction(
+                game_title, current_price or 0.0, str(e)
             )
-            return prediction
 
+    def register_game_groups(
+        self,
+        game_title: str,
+        genres: Optional[List[str]] = None,
+        publisher: Optional[str] = None,
+    ):
+        """Record a game's genres/publisher for pooled models and group rollups."""
+        self.model_registry.register_game(game_title, genres, publisher)
+        try:
+            self.rollups.set_game_groups(game_title, genres, publisher)
         except Exception as e:
-            logger.error(f"❌ Error generating price prediction: {e}")
-            return self._generate_error_prediction(game_title, current_price, str(e))
+            logger.error(f"❌ Error updating price rollup groups: {e}")
+
+    def generate_price_predictions(
+        self, current_prices: Dict[str, float], user_id: Optional[str] = None
+    ) -> Dict[str, PricePrediction]:
+        """
+        Generate predictions for many games with shared vectorized statistics.
+
+        Current prices are recorded in one transaction, histories are loaded
+        with batched queries and trend statistics are computed once for all
+        games.
+
+        Args:
+            current_prices: Current price per game title
+            user_id: Optional user ID for personalized predictions
+
+        Returns:
+            Dict[str, PricePrediction]: Prediction per game title
+        """
+        logger.info(f"🧠 Generating price predictions for {len(current_prices)} games")
+
+        now = datetime.now()
+        self.record_price_data_bulk(
+            (title, price, now, None) for title, price in current_prices.items()
+        )
+        histories = self.get_price_histories(list(current_prices))
+        statistics_by_title = self.compute_trend_statistics(
+            {
+                title: history
+                for title, history in histories.items()
+                if len(history) >= self.min_data_points
+            }
+        )
+
+        predictions = {}
+        for title, current_price in current_prices.items():
+            try:
+                predictions[title] = self._build_prediction(
+                    title,
+                    current_price,
+                    histories.get(title, []),
+                    statistics_by_title.get(title),
+                )
+            except Exception as e:
+                logger.error(f"❌ Error generating price prediction for {title}: {e}")
+                predictions[title] = self._generate_error_prediction(
+                    title, current_price, str(e)
+                )
+
+        self.model_registry.save_if_due()
+        return predictions
+
+    def refresh_models(self, game_titles: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Retrain price models on points stored since their watermarks.
+
+        Args:
+            game_titles: Games to refresh (default: every tracked game)
+
+        Returns:
+            Dict: ``games`` checked and ``retrained`` models
+        """
+        titles = game_titles if game_titles is not None else self.get_tracked_games()
+
+        retrained = 0
+        for title in titles:
+            try:
+                retrained += self._update_model(title)
+            except Exception as e:
+                logger.error(f"❌ Error retraining price model for {title}: {e}")
+        self.model_registry.save()
+
+        logger.info(f"🧮 Price models refreshed: {retrained}/{len(titles)} retrained")
+        return {"games": len(titles), "retrained": retrained}
+
+    def _update_model(self, game_title: str, until: Optional[datetime] = None) -> bool:
+        """
+        Train a game's model on stored points past its watermark.
+
+        Only rows after the watermark are read; the full stored history is
+        loaded for new models, when points were stored before the watermark
+        and when the model was trained past ``until``.
+
+        Args:
+            game_title: Name of the game
+            until: Last date trained on (default: every stored point)
+
+        Returns:
+            bool: Whether the model was retrained
+        """
+        watermark = self.model_registry.watermark(game_title)
+        if watermark is not None and (until is None or watermark <= until):
+            with self._pool.read() as conn:
+                stored_before = conn.execute(
+                    COUNT_PRICES_UNTIL_SQL, (game_title, watermark.isoformat())
+                ).fetchone()[0]
+                rows = conn.execute(
+                    SELECT_PRICES_AFTER_SQL,
+                    (
+                        game_title,
+                        watermark.isoformat(),
+                        until.isoformat() if until else LATEST_DATE,
+                    ),
+                ).fetchall()
+            new_points = [
+                PriceDataPoint(
+                    date=datetime.fromisoformat(row[0]),
+                    price=row[1],
+                    promotion_type=row[2],
+                )
+                for row in rows
+            ]
+            retrained = self.model_registry.append(
+                game_title, new_points, stored_before
+            )
+            if retrained is not None:
+                return retrained
+
+        return self.model_registry.update(
+            game_title, self.get_price_history(game_title, days_back=None, as_of=until)
+        )
+
+    def _build_prediction(
+        self,
+        game_title: str,
+        current_price: float,
+        price_history: List[PriceDataPoint],
+        trend_stats: Optional[GameTrendStatistics] = None,
+        as_of: Optional[datetime] = None,
+    ) -> PricePrediction:
+        """
+        Build a prediction from a history, computing statistics only once.
+
+        ``as_of`` replaces "now" for time-based features (backtesting).
+        """
+        if len(price_history) < self.min_data_points:
+            return self._generate_limited_prediction(game_title, current_price)
+
+        stats = trend_stats or self._trend_statistics(price_history)
+
+        # Train on points past the model watermark (no-op when up to date)
+        self._update_model(game_title, until=as_of)
+
+        # Analyze trend
+        trend_analysis = self.analyze_price_trend(price_history, stats)
+        trend = trend_analysis["trend"]
+
+        # Calculate drop probability
+        drop_probability = self.calculate_price_drop_probability(
+            game_title, price_history, stats, trend_analysis, as_of
+        )
+
+        # Predict target price
+        target_price = self.predict_target_price(
+            game_title, price_history, trend_stats=stats, trend_analysis=trend_analysis
+        )
+
+        # Determine confidence level
+        confidence = self._calculate_prediction_confidence(
+            trend_analysis, len(price_history)
+        )
+
+        # Generate prediction reasons
+        reasons = self._generate_prediction_reasons(
+            trend_analysis, drop_probability, price_history, current_price, stats, as_of
+        )
+
+        # Calculate additional metrics
+        historical_low = stats.minimum
+        avg_discount = self._calculate_average_discount(stats.maximum, current_price)
+
+        # Predict next significant drop (simplified heuristic)
+        next_drop_date = self._predict_next_drop_date(
+            price_history, drop_probability, as_of
+        )
+
+        # ML prediction of future price (30 days)
+        predicted_price = self._predict_future_price(
+            price_history, current_price, stats, game_title
+        )
+
+        prediction = PricePrediction(
+            game_title=game_title,
+            current_price=current_price,
+            predicted_price=predicted_price,
+            price_drop_probability=drop_probability,
+            trend=trend,
+            confidence=confidence,
+            target_price=target_price,
+            prediction_timeframe=self.prediction_timeframe_days,
+            historical_low=historical_low,
+            average_discount_percentage=avg_discount,
+            reasons=reasons,
+            next_significant_drop_date=next_drop_date,
+        )
+
+        logger.info(
+            f"✅ Price prediction complete: {trend.value} trend, {drop_probability:.1%} drop probability"
+        )
+        return prediction
 
     def _generate_limited_prediction(
         self, game_title: str, current_price: float
@@ -624,9 +1053,12 @@ class PricePredictionEngine:
         drop_probability: float,
         price_history: List[PriceDataPoint],
         current_price: float,
+        trend_stats: Optional[GameTrendStatistics] = None,
+        as_of: Optional[datetime] = None,
     ) -> List[str]:
         """Generate human-readable reasons for the prediction."""
         reasons = []
+        stats = trend_stats or self._trend_statistics(price_history)
 
         trend = trend_analysis["trend"]
         confidence = trend_analysis["confidence"]
@@ -658,8 +1090,7 @@ class PricePredictionEngine:
 
         # Historical context
         if len(price_history) > 0:
-            prices = [point.price for point in price_history]
-            historical_low = min(prices)
+            historical_low = stats.minimum
             price_vs_low = (current_price - historical_low) / historical_low * 100
 
             if price_vs_low < 10:
@@ -670,7 +1101,9 @@ class PricePredictionEngine:
                 )
 
         # Time-based patterns
-        days_since_drop = self._days_since_last_significant_drop(price_history)
+        days_since_drop = self._days_since_last_significant_drop(
+            price_history, stats, as_of
+        )
         if days_since_drop > 90:
             reasons.append(f"⏰ {days_since_drop} days since last significant drop")
         elif days_since_drop < 30:
@@ -679,21 +1112,20 @@ class PricePredictionEngine:
         return reasons[:5]  # Limit to 5 most important reasons
 
     def _calculate_average_discount(
-        self, prices: List[float], current_price: float
+        self, peak_price: Optional[float], current_price: float
     ) -> float:
         """Calculate average discount percentage from peak prices."""
-        if not prices:
-            return 0.0
-
-        peak_price = max(prices)
-        if peak_price <= 0:
+        if not peak_price or peak_price <= 0:
             return 0.0
 
         discount = (peak_price - current_price) / peak_price * 100
         return max(0.0, discount)
 
     def _predict_next_drop_date(
-        self, price_history: List[PriceDataPoint], drop_probability: float
+        self,
+        price_history: List[PriceDataPoint],
+        drop_probability: float,
+        as_of: Optional[datetime] = None,
     ) -> Optional[datetime]:
         """Predict when next significant drop might occur (heuristic)."""
         if drop_probability < 0.3:
@@ -705,34 +1137,30 @@ class PricePredictionEngine:
         else:
             days_ahead = 30 + int(drop_probability * 30)  # 4-8 weeks
 
-        return datetime.now() + timedelta(days=days_ahead)
+        return (as_of or datetime.now()) + timedelta(days=days_ahead)
 
     def _predict_future_price(
-        self, price_history: List[PriceDataPoint], current_price: float
+        self,
+        price_history: List[PriceDataPoint],
+        current_price: float,
+        trend_stats: Optional[GameTrendStatistics] = None,
+        game_title: Optional[str] = None,
     ) -> float:
         """Use ML to predict price in 30 days."""
         if len(price_history) < 5:
             return current_price * 0.9  # Default 10% reduction assumption
 
         try:
-            # Prepare data for ML model
-            prices = [point.price for point in price_history]
-            dates = [
-                (point.date - price_history[0].date).days for point in price_history
-            ]
+            # Cached registry model: coefficient lookup plus a dot product
+            predicted = self.model_registry.predict(game_title) if game_title else None
 
-            # Use last 30 points for training
-            recent_points = min(30, len(prices))
-            X = np.array(dates[-recent_points:]).reshape(-1, 1)
-            y = np.array(prices[-recent_points:])
+            if predicted is None:
+                # Linear fit over the last 30 points (shared trend statistics)
+                stats = trend_stats or self._trend_statistics(price_history)
 
-            # Train simple linear regression
-            model = LinearRegression()
-            model.fit(X, y)
-
-            # Predict 30 days ahead
-            future_date = dates[-1] + 30
-            predicted = model.predict([[future_date]])[0]
+                # Predict 30 days ahead
+                future_date = stats.last_day + 30
+                predicted = stats.recent_intercept + stats.recent_slope * future_date
 
             # Apply bounds (price shouldn't change too dramatically)
             max_change = current_price * 0.5  # Max 50% change
@@ -779,7 +1207,7 @@ def integrate_price_prediction_with_game_analysis(
         Enhanced game data with price predictions
     """
     try:
-        engine = PricePredictionEngine()
+        engine = get_price_prediction_engine()
 
         game_title = game_data.get("title", "Unknown")
         current_price_str = game_data.get("current_eshop_price", "0")
@@ -796,7 +1224,21 @@ def integrate_price_prediction_with_game_analysis(
             current_price = float(current_price_str)
 
         if current_price > 0:
-            prediction = engine.generate_price_prediction(game_title, current_price)
+            # Store the full scraped price history before predicting
+            if game_data.get("price_history_points"):
+                from utils.price_history_ingestion import PriceHistoryIngestor
+
+                # The current price is recorded by generate_price_prediction
+                PriceHistoryIngestor(engine).ingest_game_details(
+                    game_data, include_current_price=False
+                )
+
+            prediction = engine.generate_price_prediction(
+                game_title,
+                current_price,
+                genres=game_data.get("genres"),
+                publisher=game_data.get("publisher"),
+            )
 
             # Add prediction to game data
             game_data["ml_price_prediction"] = prediction.to_dict()
@@ -860,11 +1302,14 @@ def format_price_prediction_summary(prediction: PricePrediction) -> str:
 
 # Global price prediction engine instance
 _price_engine = None
+_price_engine_lock = threading.Lock()
 
 
 def get_price_prediction_engine() -> PricePredictionEngine:
     """Get global price prediction engine instance."""
     global _price_engine
     if _price_engine is None:
-        _price_engine = PricePredictionEngine()
+        with _price_engine_lock:
+            if _price_engine is None:
+                _price_engine = PricePredictionEngine()
     return _price_engine
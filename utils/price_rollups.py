@@ -0,0 +1,812 @@
+#!/usr/bin/env python3
+
+"""
+Price Rollups for AutoGen DekuDeals
+===================================
+
+Pre-aggregated price statistics kept inside the price history database.
+
+Tables (maintained by ``AFTER INSERT`` triggers on ``price_history``):
+- ``game_price_summary``: all-time low/high, point count, last price per game
+- ``price_rollups``: daily and weekly buckets per game (count, sum, min,
+  max, discount sum/max)
+- ``group_price_rollups``: the same buckets per genre and publisher
+- ``price_drops``: consecutive drops above the significance threshold
+
+Discount depth of a point is ``1 - price / all-time high so far``. Group
+membership lives in ``game_groups``; changing it recomputes the affected
+groups from the per-game buckets. Queries such as "average discount depth
+by genre in the last 90 days" or "games at their all-time low" read a few
+hundred pre-aggregated rows instead of the full history.
+
+Points arriving in date order update the tables in place. A point
+backfilled before a game's last date changes the discount depth and drops
+of the points after it. A second trigger only records the earliest
+backfilled date per game (``price_rollups_backfill``); writers call
+``apply_backfills`` before committing, which recomputes every marked game's
+buckets and drops, and its groups' buckets, from that date on - once per
+transaction, however many points were backfilled. ``rebuild`` recomputes
+everything from ``price_history``.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from .price_model_registry import UNKNOWN_GROUP_VALUES
+from .sqlite_pool import SQLiteConnectionPool
+
+logger = logging.getLogger(__name__)
+
+PERIODS = ("day", "week")
+GROUP_TYPES = ("genre", "publisher")
+
+# Bucket start of a date per period (weeks start on Monday)
+BUCKET_SQL = {
+    "day": "date({value})",
+    "week": "date({value}, 'weekday 0', '-6 days')",
+}
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS game_price_summary (
+        game_title TEXT PRIMARY KEY,
+        points INTEGER NOT NULL,
+        price_sum REAL NOT NULL,
+        all_time_low REAL NOT NULL,
+        all_time_high REAL NOT NULL,
+        first_date TEXT NOT NULL,
+        last_date TEXT NOT NULL,
+        last_price REAL NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS price_rollups (
+        game_title TEXT NOT NULL,
+        period TEXT NOT NULL,
+        bucket TEXT NOT NULL,
+        points INTEGER NOT NULL,
+        price_sum REAL NOT NULL,
+        price_min REAL NOT NULL,
+        price_max REAL NOT NULL,
+        discount_sum REAL NOT NULL,
+        discount_max REAL NOT NULL,
+        PRIMARY KEY (game_title, period, bucket)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS game_groups (
+        group_type TEXT NOT NULL,
+        group_name TEXT NOT NULL,
+        game_title TEXT NOT NULL,
+        PRIMARY KEY (group_type, group_name, game_title)
+    ) WITHOUT ROWID;
+
+    CREATE INDEX IF NOT EXISTS idx_game_groups_title
+    ON game_groups(game_title);
+
+    CREATE TABLE IF NOT EXISTS group_price_rollups (
+        group_type TEXT NOT NULL,
+        group_name TEXT NOT NULL,
+        period TEXT NOT NULL,
+        bucket TEXT NOT NULL,
+        points INTEGER NOT NULL,
+        price_sum REAL NOT NULL,
+        price_min REAL NOT NULL,
+        price_max REAL NOT NULL,
+        discount_sum REAL NOT NULL,
+        discount_max REAL NOT NULL,
+        PRIMARY KEY (group_type, period, bucket, group_name)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS price_drops (
+        game_title TEXT NOT NULL,
+        date TEXT NOT NULL,
+        from_price REAL NOT NULL,
+        to_price REAL NOT NULL,
+        drop_percentage REAL NOT NULL,
+        promotion_type TEXT,
+        PRIMARY KEY (game_title, date)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS price_rollups_backfill (
+        game_title TEXT PRIMARY KEY,
+        since TEXT NOT NULL
+    ) WITHOUT ROWID;
+"""
+
+# Discount depth of the new point against the (already updated) summary
+NEW_DISCOUNT_SQL = """(
+    SELECT CASE WHEN all_time_high > 0
+        THEN 1.0 - NEW.price / all_time_high ELSE 0.0 END
+    FROM game_price_summary WHERE game_title = NEW.game_title
+)"""
+
+UPSERT_SUMMARY_SQL = """
+    INSERT INTO game_price_summary (
+        game_title, points, price_sum, all_time_low, all_time_high,
+        first_date, last_date, last_price
+    )
+    VALUES (
+        NEW.game_title, 1, NEW.price, NEW.price, NEW.price,
+        NEW.date, NEW.date, NEW.price
+    )
+    ON CONFLICT(game_title) DO UPDATE SET
+        points = points + 1,
+        price_sum = price_sum + excluded.price_sum,
+        all_time_low = MIN(all_time_low, excluded.all_time_low),
+        all_time_high = MAX(all_time_high, excluded.all_time_high),
+        first_date = MIN(first_date, excluded.first_date),
+        last_price = CASE WHEN excluded.last_date >= last_date
+            THEN excluded.last_price ELSE last_price END,
+        last_date = MAX(last_date, excluded.last_date);
+"""
+
+UPSERT_GAME_ROLLUP_SQL = """
+    INSERT INTO price_rollups (
+        game_title, period, bucket, points, price_sum, price_min, price_max,
+        discount_sum, discount_max
+    )
+    VALUES (
+        NEW.game_title, '{period}', {bucket}, 1, NEW.price, NEW.price,
+        NEW.price, {discount}, {discount}
+    )
+    ON CONFLICT(game_title, period, bucket) DO UPDATE SET
+        points = points + 1,
+        price_sum = price_sum + excluded.price_sum,
+        price_min = MIN(price_min, excluded.price_min),
+        price_max = MAX(price_max, excluded.price_max),
+        discount_sum = discount_sum + excluded.discount_sum,
+        discount_max = MAX(discount_max, excluded.discount_max);
+"""
+
+UPSERT_GROUP_ROLLUP_SQL = """
+    INSERT INTO group_price_rollups (
+        group_type, group_name, period, bucket, points, price_sum, price_min,
+        price_max, discount_sum, discount_max
+    )
+    SELECT group_type, group_name, '{period}', {bucket}, 1, NEW.price,
+        NEW.price, NEW.price, {discount}, {discount}
+    FROM game_groups WHERE game_title = NEW.game_title
+    ON CONFLICT(group_type, period, bucket, group_name) DO UPDATE SET
+        points = points + 1,
+        price_sum = price_sum + excluded.price_sum,
+        price_min = MIN(price_min, excluded.price_min),
+        price_max = MAX(price_max, excluded.price_max),
+        discount_sum = discount_sum + excluded.discount_sum,
+        discount_max = MAX(discount_max, excluded.discount_max);
+"""
+
+INSERT_NEW_DROP_SQL = """
+    INSERT OR REPLACE INTO price_drops (
+        game_title, date, from_price, to_price, drop_percentage, promotion_type
+    )
+    SELECT NEW.game_title, NEW.date, previous.price, NEW.price,
+        (previous.price - NEW.price) / previous.price * 100, NEW.promotion_type
+    FROM (
+        SELECT price FROM price_history
+        WHERE game_title = NEW.game_title AND date < NEW.date
+        ORDER BY date DESC LIMIT 1
+    ) AS previous
+    WHERE previous.price > 0
+        AND (previous.price - NEW.price) / previous.price >= {threshold};
+"""
+
+# Points before the game's last date (backfill) only mark the game
+MARK_BACKFILL_SQL = """
+    INSERT INTO price_rollups_backfill (game_title, since)
+    VALUES (NEW.game_title, NEW.date)
+    ON CONFLICT(game_title) DO UPDATE SET since = MIN(since, excluded.since);
+"""
+
+BACKFILL_CONDITION_SQL = """EXISTS (
+    SELECT 1 FROM game_price_summary
+    WHERE game_title = NEW.game_title AND last_date > NEW.date
+)"""
+
+# Full recomputation from price_history (prefix maximum via window function)
+REBUILD_SUMMARY_SQL = """
+    INSERT INTO game_price_summary
+    SELECT game_title, COUNT(*), SUM(price), MIN(price), MAX(price),
+        MIN(date), MAX(date),
+        (SELECT price FROM price_history AS latest
+         WHERE latest.game_title = history.game_title
+         ORDER BY date DESC, id DESC LIMIT 1)
+    FROM price_history AS history
+    GROUP BY game_title
+"""
+
+# Filters bound the recomputation to one game from a date on (backfills)
+REBUILD_GAME_ROLLUPS_SQL = """
+    INSERT INTO price_rollups
+    SELECT game_title, '{period}', {bucket} AS bucket, COUNT(*), SUM(price),
+        MIN(price), MAX(price), SUM(discount), MAX(discount)
+    FROM (
+        SELECT game_title, date, price,
+            CASE WHEN running_high > 0
+                THEN 1.0 - price / running_high ELSE 0.0 END AS discount
+        FROM (
+            SELECT game_title, date, price,
+                MAX(
+                    MAX(price) OVER (
+                        PARTITION BY game_title ORDER BY date, id
+                        ROWS UNBOUNDED PRECEDING
+                    ),
+                    {earlier_high}
+                ) AS running_high
+            FROM price_history{history_filter}
+        )
+    )
+    GROUP BY game_title, bucket;
+"""
+
+REBUILD_DROPS_SQL = """
+    INSERT OR REPLACE INTO price_drops
+    SELECT game_title, date, previous_price, price,
+        (previous_price - price) / previous_price * 100, promotion_type
+    FROM (
+        SELECT game_title, date, price, promotion_type,
+            LAG(price) OVER (PARTITION BY game_title ORDER BY date, id)
+                AS previous_price
+        FROM price_history{history_filter}
+    )
+    WHERE previous_price > 0
+        AND (previous_price - price) / previous_price >= {threshold}{date_filter};
+"""
+
+# Backfill: a game's rows from its earliest backfilled bucket/date on are
+# recomputed once per transaction, reading the game's points from there only
+DELETE_GAME_ROLLUPS_SQL = """
+    DELETE FROM price_rollups
+    WHERE game_title = :game_title AND period = '{period}'
+        AND bucket >= {bucket}
+"""
+
+DELETE_GAME_DROPS_SQL = """
+    DELETE FROM price_drops
+    WHERE game_title = :game_title AND date >= :since
+"""
+
+EARLIER_HIGH_SQL = """COALESCE((
+    SELECT MAX(price) FROM price_history
+    WHERE game_title = :game_title AND date < {bucket}
+), 0)"""
+
+PREVIOUS_DATE_SQL = """COALESCE((
+    SELECT MAX(date) FROM price_history
+    WHERE game_title = :game_title AND date < :since
+), :since)"""
+
+# Groups of backfilled games, from the earliest backfilled date of a member
+SELECT_BACKFILLED_GROUPS_SQL = """
+    SELECT groups.group_type, groups.group_name, MIN(backfill.since)
+    FROM price_rollups_backfill AS backfill
+    JOIN game_groups AS groups ON groups.game_title = backfill.game_title
+    GROUP BY groups.group_type, groups.group_name
+"""
+
+DELETE_GROUP_ROLLUPS_SQL = """
+    DELETE FROM group_price_rollups
+    WHERE group_type = :group_type AND group_name = :group_name
+        AND period = '{period}' AND bucket >= {bucket}
+"""
+
+INSERT_GROUP_ROLLUPS_SQL = """
+    INSERT INTO group_price_rollups
+    SELECT groups.group_type, groups.group_name, rollups.period,
+        rollups.bucket, SUM(rollups.points), SUM(rollups.price_sum),
+        MIN(rollups.price_min), MAX(rollups.price_max),
+        SUM(rollups.discount_sum), MAX(rollups.discount_max)
+    FROM game_groups AS groups
+    JOIN price_rollups AS rollups ON rollups.game_title = groups.game_title
+    WHERE groups.group_type = :group_type AND groups.group_name = :group_name
+        AND rollups.period = '{period}' AND rollups.bucket >= {bucket}
+    GROUP BY rollups.bucket
+"""
+
+REBUILD_GROUP_ROLLUPS_SQL = """
+    INSERT INTO group_price_rollups
+    SELECT groups.group_type, groups.group_name, rollups.period,
+        rollups.bucket, SUM(rollups.points), SUM(rollups.price_sum),
+        MIN(rollups.price_min), MAX(rollups.price_max),
+        SUM(rollups.discount_sum), MAX(rollups.discount_max)
+    FROM game_groups AS groups
+    JOIN price_rollups AS rollups ON rollups.game_title = groups.game_title
+    WHERE groups.group_type = ? AND groups.group_name = ?
+    GROUP BY rollups.period, rollups.bucket
+"""
+
+
+TRIGGER_NAMES = ("price_history_rollups", "price_history_backfill")
+
+
+def _trigger_sql(drop_threshold: float) -> List[str]:
+    """
+    ``AFTER INSERT`` triggers keeping every rollup table current.
+
+    The conditions are complementary whichever trigger fires first: an
+    in-order point becomes the game's last date, a backfilled one never does.
+    A backfilled point only updates the summary and marks its game; the
+    writer then calls ``PriceRollups.apply_backfills`` in the same
+    transaction.
+    """
+    in_order = [UPSERT_SUMMARY_SQL]
+    for period in PERIODS:
+        bucket = BUCKET_SQL[period].format(value="NEW.date")
+        for template in (UPSERT_GAME_ROLLUP_SQL, UPSERT_GROUP_ROLLUP_SQL):
+            in_order.append(
+                template.format(period=period, bucket=bucket, discount=NEW_DISCOUNT_SQL)
+            )
+    in_order.append(INSERT_NEW_DROP_SQL.format(threshold=float(drop_threshold)))
+    backfill = [UPSERT_SUMMARY_SQL, MARK_BACKFILL_SQL]
+
+    return [
+        f"CREATE TRIGGER {name}\n"
+        "AFTER INSERT ON price_history\n"
+        f"WHEN {condition}\n"
+        "BEGIN\n" + "".join(statements) + "\nEND"
+        for name, condition, statements in (
+            ("price_history_rollups", f"NOT {BACKFILL_CONDITION_SQL}", in_order),
+            ("price_history_backfill", BACKFILL_CONDITION_SQL, backfill),
+        )
+    ]
+
+
+def _cutoff_date(days_back: int) -> str:
+    """ISO date ``days_back`` days ago."""
+    return (datetime.now() - timedelta(days=days_back)).date().isoformat()
+
+
+def _percent(value: Optional[float]) -> float:
+    return round((value or 0.0) * 100, 2)
+
+
+class PriceRollups:
+    """
+    Incrementally maintained price aggregates and queries on top of them.
+
+    Usage:
+        rollups = PriceRollups(pool)
+        rollups.ensure_schema()
+        rollups.set_game_groups("Hades", genres=["Action"], publisher="Supergiant")
+        rollups.discount_depth_by_group("genre", days_back=90)
+        rollups.games_at_all_time_low()
+    """
+
+    def __init__(self, pool: SQLiteConnectionPool, drop_threshold: float = 0.15):
+        """
+        Initialize rollups over a price history database.
+
+        Args:
+            pool: Pool of the database holding ``price_history``
+            drop_threshold: Consecutive fractional drop recorded in ``price_drops``
+        """
+        self._pool = pool
+        self.drop_threshold = drop_threshold
+        self._lock = threading.Lock()
+
+    def ensure_schema(self):
+        """Create tables and trigger; fill them once for an existing history."""
+        with self._pool.write() as conn:
+            for statement in SCHEMA_SQL.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            # Recreated so existing databases get the current definitions
+            for name in TRIGGER_NAMES:
+                conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            for statement in _trigger_sql(self.drop_threshold):
+                conn.execute(statement)
+
+            summarized = conn.execute(
+                "SELECT EXISTS (SELECT 1 FROM game_price_summary)"
+            ).fetchone()[0]
+            has_history = conn.execute(
+                "SELECT EXISTS (SELECT 1 FROM price_history)"
+            ).fetchone()[0]
+            if has_history and not summarized:
+                logger.info("📊 Building price rollups for existing history")
+                self._rebuild(conn)
+            else:
+                # Backfills written by a writer that did not apply them
+                self.apply_backfills(conn)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def rebuild(self):
+        """Recompute every rollup table from ``price_history``."""
+        with self._pool.write() as conn:
+            self._rebuild(conn)
+
+    def _rebuild(self, conn):
+        for table in (
+            "game_price_summary",
+            "price_rollups",
+            "group_price_rollups",
+            "price_drops",
+            "price_rollups_backfill",
+        ):
+            conn.execute(f"DELETE FROM {table}")
+
+        conn.execute(REBUILD_SUMMARY_SQL)
+        for period in PERIODS:
+            conn.execute(
+                REBUILD_GAME_ROLLUPS_SQL.format(
+                    period=period,
+                    bucket=BUCKET_SQL[period].format(value="date"),
+                    earlier_high="0",
+                    history_filter="",
+                )
+            )
+        conn.execute(
+            REBUILD_DROPS_SQL.format(
+                history_filter="", threshold=float(self.drop_threshold), date_filter=""
+            )
+        )
+
+        groups = conn.execute(
+            "SELECT DISTINCT group_type, group_name FROM game_groups"
+        ).fetchall()
+        self._rebuild_groups(conn, groups)
+
+    def apply_backfills(self, conn) -> int:
+        """
+        Recompute games marked by the backfill trigger (and their groups).
+
+        Call on the writing connection before its transaction commits.
+
+        Returns:
+            int: Number of recomputed games
+        """
+        backfilled = conn.execute(
+            "SELECT game_title, since FROM price_rollups_backfill"
+        ).fetchall()
+        if not backfilled:
+            return 0
+
+        threshold = float(self.drop_threshold)
+        for game_title, since in backfilled:
+            params = {"game_title": game_title, "since": since}
+            for period in PERIODS:
+                bucket = BUCKET_SQL[period].format(value=":since")
+                conn.execute(
+                    DELETE_GAME_ROLLUPS_SQL.format(period=period, bucket=bucket),
+                    params,
+                )
+                conn.execute(
+                    REBUILD_GAME_ROLLUPS_SQL.format(
+                        period=period,
+                        bucket=BUCKET_SQL[period].format(value="date"),
+                        earlier_high=EARLIER_HIGH_SQL.format(bucket=bucket),
+                        history_filter=(
+                            f" WHERE game_title = :game_title AND date >= {bucket}"
+                        ),
+                    ),
+                    params,
+                )
+            conn.execute(DELETE_GAME_DROPS_SQL, params)
+            conn.execute(
+                REBUILD_DROPS_SQL.format(
+                    history_filter=(
+                        " WHERE game_title = :game_title"
+                        f" AND date >= {PREVIOUS_DATE_SQL}"
+                    ),
+                    threshold=threshold,
+                    date_filter=" AND date >= :since",
+                ),
+                params,
+            )
+
+        groups = conn.execute(SELECT_BACKFILLED_GROUPS_SQL).fetchall()
+        for group_type, group_name, since in groups:
+            params = {
+                "group_type": group_type,
+                "group_name": group_name,
+                "since": since,
+            }
+            for period in PERIODS:
+                bucket = BUCKET_SQL[period].format(value=":since")
+                for template in (DELETE_GROUP_ROLLUPS_SQL, INSERT_GROUP_ROLLUPS_SQL):
+                    conn.execute(template.format(period=period, bucket=bucket), params)
+
+        conn.execute("DELETE FROM price_rollups_backfill")
+        logger.debug(
+            f"📊 Recomputed price rollups of {len(backfilled)} backfilled games "
+            f"and {len(groups)} groups"
+        )
+        return len(backfilled)
+
+    @staticmethod
+    def _rebuild_groups(conn, groups):
+        """Recompute the given (group_type, group_name) rollups."""
+        for group_type, group_name in groups:
+            conn.execute(
+                "DELETE FROM group_price_rollups WHERE group_type = ? AND group_name = ?",
+                (group_type, group_name),
+            )
+            conn.execute(REBUILD_GROUP_ROLLUPS_SQL, (group_type, group_name))
+
+    def set_game_groups(
+        self,
+        game_title: str,
+        genres: Optional[List[str]] = None,
+        publisher: Optional[str] = None,
+    ) -> bool:
+        """
+        Set the genres/publisher a game is aggregated into.
+
+        Args:
+            game_title: Game title
+            genres: Game genres (placeholders like "Nieznany" are ignored)
+            publisher: Game publisher
+
+        Returns:
+            bool: Whether the membership changed
+        """
+        membership = {
+            ("genre", genre)
+            for genre in genres or []
+            if genre not in UNKNOWN_GROUP_VALUES
+        }
+        if publisher not in UNKNOWN_GROUP_VALUES and publisher is not None:
+            membership.add(("publisher", publisher))
+
+        with self._lock:
+            with self._pool.read() as conn:
+                current = set(
+                    conn.execute(
+                        "SELECT group_type, group_name FROM game_groups WHERE game_title = ?",
+                        (game_title,),
+                    ).fetchall()
+                )
+            if current == membership:
+                return False
+
+            with self._pool.write() as conn:
+                conn.execute(
+                    "DELETE FROM game_groups WHERE game_title = ?", (game_title,)
+                )
+                conn.executemany(
+                    "INSERT INTO game_groups (group_type, group_name, game_title) "
+                    "VALUES (?, ?, ?)",
+                    [(kind, name, game_title) for kind, name in sorted(membership)],
+                )
+                self._rebuild_groups(conn, sorted(current ^ membership))
+
+        logger.debug(f"🏷️ Price rollup groups updated for {game_title}")
+        return True
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def game_summary(self, game_title: str) -> Optional[Dict[str, Any]]:
+        """All-time statistics of a game, or None if it has no history."""
+        with self._pool.read() as conn:
+            row = conn.execute(
+                """
+                SELECT points, price_sum, all_time_low, all_time_high,
+                    first_date, last_date, last_price
+                FROM game_price_summary WHERE game_title = ?
+                """,
+                (game_title,),
+            ).fetchone()
+
+        if row is None:
+            return None
+        points, price_sum, low, high, first_date, last_date, last_price = row
+        return {
+            "game_title": game_title,
+            "data_points": points,
+            "all_time_low": low,
+            "all_time_high": high,
+            "average_price": price_sum / points,
+            "current_price": last_price,
+            "first_date": first_date,
+            "last_date": last_date,
+            "at_all_time_low": last_price <= low,
+        }
+
+    def window_summary(self, game_title: str, days_back: int = 365) -> Dict[str, Any]:
+        """
+        Price statistics of a game over whole days in the last ``days_back`` days.
+
+        Returns:
+            Dict: data_points, high, low and average price (empty without data)
+        """
+        with self._pool.read() as conn:
+            points, price_sum, low, high = conn.execute(
+                """
+                SELECT SUM(points), SUM(price_sum), MIN(price_min), MAX(price_max)
+                FROM price_rollups
+                WHERE game_title = ? AND period = 'day' AND bucket >= ?
+                """,
+                (game_title, _cutoff_date(days_back)),
+            ).fetchone()
+
+        if not points:
+            return {}
+        return {
+            "data_points": points,
+            "high": high,
+            "low": low,
+            "average_price": price_sum / points,
+        }
+
+    def game_rollups(
+        self, game_title: str, period: str = "week", days_back: int = 365
+    ) -> List[Dict[str, Any]]:
+        """Daily or weekly buckets of a game, oldest first."""
+        if period not in PERIODS:
+            raise ValueError(f"Unknown rollup period: {period}")
+
+        with self._pool.read() as conn:
+            rows = conn.execute(
+                """
+                SELECT bucket, points, price_sum, price_min, price_max,
+                    discount_sum, discount_max
+                FROM price_rollups
+                WHERE game_title = ? AND period = ? AND bucket >= ?
+                ORDER BY bucket
+                """,
+                (game_title, period, _cutoff_date(days_back)),
+            ).fetchall()
+
+        return [
+            {
+                "bucket": bucket,
+                "data_points": points,
+                "average_price": price_sum / points,
+                "low": low,
+                "high": high,
+                "average_discount_percentage": _percent(discount_sum / points),
+                "max_discount_percentage": _percent(discount_max),
+            }
+            for bucket, points, price_sum, low, high, discount_sum, discount_max in rows
+        ]
+
+    def price_drops(
+        self, game_title: str, days_back: int = 365
+    ) -> List[Dict[str, Any]]:
+        """Significant consecutive drops of a game, oldest first."""
+        cutoff = (datetime.now() - timedelta(days=days_back)).isoformat()
+        with self._pool.read() as conn:
+            rows = conn.execute(
+                """
+                SELECT date, from_price, to_price, drop_percentage, promotion_type
+                FROM price_drops
+                WHERE game_title = ? AND date >= ?
+                ORDER BY date
+                """,
+                (game_title, cutoff),
+            ).fetchall()
+
+        return [
+            {
+                "date": date,
+                "from_price": from_price,
+                "to_price": to_price,
+                "drop_percentage": drop_percentage,
+                "promotion_type": promotion_type,
+            }
+            for date, from_price, to_price, drop_percentage, promotion_type in rows
+        ]
+
+    def discount_depth_by_group(
+        self, group_type: str = "genre", days_back: int = 90
+    ) -> List[Dict[str, Any]]:
+        """
+        Average and maximum discount depth per genre or publisher.
+
+        Args:
+            group_type: "genre" or "publisher"
+            days_back: Days of buckets to aggregate
+
+        Returns:
+            List[Dict]: One entry per group, deepest average discount first
+        """
+        if group_type not in GROUP_TYPES:
+            raise ValueError(f"Unknown group type: {group_type}")
+
+        with self._pool.read() as conn:
+            rows = conn.execute(
+                """
+                SELECT rollups.group_name, SUM(rollups.points),
+                    SUM(rollups.price_sum), SUM(rollups.discount_sum),
+                    MAX(rollups.discount_max),
+                    (SELECT COUNT(*) FROM game_groups AS groups
+                     WHERE groups.group_type = rollups.group_type
+                        AND groups.group_name = rollups.group_name)
+                FROM group_price_rollups AS rollups
+                WHERE rollups.group_type = ? AND rollups.period = 'day'
+                    AND rollups.bucket >= ?
+                GROUP BY rollups.group_name
+                """,
+                (group_type, _cutoff_date(days_back)),
+            ).fetchall()
+
+        groups = [
+            {
+                "group": name,
+                "games": games,
+                "data_points": points,
+                "average_price": round(price_sum / points, 2),
+                "average_discount_percentage": _percent(discount_sum / points),
+                "max_discount_percentage": _percent(discount_max),
+            }
+            for name, points, price_sum, discount_sum, discount_max, games in rows
+        ]
+        groups.sort(key=lambda g: g["average_discount_percentage"], reverse=True)
+        return groups
+
+    def games_at_all_time_low(
+        self,
+        tolerance: float = 0.0,
+        group_type: Optional[str] = None,
+        group_name: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Games whose latest price is at (or within ``tolerance`` of) their all-time low.
+
+        Games that were never discounted (low equals high) are skipped.
+
+        Args:
+            tolerance: Fraction above the low still counted (0.05 = 5%)
+            group_type: Optional group filter ("genre" or "publisher")
+            group_name: Group name for the filter
+            limit: Maximum number of games
+
+        Returns:
+            List[Dict]: Games sorted by discount from their all-time high
+        """
+        sql = """
+            SELECT summary.game_title, summary.last_price, summary.all_time_low,
+                summary.all_time_high, summary.last_date
+            FROM game_price_summary AS summary
+        """
+        params: List[Any] = []
+        if group_type is not None:
+            sql += """
+            JOIN game_groups AS groups ON groups.game_title = summary.game_title
+                AND groups.group_type = ? AND groups.group_name = ?
+            """
+            params += [group_type, group_name]
+        sql += """
+            WHERE summary.all_time_high > summary.all_time_low
+                AND summary.last_price <= summary.all_time_low * ?
+            ORDER BY 1.0 - summary.last_price / summary.all_time_high DESC
+            LIMIT ?
+        """
+        params += [1.0 + tolerance, limit]
+
+        with self._pool.read() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        return [
+            {
+                "game_title": title,
+                "current_price": last_price,
+                "all_time_low": low,
+                "all_time_high": high,
+                "discount_percentage": _percent(1.0 - last_price / high),
+                "last_date": last_date,
+            }
+            for title, last_price, low, high, last_date in rows
+        ]
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Row counts of the rollup tables."""
+        with self._pool.read() as conn:
+            return {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in (
+                    "game_price_summary",
+                    "price_rollups",
+                    "group_price_rollups",
+                    "price_drops",
+                    "game_groups",
+                )
+            }
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+
+"""
+Columnar Price Series Store for AutoGen DekuDeals
+=================================================
+
+Compact, memory-mapped read copy of the SQLite price history.
+
+Layout (``price_data/series``):
+- ``prices.f32``: float32 prices, each game's points stored contiguously
+- ``days.i32``: int32 day offsets (days since 1970-01-01), parallel to prices
+- ``index.json``: ``{game_title: [offset, length]}`` plus the last synced
+  SQLite row id
+
+SQLite stays the write-ahead source: ``sync`` copies games with rows past
+the synced row id. Changed games are re-read and appended as new segments
+(the data files are append-only, so existing views stay valid); the files
+are compacted once superseded segments dominate. Readers get zero-copy
+NumPy views into the memory-mapped files.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .sqlite_pool import SQLiteConnectionPool
+
+logger = logging.getLogger(__name__)
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+PRICES_FILE = "prices.f32"
+DAYS_FILE = "days.i32"
+INDEX_FILE = "index.json"
+STORE_VERSION = 1
+
+# Titles per IN (...) query, below SQLite's bound parameter limit
+SYNC_QUERY_CHUNK = 500
+
+# Compact when superseded segments exceed live data (and this many points)
+COMPACT_MIN_POINTS = 100_000
+
+SELECT_CHANGED_TITLES_SQL = """
+    SELECT DISTINCT game_title FROM price_history WHERE id > ?
+"""
+
+SELECT_SERIES_SQL = """
+    SELECT game_title, date, price
+    FROM price_history
+    WHERE game_title IN ({placeholders})
+    ORDER BY game_title, date ASC
+"""
+
+
+def day_number(value: Union[datetime, date]) -> int:
+    """Days since 1970-01-01."""
+    return value.toordinal() - EPOCH_ORDINAL
+
+
+class DayDates(Sequence):
+    """Lazy ``datetime`` view of a day-offset array (midnight of each day)."""
+
+    def __init__(self, days: np.ndarray):
+        self._days = days
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return EPOCH + timedelta(days=int(self._days[index]))
+
+
+@dataclass(frozen=True)
+class StoredSeries:
+    """Read-only price series of one game (views into the store)."""
+
+    game_title: str
+    prices: np.ndarray  # float32
+    days: np.ndarray  # int32 days since 1970-01-01
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def dates(self) -> DayDates:
+        """Point dates (day resolution), converted on access."""
+        return DayDates(self.days)
+
+
+class PriceSeriesStore:
+    """
+    Memory-mapped columnar copy of the price history table.
+
+    Usage:
+        store = PriceSeriesStore("price_data/series")
+        store.sync(pool)
+        series = store.series("Hades", since_day=day_number(cutoff))
+        series.prices.mean()
+    """
+
+    def __init__(self, store_dir: Union[str, Path]):
+        """
+        Initialize the store and map existing files.
+
+        Args:
+            store_dir: Directory holding the data and index files
+        """
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.prices_path = self.store_dir / PRICES_FILE
+        self.days_path = self.store_dir / DAYS_FILE
+        self.index_path = self.store_dir / INDEX_FILE
+
+        self._lock = threading.Lock()
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._synced_rowid = 0
+        self._length = 0  # Points written (live and superseded)
+
+        # (prices, days, index) published together for lock-free readers
+        self._snapshot: Tuple[np.ndarray, np.ndarray, Dict[str, Tuple[int, int]]]
+
+        self._load_index()
+        self._publish()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def series(
+        self, game_title: str, since_day: Optional[int] = None
+    ) -> Optional[StoredSeries]:
+        """
+        Zero-copy series of a game.
+
+        Args:
+            game_title: Game title
+            since_day: Only points on or after this day number
+
+        Returns:
+            Optional[StoredSeries]: Views into the mapped files, or None
+        """
+        prices, days, index = self._snapshot
+        entry = index.get(game_title)
+        if entry is None:
+            return None
+
+        offset, length = entry
+        game_prices = prices[offset : offset + length]
+        game_days = days[offset : offset + length]
+        if since_day is not None:
+            start = int(np.searchsorted(game_days, since_day, side="left"))
+            game_prices, game_days = game_prices[start:], game_days[start:]
+
+        return StoredSeries(game_title, game_prices, game_days)
+
+    def titles(self) -> List[str]:
+        """Titles of all stored games."""
+        return list(self._snapshot[2])
+
+    def __contains__(self, game_title: str) -> bool:
+        return game_title in self._snapshot[2]
+
+    def __iter__(self) -> Iterator[StoredSeries]:
+        for title in self.titles():
+            series = self.series(title)
+            if series is not None:
+                yield series
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Store summary."""
+        with self._lock:
+            live = self._live_points()
+            return {
+                "games": len(self._index),
+                "points": live,
+                "superseded_points": self._length - live,
+                "bytes": self._length * 8,
+                "synced_rowid": self._synced_rowid,
+            }
+
+    # ------------------------------------------------------------------
+    # Sync from SQLite
+    # ------------------------------------------------------------------
+
+    def sync(self, pool: SQLiteConnectionPool) -> int:
+        """
+        Copy games with rows past the synced row id from SQLite.
+
+        Args:
+            pool: Pool of the price history database
+
+        Returns:
+            int: Number of games rewritten
+        """
+        with self._lock:
+            with pool.read() as conn:
+                max_rowid = conn.execute(
+                    "SELECT COALESCE(MAX(id), 0) FROM price_history"
+                ).fetchone()[0]
+                if max_rowid == self._synced_rowid:
+                    return 0
+
+                if max_rowid < self._synced_rowid:
+                    # The database was replaced: start over
+                    logger.info("🔄 Price history database changed, rebuilding series")
+                    self._reset()
+
+                changed = [
+                    row[0]
+                    for row in conn.execute(
+                        SELECT_CHANGED_TITLES_SQL, (self._synced_rowid,)
+                    )
+                ]
+                series = self._read_series(conn, changed)
+
+            self._append(series)
+            self._synced_rowid = max_rowid
+
+            live = self._live_points()
+            if self._length - live > max(live, COMPACT_MIN_POINTS):
+                self._compact()
+
+            self._write_index()
+            self._publish()
+
+        logger.debug(f"🗃️ Price series store synced: {len(series)} games updated")
+        return len(series)
+
+    def rebuild(self, pool: SQLiteConnectionPool) -> int:
+        """Discard the store and copy the whole price history again."""
+        with self._lock:
+            self._reset()
+            self._publish()
+        return self.sync(pool)
+
+    def _reset(self):
+        """Forget all segments (mapped files are unlinked, never truncated)."""
+        self._index, self._length, self._synced_rowid = {}, 0, 0
+        for path in (self.prices_path, self.days_path):
+            path.unlink(missing_ok=True)
+
+    def _live_points(self) -> int:
+        return sum(length for _, length in self._index.values())
+
+    @staticmethod
+    def _read_series(
+        conn, titles: List[str]
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Full price/day arrays of the given games."""
+        rows: Dict[str, Tuple[List[float], List[int]]] = {}
+        for start in range(0, len(titles), SYNC_QUERY_CHUNK):
+            chunk = titles[start : start + SYNC_QUERY_CHUNK]
+            sql = SELECT_SERIES_SQL.format(placeholders=", ".join("?" * len(chunk)))
+            for title, raw_date, price in conn.execute(sql, chunk):
+                prices, days = rows.setdefault(title, ([], []))
+                prices.append(price)
+                days.append(
+                    date.fromisoformat(raw_date[:10]).toordinal() - EPOCH_ORDINAL
+                )
+
+        return {
+            title: (
+                np.asarray(prices, dtype=np.float32),
+                np.asarray(days, dtype=np.int32),
+            )
+            for title, (prices, days) in rows.items()
+        }
+
+    def _append(self, series: Dict[str, Tuple[np.ndarray, np.ndarray]]):
+        """Append game segments and point the index at them."""
+        if not series:
+            return
+
+        with open(self.prices_path, "ab") as prices_file, open(
+            self.days_path, "ab"
+        ) as days_file:
+            # Drop any tail left by an interrupted sync
+            prices_file.truncate(self._length * 4)
+            days_file.truncate(self._length * 4)
+
+            # Readers keep using the published index until the sync is done
+            index = dict(self._index)
+            for title, (prices, days) in series.items():
+                prices.tofile(prices_file)
+                days.tofile(days_file)
+                index[title] = (self._length, len(prices))
+                self._length += len(prices)
+            self._index = index
+
+            prices_file.flush()
+            days_file.flush()
+            os.fsync(prices_file.fileno())
+            os.fsync(days_file.fileno())
+
+    def _compact(self):
+        """Rewrite the data files with live segments only."""
+        prices = np.memmap(self.prices_path, dtype=np.float32, mode="r")
+        days = np.memmap(self.days_path, dtype=np.int32, mode="r")
+        temp_prices = self.prices_path.with_suffix(".tmp")
+        temp_days = self.days_path.with_suffix(".tmp")
+
+        index, offset = {}, 0
+        with open(temp_prices, "wb") as prices_file, open(temp_days, "wb") as days_file:
+            for title, (start, length) in self._index.items():
+                prices[start : start + length].tofile(prices_file)
+                days[start : start + length].tofile(days_file)
+                index[title] = (offset, length)
+                offset += length
+
+        # Existing views keep the replaced (unlinked) files mapped
+        os.replace(temp_prices, self.prices_path)
+        os.replace(temp_days, self.days_path)
+        logger.info(f"🗜️ Compacted price series store: {self._length} → {offset} points")
+        self._index, self._length = index, offset
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def _publish(self):
+        """Map the data files and publish them with the current index."""
+        if self._length == 0:
+            prices = np.empty(0, dtype=np.float32)
+            days = np.empty(0, dtype=np.int32)
+        else:
+            # Views of previous maps stay valid (files are append-only or
+            # replaced, never rewritten in place)
+            prices = np.memmap(
+                self.prices_path, dtype=np.float32, mode="r", shape=(self._length,)
+            )
+            days = np.memmap(
+                self.days_path, dtype=np.int32, mode="r", shape=(self._length,)
+            )
+        self._snapshot = (prices, days, self._index)
+
+    def _write_index(self):
+        """Write the index atomically (after the data it points to)."""
+        data = {
+            "version": STORE_VERSION,
+            "synced_rowid": self._synced_rowid,
+            "length": self._length,
+            "games": {title: list(entry) for title, entry in self._index.items()},
+        }
+        temp_path = self.index_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, self.index_path)
+
+    def _load_index(self):
+        """Load the index, starting empty if it is missing or inconsistent."""
+        if not self.index_path.exists():
+            return
+
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+
+            length = data["length"]
+            for path in (self.prices_path, self.days_path):
+                if not path.exists() or path.stat().st_size < length * 4:
+                    raise ValueError(f"{path.name} is shorter than the index")
+
+            if data.get("version") != STORE_VERSION:
+                raise ValueError(f"unsupported version {data.get('version')}")
+
+            self._index = {
+                title: (int(offset), int(length))
+                for title, (offset, length) in data["games"].items()
+            }
+            self._synced_rowid = data["synced_rowid"]
+            self._length = length
+
+        except Exception as e:
+            logger.warning(f"⚠️ Price series index unusable, rebuilding: {e}")
+            self._index, self._synced_rowid, self._length = {}, 0, 0
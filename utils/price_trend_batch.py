@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+
+"""
+Batch Price Trend Statistics for AutoGen DekuDeals
+==================================================
+
+Vectorized trend analysis over the price histories of many games at once.
+
+Histories are packed into NaN-padded NumPy arrays (one row per game) and
+all statistics are computed with closed-form masked array math:
+- least-squares slope/intercept and R² over the full history
+- the same fit over the most recent points (for short-term forecasts)
+- volatility (coefficient of variation), mean, min, max
+- 25th percentile and median
+- rolling-window drop rate and the last significant consecutive drop
+  (O(n) monotonic-deque windows from ``utils.time_series``)
+
+``PricePredictionEngine`` computes these once per prediction (or once per
+batch of games) and shares them between its trend, drop probability,
+target price and future price paths.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .price_series_store import StoredSeries
+from .time_series import last_significant_drop, window_drop_rate
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PriceSeriesBatch:
+    """Price histories of several games packed into padded arrays."""
+
+    titles: List[str]
+    prices: np.ndarray  # (games, max_length), NaN padded
+    days: np.ndarray  # Whole days since each game's first point, NaN padded
+    lengths: np.ndarray  # Number of points per game
+    dates: List[Sequence[datetime]]
+
+    @classmethod
+    def from_histories(cls, histories: Dict[str, Sequence]) -> "PriceSeriesBatch":
+        """
+        Pack ``{game_title: [PriceDataPoint, ...]}`` (sorted by date).
+
+        Histories may also be ``StoredSeries`` arrays from the columnar
+        store; their day offsets are used directly.
+
+        Args:
+            histories: Price history per game
+
+        Returns:
+            PriceSeriesBatch: Packed histories
+        """
+        titles = list(histories)
+        lengths = np.array([len(histories[t]) for t in titles], dtype=np.int64)
+        width = int(lengths.max()) if len(titles) else 0
+
+        prices = np.full((len(titles), width), np.nan)
+        days = np.full((len(titles), width), np.nan)
+        dates = []
+
+        for row, title in enumerate(titles):
+            history = histories[title]
+            if isinstance(history, StoredSeries):
+                dates.append(history.dates)
+                if len(history):
+                    prices[row, : len(history)] = history.prices
+                    days[row, : len(history)] = history.days - history.days[0]
+                continue
+
+            game_dates = [point.date for point in history]
+            dates.append(game_dates)
+            if not history:
+                continue
+            prices[row, : len(history)] = [point.price for point in history]
+            days[row, : len(history)] = [
+                (date - game_dates[0]).days for date in game_dates
+            ]
+
+        return cls(
+            titles=titles, prices=prices, days=days, lengths=lengths, dates=dates
+        )
+
+    @property
+    def mask(self) -> np.ndarray:
+        """Boolean mask of real (non-padding) points."""
+        return np.arange(self.prices.shape[1]) < self.lengths[:, np.newaxis]
+
+
+@dataclass
+class GameTrendStatistics:
+    """Trend statistics of a single game."""
+
+    game_title: str
+    count: int
+    slope: float
+    intercept: float
+    r_squared: float
+    volatility: float
+    mean: float
+    minimum: float
+    maximum: float
+    q1: float
+    median: float
+    recent_slope: float
+    recent_intercept: float
+    last_day: float
+    window_drop_rate: Optional[float]
+    last_drop_date: Optional[datetime]
+
+    def days_since_last_drop(self, now: Optional[datetime] = None) -> int:
+        """Days since the last significant drop (999 when there was none)."""
+        if self.last_drop_date is None:
+            return 999
+        return max(0, ((now or datetime.now()) - self.last_drop_date).days)
+
+
+@dataclass
+class TrendStatistics:
+    """Trend statistics for a batch of games (one array entry per game)."""
+
+    titles: List[str]
+    count: np.ndarray
+    slope: np.ndarray
+    intercept: np.ndarray
+    r_squared: np.ndarray
+    volatility: np.ndarray
+    mean: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    q1: np.ndarray
+    median: np.ndarray
+    recent_slope: np.ndarray
+    recent_intercept: np.ndarray
+    last_day: np.ndarray
+    window_drop_rate: np.ndarray  # NaN when no window could be evaluated
+    last_drop_dates: List[Optional[datetime]]
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def for_game(self, index: int) -> GameTrendStatistics:
+        """Scalar statistics for the game at ``index``."""
+        drop_rate = self.window_drop_rate[index]
+        return GameTrendStatistics(
+            game_title=self.titles[index],
+            count=int(self.count[index]),
+            slope=float(self.slope[index]),
+            intercept=float(self.intercept[index]),
+            r_squared=float(self.r_squared[index]),
+            volatility=float(self.volatility[index]),
+            mean=float(self.mean[index]),
+            minimum=float(self.minimum[index]),
+            maximum=float(self.maximum[index]),
+            q1=float(self.q1[index]),
+            median=float(self.median[index]),
+            recent_slope=float(self.recent_slope[index]),
+            recent_intercept=float(self.recent_intercept[index]),
+            last_day=float(self.last_day[index]),
+            window_drop_rate=None if np.isnan(drop_rate) else float(drop_rate),
+            last_drop_date=self.last_drop_dates[index],
+        )
+
+    def by_title(self) -> Dict[str, GameTrendStatistics]:
+        """Scalar statistics keyed by game title."""
+        return {title: self.for_game(i) for i, title in enumerate(self.titles)}
+
+
+def masked_linear_fit(
+    x: np.ndarray, y: np.ndarray, mask: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Row-wise ordinary least squares ``y = slope * x + intercept``.
+
+    Matches ``sklearn.linear_model.LinearRegression`` (including its R²
+    convention for constant targets) without fitting a model per row.
+
+    Args:
+        x, y: (rows, points) arrays; values outside ``mask`` are ignored
+        mask: Boolean (rows, points) array of valid points
+
+    Returns:
+        Tuple: (slope, intercept, r_squared) arrays of shape (rows,)
+    """
+    weights = mask.astype(float)
+    n = weights.sum(axis=1)
+    safe_n = np.where(n > 0, n, 1)
+    x = np.where(mask, x, 0.0)
+    y = np.where(mask, y, 0.0)
+
+    mean_x = x.sum(axis=1) / safe_n
+    mean_y = y.sum(axis=1) / safe_n
+    dx = (x - mean_x[:, np.newaxis]) * weights
+    dy = (y - mean_y[:, np.newaxis]) * weights
+
+    sxx = (dx * dx).sum(axis=1)
+    sxy = (dx * dy).sum(axis=1)
+    syy = (dy * dy).sum(axis=1)
+
+    slope = np.divide(sxy, sxx, out=np.zeros_like(sxy), where=sxx > 0)
+    intercept = mean_y - slope * mean_x
+
+    residuals = (y - (slope[:, np.newaxis] * x + intercept[:, np.newaxis])) * weights
+    ss_res = (residuals * residuals).sum(axis=1)
+
+    # Constant targets (up to rounding) are fitted perfectly and score 1.0
+    constant = syy <= 1e-12 * np.maximum(1.0, mean_y * mean_y * n)
+    r_squared = np.divide(ss_res, syy, out=np.zeros_like(ss_res), where=~constant)
+    r_squared = np.where(constant, 1.0, 1.0 - r_squared)
+
+    return slope, intercept, r_squared
+
+
+def compute_trend_statistics(
+    batch: PriceSeriesBatch,
+    drop_threshold: float = 0.15,
+    drop_window: int = 30,
+    recent_points: int = 30,
+) -> TrendStatistics:
+    """
+    Compute trend statistics for every game in a batch.
+
+    Args:
+        batch: Packed price histories
+        drop_threshold: Fractional drop counted as significant
+        drop_window: Days-worth of points per rolling drop window
+        recent_points: Points used for the short-term fit
+
+    Returns:
+        TrendStatistics: Per-game statistics arrays
+    """
+    prices = batch.prices
+    mask = batch.mask
+    lengths = batch.lengths
+    rows = len(batch.titles)
+
+    if rows == 0 or prices.shape[1] == 0:
+        empty = np.full(rows, np.nan)
+        return TrendStatistics(
+            titles=list(batch.titles),
+            count=lengths.copy(),
+            **{
+                name: empty.copy()
+                for name in (
+                    "slope",
+                    "intercept",
+                    "r_squared",
+                    "volatility",
+                    "mean",
+                    "minimum",
+                    "maximum",
+                    "q1",
+                    "median",
+                    "recent_slope",
+                    "recent_intercept",
+                    "last_day",
+                    "window_drop_rate",
+                )
+            },
+            last_drop_dates=[None] * rows,
+        )
+
+    has_points = lengths > 0
+    safe_lengths = np.where(has_points, lengths, 1)
+
+    # Full-history fit
+    slope, intercept, r_squared = masked_linear_fit(batch.days, prices, mask)
+
+    # Fit over the most recent points only
+    positions = np.arange(prices.shape[1])
+    recent_mask = mask & (positions >= (lengths - recent_points)[:, np.newaxis])
+    recent_slope, recent_intercept, _ = masked_linear_fit(
+        batch.days, prices, recent_mask
+    )
+
+    # Distribution statistics (population std, like np.std)
+    filled = np.where(mask, prices, 0.0)
+    mean = filled.sum(axis=1) / safe_lengths
+    variance = (np.where(mask, prices - mean[:, np.newaxis], 0.0) ** 2).sum(
+        axis=1
+    ) / safe_lengths
+    std = np.sqrt(variance)
+    volatility = np.divide(std, mean, out=np.zeros_like(std), where=mean > 0)
+
+    minimum = np.where(mask, prices, np.inf).min(axis=1)
+    maximum = np.where(mask, prices, -np.inf).max(axis=1)
+
+    q1 = np.full(rows, np.nan)
+    median = np.full(rows, np.nan)
+    if has_points.any():
+        q1[has_points], median[has_points] = np.nanpercentile(
+            prices[has_points], [25, 50], axis=1
+        )
+
+    last_day = np.where(
+        has_points,
+        batch.days[np.arange(rows), np.maximum(lengths - 1, 0)],
+        np.nan,
+    )
+
+    window_drop_rate = _window_drop_rates(prices, lengths, drop_threshold, drop_window)
+    last_drop_dates = _last_drop_dates(batch, drop_threshold)
+
+    invalid = ~has_points
+    for values in (mean, volatility, minimum, maximum, slope, intercept, r_squared):
+        values[invalid] = np.nan
+
+    return TrendStatistics(
+        titles=list(batch.titles),
+        count=lengths.copy(),
+        slope=slope,
+        intercept=intercept,
+        r_squared=r_squared,
+        volatility=volatility,
+        mean=mean,
+        minimum=minimum,
+        maximum=maximum,
+        q1=q1,
+        median=median,
+        recent_slope=recent_slope,
+        recent_intercept=recent_intercept,
+        last_day=last_day,
+        window_drop_rate=window_drop_rate,
+        last_drop_dates=last_drop_dates,
+    )
+
+
+def _window_drop_rates(
+    prices: np.ndarray, lengths: np.ndarray, threshold: float, window: int
+) -> np.ndarray:
+    """Rolling-window drop rate per game (NaN when no window was evaluated)."""
+    rates = np.full(len(lengths), np.nan)
+    for row, length in enumerate(lengths):
+        rate = window_drop_rate(
+            prices[row, :length], lookback=window, window=window, threshold=threshold
+        )
+        if rate is not None:
+            rates[row] = rate
+    return rates
+
+
+def _last_drop_dates(
+    batch: PriceSeriesBatch, threshold: float
+) -> List[Optional[datetime]]:
+    """Date of the last consecutive drop of at least ``threshold`` per game."""
+    dates = []
+    for row, length in enumerate(batch.lengths):
+        index = last_significant_drop(batch.prices[row, :length], threshold)
+        dates.append(batch.dates[row][index] if index is not None else None)
+    return dates
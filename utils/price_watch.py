@@ -0,0 +1,613 @@
+#!/usr/bin/env python3
+
+"""
+Wishlist Price Watch Engine for AutoGen DekuDeals
+=================================================
+
+Per-user target prices for wishlist games, checked catalog-wide.
+
+A scan:
+1. syncs watches with ``GameStatus.WISHLIST`` entries of every collection
+   (new entries get the prediction engine's target price)
+2. refreshes only current prices of watched games (price table of the
+   item page), concurrently, and stores them in one transaction
+3. evaluates every watch in one vectorized pass against the latest stored
+   prices and emits ``AlertingSystem`` events for targets reached
+
+A watch alerts once per target hit; it alerts again only if the price keeps
+falling, and re-arms when the price climbs back above the target.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .price_calculator import extract_price
+from .price_prediction_ml import PricePredictionEngine, get_price_prediction_engine
+from .sqlite_pool import SQLiteConnectionPool
+
+logger = logging.getLogger(__name__)
+
+WATCH_COLUMNS = (
+    "user_id, game_title, target_price, source, game_url, created_at, "
+    "last_price, last_checked, alerted_price, alerted_at"
+)
+
+UPSERT_WATCH_SQL = """
+    INSERT INTO price_watches
+    (user_id, game_title, target_price, source, game_url, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(user_id, game_title) DO UPDATE SET
+        target_price = excluded.target_price,
+        source = excluded.source,
+        game_url = COALESCE(excluded.game_url, price_watches.game_url),
+        alerted_price = NULL,
+        alerted_at = NULL
+"""
+
+UPDATE_PREDICTED_TARGET_SQL = """
+    UPDATE price_watches
+    SET target_price = ?, alerted_price = NULL, alerted_at = NULL
+    WHERE user_id = ? AND game_title = ? AND source != 'manual'
+      AND target_price != ?
+"""
+
+UPDATE_CHECK_SQL = """
+    UPDATE price_watches SET last_price = ?, last_checked = ?
+    WHERE user_id = ? AND game_title = ?
+"""
+
+UPDATE_ALERTED_SQL = """
+    UPDATE price_watches SET alerted_price = ?, alerted_at = ?
+    WHERE user_id = ? AND game_title = ?
+"""
+
+PriceFetcher = Callable[[str, Optional[str]], Tuple[Optional[float], Optional[str]]]
+
+
+@dataclass
+class PriceWatch:
+    """Target price of one wishlist game for one user."""
+
+    user_id: str
+    game_title: str
+    target_price: float
+    source: str  # "prediction" or "manual"
+    game_url: Optional[str]
+    created_at: str
+    last_price: Optional[float] = None
+    last_checked: Optional[str] = None
+    alerted_price: Optional[float] = None
+    alerted_at: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class PriceWatchEvent:
+    """A wishlist game reaching its target price."""
+
+    user_id: str
+    game_title: str
+    current_price: float
+    target_price: float
+    alert_id: Optional[str] = None
+
+    @property
+    def below_target_percentage(self) -> float:
+        """How far the current price is below the target, in percent."""
+        if self.target_price <= 0:
+            return 0.0
+        return (self.target_price - self.current_price) / self.target_price * 100
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["below_target_percentage"] = round(self.below_target_percentage, 1)
+        return data
+
+
+class PriceWatchEngine:
+    """
+    Stores wishlist price targets and scans them in bulk.
+
+    Usage:
+        watches = PriceWatchEngine()
+        watches.set_target("user_1", "Hades", 14.99)
+        summary = watches.run_once()
+        for event in summary["events"]:
+            print(event["game_title"], event["current_price"])
+    """
+
+    def __init__(
+        self,
+        price_engine: Optional[PricePredictionEngine] = None,
+        collection_manager=None,
+        alerting=None,
+        fetch_price: Optional[PriceFetcher] = None,
+        db_path: Optional[Union[str, Path]] = None,
+        max_workers: int = 8,
+        interval_hours: float = 6.0,
+        default_target_ratio: float = 0.75,
+        price_max_age_days: int = 7,
+    ):
+        """
+        Initialize the watch engine.
+
+        Args:
+            price_engine: Price store and target predictor (shared by default)
+            collection_manager: Source of wishlists (shared by default)
+            alerting: Receives target-reached events (shared by default)
+            fetch_price: ``(title, url) -> (price, url)`` current price lookup
+            db_path: Watch database (defaults to the price data directory)
+            max_workers: Concurrent price fetches
+            interval_hours: Time between scheduled scans
+            default_target_ratio: Target as a share of the current price when
+                there is too little history to predict one
+            price_max_age_days: Stored prices older than this are ignored
+        """
+        self.price_engine = price_engine or get_price_prediction_engine()
+        self._collection_manager = collection_manager
+        self._alerting = alerting
+        self.fetch_price = fetch_price or _fetch_current_price
+        self.max_workers = max_workers
+        self.interval_hours = interval_hours
+        self.default_target_ratio = default_target_ratio
+        self.price_max_age_days = price_max_age_days
+
+        self.db_path = Path(db_path or self.price_engine.data_dir / "price_watches.db")
+        self._pool = SQLiteConnectionPool(self.db_path)
+        self._init_database()
+
+        self.last_run: Optional[Dict[str, Any]] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _init_database(self):
+        """Create the watch table."""
+        with self._pool.write() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS price_watches (
+                    user_id TEXT NOT NULL,
+                    game_title TEXT NOT NULL,
+                    target_price REAL NOT NULL,
+                    source TEXT NOT NULL DEFAULT 'manual',
+                    game_url TEXT,
+                    created_at TEXT NOT NULL,
+                    last_price REAL,
+                    last_checked TEXT,
+                    alerted_price REAL,
+                    alerted_at TEXT,
+                    PRIMARY KEY (user_id, game_title)
+                )
+            """
+            )
+
+    @property
+    def collection_manager(self):
+        if self._collection_manager is None:
+            from .game_collection_manager import get_game_collection_manager
+
+            self._collection_manager = get_game_collection_manager()
+        return self._collection_manager
+
+    @property
+    def alerting(self):
+        if self._alerting is None:
+            from .alerting_system import get_alerting_system
+
+            self._alerting = get_alerting_system()
+        return self._alerting
+
+    def close(self):
+        """Close pooled database connections."""
+        self._pool.close()
+
+    # ------------------------------------------------------------------
+    # Watches
+    # ------------------------------------------------------------------
+
+    def set_target(
+        self,
+        user_id: str,
+        game_title: str,
+        target_price: float,
+        source: str = "manual",
+        game_url: Optional[str] = None,
+    ):
+        """Create or replace a user's target price for a game."""
+        with self._pool.write() as conn:
+            conn.execute(
+                UPSERT_WATCH_SQL,
+                (
+                    user_id,
+                    game_title,
+                    target_price,
+                    source,
+                    game_url,
+                    datetime.now().isoformat(),
+                ),
+            )
+        logger.info(f"🎯 Watching {game_title} for {user_id} at ${target_price:.2f}")
+
+    def record_prediction(self, user_id: str, prediction) -> bool:
+        """
+        Store a ``PricePrediction`` target on the user's existing watch.
+
+        Manually set targets are never overwritten.
+
+        Returns:
+            bool: Whether a watch was updated
+        """
+        if not prediction.target_price:
+            return False
+
+        with self._pool.write() as conn:
+            updated = conn.execute(
+                UPDATE_PREDICTED_TARGET_SQL,
+                (
+                    prediction.target_price,
+                    user_id,
+                    prediction.game_title,
+                    prediction.target_price,
+                ),
+            ).rowcount
+        return updated > 0
+
+    def remove_target(self, user_id: str, game_title: str) -> bool:
+        """Stop watching a game for a user."""
+        with self._pool.write() as conn:
+            removed = conn.execute(
+                "DELETE FROM price_watches WHERE user_id = ? AND game_title = ?",
+                (user_id, game_title),
+            ).rowcount
+        return removed > 0
+
+    def get_watches(self, user_id: Optional[str] = None) -> List[PriceWatch]:
+        """Get all watches, or those of one user."""
+        with self._pool.read() as conn:
+            if user_id is None:
+                rows = conn.execute(f"SELECT {WATCH_COLUMNS} FROM price_watches")
+            else:
+                rows = conn.execute(
+                    f"SELECT {WATCH_COLUMNS} FROM price_watches WHERE user_id = ?",
+                    (user_id,),
+                )
+            return [PriceWatch(*row) for row in rows.fetchall()]
+
+    def sync_wishlists(self) -> Dict[str, int]:
+        """
+        Match watches to the wishlist entries of every user collection.
+
+        New wishlist games get a predicted target price (from stored history
+        when possible, otherwise a share of the known current price). Games
+        that left a wishlist stop being watched.
+
+        Returns:
+            Dict: ``added`` and ``removed`` watch counts
+        """
+        from .game_collection_manager import GameStatus
+
+        wishlists: Dict[str, Dict[str, Any]] = {
+            user_id: {
+                entry.title: entry
+                for entry in games.values()
+                if entry.status == GameStatus.WISHLIST
+            }
+            for user_id, games in self.collection_manager.user_collections.items()
+        }
+
+        existing = {(w.user_id, w.game_title) for w in self.get_watches()}
+        wanted = {
+            (user_id, title)
+            for user_id, entries in wishlists.items()
+            for title in entries
+        }
+
+        new_keys = sorted(wanted - existing)
+        targets = self._default_targets(
+            {
+                title: wishlists[user_id][title].current_price
+                for user_id, title in new_keys
+            }
+        )
+
+        now = datetime.now().isoformat()
+        new_rows = [
+            (
+                user_id,
+                title,
+                targets[title],
+                "prediction",
+                wishlists[user_id][title].dekudeals_url,
+                now,
+            )
+            for user_id, title in new_keys
+            if targets.get(title) is not None
+        ]
+        stale_keys = list(existing - wanted)
+
+        with self._pool.write() as conn:
+            conn.executemany(UPSERT_WATCH_SQL, new_rows)
+            conn.executemany(
+                "DELETE FROM price_watches WHERE user_id = ? AND game_title = ?",
+                stale_keys,
+            )
+
+        if new_rows or stale_keys:
+            logger.info(
+                f"🎯 Wishlist watches synced: +{len(new_rows)} / -{len(stale_keys)}"
+            )
+        return {"added": len(new_rows), "removed": len(stale_keys)}
+
+    def _default_targets(
+        self, current_prices: Dict[str, Optional[float]]
+    ) -> Dict[str, Optional[float]]:
+        """Predicted target prices for new watches (batched statistics)."""
+        if not current_prices:
+            return {}
+
+        engine = self.price_engine
+        histories = engine.get_price_histories(list(current_prices))
+        statistics = engine.compute_trend_statistics(
+            {
+                title: history
+                for title, history in histories.items()
+                if len(history) >= engine.min_data_points
+            }
+        )
+
+        targets = {}
+        for title, current_price in current_prices.items():
+            target = None
+            if title in statistics:
+                target = engine.predict_target_price(
+                    title, histories[title], trend_stats=statistics[title]
+                )
+            if target is None:
+                latest = histories[title][-1].price if histories[title] else None
+                known_price = current_price or latest
+                if known_price:
+                    target = round(known_price * self.default_target_ratio, 2)
+            targets[title] = target
+        return targets
+
+    # ------------------------------------------------------------------
+    # Scans
+    # ------------------------------------------------------------------
+
+    def refresh_prices(self, titles: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Fetch current prices of watched games and store them in one batch.
+
+        Args:
+            titles: Games to refresh (default: every watched game)
+
+        Returns:
+            Dict: ``refreshed`` count and ``failed`` titles
+        """
+        urls: Dict[str, Optional[str]] = {}
+        for watch in self.get_watches():
+            if titles is None or watch.game_title in titles:
+                urls[watch.game_title] = urls.get(watch.game_title) or watch.game_url
+
+        now = datetime.now()
+        prices: Dict[str, float] = {}
+        resolved_urls: List[Tuple[str, str]] = []
+        failed = []
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            futures = {
+                executor.submit(self.fetch_price, title, url): title
+                for title, url in urls.items()
+            }
+            for future in as_completed(futures):
+                title = futures[future]
+                try:
+                    price, url = future.result()
+                except Exception as e:
+                    logger.warning(f"⚠️ Price refresh failed for {title}: {e}")
+                    price, url = None, None
+
+                if price is None:
+                    failed.append(title)
+                    continue
+                prices[title] = price
+                if url and url != urls[title]:
+                    resolved_urls.append((url, title))
+
+        self.price_engine.record_price_data_bulk(
+            (title, price, now, None) for title, price in prices.items()
+        )
+        if resolved_urls:
+            with self._pool.write() as conn:
+                conn.executemany(
+                    "UPDATE price_watches SET game_url = ? WHERE game_title = ?",
+                    resolved_urls,
+                )
+
+        return {"refreshed": len(prices), "failed": failed}
+
+    def evaluate(self) -> List[PriceWatchEvent]:
+        """
+        Check every watch against the latest stored prices in one pass.
+
+        Returns:
+            List[PriceWatchEvent]: Newly reached targets (alerts emitted)
+        """
+        watches = self.get_watches()
+        if not watches:
+            return []
+
+        titles = sorted({w.game_title for w in watches})
+        series = self.price_engine.get_price_series_many(
+            titles, days_back=self.price_max_age_days
+        )
+        latest = np.array(
+            [
+                float(series[t].prices[-1]) if len(series.get(t, ())) else np.nan
+                for t in titles
+            ]
+        )
+
+        title_index = {title: i for i, title in enumerate(titles)}
+        current = latest[[title_index[w.game_title] for w in watches]]
+        current = np.round(current, 2)  # float32 storage
+        targets = np.array([w.target_price for w in watches], dtype=float)
+        alerted = np.array(
+            [np.nan if w.alerted_price is None else w.alerted_price for w in watches]
+        )
+
+        # NaN comparisons are False: unknown prices never trigger or re-arm
+        reached = current <= targets
+        notify = reached & ~(current >= alerted)
+        rearm = (current > targets) & ~np.isnan(alerted)
+        checked = ~np.isnan(current)
+
+        now = datetime.now().isoformat()
+        events = []
+        for i in np.flatnonzero(notify):
+            watch = watches[i]
+            event = PriceWatchEvent(
+                user_id=watch.user_id,
+                game_title=watch.game_title,
+                current_price=float(current[i]),
+                target_price=watch.target_price,
+            )
+            event.alert_id = self._emit_event(event)
+            events.append(event)
+
+        with self._pool.write() as conn:
+            conn.executemany(
+                UPDATE_CHECK_SQL,
+                [
+                    (float(current[i]), now, watches[i].user_id, watches[i].game_title)
+                    for i in np.flatnonzero(checked)
+                ],
+            )
+            conn.executemany(
+                UPDATE_ALERTED_SQL,
+                [
+                    (float(current[i]), now, watches[i].user_id, watches[i].game_title)
+                    for i in np.flatnonzero(notify)
+                ]
+                + [
+                    (None, None, watches[i].user_id, watches[i].game_title)
+                    for i in np.flatnonzero(rearm)
+                ],
+            )
+
+        logger.info(
+            f"🔔 Evaluated {len(watches)} price watches: {len(events)} targets reached"
+        )
+        return events
+
+    def _emit_event(self, event: PriceWatchEvent) -> Optional[str]:
+        """Send a target-reached event to the alerting system."""
+        from .alerting_system import AlertCategory, AlertSeverity
+
+        try:
+            return self.alerting.emit_alert(
+                title=f"Price target reached: {event.game_title}",
+                message=(
+                    f"{event.game_title} is ${event.current_price:.2f} "
+                    f"(target ${event.target_price:.2f}) for {event.user_id}"
+                ),
+                category=AlertCategory.PRICE,
+                severity=AlertSeverity.INFO,
+                trigger_value=event.current_price,
+                threshold_value=event.target_price,
+                context=event.to_dict(),
+                source="price_watch",
+            )
+        except Exception as e:
+            logger.error(f"❌ Could not emit price watch alert: {e}")
+            return None
+
+    def run_once(self) -> Dict[str, Any]:
+        """
+        Sync wishlists, refresh watched prices and evaluate all watches.
+
+        Returns:
+            Dict: Scan summary with the emitted events
+        """
+        start = time.time()
+        synced = self.sync_wishlists()
+        refreshed = self.refresh_prices()
+        events = self.evaluate()
+
+        self.last_run = {
+            "started_at": datetime.fromtimestamp(start).isoformat(),
+            "duration_seconds": round(time.time() - start, 2),
+            "watches": len(self.get_watches()),
+            "watches_added": synced["added"],
+            "watches_removed": synced["removed"],
+            "prices_refreshed": refreshed["refreshed"],
+            "failed_games": refreshed["failed"],
+            "events": [event.to_dict() for event in events],
+        }
+        return self.last_run
+
+    def start(self):
+        """Start scanning periodically in a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._schedule_loop, daemon=True)
+        self._thread.start()
+        logger.info(f"⏰ Wishlist price watch scheduled every {self.interval_hours}h")
+
+    def stop(self):
+        """Stop the scheduled scans."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        logger.info("Wishlist price watch stopped")
+
+    def _schedule_loop(self):
+        """Background loop: scan, then wait for the next interval."""
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Error in wishlist price watch: {e}")
+            self._stop_event.wait(self.interval_hours * 3600)
+
+
+def _fetch_current_price(
+    game_title: str, game_url: Optional[str]
+) -> Tuple[Optional[float], Optional[str]]:
+    """Current eShop price from the item page's price table only."""
+    from deku_tools import scrape_current_price, search_deku_deals
+
+    game_url = game_url or search_deku_deals(game_title)
+    if not game_url:
+        return None, None
+    return extract_price(scrape_current_price(game_url)), game_url
+
+
+# Global price watch engine instance
+_price_watch_engine = None
+_price_watch_engine_lock = threading.Lock()
+
+
+def get_price_watch_engine() -> PriceWatchEngine:
+    """Get global price watch engine instance."""
+    global _price_watch_engine
+    if _price_watch_engine is None:
+        with _price_watch_engine_lock:
+            if _price_watch_engine is None:
+                _price_watch_engine = PriceWatchEngine()
+    return _price_watch_engine
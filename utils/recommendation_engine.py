@@ -13,6 +13,8 @@ from enum import Enum
 import json
 from datetime import datetime
 
+from utils.analysis_context import GameAnalysisContext
+
 logger = logging.getLogger(__name__)
 
 
@@ -352,68 +354,116 @@ class RecommendationEngine:
         else:
             return max(1.0, best_score / user_profile.minimum_score * 5.0)
 
-    def generate_personalized_recommendations(
-        self,
-        games_data: List[Dict[str, Any]],
-        user_profile: UserProfile,
-        max_recommendations: int = 5,
-    ) -> List[GameRecommendation]:
+    def analyze_games(
+        self, games_data: List[Dict[str, Any]]
+    ) -> List[GameAnalysisContext]:
         """
-        Generuje spersonalizowane rekomendacje.
+        Oblicza analizy wartości raz dla każdej gry.
 
         Args:
             games_data: Lista danych gier
-            user_profile: Profil użytkownika
-            max_recommendations: Maksymalna liczba rekomendacji
 
         Returns:
-            List[GameRecommendation]: Lista rekomendacji
+            List[GameAnalysisContext]: Gry z udanymi analizami (kolejność zachowana)
         """
-        recommendations = []
+        analyzed_games = []
 
         for game_data in games_data:
             try:
-                # Import here to avoid circular imports
-                from agent_tools import (
-                    calculate_value_score,
-                    calculate_advanced_value_analysis,
+                context = GameAnalysisContext(game_data)
+                if context.analyses_successful:
+                    analyzed_games.append(context)
+
+            except Exception as e:
+                logger.error(
+                    f"Error analyzing game {game_data.get('title', 'Unknown')}: {e}"
                 )
+                continue
 
-                # Get analyses
-                basic_analysis = calculate_value_score(game_data)
-                advanced_analysis = calculate_advanced_value_analysis(game_data)
+        return analyzed_games
 
-                if not basic_analysis.get("success") or not advanced_analysis.get(
-                    "success"
-                ):
-                    continue
+    def recommend_for_profiles(
+        self,
+        analyzed_games: List[GameAnalysisContext],
+        user_profiles: List[UserProfile],
+        max_recommendations: int = 5,
+    ) -> Dict[str, List[GameRecommendation]]:
+        """
+        Generuje rekomendacje dla wielu profili w jednym przebiegu po grach.
 
-                # Calculate recommendation score
-                rec_score = self.calculate_recommendation_score(
-                    game_data, basic_analysis, advanced_analysis, user_profile
-                )
+        Args:
+            analyzed_games: Gry z obliczonymi analizami (``analyze_games``)
+            user_profiles: Profile użytkowników
+            max_recommendations: Maksymalna liczba rekomendacji na profil
 
-                # Generate recommendation
-                recommendation = self._create_game_recommendation(
-                    game_data,
-                    basic_analysis,
-                    advanced_analysis,
-                    user_profile,
-                    rec_score,
-                )
+        Returns:
+            Dict[str, List[GameRecommendation]]: Rekomendacje wg user_id profilu
+        """
+        recommendations: Dict[str, List[GameRecommendation]] = {
+            profile.user_id: [] for profile in user_profiles
+        }
 
-                recommendations.append(recommendation)
+        for analyzed in analyzed_games:
+            for user_profile in user_profiles:
+                try:
+                    rec_score = self.calculate_recommendation_score(
+                        analyzed.game_data,
+                        analyzed.basic_analysis,
+                        analyzed.advanced_analysis,
+                        user_profile,
+                    )
 
-            except Exception as e:
-                logger.error(
-                    f"Error processing game {game_data.get('title', 'Unknown')}: {e}"
-                )
-                continue
+                    recommendations[user_profile.user_id].append(
+                        self._create_game_recommendation(
+                            analyzed.game_data,
+                            analyzed.basic_analysis,
+                            analyzed.advanced_analysis,
+                            user_profile,
+                            rec_score,
+                        )
+                    )
+
+                except Exception as e:
+                    logger.error(
+                        f"Error processing game {analyzed.game_data.get('title', 'Unknown')} "
+                        f"for {user_profile.user_id}: {e}"
+                    )
+                    continue
 
         # Sort by recommendation score
-        recommendations.sort(key=lambda x: x.recommendation_score, reverse=True)
+        for user_id, profile_recommendations in recommendations.items():
+            profile_recommendations.sort(
+                key=lambda x: x.recommendation_score, reverse=True
+            )
+            recommendations[user_id] = profile_recommendations[:max_recommendations]
+
+        return recommendations
+
+    def generate_personalized_recommendations(
+        self,
+        games_data: List[Dict[str, Any]],
+        user_profile: UserProfile,
+        max_recommendations: int = 5,
+        analyzed_games: Optional[List[GameAnalysisContext]] = None,
+    ) -> List[GameRecommendation]:
+        """
+        Generuje spersonalizowane rekomendacje.
+
+        Args:
+            games_data: Lista danych gier
+            user_profile: Profil użytkownika
+            max_recommendations: Maksymalna liczba rekomendacji
+            analyzed_games: Opcjonalne, wcześniej obliczone analizy gier
+
+        Returns:
+            List[GameRecommendation]: Lista rekomendacji
+        """
+        if analyzed_games is None:
+            analyzed_games = self.analyze_games(games_data)
 
-        return recommendations[:max_recommendations]
+        return self.recommend_for_profiles(
+            analyzed_games, [user_profile], max_recommendations
+        )[user_profile.user_id]
 
     def _create_game_recommendation(
         self,
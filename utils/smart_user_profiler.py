@@ -14,6 +14,7 @@ from pathlib import Path
 from collections import defaultdict, Counter
 from dataclasses import dataclass, field
 from enum import Enum
+from threading import Lock, RLock
 import uuid
 
 from utils.recommendation_engine import UserPreference, UserProfile
@@ -130,6 +131,9 @@ class SmartUserProfiler:
         self.user_profiles: Dict[str, DynamicUserProfile] = {}
         self.interaction_history: List[UserInteraction] = []
 
+        # Interactions may be recorded from concurrent scraping threads
+        self._lock = RLock()
+
         # Learning parameters
         self.min_interactions_for_profiling = 3
         self.confidence_threshold = 0.6
@@ -238,32 +242,33 @@ class SmartUserProfiler:
             session_context=session_context or {},
         )
 
-        self.interaction_history.append(interaction)
+        with self._lock:
+            self.interaction_history.append(interaction)
 
-        # Get current user ID from Multi-User system
-        current_user_id = _get_current_multi_user_id()
+            # Get current user ID from Multi-User system
+            current_user_id = _get_current_multi_user_id()
 
-        # Add current user context to interaction
-        try:
-            current_user = self.user_manager.get_current_user()
-            if current_user:
-                interaction.session_context.update(
-                    {
-                        "multi_user_system": {
-                            "user_id": current_user.user_id,
-                            "username": current_user.username,
-                            "role": current_user.role.value,
+            # Add current user context to interaction
+            try:
+                current_user = self.user_manager.get_current_user()
+                if current_user:
+                    interaction.session_context.update(
+                        {
+                            "multi_user_system": {
+                                "user_id": current_user.user_id,
+                                "username": current_user.username,
+                                "role": current_user.role.value,
+                            }
                         }
-                    }
-                )
-        except Exception as e:
-            logger.debug(f"Could not add Multi-User context: {e}")
+                    )
+            except Exception as e:
+                logger.debug(f"Could not add Multi-User context: {e}")
 
-        self._update_user_profile_from_interaction(current_user_id, interaction)
+            self._update_user_profile_from_interaction(current_user_id, interaction)
 
-        # Save periodically
-        if len(self.interaction_history) % 5 == 0:  # Save every 5 interactions
-            self._save_data()
+            # Save periodically
+            if len(self.interaction_history) % 5 == 0:  # Save every 5 interactions
+                self._save_data()
 
         logger.debug(
             f"Recorded interaction: {game_name} ({interaction_type}) for user {current_user_id}"
@@ -810,13 +815,16 @@ class SmartUserProfiler:
 
 # Global instance
 _smart_profiler_instance = None
+_smart_profiler_lock = Lock()
 
 
 def get_smart_user_profiler() -> SmartUserProfiler:
     """Get global smart user profiler instance"""
     global _smart_profiler_instance
     if _smart_profiler_instance is None:
-        _smart_profiler_instance = SmartUserProfiler()
+        with _smart_profiler_lock:
+            if _smart_profiler_instance is None:
+                _smart_profiler_instance = SmartUserProfiler()
     return _smart_profiler_instance
 
 
@@ -0,0 +1,206 @@
+"""
+Deterministic Speaker Selection for AutoGen DekuDeals
+Deterministyczny wybór mówcy (maszyna stanów) dla GroupChat analizy gier
+
+Replaces ``speaker_selection_method="auto"`` (one extra LLM call per round)
+with an explicit transition graph:
+
+    USER_PROXY → DATA_COLLECTOR → PRICE_ANALYZER → REVIEW_GENERATOR → QUALITY_ASSURANCE
+
+- an agent requesting tools hands over to USER_PROXY, which returns the
+  results to the same agent (at most ``max_tool_rounds`` times per stage)
+- QUALITY_ASSURANCE ends the chat when it reports a pass and sends the
+  analysis back to REVIEW_GENERATOR (``max_qa_retries`` times) on a fail
+
+The number of rounds is therefore bounded by construction
+(``max_rounds``) and the latency of every round is recorded.
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_STAGES = [
+    "DATA_COLLECTOR_agent",
+    "PRICE_ANALYZER_agent",
+    "REVIEW_GENERATOR_agent",
+    "QUALITY_ASSURANCE_agent",
+]
+EXECUTOR = "USER_PROXY"
+
+# QUALITY_ASSURANCE_agent ends its reply with one of these markers
+QA_STATUS_PATTERN = re.compile(r"QA_STATUS:\s*(PASS|FAIL)", re.IGNORECASE)
+
+
+def qa_status(content: Any) -> Optional[bool]:
+    """Wynik kontroli jakości z wiadomości QA (None gdy brak znacznika)."""
+    matches = QA_STATUS_PATTERN.findall(str(content or ""))
+    if not matches:
+        return None
+    return matches[-1].upper() == "PASS"
+
+
+def _requests_tools(message: Dict[str, Any]) -> bool:
+    return bool(message.get("tool_calls") or message.get("function_call"))
+
+
+@dataclass
+class RoundTiming:
+    """Czas jednej rundy konwersacji."""
+
+    round: int
+    speaker: str
+    seconds: float
+
+
+class AnalysisSpeakerFSM:
+    """
+    Maszyna stanów wyboru mówcy dla ``autogen.GroupChat``.
+
+    Usage:
+        fsm = AnalysisSpeakerFSM()
+        groupchat = autogen.GroupChat(
+            agents=agents,
+            messages=[],
+            max_round=fsm.max_rounds,
+            speaker_selection_method=fsm,
+        )
+        fsm.reset()
+        user_proxy.initiate_chat(manager, message=prompt)
+        fsm.get_summary()
+    """
+
+    def __init__(
+        self,
+        stages: Optional[List[str]] = None,
+        executor: str = EXECUTOR,
+        retry_stage: str = "REVIEW_GENERATOR_agent",
+        max_qa_retries: int = 1,
+        max_tool_rounds: int = 3,
+    ):
+        """
+        Args:
+            stages: Nazwy agentów w kolejności workflow (ostatni to QA)
+            executor: Agent wykonujący narzędzia
+            retry_stage: Etap powtarzany po negatywnej ocenie QA
+            max_qa_retries: Maksymalna liczba powtórek po negatywnej ocenie QA
+            max_tool_rounds: Maksymalna liczba wywołań narzędzi na etap
+        """
+        self.stages = list(stages or ANALYSIS_STAGES)
+        self.executor = executor
+        self.retry_stage = retry_stage
+        self.max_qa_retries = max_qa_retries
+        self.max_tool_rounds = max_tool_rounds
+
+        if retry_stage not in self.stages:
+            raise ValueError(f"Retry stage {retry_stage} is not a workflow stage")
+
+        self.transitions = self._build_transitions()
+        self.reset()
+
+    def _build_transitions(self) -> Dict[str, List[str]]:
+        """Dozwolone przejścia (brak przejścia z QA = koniec konwersacji)."""
+        transitions = {self.executor: list(self.stages)}
+        for stage, next_stage in zip(self.stages, self.stages[1:]):
+            transitions[stage] = [self.executor, next_stage]
+        transitions[self.stages[-1]] = [self.executor, self.retry_stage]
+        return transitions
+
+    @property
+    def max_rounds(self) -> int:
+        """Górna granica liczby rund wynikająca z grafu przejść."""
+        per_stage = 2 * self.max_tool_rounds + 1  # Tool calls with results + answer
+        retried = len(self.stages) - self.stages.index(self.retry_stage)
+        visits = len(self.stages) + self.max_qa_retries * retried
+        return 1 + visits * per_stage
+
+    def reset(self):
+        """Przygotowuje maszynę do nowej konwersacji."""
+        self.current_stage: Optional[str] = None
+        self.tool_rounds = 0
+        self.qa_retries = 0
+        self.qa_passed: Optional[bool] = None
+        self.termination_reason: Optional[str] = None
+        self.round_timings: List[RoundTiming] = []
+        self._round_started = time.perf_counter()
+
+    def __call__(self, last_speaker: Any, groupchat: Any) -> Optional[Any]:
+        """Wybiera następnego mówcę (None kończy konwersację)."""
+        now = time.perf_counter()
+        self.round_timings.append(
+            RoundTiming(
+                round=len(self.round_timings) + 1,
+                speaker=last_speaker.name,
+                seconds=now - self._round_started,
+            )
+        )
+        self._round_started = now
+
+        message = groupchat.messages[-1] if groupchat.messages else {}
+        next_name = self._next_speaker(last_speaker.name, message)
+        if next_name is None:
+            logger.info(f"🏁 Analysis chat finished: {self.termination_reason}")
+            return None
+
+        if next_name not in self.transitions.get(last_speaker.name, []):
+            raise ValueError(
+                f"Transition {last_speaker.name} → {next_name} is not allowed"
+            )
+        if next_name != self.executor and next_name != self.current_stage:
+            self.current_stage, self.tool_rounds = next_name, 0
+
+        return groupchat.agent_by_name(next_name)
+
+    def _next_speaker(self, speaker: str, message: Dict[str, Any]) -> Optional[str]:
+        """Przejście maszyny stanów dla ostatniej wiadomości."""
+        if speaker == self.executor:
+            # Initial task goes to the first stage; tool results go back
+            return self.current_stage or self.stages[0]
+
+        if _requests_tools(message):
+            if self.tool_rounds >= self.max_tool_rounds:
+                self.termination_reason = f"tool round limit reached by {speaker}"
+                return None
+            self.tool_rounds += 1
+            return self.executor
+
+        if speaker != self.stages[-1]:
+            return self.stages[self.stages.index(speaker) + 1]
+
+        status = qa_status(message.get("content"))
+        if status is False and self.qa_retries < self.max_qa_retries:
+            self.qa_retries += 1
+            self.qa_passed = False
+            return self.retry_stage
+
+        # A reply without a status marker counts as accepted
+        self.qa_passed = status is not False
+        self.termination_reason = (
+            "quality check passed" if self.qa_passed else "quality retries exhausted"
+        )
+        return None
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Podsumowanie konwersacji z czasami rund."""
+        seconds = [timing.seconds for timing in self.round_timings]
+        return {
+            "rounds": len(self.round_timings),
+            "max_rounds": self.max_rounds,
+            "qa_passed": self.qa_passed,
+            "qa_retries": self.qa_retries,
+            "termination_reason": self.termination_reason,
+            "total_seconds": round(sum(seconds), 3),
+            "slowest_round_seconds": round(max(seconds), 3) if seconds else 0.0,
+            "round_timings": [
+                {
+                    "round": timing.round,
+                    "speaker": timing.speaker,
+                    "seconds": round(timing.seconds, 3),
+                }
+                for timing in self.round_timings
+            ],
+        }
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+"""
+SQLite Connection Pool for AutoGen DekuDeals
+============================================
+
+Persistent, thread-local SQLite connections for storage-heavy components.
+
+Features:
+- One long-lived connection per thread (no connect/close per call), closed
+  when the thread exits so short-lived worker threads do not leak them
+- WAL journal mode so readers never block on the writer
+- Tuned pragmas (synchronous, cache size, temp store, busy timeout)
+- Per-connection prepared statement cache
+- Serialized write transactions (``BEGIN IMMEDIATE``) to avoid busy retries
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import logging
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Pragmas applied to every pooled connection
+DEFAULT_PRAGMAS: Dict[str, Union[str, int]] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",  # Safe with WAL, avoids an fsync per commit
+    "temp_store": "MEMORY",
+    "cache_size": -8000,  # 8 MB page cache
+    "busy_timeout": 5000,  # ms
+}
+
+
+class _ConnectionHolder:
+    """Thread-local holder; its finalizer closes the thread's connection"""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+class SQLiteConnectionPool:
+    """
+    Thread-local SQLite connection pool.
+
+    Usage:
+        pool = SQLiteConnectionPool("price_data/price_history.db")
+        with pool.write() as conn:
+            conn.executemany(INSERT_SQL, rows)
+        rows = pool.connection().execute(SELECT_SQL, params).fetchall()
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        pragmas: Optional[Dict[str, Union[str, int]]] = None,
+        cached_statements: int = 256,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            db_path: Path to the SQLite database file
+            pragmas: Pragmas overriding ``DEFAULT_PRAGMAS``
+            cached_statements: Prepared statements kept per connection
+        """
+        self.db_path = str(db_path)
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.cached_statements = cached_statements
+
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._connections_lock = threading.Lock()
+        self._connections: Dict[sqlite3.Connection, weakref.finalize] = {}
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = self._connect()
+            holder = _ConnectionHolder(conn)
+            # The thread-local is dropped when the thread exits, which
+            # closes the connection (executor workers come and go)
+            finalizer = weakref.finalize(holder, self._release, conn)
+            with self._connections_lock:
+                self._connections[conn] = finalizer
+            self._local.holder = holder
+        return holder.conn
+
+    @property
+    def open_connections(self) -> int:
+        """Number of connections currently open."""
+        with self._connections_lock:
+            return len(self._connections)
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Context manager yielding a connection for read-only queries."""
+        yield self.connection()
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """
+        Context manager running the block in one write transaction.
+
+        Writers are serialized within the process; WAL mode lets readers
+        continue while a write is in progress. The transaction is committed
+        on success and rolled back on error.
+        """
+        conn = self.connection()
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+
+    def close(self):
+        """Close every connection opened by the pool."""
+        with self._connections_lock:
+            finalizers = list(self._connections.values())
+        for finalizer in finalizers:
+            finalizer()  # Runs _release at most once
+        self._local = threading.local()
+
+    def _release(self, conn: sqlite3.Connection):
+        """Close a connection and forget it."""
+        with self._connections_lock:
+            self._connections.pop(conn, None)
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Error closing SQLite connection: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,  # Transactions are managed explicitly
+            check_same_thread=False,  # Closed cross-thread by close()/finalizer
+            cached_statements=self.cached_statements,
+        )
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+
+        logger.debug(
+            f"🔌 Opened pooled SQLite connection to {self.db_path} "
+            f"(thread {threading.get_ident()})"
+        )
+        return conn
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+"""
+Time Series Utilities for AutoGen DekuDeals
+===========================================
+
+Array-backed price series and O(n) drop detection.
+
+Sliding-window maximum/minimum use monotonic deques, so every point is
+pushed and popped at most once regardless of the window size. Drop
+statistics built on top of them are shared by the price prediction engine
+and the price history analysis tool.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+@dataclass
+class PriceSeries:
+    """Prices and dates of one game as parallel arrays."""
+
+    prices: np.ndarray
+    dates: List[datetime]
+
+    @classmethod
+    def from_points(cls, points: Sequence) -> "PriceSeries":
+        """Build from ``PriceDataPoint``-like objects (``.date``, ``.price``)."""
+        return cls(
+            prices=np.fromiter((p.price for p in points), float, len(points)),
+            dates=[p.date for p in points],
+        )
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+
+def _sliding_extreme(values: Sequence[float], window: int, is_max: bool) -> np.ndarray:
+    """Monotonic-deque sliding extreme over windows ending at each index."""
+    values = np.asarray(values, dtype=float)
+    result = np.empty(len(values))
+    candidates: deque = deque()  # Indices with monotonic values
+
+    for i, value in enumerate(values.tolist()):
+        # Drop candidates dominated by the new value
+        if is_max:
+            while candidates and values[candidates[-1]] <= value:
+                candidates.pop()
+        else:
+            while candidates and values[candidates[-1]] >= value:
+                candidates.pop()
+        candidates.append(i)
+
+        # Drop the candidate that left the window
+        if candidates[0] <= i - window:
+            candidates.popleft()
+
+        result[i] = values[candidates[0]]
+
+    return result
+
+
+def sliding_window_max(values: Sequence[float], window: int) -> np.ndarray:
+    """
+    Maximum of each window ``values[max(0, i - window + 1) : i + 1]``.
+
+    Args:
+        values: Series values
+        window: Number of points per window
+
+    Returns:
+        np.ndarray: Window maximum ending at each index
+    """
+    return _sliding_extreme(values, window, is_max=True)
+
+
+def sliding_window_min(values: Sequence[float], window: int) -> np.ndarray:
+    """Minimum of each window ``values[max(0, i - window + 1) : i + 1]``."""
+    return _sliding_extreme(values, window, is_max=False)
+
+
+def window_drop_fractions(values: Sequence[float], window: int) -> np.ndarray:
+    """
+    Peak-to-trough drop ``(high - low) / high`` of each sliding window.
+
+    Windows with a non-positive high get a drop of 0.
+    """
+    highs = sliding_window_max(values, window)
+    lows = sliding_window_min(values, window)
+    return np.divide(highs - lows, highs, out=np.zeros_like(highs), where=highs > 0)
+
+
+def window_drop_rate(
+    values: Sequence[float],
+    lookback: int = 30,
+    window: int = 30,
+    threshold: float = 0.15,
+) -> Optional[float]:
+    """
+    Share of recent windows containing a significant drop.
+
+    Evaluates the windows ending at each of the last ``lookback`` points;
+    each window spans the ``window`` points before its end plus the end
+    point itself. Windows with a single point are skipped.
+
+    Args:
+        values: Series values in date order
+        lookback: Number of most recent window ends evaluated
+        window: Points preceding each window end
+        threshold: Minimum fractional drop counted as significant
+
+    Returns:
+        Optional[float]: Drop rate, or None when no window was evaluated
+    """
+    values = np.asarray(values, dtype=float)
+    start = max(1, len(values) - lookback)
+    if start >= len(values):
+        return None
+
+    # Only the tail (plus its window history) is needed
+    offset = max(0, start - window)
+    highs = sliding_window_max(values[offset:], window + 1)[start - offset :]
+    lows = sliding_window_min(values[offset:], window + 1)[start - offset :]
+
+    positive = highs > 0
+    drops = positive & ((highs - lows) / np.where(positive, highs, 1.0) >= threshold)
+    return float(drops.sum()) / len(highs)
+
+
+def significant_drop_indices(
+    values: Sequence[float], threshold: float = 0.15
+) -> np.ndarray:
+    """
+    Indices ``i`` where ``values[i]`` dropped at least ``threshold`` from ``values[i - 1]``.
+
+    Args:
+        values: Series values in date order
+        threshold: Minimum fractional drop
+
+    Returns:
+        np.ndarray: Ascending indices of drop points
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        return np.empty(0, dtype=np.int64)
+
+    previous, current = values[:-1], values[1:]
+    positive = previous > 0
+    drops = positive & (
+        (previous - current) / np.where(positive, previous, 1.0) >= threshold
+    )
+    return np.flatnonzero(drops) + 1
+
+
+def last_significant_drop(
+    values: Sequence[float], threshold: float = 0.15
+) -> Optional[int]:
+    """Index of the most recent significant consecutive drop, if any."""
+    indices = significant_drop_indices(values, threshold)
+    return int(indices[-1]) if len(indices) else None
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+
+"""
+Tool Result Compaction for AutoGen DekuDeals
+============================================
+
+Token-budgeted compaction of tool results before they reach the LLM.
+
+Agent tools return large dicts (a comprehensive review carries its full
+``formatted_review`` next to every underlying analysis, category scrapes
+carry whole game lists) and every result is re-sent to the model in each
+following round. Tools wrapped with ``ToolResultCompactor.wrap`` return:
+- the result unchanged when it fits the token budget
+- otherwise a summary: the fields listed in the tool's summary schema,
+  then long strings and lists shortened until the budget is met
+
+Compacted results carry a ``_compaction`` entry with the id of the full
+payload in a side store; agents fetch omitted fields with the
+``get_full_tool_result`` tool. Tokens saved are counted per conversation
+(``start_conversation`` / ``get_statistics``).
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Fields kept per tool ("a.b" nested key, "items[].key" key of every list item)
+SUMMARY_SCHEMAS: Dict[str, List[str]] = {
+    "generate_comprehensive_game_review": [
+        "success",
+        "error",
+        "game_title",
+        "review_data.overall_rating",
+        "review_data.recommendation",
+        "review_data.confidence",
+        "review_data.strengths",
+        "review_data.weaknesses",
+        "review_data.target_audience",
+        "review_data.value_assessment",
+        "review_data.price_recommendation",
+        "review_data.timing_advice",
+        "review_data.final_verdict",
+        "quality_scores",
+        "review_metadata.data_completeness",
+    ],
+    "scrape_dekudeals_category": [
+        "success",
+        "error",
+        "category",
+        "category_name",
+        "games_found",
+        "games[].title",
+        "games[].current_price",
+        "games[].discount",
+        "games[].rating",
+    ],
+    "get_games_from_popular_categories": [
+        "success",
+        "error",
+        "categories_processed",
+        "failed_categories",
+        "total_unique_games",
+        "all_unique_titles",
+    ],
+    "get_random_game_sample": [
+        "success",
+        "error",
+        "sample_size_actual",
+        "category_preference",
+        "selected_games",
+    ],
+}
+
+# Shortening passes: (max string characters, max list items)
+SHRINK_STEPS = [(400, 10), (200, 5), (100, 3), (40, 1)]
+
+_encoding = None
+_encoding_loaded = False
+_encoding_lock = threading.Lock()
+
+
+def count_tokens(value: Any) -> int:
+    """
+    Liczba tokenów wartości serializowanej tak jak wynik narzędzia.
+
+    Uses the tiktoken encoding of the configured model when it is available
+    locally, otherwise estimates four characters per token.
+    """
+    global _encoding, _encoding_loaded
+    text = value if isinstance(value, str) else _serialize(value)
+    with _encoding_lock:
+        if not _encoding_loaded:
+            _encoding_loaded = True
+            try:
+                import tiktoken
+
+                _encoding = tiktoken.get_encoding("o200k_base")
+            except Exception as e:
+                logger.debug(f"tiktoken encoding unavailable, estimating: {e}")
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return len(text) // 4 + 1
+
+
+_MISSING = object()
+
+
+def _serialize(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _project(value: Any, path: List[str]) -> Any:
+    """Wartość pod ścieżką schematu (``_MISSING`` gdy brak)."""
+    if not path:
+        return value
+    key, rest = path[0], path[1:]
+    if key.endswith("[]"):
+        items = value.get(key[:-2]) if isinstance(value, dict) else None
+        if not isinstance(items, list):
+            return _MISSING
+        return [_project(item, rest) for item in items]
+    if not isinstance(value, dict) or key not in value:
+        return _MISSING
+    return _project(value[key], rest)
+
+
+def _merge(target: Dict[str, Any], path: List[str], value: Any):
+    """Wstawia wartość pod ścieżkę schematu (listy łączone element po elemencie)."""
+    key, rest = path[0], path[1:]
+    if key.endswith("[]"):
+        if not rest:
+            target[key[:-2]] = value
+            return
+        items = target.setdefault(key[:-2], [{} for _ in value])
+        for item, item_value in zip(items, value):
+            if item_value is not _MISSING:
+                _merge(item, rest, item_value)
+        return
+    if not rest:
+        target[key] = value
+        return
+    _merge(target.setdefault(key, {}), rest, value)
+
+
+def apply_summary_schema(result: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """Wybiera z wyniku pola schematu."""
+    summary: Dict[str, Any] = {}
+    for field in fields:
+        path = field.split(".")
+        value = _project(result, path)
+        if value is not _MISSING:
+            _merge(summary, path, value)
+    return summary
+
+
+def _shrink(value: Any, max_chars: int, max_items: int) -> Any:
+    """Skraca długie napisy i listy (z informacją o pominiętych elementach)."""
+    if isinstance(value, str):
+        return value if len(value) <= max_chars else value[:max_chars] + "…"
+    if isinstance(value, dict):
+        return {key: _shrink(item, max_chars, max_items) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [_shrink(item, max_chars, max_items) for item in value[:max_items]]
+        if len(value) > max_items:
+            items.append(f"… {len(value) - max_items} more")
+        return items
+    return value
+
+
+class ToolResultCompactor:
+    """
+    Kompaktowanie wyników narzędzi do budżetu tokenów.
+
+    Usage:
+        compactor = ToolResultCompactor(token_budget=600)
+        summary = compactor.compact("generate_comprehensive_game_review", result)
+        compactor.get_full_result(summary["_compaction"]["result_id"])
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 600,
+        tool_budgets: Optional[Dict[str, int]] = None,
+        max_stored_results: int = 256,
+        schemas: Optional[Dict[str, List[str]]] = None,
+    ):
+        """
+        Args:
+            token_budget: Domyślny budżet tokenów wyniku narzędzia
+            tool_budgets: Budżety dla wybranych narzędzi
+            max_stored_results: Maksymalna liczba pełnych wyników w magazynie
+            schemas: Schematy podsumowań (domyślnie ``SUMMARY_SCHEMAS``)
+        """
+        self.token_budget = token_budget
+        self.tool_budgets = dict(tool_budgets or {})
+        self.max_stored_results = max_stored_results
+        self.schemas = SUMMARY_SCHEMAS if schemas is None else schemas
+
+        self._lock = threading.Lock()
+        self._store: "OrderedDict[str, Any]" = OrderedDict()
+        self.start_conversation()
+
+    @classmethod
+    def from_config(cls) -> "ToolResultCompactor":
+        """Kompaktor skonfigurowany w ``config/llm_config.py``."""
+        from config.llm_config import get_tool_compaction_config
+
+        config = get_tool_compaction_config()
+        return cls(
+            token_budget=config["token_budget"],
+            tool_budgets=config["tool_budgets"],
+            max_stored_results=config["max_stored_results"],
+        )
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Narzędzie agenta zwracające skompaktowany wynik.
+
+        Register the wrapper with AutoGen so the function map receives the
+        compacted result; the tool name is the function name.
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.compact(func.__name__, func(*args, **kwargs))
+
+        return wrapper
+
+    def budget_for(self, tool_name: str) -> int:
+        return self.tool_budgets.get(tool_name, self.token_budget)
+
+    def start_conversation(self):
+        """Zeruje statystyki nowej konwersacji (magazyn wyników zostaje)."""
+        with self._lock:
+            self._stats: Dict[str, Any] = {
+                "tool_calls": 0,
+                "compacted_calls": 0,
+                "original_tokens": 0,
+                "returned_tokens": 0,
+                "per_tool": {},
+            }
+
+    def compact(self, tool_name: str, result: Any) -> Any:
+        """Zwraca wynik mieszczący się w budżecie (pełny wynik trafia do magazynu)."""
+        budget = self.budget_for(tool_name)
+        original_tokens = count_tokens(result)
+        if not isinstance(result, dict) or original_tokens <= budget:
+            self._record(tool_name, original_tokens, original_tokens, False)
+            return result
+
+        result_id = self._store_result(tool_name, result)
+        marker = {
+            "result_id": result_id,
+            "original_tokens": original_tokens,
+            "note": "Summarized; call get_full_tool_result(result_id, field_path) "
+            "for omitted details",
+        }
+        fields = self.schemas.get(tool_name)
+        summary = apply_summary_schema(result, fields) if fields else dict(result)
+        summary["_compaction"] = marker
+        for max_chars, max_items in SHRINK_STEPS:
+            if count_tokens(summary) <= budget:
+                break
+            summary = _shrink(summary, max_chars, max_items)
+            summary["_compaction"] = marker
+
+        returned_tokens = count_tokens(summary)
+        self._record(tool_name, original_tokens, returned_tokens, True)
+        logger.debug(
+            f"🗜️ {tool_name} result compacted: {original_tokens} → "
+            f"{returned_tokens} tokens ({result_id})"
+        )
+        return summary
+
+    def _store_result(self, tool_name: str, result: Dict[str, Any]) -> str:
+        digest = hashlib.sha1(_serialize(result).encode("utf-8")).hexdigest()[:12]
+        result_id = f"{tool_name}:{digest}"
+        with self._lock:
+            self._store[result_id] = result
+            self._store.move_to_end(result_id)
+            while len(self._store) > self.max_stored_results:
+                self._store.popitem(last=False)
+        return result_id
+
+    def _record(self, tool_name: str, original: int, returned: int, compacted: bool):
+        with self._lock:
+            stats = self._stats
+            tool = stats["per_tool"].setdefault(
+                tool_name, {"calls": 0, "compacted_calls": 0, "tokens_saved": 0}
+            )
+            stats["tool_calls"] += 1
+            stats["original_tokens"] += original
+            stats["returned_tokens"] += returned
+            tool["calls"] += 1
+            tool["tokens_saved"] += original - returned
+            if compacted:
+                stats["compacted_calls"] += 1
+                tool["compacted_calls"] += 1
+
+    def get_full_result(self, result_id: str, field_path: str = "") -> Dict[str, Any]:
+        """
+        Pełny wynik (lub jego pole) z magazynu.
+
+        Args:
+            result_id: Identyfikator z ``_compaction.result_id``
+            field_path: Opcjonalna ścieżka pola, np. "review_data.reviewer_notes"
+        """
+        with self._lock:
+            result = self._store.get(result_id)
+        if result is None:
+            return {"success": False, "error": f"Unknown result id: {result_id}"}
+        if not field_path:
+            return result
+
+        value = _project(result, field_path.split("."))
+        if value is _MISSING:
+            return {
+                "success": False,
+                "error": f"Field '{field_path}' not found in {result_id}",
+            }
+        return {"success": True, "field_path": field_path, "value": value}
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statystyki bieżącej konwersacji."""
+        with self._lock:
+            stats = json.loads(_serialize(self._stats))
+            stored = len(self._store)
+        stats["tokens_saved"] = stats["original_tokens"] - stats["returned_tokens"]
+        stats["stored_results"] = stored
+        return stats
+
+
+_compactor: Optional[ToolResultCompactor] = None
+_compactor_lock = threading.Lock()
+
+
+def get_tool_result_compactor() -> ToolResultCompactor:
+    """Kompaktor domyślnego zespołu agentów."""
+    global _compactor
+    with _compactor_lock:
+        if _compactor is None:
+            _compactor = ToolResultCompactor.from_config()
+        return _compactor
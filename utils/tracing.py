@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+
+"""
+Tracing for AutoGen DekuDeals
+=============================
+
+Lightweight hierarchical span tracing for the analysis pipeline.
+
+    from utils.tracing import trace_span, propagate_context
+
+    with trace_span("analyze_game", game="Hades"):
+        with trace_span("search") as span:
+            span.set_attribute("bytes", len(html))
+        executor.submit(propagate_context(run_review))  # child of analyze_game
+
+The current span lives in a ``contextvars.ContextVar``, so nesting follows
+the call stack; ``propagate_context`` carries it into ``ThreadPoolExecutor``
+workers. Tracing is off by default - ``trace_span`` then returns a shared
+no-op span - and is enabled with ``get_tracer().enable(path)``, the CLI's
+``--trace FILE`` option or the ``DEKUDEALS_TRACE_FILE`` environment variable.
+
+Finished spans are exported as Chrome trace JSON (``chrome://tracing``,
+https://ui.perfetto.dev): one complete event per span on its thread's track,
+flow arrows from parents to children started on other threads, and span
+attributes (game, cache tier, bytes...) in the event args.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import atexit
+import contextvars
+import functools
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+TRACE_FILE_ENV = "DEKUDEALS_TRACE_FILE"
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar(
+    "dekudeals_current_span", default=None
+)
+_span_ids = itertools.count(1)
+
+
+@dataclass
+class Span:
+    """Pojedynczy odcinek śladu (nazwa, rodzic, czas, atrybuty)"""
+
+    name: str
+    span_id: int
+    trace_id: int
+    parent_id: Optional[int]
+    parent_thread_id: Optional[int]
+    thread_id: int
+    thread_name: str
+    start_ns: int
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any):
+        self.attributes.update(attributes)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+
+class _NoopSpan:
+    """Span used while tracing is disabled"""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, **attributes: Any):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """
+    Zbiera zakończone spany w pamięci i eksportuje je do pliku.
+
+    Args:
+        max_spans: Rozmiar bufora zakończonych spanów (najstarsze wypadają)
+    """
+
+    def __init__(self, max_spans: int = 100000):
+        self.enabled = False
+        self.output_path: Optional[Path] = None
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        # Wall clock of perf_counter zero, for absolute trace timestamps
+        self._epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+        self._atexit_registered = False
+
+    def enable(self, output_path: Optional[Union[str, Path]] = None):
+        """Włącza śledzenie; z ``output_path`` ślad jest zapisywany przy wyjściu"""
+        self.enabled = True
+        if output_path is not None:
+            self.output_path = Path(output_path)
+            if not self._atexit_registered:
+                atexit.register(self._export_at_exit)
+                self._atexit_registered = True
+
+    def disable(self):
+        self.enabled = False
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Union[Span, _NoopSpan]]:
+        """Otwiera span jako dziecko bieżącego spanu (kontekstu)"""
+        if not self.enabled:
+            yield NOOP_SPAN
+            return
+
+        parent = _current_span.get()
+        thread = threading.current_thread()
+        span_id = next(_span_ids)
+        span = Span(
+            name=name,
+            span_id=span_id,
+            trace_id=parent.trace_id if parent else span_id,
+            parent_id=parent.span_id if parent else None,
+            parent_thread_id=parent.thread_id if parent else None,
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            start_ns=time.perf_counter_ns() + self._epoch_offset_ns,
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns() + self._epoch_offset_ns
+            _current_span.reset(token)
+            self._spans.append(span)
+
+    def finished_spans(self) -> List[Span]:
+        return list(self._spans)
+
+    def clear(self):
+        self._spans.clear()
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Zakończone spany w formacie Chrome trace (Trace Event Format)"""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        threads: Dict[int, str] = {}
+
+        # Snapshot first: worker threads may still be finishing spans
+        for span in sorted(list(self._spans), key=lambda s: s.start_ns):
+            threads.setdefault(span.thread_id, span.thread_name)
+            start_us = span.start_ns / 1000
+            args = {
+                **{key: _json_value(value) for key, value in span.attributes.items()},
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "trace_id": span.trace_id,
+            }
+            if span.error:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "dekudeals",
+                    "ph": "X",
+                    "ts": start_us,
+                    "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": args,
+                }
+            )
+
+            # Flow arrow from the parent's track to a child on another thread
+            if span.parent_id and span.parent_thread_id != span.thread_id:
+                flow = {
+                    "name": "context",
+                    "cat": "dekudeals.flow",
+                    "id": span.span_id,
+                    "ts": start_us,
+                    "pid": pid,
+                }
+                events.append({**flow, "ph": "s", "tid": span.parent_thread_id})
+                events.append({**flow, "ph": "f", "bp": "e", "tid": span.thread_id})
+
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in threads.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: Union[str, Path]) -> int:
+        """
+        Zapisuje ślad do pliku JSON (otwórz w chrome://tracing lub Perfetto).
+
+        Returns:
+            int: Liczba wyeksportowanych spanów
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        spans = len(self._spans)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+        os.replace(temp_path, path)
+        logger.info(f"🧭 Exported {spans} spans to {path}")
+        return spans
+
+    def _export_at_exit(self):
+        if self.output_path is not None and self._spans:
+            try:
+                self.export_chrome_trace(self.output_path)
+            except Exception as e:
+                logger.error(f"Could not export trace: {e}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        spans = list(self._spans)
+        return {
+            "enabled": self.enabled,
+            "spans": len(spans),
+            "traces": len({span.trace_id for span in spans}),
+            "threads": len({span.thread_id for span in spans}),
+            "output_path": str(self.output_path) if self.output_path else None,
+        }
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+# ===================================================================
+# Global tracer and helpers
+# ===================================================================
+
+_global_tracer: Optional[Tracer] = None
+_global_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Globalny tracer (włączany przez ``DEKUDEALS_TRACE_FILE``)"""
+    global _global_tracer
+    if _global_tracer is None:
+        with _global_tracer_lock:
+            if _global_tracer is None:
+                tracer = Tracer()
+                trace_file = os.environ.get(TRACE_FILE_ENV)
+                if trace_file:
+                    tracer.enable(trace_file)
+                _global_tracer = tracer
+    return _global_tracer
+
+
+def trace_span(name: str, **attributes: Any):
+    """``with trace_span("scrape", game=...) as span:`` na globalnym tracerze"""
+    return get_tracer().span(name, **attributes)
+
+
+def current_span() -> Union[Span, _NoopSpan]:
+    """Bieżący span (lub no-op, gdy żaden nie jest otwarty)"""
+    return _current_span.get() or NOOP_SPAN
+
+
+def add_span_attributes(**attributes: Any):
+    """Dodaje atrybuty do bieżącego spanu, np. ``cache_tier="memory"``"""
+    span = _current_span.get()
+    if span is not None:
+        span.attributes.update(attributes)
+
+
+def traced(name: Optional[str] = None, **attributes: Any) -> Callable:
+    """Dekorator: każde wywołanie funkcji jest spanem"""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(span_name, **attributes):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def propagate_context(func: Callable) -> Callable:
+    """
+    Przenosi bieżący kontekst (span) do wątku roboczego.
+
+    Capture happens now, at submission; each call runs in its own copy of
+    the captured context, so one wrapper may run concurrently:
+
+        executor.submit(propagate_context(fetch), url)
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+
+"""
+Usage Aggregates for AutoGen DekuDeals
+======================================
+
+Streaming aggregation of usage events for analytics dashboards.
+
+``UsageAnalytics.track_event`` feeds every event to a ``UsageAggregator``:
+- hourly buckets: event, error and per-type counts, game / command /
+  hour-of-day / weekday counters, execution time, and HyperLogLog sketches
+  of unique users and games
+- per-user daily buckets (the same counters, no sketches) and their running
+  totals over the retention period, for user insights and segmentation
+
+Statistics for a period merge the buckets it covers, so a dashboard refresh
+costs O(buckets) instead of O(events). Buckets older than the retention
+period are dropped; the aggregator is persisted as a JSON snapshot with the
+timestamp of the last event it contains.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import base64
+import hashlib
+import math
+import threading
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+HOUR_SECONDS = 3600
+
+
+def hour_start(timestamp: float) -> int:
+    """Początek godziny (epoch) zawierającej znacznik czasu."""
+    return int(timestamp // HOUR_SECONDS) * HOUR_SECONDS
+
+
+class HyperLogLog:
+    """
+    Szkic HyperLogLog: przybliżona liczba unikalnych wartości.
+
+    Registers stay sparse (index -> rank) until an eighth of them is set,
+    so the many small hourly sketches cost a few entries each. Standard
+    error is about ``1.04 / sqrt(2 ** precision)`` (1.6% for 12).
+    """
+
+    def __init__(self, precision: int = 12):
+        self.precision = precision
+        self.size = 1 << precision
+        self._sparse: Optional[Dict[int, int]] = {}
+        self._dense: Optional[bytearray] = None
+
+    def add(self, value: str):
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+        width = 64 - self.precision
+        index = hashed >> width
+        rank = width - (hashed & ((1 << width) - 1)).bit_length() + 1
+        self._set(index, rank)
+
+    def _set(self, index: int, rank: int):
+        if self._dense is not None:
+            if rank > self._dense[index]:
+                self._dense[index] = rank
+            return
+        if rank > self._sparse.get(index, 0):
+            self._sparse[index] = rank
+            if len(self._sparse) > self.size // 8:
+                self._densify()
+
+    def _densify(self):
+        dense = bytearray(self.size)
+        for index, rank in self._sparse.items():
+            dense[index] = rank
+        self._dense, self._sparse = dense, None
+
+    def _registers(self) -> Iterable:
+        if self._dense is not None:
+            return ((i, r) for i, r in enumerate(self._dense) if r)
+        return self._sparse.items()
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Dołącza drugi szkic (ta sama precyzja) w miejscu."""
+        if other.precision != self.precision:
+            raise ValueError("HyperLogLog precision mismatch")
+        for index, rank in other._registers():
+            self._set(index, rank)
+        return self
+
+    def count(self) -> int:
+        if self._dense is not None:
+            ranks = [rank for rank in self._dense if rank]
+        else:
+            ranks = list(self._sparse.values())
+        zeros = self.size - len(ranks)
+        harmonic = zeros + sum(2.0**-rank for rank in ranks)
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        estimate = alpha * self.size * self.size / harmonic
+        if estimate <= 2.5 * self.size and zeros:
+            # Small range: linear counting is exact enough and unbiased
+            estimate = self.size * math.log(self.size / zeros)
+        return int(round(estimate))
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self._dense is not None:
+            packed = base64.b64encode(zlib.compress(bytes(self._dense))).decode()
+            return {"precision": self.precision, "dense": packed}
+        return {"precision": self.precision, "sparse": self._sparse}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HyperLogLog":
+        sketch = cls(data["precision"])
+        if "dense" in data:
+            sketch._dense = bytearray(zlib.decompress(base64.b64decode(data["dense"])))
+            sketch._sparse = None
+        else:
+            sketch._sparse = {int(i): rank for i, rank in data["sparse"].items()}
+        return sketch
+
+
+@dataclass
+class UsageBucket:
+    """Zagregowane zdarzenia jednego przedziału czasu."""
+
+    start: float
+    events: int = 0
+    errors: int = 0
+    execution_time: float = 0.0
+    price_focus_events: int = 0
+    first_ts: Optional[float] = None
+    last_ts: Optional[float] = None
+    event_types: Counter = field(default_factory=Counter)
+    games: Counter = field(default_factory=Counter)
+    commands: Counter = field(default_factory=Counter)
+    hours: Counter = field(default_factory=Counter)
+    weekdays: Counter = field(default_factory=Counter)
+    users: Optional[HyperLogLog] = None
+    unique_games: Optional[HyperLogLog] = None
+
+    @classmethod
+    def with_sketches(cls, start: float) -> "UsageBucket":
+        return cls(start=start, users=HyperLogLog(), unique_games=HyperLogLog())
+
+    def add(
+        self,
+        event: Dict[str, Any],
+        ts: float,
+        hour: int,
+        weekday: str,
+        price_focus: bool,
+    ):
+        self.events += 1
+        self.execution_time += event.get("execution_time") or 0.0
+        if not event.get("success", True):
+            self.errors += 1
+        if price_focus:
+            self.price_focus_events += 1
+        self.first_ts = ts if self.first_ts is None else min(self.first_ts, ts)
+        self.last_ts = ts if self.last_ts is None else max(self.last_ts, ts)
+
+        self.event_types[event["event_type"]] += 1
+        self.hours[hour] += 1
+        self.weekdays[weekday] += 1
+        game_name, command = event.get("game_name"), event.get("command")
+        if game_name:
+            self.games[game_name] += 1
+        if command:
+            self.commands[command] += 1
+        if self.users is not None:
+            self.users.add(event["user_id"])
+            if game_name:
+                self.unique_games.add(game_name)
+
+    def merge(self, other: "UsageBucket") -> "UsageBucket":
+        """Dołącza drugi przedział w miejscu."""
+        self.events += other.events
+        self.errors += other.errors
+        self.execution_time += other.execution_time
+        self.price_focus_events += other.price_focus_events
+        for name in ("first_ts", "last_ts"):
+            value, theirs = getattr(self, name), getattr(other, name)
+            if theirs is not None:
+                pick = min if name == "first_ts" else max
+                setattr(self, name, theirs if value is None else pick(value, theirs))
+        self.event_types.update(other.event_types)
+        self.games.update(other.games)
+        self.commands.update(other.commands)
+        self.hours.update(other.hours)
+        self.weekdays.update(other.weekdays)
+        if self.users is not None and other.users is not None:
+            self.users.merge(other.users)
+            self.unique_games.merge(other.unique_games)
+        return self
+
+    def subtract(self, other: "UsageBucket") -> "UsageBucket":
+        """Odejmuje liczniki przedziału (bez szkiców i zakresu czasu)."""
+        self.events -= other.events
+        self.errors -= other.errors
+        self.execution_time -= other.execution_time
+        self.price_focus_events -= other.price_focus_events
+        self.event_types -= other.event_types
+        self.games -= other.games
+        self.commands -= other.commands
+        self.hours -= other.hours
+        self.weekdays -= other.weekdays
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            name: getattr(self, name)
+            for name in (
+                "start",
+                "events",
+                "errors",
+                "execution_time",
+                "price_focus_events",
+                "first_ts",
+                "last_ts",
+                "event_types",
+                "games",
+                "commands",
+                "hours",
+                "weekdays",
+            )
+        }
+        if self.users is not None:
+            data["users"] = self.users.to_dict()
+            data["unique_games"] = self.unique_games.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UsageBucket":
+        bucket = cls(
+            start=data["start"],
+            events=data["events"],
+            errors=data["errors"],
+            execution_time=data["execution_time"],
+            price_focus_events=data["price_focus_events"],
+            first_ts=data["first_ts"],
+            last_ts=data["last_ts"],
+            event_types=Counter(data["event_types"]),
+            games=Counter(data["games"]),
+            commands=Counter(data["commands"]),
+            hours=Counter({int(hour): n for hour, n in data["hours"].items()}),
+            weekdays=Counter(data["weekdays"]),
+        )
+        if "users" in data:
+            bucket.users = HyperLogLog.from_dict(data["users"])
+            bucket.unique_games = HyperLogLog.from_dict(data["unique_games"])
+        return bucket
+
+
+class UsageAggregator:
+    """
+    Przyrostowe agregaty zdarzeń: kubełki godzinowe i dzienne per użytkownik.
+
+    Usage:
+        aggregator = UsageAggregator(retention_days=30)
+        aggregator.add(event)  # dict as stored in the usage event log
+        stats = aggregator.merge_hours(start_ts)  # UsageBucket of the period
+        aggregator.user_summary("user_1")  # O(1), used on every event
+    """
+
+    def __init__(self, retention_days: int = 30):
+        self.retention_days = retention_days
+        self.last_ts: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._hours: Dict[int, UsageBucket] = {}
+        self._user_days: Dict[str, Dict[int, UsageBucket]] = {}
+        self._user_totals: Dict[str, UsageBucket] = {}
+
+    def add(self, event: Dict[str, Any]):
+        """Dodaje zdarzenie (``timestamp`` jako datetime albo ``ts``)."""
+        moment = event.get("timestamp")
+        ts = event["ts"] if moment is None else moment.timestamp()
+        moment = moment or datetime.fromtimestamp(ts)
+        key, day = hour_start(ts), moment.toordinal()
+        parameters = event.get("parameters") or {}
+        price_focus = (
+            parameters.get("analysis_type") == "price"
+            or "price" in str(parameters).lower()
+        )
+        facts = (ts, moment.hour, moment.strftime("%A"), price_focus)
+
+        with self._lock:
+            bucket = self._hours.get(key)
+            if bucket is None:
+                bucket = self._hours[key] = UsageBucket.with_sketches(key)
+                self._prune(ts)
+            bucket.add(event, *facts)
+
+            days = self._user_days.setdefault(event["user_id"], {})
+            user_bucket = days.get(day)
+            if user_bucket is None:
+                user_bucket = days[day] = UsageBucket(start=day)
+            user_bucket.add(event, *facts)
+            totals = self._user_totals.get(event["user_id"])
+            if totals is None:
+                totals = self._user_totals[event["user_id"]] = UsageBucket(start=day)
+            totals.add(event, *facts)
+
+            self.last_ts = ts if self.last_ts is None else max(self.last_ts, ts)
+
+    def _prune(self, now: float):
+        """Usuwa kubełki starsze niż okres przechowywania (przy nowej godzinie)."""
+        cutoff = now - self.retention_days * 86400
+        for key in [key for key in self._hours if key + HOUR_SECONDS <= cutoff]:
+            del self._hours[key]
+        cutoff_day = (
+            date.fromtimestamp(now) - timedelta(days=self.retention_days)
+        ).toordinal()
+        for user_id in list(self._user_days):
+            days = self._user_days[user_id]
+            expired = [day for day in days if day < cutoff_day]
+            if not expired:
+                continue
+            totals = self._user_totals[user_id]
+            for day in expired:
+                totals.subtract(days.pop(day))
+            if not days:
+                del self._user_days[user_id]
+                del self._user_totals[user_id]
+                continue
+            totals.start = min(days)
+            totals.first_ts = min(bucket.first_ts for bucket in days.values())
+
+    def merge_hours(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> UsageBucket:
+        """
+        Suma kubełków godzinowych rozpoczętych w ``[start, end)``.
+
+        Bounds are meant to be whole hours; callers add partial hours at the
+        edges from the event log.
+        """
+        merged = UsageBucket.with_sketches(start or 0)
+        with self._lock:
+            for key, bucket in self._hours.items():
+                if (start is None or key >= start) and (end is None or key < end):
+                    merged.merge(bucket)
+        return merged
+
+    def user_activity(self, user_id: str) -> Optional[UsageBucket]:
+        """Aktywność użytkownika w okresie przechowywania (kopia sum)."""
+        with self._lock:
+            totals = self._user_totals.get(user_id)
+            if totals is None or not totals.events:
+                return None
+            return UsageBucket(start=totals.start).merge(totals)
+
+    def user_summary(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Liczniki segmentacji użytkownika (bez kopiowania liczników gier)."""
+        with self._lock:
+            totals = self._user_totals.get(user_id)
+            if totals is None or not totals.events:
+                return None
+            return {
+                "events": totals.events,
+                "unique_games": len(totals.games),
+                "price_focus_events": totals.price_focus_events,
+                "event_types": dict(totals.event_types),
+                "first_ts": totals.first_ts,
+                "last_ts": totals.last_ts,
+            }
+
+    def user_ids(self):
+        with self._lock:
+            return list(self._user_days)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hour_buckets": len(self._hours),
+                "user_day_buckets": sum(len(days) for days in self._user_days.values()),
+                "users": len(self._user_days),
+                "last_event": (
+                    datetime.fromtimestamp(self.last_ts).isoformat()
+                    if self.last_ts
+                    else None
+                ),
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Migawka agregatów (JSON)."""
+        with self._lock:
+            return {
+                "retention_days": self.retention_days,
+                "last_ts": self.last_ts,
+                "hours": [bucket.to_dict() for bucket in self._hours.values()],
+                "user_days": {
+                    user_id: [bucket.to_dict() for bucket in days.values()]
+                    for user_id, days in self._user_days.items()
+                },
+            }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UsageAggregator":
+        aggregator = cls(data.get("retention_days", 30))
+        aggregator.last_ts = data.get("last_ts")
+        for item in data.get("hours", []):
+            bucket = UsageBucket.from_dict(item)
+            aggregator._hours[int(bucket.start)] = bucket
+        for user_id, items in data.get("user_days", {}).items():
+            days = {int(item["start"]): UsageBucket.from_dict(item) for item in items}
+            totals = UsageBucket(start=min(days))
+            for bucket in days.values():
+                totals.merge(bucket)
+            aggregator._user_days[user_id] = days
+            aggregator._user_totals[user_id] = totals
+        return aggregator
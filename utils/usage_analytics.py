@@ -3,6 +3,7 @@
 # Comprehensive user behavior and usage pattern tracking
 # ===================================================================
 
+import atexit
 import json
 import time
 import uuid
@@ -15,6 +16,9 @@ import logging
 from collections import defaultdict, Counter
 import threading
 
+from .usage_aggregates import HOUR_SECONDS, UsageAggregator, UsageBucket, hour_start
+from .usage_event_log import UsageEventLog
+
 # ===================================================================
 # Analytics Data Models
 # ===================================================================
@@ -129,7 +133,8 @@ class UsageAnalytics:
     Comprehensive usage analytics and user behavior tracking system
 
     Features:
-    - Real-time event tracking
+    - Real-time event tracking (append-only event log, see usage_event_log)
+    - Streaming aggregates for statistics (hourly buckets, see usage_aggregates)
     - User session management
     - Behavior pattern analysis
     - User segmentation
@@ -137,18 +142,26 @@ class UsageAnalytics:
     - Trend analysis and insights
     """
 
-    def __init__(self, data_dir: str = "analytics_data"):
+    def __init__(self, data_dir: str = "analytics_data", retention_days: int = 30):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
 
         # Storage files
-        self.events_file = self.data_dir / "usage_events.json"
+        self.events_file = self.data_dir / "usage_events.json"  # Legacy, migrated
         self.sessions_file = self.data_dir / "user_sessions.json"
         self.profiles_file = self.data_dir / "user_profiles.json"
         self.statistics_file = self.data_dir / "usage_statistics.json"
+        self.aggregates_file = self.data_dir / "usage_aggregates.json"
+
+        # Events: append-only log on disk, queried by time range/user/type
+        self.event_log = UsageEventLog(
+            self.data_dir / "events", retention_days=retention_days
+        )
+
+        # Incremental aggregates of the events (statistics are bucket merges)
+        self.aggregates = UsageAggregator(retention_days)
 
         # In-memory storage
-        self.events: List[UsageEvent] = []
         self.sessions: Dict[str, UserSession] = {}
         self.user_profiles: Dict[str, UserProfile] = {}
 
@@ -157,8 +170,10 @@ class UsageAnalytics:
         self.current_user_id: str = self._generate_user_id()
 
         # Configuration
-        self.max_events_in_memory = 50000
+        self.retention_days = retention_days
         self.session_timeout_minutes = 30
+        self.save_every_events = 1000  # Sessions/profiles snapshot cadence
+        self._events_since_save = 0
 
         # Thread safety
         self._lock = threading.Lock()
@@ -194,29 +209,9 @@ class UsageAnalytics:
     def _load_existing_data(self):
         """Load existing analytics data"""
         try:
-            # Load events (last 30 days)
+            # Move events from the legacy JSON file into the event log
             if self.events_file.exists():
-                with open(self.events_file, "r") as f:
-                    data = json.load(f)
-                    cutoff = datetime.now() - timedelta(days=30)
-                    for item in data.get("events", []):
-                        timestamp = datetime.fromisoformat(item["timestamp"])
-                        if timestamp > cutoff:
-                            event = UsageEvent(
-                                event_id=item["event_id"],
-                                session_id=item["session_id"],
-                                user_id=item["user_id"],
-                                event_type=EventType(item["event_type"]),
-                                timestamp=timestamp,
-                                game_name=item.get("game_name"),
-                                command=item.get("command"),
-                                parameters=item.get("parameters", {}),
-                                success=item["success"],
-                                execution_time=item["execution_time"],
-                                error_message=item.get("error_message"),
-                                metadata=item.get("metadata", {}),
-                            )
-                            self.events.append(event)
+                self._migrate_legacy_events()
 
             # Load sessions
             if self.sessions_file.exists():
@@ -273,6 +268,48 @@ class UsageAnalytics:
         except Exception as e:
             self.logger.warning(f"Could not load existing analytics data: {e}")
 
+        self._load_aggregates()
+
+    def _load_aggregates(self):
+        """Load the aggregates snapshot and replay newer events from the log"""
+        try:
+            if self.aggregates_file.exists():
+                with open(self.aggregates_file, "r") as f:
+                    self.aggregates = UsageAggregator.from_dict(json.load(f))
+                self.aggregates.retention_days = self.retention_days
+        except Exception as e:
+            self.logger.warning(f"Could not load usage aggregates, rebuilding: {e}")
+            self.aggregates = UsageAggregator(self.retention_days)
+
+        last_ts = self.aggregates.last_ts
+        start = (
+            last_ts
+            if last_ts is not None
+            else datetime.now() - timedelta(days=self.retention_days)
+        )
+        replayed = 0
+        for item in self.event_log.query(start=start):
+            if last_ts is None or item["ts"] > last_ts:
+                self.aggregates.add(item)
+                replayed += 1
+        if replayed:
+            self.logger.info(f"Replayed {replayed} usage events into aggregates")
+
+    def _migrate_legacy_events(self):
+        """Import events of the legacy usage_events.json into the event log"""
+        with open(self.events_file, "r") as f:
+            data = json.load(f)
+        cutoff = datetime.now() - timedelta(days=self.retention_days)
+        migrated = 0
+        for item in data.get("events", []):
+            timestamp = datetime.fromisoformat(item["timestamp"])
+            if timestamp > cutoff:
+                self.event_log.append({**item, "timestamp": timestamp})
+                migrated += 1
+        self.event_log.flush()
+        self.events_file.rename(self.events_file.with_suffix(".json.migrated"))
+        self.logger.info(f"Migrated {migrated} usage events to the event log")
+
     def _start_session(self):
         """Start a new user session"""
         self.current_session_id = f"session_{uuid.uuid4().hex[:8]}"
@@ -331,9 +368,11 @@ class UsageAnalytics:
             metadata=metadata or {},
         )
 
-        with self._lock:
-            self.events.append(event)
+        record = {**vars(event), "event_type": event_type.value}
+        self.event_log.append(record)
+        self.aggregates.add(record)
 
+        with self._lock:
             # Update session
             if self.current_session_id in self.sessions:
                 session = self.sessions[self.current_session_id]
@@ -347,16 +386,16 @@ class UsageAnalytics:
                 if not success:
                     session.errors_count += 1
 
-            # Keep only recent events in memory
-            if len(self.events) > self.max_events_in_memory:
-                cutoff = datetime.now() - timedelta(days=7)
-                self.events = [e for e in self.events if e.timestamp > cutoff]
+            self._events_since_save += 1
+            save_due = self._events_since_save >= self.save_every_events
+            if save_due:
+                self._events_since_save = 0
 
         # Update user profile
         self._update_user_profile(event)
 
-        # Save periodically
-        if len(self.events) % 1000 == 0:
+        # Snapshot sessions and profiles periodically (the log persists events)
+        if save_due:
             self._save_data()
 
         self.logger.debug(
@@ -407,23 +446,20 @@ class UsageAnalytics:
 
     def _determine_user_segment(self, user_id: str) -> UserSegment:
         """Determine user segment based on behavior"""
-        user_events = [e for e in self.events if e.user_id == user_id]
+        activity = self.aggregates.user_summary(user_id)
 
-        if not user_events:
+        if not activity:
             return UserSegment.NEW_USER
 
         # Calculate metrics
-        total_events = len(user_events)
-        unique_games = len(set(e.game_name for e in user_events if e.game_name))
-        batch_events = len(
-            [e for e in user_events if e.event_type == EventType.BATCH_ANALYSIS]
-        )
-        comparison_events = len(
-            [e for e in user_events if e.event_type == EventType.COMPARISON]
-        )
+        total_events = activity["events"]
+        unique_games = activity["unique_games"]
+        event_types = activity["event_types"]
+        batch_events = event_types.get(EventType.BATCH_ANALYSIS.value, 0)
+        comparison_events = event_types.get(EventType.COMPARISON.value, 0)
         days_active = (
-            max(e.timestamp for e in user_events)
-            - min(e.timestamp for e in user_events)
+            datetime.fromtimestamp(activity["last_ts"])
+            - datetime.fromtimestamp(activity["first_ts"])
         ).days + 1
 
         # Calculate rates
@@ -440,14 +476,7 @@ class UsageAnalytics:
             return UserSegment.RESEARCHER
         elif events_per_day >= 2:
             # Analyze content patterns for bargain hunter vs quality seeker
-            price_focus_events = len(
-                [
-                    e
-                    for e in user_events
-                    if e.parameters.get("analysis_type") == "price"
-                    or "price" in str(e.parameters).lower()
-                ]
-            )
+            price_focus_events = activity["price_focus_events"]
 
             if price_focus_events / total_events >= 0.4:
                 return UserSegment.BARGAIN_HUNTER
@@ -499,6 +528,23 @@ class UsageAnalytics:
         self.current_session_id = None
         self._save_data()
 
+    def _period_bucket(self, start: datetime) -> UsageBucket:
+        """Aggregates since ``start``: whole hours merged from the hourly
+        buckets, the partial first hour read from the event log"""
+        start_ts = start.timestamp()
+        first_hour = hour_start(start_ts)
+        if first_hour < start_ts:
+            first_hour += HOUR_SECONDS
+        bucket = self.aggregates.merge_hours(first_hour)
+
+        partial = self.event_log.query(start=start_ts, end=first_hour)
+        if partial:
+            edge = UsageAggregator(self.retention_days)
+            for item in partial:
+                edge.add(item)
+            bucket.merge(edge.merge_hours())
+        return bucket
+
     def get_usage_statistics(self, period: str = "30d") -> UsageStatistics:
         """Generate comprehensive usage statistics"""
         # Parse period
@@ -511,11 +557,11 @@ class UsageAnalytics:
         else:
             cutoff = datetime.now() - timedelta(days=30)  # Default 30 days
 
-        # Filter data
-        period_events = [e for e in self.events if e.timestamp >= cutoff]
+        # Merge the period's aggregates (no per-event scan)
+        totals = self._period_bucket(cutoff)
         period_sessions = [s for s in self.sessions.values() if s.start_time >= cutoff]
 
-        if not period_events:
+        if not totals.events:
             return UsageStatistics(
                 period=period,
                 total_users=0,
@@ -533,10 +579,9 @@ class UsageAnalytics:
             )
 
         # Calculate basic metrics
-        unique_users = len(set(e.user_id for e in period_events))
-        unique_games = len(set(e.game_name for e in period_events if e.game_name))
-        success_events = [e for e in period_events if e.success]
-        error_rate = (1 - len(success_events) / len(period_events)) * 100
+        unique_users = totals.users.count()
+        unique_games = totals.unique_games.count()
+        error_rate = totals.errors / totals.events * 100
 
         # Session metrics
         session_durations = [
@@ -549,17 +594,15 @@ class UsageAnalytics:
         )
 
         # Popular games
-        game_counts = Counter(e.game_name for e in period_events if e.game_name)
         most_popular_games = [
             {"game": game, "count": count}
-            for game, count in game_counts.most_common(10)
+            for game, count in totals.games.most_common(10)
         ]
 
         # Popular commands
-        command_counts = Counter(e.command for e in period_events if e.command)
         most_used_commands = [
             {"command": cmd, "count": count}
-            for cmd, count in command_counts.most_common(10)
+            for cmd, count in totals.commands.most_common(10)
         ]
 
         # User segments
@@ -570,12 +613,8 @@ class UsageAnalytics:
         user_segments = dict(segment_counts)
 
         # Cache metrics
-        cache_hits = len(
-            [e for e in period_events if e.event_type == EventType.CACHE_HIT]
-        )
-        cache_misses = len(
-            [e for e in period_events if e.event_type == EventType.CACHE_MISS]
-        )
+        cache_hits = totals.event_types[EventType.CACHE_HIT.value]
+        cache_misses = totals.event_types[EventType.CACHE_MISS.value]
         cache_hit_rate = (
             (cache_hits / (cache_hits + cache_misses)) * 100
             if (cache_hits + cache_misses) > 0
@@ -583,17 +622,16 @@ class UsageAnalytics:
         )
 
         # Peak usage hours
-        hour_counts = Counter(e.timestamp.hour for e in period_events)
-        peak_usage_hours = [hour for hour, count in hour_counts.most_common(3)]
+        peak_usage_hours = [hour for hour, count in totals.hours.most_common(3)]
 
         # Growth metrics
-        growth_metrics = self._calculate_growth_metrics(period_events, period)
+        growth_metrics = self._calculate_growth_metrics(cutoff, period)
 
         return UsageStatistics(
             period=period,
             total_users=unique_users,
             total_sessions=len(period_sessions),
-            total_events=len(period_events),
+            total_events=totals.events,
             unique_games_analyzed=unique_games,
             avg_session_duration=avg_session_duration,
             most_popular_games=most_popular_games,
@@ -606,35 +644,36 @@ class UsageAnalytics:
         )
 
     def _calculate_growth_metrics(
-        self, events: List[UsageEvent], period: str
+        self, cutoff: datetime, period: str
     ) -> Dict[str, float]:
         """Calculate growth metrics"""
-        if not events:
-            return {}
-
         # Split period in half for comparison
         total_days = (
             30 if period == "30d" else int(period[:-1]) if period.endswith("d") else 30
         )
         mid_point = datetime.now() - timedelta(days=total_days // 2)
 
-        first_half = [e for e in events if e.timestamp < mid_point]
-        second_half = [e for e in events if e.timestamp >= mid_point]
+        # Halves split at the hour bucket boundary nearest the mid point
+        mid_hour = hour_start(mid_point.timestamp())
+        first_half = self.aggregates.merge_hours(
+            hour_start(cutoff.timestamp()), mid_hour
+        )
+        second_half = self.aggregates.merge_hours(mid_hour)
 
-        if not first_half:
+        if not first_half.events:
             return {"user_growth": 0.0, "event_growth": 0.0}
 
         # Calculate growth rates
-        users_first = len(set(e.user_id for e in first_half))
-        users_second = len(set(e.user_id for e in second_half))
+        users_first = first_half.users.count()
+        users_second = second_half.users.count()
         user_growth = (
             ((users_second - users_first) / users_first) * 100
             if users_first > 0
             else 0.0
         )
 
-        events_first = len(first_half)
-        events_second = len(second_half)
+        events_first = first_half.events
+        events_second = second_half.events
         event_growth = (
             ((events_second - events_first) / events_first) * 100
             if events_first > 0
@@ -647,27 +686,27 @@ class UsageAnalytics:
         """Get detailed user behavior insights"""
         target_user = user_id or self.current_user_id
 
-        user_events = [e for e in self.events if e.user_id == target_user]
+        activity = self.aggregates.user_activity(target_user)
         user_sessions = [s for s in self.sessions.values() if s.user_id == target_user]
 
-        if not user_events:
+        if not activity:
             return {"error": "No data found for user"}
 
         # Basic stats
-        total_events = len(user_events)
-        unique_games = len(set(e.game_name for e in user_events if e.game_name))
-        first_activity = min(e.timestamp for e in user_events)
-        last_activity = max(e.timestamp for e in user_events)
+        total_events = activity.events
+        unique_games = len(activity.games)
+        first_activity = datetime.fromtimestamp(activity.first_ts)
+        last_activity = datetime.fromtimestamp(activity.last_ts)
         days_active = (last_activity - first_activity).days + 1
 
         # Behavior patterns
-        event_types = Counter(e.event_type.value for e in user_events)
-        game_preferences = Counter(e.game_name for e in user_events if e.game_name)
-        command_usage = Counter(e.command for e in user_events if e.command)
+        event_types = activity.event_types
+        game_preferences = activity.games
+        command_usage = activity.commands
 
         # Time patterns
-        hour_pattern = Counter(e.timestamp.hour for e in user_events)
-        day_pattern = Counter(e.timestamp.strftime("%A") for e in user_events)
+        hour_pattern = activity.hours
+        day_pattern = activity.weekdays
 
         # Session patterns
         session_durations = [
@@ -711,69 +750,34 @@ class UsageAnalytics:
 
     def get_analytics_summary(self) -> Dict[str, Any]:
         """Get comprehensive analytics summary"""
+        now = datetime.now()
+        retained = self.aggregates.merge_hours()
+        last_day = self._period_bucket(now - timedelta(days=1))
         return {
             "analytics_status": "active",
             "current_user": self.current_user_id,
             "current_session": self.current_session_id,
             "data_summary": {
-                "total_events": len(self.events),
+                "total_events": retained.events,
                 "total_sessions": len(self.sessions),
                 "total_users": len(self.user_profiles),
-                "data_retention": "30 days",
+                "data_retention": f"{self.retention_days} days",
                 "last_update": datetime.now().isoformat(),
             },
             "recent_activity": {
-                "events_last_hour": len(
-                    [
-                        e
-                        for e in self.events
-                        if e.timestamp > datetime.now() - timedelta(hours=1)
-                    ]
-                ),
-                "events_last_day": len(
-                    [
-                        e
-                        for e in self.events
-                        if e.timestamp > datetime.now() - timedelta(days=1)
-                    ]
-                ),
-                "active_users_today": len(
-                    set(
-                        e.user_id
-                        for e in self.events
-                        if e.timestamp > datetime.now() - timedelta(days=1)
-                    )
-                ),
+                "events_last_hour": self._period_bucket(
+                    now - timedelta(hours=1)
+                ).events,
+                "events_last_day": last_day.events,
+                "active_users_today": last_day.users.count(),
             },
+            "event_log": self.event_log.get_statistics(),
+            "aggregates": self.aggregates.get_statistics(),
         }
 
     def _save_data(self):
         """Save analytics data to disk"""
         try:
-            # Save events
-            events_data = {"timestamp": datetime.now().isoformat(), "events": []}
-
-            for event in self.events:
-                events_data["events"].append(
-                    {
-                        "event_id": event.event_id,
-                        "session_id": event.session_id,
-                        "user_id": event.user_id,
-                        "event_type": event.event_type.value,
-                        "timestamp": event.timestamp.isoformat(),
-                        "game_name": event.game_name,
-                        "command": event.command,
-                        "parameters": event.parameters,
-                        "success": event.success,
-                        "execution_time": event.execution_time,
-                        "error_message": event.error_message,
-                        "metadata": event.metadata,
-                    }
-                )
-
-            with open(self.events_file, "w") as f:
-                json.dump(events_data, f, indent=2)
-
             # Save sessions
             sessions_data = {"timestamp": datetime.now().isoformat(), "sessions": {}}
 
@@ -820,9 +824,20 @@ class UsageAnalytics:
             with open(self.profiles_file, "w") as f:
                 json.dump(profiles_data, f, indent=2)
 
+            # Save aggregates snapshot (newer events are replayed from the log)
+            tmp_file = self.aggregates_file.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(self.aggregates.to_dict(), f)
+            tmp_file.replace(self.aggregates_file)
+
         except Exception as e:
             self.logger.error(f"Could not save analytics data: {e}")
 
+    def close(self):
+        """Flush pending events and save sessions and profiles"""
+        self._save_data()
+        self.event_log.close()
+
 
 # ===================================================================
 # Global Usage Analytics Instance
@@ -837,6 +852,8 @@ def get_usage_analytics() -> UsageAnalytics:
     global _global_analytics
     if _global_analytics is None:
         _global_analytics = UsageAnalytics()
+        # Buffered events are written by a daemon thread; flush them at exit
+        atexit.register(_global_analytics.close)
     return _global_analytics
 
 
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+
+"""
+Usage Event Log for AutoGen DekuDeals
+=====================================
+
+Append-only, segment-rotated storage of usage analytics events.
+
+Layout (``analytics_data/events``):
+- one SQLite segment per day, ``events-YYYYMMDD.db`` (WAL mode, pooled
+  connections from ``SQLiteConnectionPool``)
+- indexes on timestamp, (user, timestamp) and (event type, timestamp)
+
+``append`` only buffers the event; a background thread writes buffered
+events in batches (one transaction per segment) every ``flush_interval``
+seconds or as soon as ``batch_size`` events are waiting. Queries flush the
+buffer first and open only the segments overlapping the requested time
+range. Segments older than ``retention_days`` are deleted on rotation.
+
+Author: AutoGen DekuDeals Team
+Version: 1.0.0
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .sqlite_pool import SQLiteConnectionPool
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PREFIX = "events-"
+SEGMENT_SUFFIX = ".db"
+SEGMENT_DATE_FORMAT = "%Y%m%d"
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS usage_events (
+        seq INTEGER PRIMARY KEY,
+        event_id TEXT NOT NULL,
+        session_id TEXT,
+        user_id TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        ts REAL NOT NULL,
+        game_name TEXT,
+        command TEXT,
+        success INTEGER NOT NULL,
+        execution_time REAL NOT NULL,
+        error_message TEXT,
+        parameters TEXT,
+        metadata TEXT
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_usage_events_ts ON usage_events(ts);
+    CREATE INDEX IF NOT EXISTS idx_usage_events_user
+        ON usage_events(user_id, ts);
+    CREATE INDEX IF NOT EXISTS idx_usage_events_type
+        ON usage_events(event_type, ts);
+"""
+
+COLUMNS = (
+    "event_id",
+    "session_id",
+    "user_id",
+    "event_type",
+    "ts",
+    "game_name",
+    "command",
+    "success",
+    "execution_time",
+    "error_message",
+    "parameters",
+    "metadata",
+)
+
+INSERT_SQL = (
+    f"INSERT INTO usage_events ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in COLUMNS)})"
+)
+
+# Columns that may be counted with ``distinct``
+DISTINCT_COLUMNS = {"user_id", "session_id", "game_name", "command", "event_type"}
+
+
+def _segment_day(timestamp: float) -> date:
+    return datetime.fromtimestamp(timestamp).date()
+
+
+def _to_timestamp(value: Optional[Union[datetime, float]]) -> Optional[float]:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return value.timestamp()
+
+
+class UsageEventLog:
+    """
+    Dziennik zdarzeń użycia: segmenty dzienne, zapis wsadowy w tle.
+
+    Usage:
+        log = UsageEventLog("analytics_data/events")
+        log.append({"event_id": "event_1", "user_id": "user_1", ...})
+        log.query(start=datetime.now() - timedelta(days=7), user_id="user_1")
+        log.close()
+    """
+
+    def __init__(
+        self,
+        log_dir: Union[str, Path],
+        retention_days: int = 30,
+        flush_interval: float = 2.0,
+        batch_size: int = 500,
+    ):
+        """
+        Args:
+            log_dir: Katalog segmentów
+            retention_days: Liczba dni przechowywanych segmentów
+            flush_interval: Maksymalny czas buforowania zdarzeń (sekundy)
+            batch_size: Liczba zdarzeń w buforze wymuszająca zapis
+        """
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.retention_days = retention_days
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._pending: List[Tuple[Any, ...]] = []
+        self._pending_lock = threading.Condition(threading.Lock())
+        self._flush_lock = threading.Lock()
+        self._segments_lock = threading.Lock()
+        self._segments: Dict[date, SQLiteConnectionPool] = {}
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            "appended": 0,
+            "written": 0,
+            "flushes": 0,
+            "dropped": 0,
+            "expired": 0,
+        }
+
+        for path in self.log_dir.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+            day = self._parse_segment_name(path.name)
+            if day is not None:
+                self._segments[day] = self._open_segment(path)
+        self._apply_retention()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, event: Dict[str, Any]):
+        """
+        Dodaje zdarzenie do bufora (zapis nastąpi w tle).
+
+        ``event`` holds the ``COLUMNS`` fields; ``ts`` may be given as a
+        ``datetime`` under ``timestamp``, ``parameters`` and ``metadata`` as
+        dicts.
+        """
+        row = self._to_row(event)
+        with self._pending_lock:
+            if self._closed:
+                raise RuntimeError("Usage event log is closed")
+            self._pending.append(row)
+            self._stats["appended"] += 1
+            if len(self._pending) >= self.batch_size:
+                self._pending_lock.notify()
+        self._ensure_flusher()
+
+    def flush(self) -> int:
+        """Zapisuje zbuforowane zdarzenia; zwraca liczbę zapisanych."""
+        with self._flush_lock:
+            with self._pending_lock:
+                rows, self._pending = self._pending, []
+            if not rows:
+                return 0
+
+            # Events past retention (e.g. migrated history) are not stored
+            cutoff = date.today() - timedelta(days=self.retention_days)
+            by_day: Dict[date, List[Tuple[Any, ...]]] = {}
+            for row in rows:
+                day = _segment_day(row[4])
+                if day < cutoff:
+                    self._stats["expired"] += 1
+                    continue
+                by_day.setdefault(day, []).append(row)
+
+            written = 0
+            for day, day_rows in sorted(by_day.items()):
+                try:
+                    with self._segment(day).write() as conn:
+                        conn.executemany(INSERT_SQL, day_rows)
+                    written += len(day_rows)
+                except Exception as e:
+                    logger.error(f"Could not write usage events to {day}: {e}")
+                    self._stats["dropped"] += len(day_rows)
+
+            self._stats["written"] += written
+            self._stats["flushes"] += 1
+            return written
+
+    def _ensure_flusher(self):
+        if self._thread is not None:
+            return
+        with self._pending_lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._flush_loop, name="usage-event-log", daemon=True
+                )
+                self._thread.start()
+
+    def _flush_loop(self):
+        """Wątek w tle: zapis co ``flush_interval`` lub po zapełnieniu bufora."""
+        while True:
+            with self._pending_lock:
+                if not self._closed and len(self._pending) < self.batch_size:
+                    self._pending_lock.wait(self.flush_interval)
+                closed = self._closed
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Usage event log flush failed: {e}")
+            if closed:
+                return
+
+    def close(self):
+        """Zapisuje bufor, zatrzymuje wątek i zamyka segmenty."""
+        with self._pending_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending_lock.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=10)
+        self.flush()
+        with self._segments_lock:
+            for pool in self._segments.values():
+                pool.close()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        start: Optional[Union[datetime, float]] = None,
+        end: Optional[Union[datetime, float]] = None,
+        user_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Zdarzenia z zakresu czasu (``start`` <= ts < ``end``), rosnąco.
+
+        Only segments overlapping the range are opened; filters use the
+        segment indexes.
+        """
+        where, params = self._where(start, end, user_id, event_type)
+        sql = f"SELECT {', '.join(COLUMNS)} FROM usage_events{where} ORDER BY ts, seq"
+        events: List[Dict[str, Any]] = []
+        for pool in self._segments_in_range(start, end):
+            for row in pool.connection().execute(sql, params):
+                events.append(self._from_row(row))
+                if limit is not None and len(events) >= limit:
+                    return events
+        return events
+
+    def count(
+        self,
+        start: Optional[Union[datetime, float]] = None,
+        end: Optional[Union[datetime, float]] = None,
+        user_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+    ) -> int:
+        """Liczba zdarzeń spełniających filtry."""
+        where, params = self._where(start, end, user_id, event_type)
+        sql = f"SELECT COUNT(*) FROM usage_events{where}"
+        return sum(
+            pool.connection().execute(sql, params).fetchone()[0]
+            for pool in self._segments_in_range(start, end)
+        )
+
+    def distinct(
+        self,
+        column: str,
+        start: Optional[Union[datetime, float]] = None,
+        end: Optional[Union[datetime, float]] = None,
+        user_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+    ) -> set:
+        """Różne (niepuste) wartości kolumny, np. ``distinct("user_id")``."""
+        if column not in DISTINCT_COLUMNS:
+            raise ValueError(f"Unsupported column: {column}")
+        where, params = self._where(start, end, user_id, event_type)
+        where = f"{where} AND" if where else " WHERE"
+        sql = f"SELECT DISTINCT {column} FROM usage_events{where} {column} IS NOT NULL"
+        values = set()
+        for pool in self._segments_in_range(start, end):
+            values.update(row[0] for row in pool.connection().execute(sql, params))
+        return values
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statystyki dziennika (segmenty, bufor, zapisy)."""
+        with self._pending_lock:
+            stats = {**self._stats, "pending": len(self._pending)}
+        with self._segments_lock:
+            days = sorted(self._segments)
+        stats["segments"] = len(days)
+        stats["oldest_segment"] = days[0].isoformat() if days else None
+        stats["newest_segment"] = days[-1].isoformat() if days else None
+        return stats
+
+    @staticmethod
+    def _where(
+        start: Optional[Union[datetime, float]],
+        end: Optional[Union[datetime, float]],
+        user_id: Optional[str],
+        event_type: Optional[str],
+    ) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(_to_timestamp(start))
+        if end is not None:
+            clauses.append("ts < ?")
+            params.append(_to_timestamp(end))
+        if user_id is not None:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if event_type is not None:
+            clauses.append("event_type = ?")
+            params.append(event_type)
+        return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def _segments_in_range(
+        self,
+        start: Optional[Union[datetime, float]],
+        end: Optional[Union[datetime, float]],
+    ) -> Iterator[SQLiteConnectionPool]:
+        """Segmenty nakładające się na zakres (po zapisaniu bufora)."""
+        self.flush()
+        start_ts, end_ts = _to_timestamp(start), _to_timestamp(end)
+        first = _segment_day(start_ts) if start_ts is not None else date.min
+        last = _segment_day(end_ts) if end_ts is not None else date.max
+        with self._segments_lock:
+            pools = [
+                pool
+                for day, pool in sorted(self._segments.items())
+                if first <= day <= last
+            ]
+        return iter(pools)
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+
+    def _segment(self, day: date) -> SQLiteConnectionPool:
+        """Pula segmentu dnia (tworzy segment przy rotacji)."""
+        with self._segments_lock:
+            pool = self._segments.get(day)
+            if pool is not None:
+                return pool
+            name = (
+                f"{SEGMENT_PREFIX}{day.strftime(SEGMENT_DATE_FORMAT)}{SEGMENT_SUFFIX}"
+            )
+            pool = self._segments[day] = self._open_segment(self.log_dir / name)
+        logger.debug(f"🗂️ Usage event log rotated to segment {name}")
+        self._apply_retention()
+        return pool
+
+    @staticmethod
+    def _open_segment(path: Path) -> SQLiteConnectionPool:
+        pool = SQLiteConnectionPool(path)
+        pool.connection().executescript(SCHEMA_SQL)
+        return pool
+
+    @staticmethod
+    def _parse_segment_name(name: str) -> Optional[date]:
+        try:
+            stamp = name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]
+            return datetime.strptime(stamp, SEGMENT_DATE_FORMAT).date()
+        except ValueError:
+            return None
+
+    def _apply_retention(self):
+        """Usuwa segmenty starsze niż ``retention_days``."""
+        cutoff = date.today() - timedelta(days=self.retention_days)
+        with self._segments_lock:
+            expired = [day for day in self._segments if day < cutoff]
+            pools = [self._segments.pop(day) for day in expired]
+        for pool in pools:
+            pool.close()
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(pool.db_path + suffix)
+                except FileNotFoundError:
+                    pass
+        if expired:
+            logger.info(f"🧹 Removed {len(expired)} expired usage event segments")
+
+    # ------------------------------------------------------------------
+    # Rows
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _to_row(event: Dict[str, Any]) -> Tuple[Any, ...]:
+        ts = event.get("ts")
+        if ts is None:
+            ts = _to_timestamp(event.get("timestamp") or datetime.now())
+        return (
+            event["event_id"],
+            event.get("session_id"),
+            event["user_id"],
+            event["event_type"],
+            ts,
+            event.get("game_name"),
+            event.get("command"),
+            1 if event.get("success", True) else 0,
+            float(event.get("execution_time") or 0.0),
+            event.get("error_message"),
+            json.dumps(event.get("parameters") or {}, default=str),
+            json.dumps(event.get("metadata") or {}, default=str),
+        )
+
+    @staticmethod
+    def _from_row(row: Tuple[Any, ...]) -> Dict[str, Any]:
+        event = dict(zip(COLUMNS, row))
+        event["timestamp"] = datetime.fromtimestamp(event["ts"])
+        event["success"] = bool(event["success"])
+        event["parameters"] = json.loads(event["parameters"] or "{}")
+        event["metadata"] = json.loads(event["metadata"] or "{}")
+        return event
@@ -17,6 +17,7 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import logging
+from threading import Lock
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -519,8 +520,26 @@ class UserManager:
         }
 
 
-# Global user manager instance
-user_manager = UserManager()
+# Global user manager instance (created on first use, not at import)
+_user_manager_instance: Optional[UserManager] = None
+_user_manager_lock = Lock()
+
+
+def get_user_manager() -> UserManager:
+    """Get global user manager instance"""
+    global _user_manager_instance
+    if _user_manager_instance is None:
+        with _user_manager_lock:
+            if _user_manager_instance is None:
+                _user_manager_instance = UserManager()
+    return _user_manager_instance
+
+
+def __getattr__(name: str) -> Any:
+    # Backward compatibility: ``from utils.user_management import user_manager``
+    if name == "user_manager":
+        return get_user_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Convenience functions for easy access
@@ -551,7 +570,9 @@ def register_user(
     if preferences:
         prefs = UserPreferences(**preferences)
 
-    success, message, profile = user_manager.register_user(username, role_enum, prefs)
+    success, message, profile = get_user_manager().register_user(
+        username, role_enum, prefs
+    )
 
     if success and profile:
         return success, message, asdict(profile)
@@ -561,7 +582,7 @@ def register_user(
 
 def get_current_user_info() -> Dict[str, Any]:
     """Get current user information (convenience function)."""
-    return user_manager.get_current_user_info()
+    return get_user_manager().get_current_user_info()
 
 
 def switch_user(user_identifier: str) -> Tuple[bool, str, Optional[Dict]]:
@@ -574,7 +595,7 @@ def switch_user(user_identifier: str) -> Tuple[bool, str, Optional[Dict]]:
     Returns:
         Tuple of (success, message, user_data)
     """
-    success, message, profile = user_manager.switch_user(user_identifier)
+    success, message, profile = get_user_manager().switch_user(user_identifier)
 
     if success and profile:
         return success, message, asdict(profile)
@@ -584,13 +605,13 @@ def switch_user(user_identifier: str) -> Tuple[bool, str, Optional[Dict]]:
 
 def list_all_users() -> List[Dict[str, Any]]:
     """Get list of all users (convenience function)."""
-    users = user_manager.get_all_users()
+    users = get_user_manager().get_all_users()
     return [asdict(user) for user in users]
 
 
 def get_system_stats() -> Dict[str, Any]:
     """Get system statistics (convenience function)."""
-    return user_manager.get_system_stats()
+    return get_user_manager().get_system_stats()
 
 
 if __name__ == "__main__":